@@ -18,3 +18,9 @@ class InstrumentDTO:
     status: str
     created_at: datetime
     updated_at: datetime
+
+
+@dataclass(frozen=True, slots=True)
+class InstrumentStatusDTO:
+    instrument_id: str
+    status: str
@@ -1,6 +1,8 @@
 import logging
 from dataclasses import dataclass
 
+from src.domain.events.instrument_events import InstrumentActivated
+from src.domain.ports.event_publisher import EventPublisher
 from src.domain.ports.unit_of_work import UnitOfWork
 from src.domain.value_objects.instrument_id import InstrumentId
 
@@ -13,8 +15,11 @@ class ActivateInstrumentCommand:
 
 
 class ActivateInstrumentHandler:
-    def __init__(self, uow: UnitOfWork) -> None:
+    def __init__(
+        self, uow: UnitOfWork, event_publisher: EventPublisher | None = None
+    ) -> None:
         self._uow = uow
+        self._event_publisher = event_publisher
 
     async def handle(self, command: ActivateInstrumentCommand) -> None:
         logger.info("Activating instrument: id=%s", command.instrument_id)
@@ -23,8 +28,25 @@ class ActivateInstrumentHandler:
                 InstrumentId(command.instrument_id)
             )
             instrument.activate()
-            if instrument.is_changed():
+            changed = instrument.is_changed()
+            if changed:
                 await self._uow.instruments.update(instrument)
                 await self._uow.commit()
                 instrument.clear_changes()
+        if changed and self._event_publisher is not None:
+            try:
+                await self._event_publisher.publish(
+                    InstrumentActivated(
+                        instrument_id=instrument.id.value,
+                        symbol=instrument.symbol,
+                        status=instrument.status.value,
+                    )
+                )
+            except Exception:
+                # Already committed; OIS picks the status up on its next
+                # reload of /instruments/statuses.
+                logger.exception(
+                    "Failed to publish InstrumentActivated: id=%s",
+                    command.instrument_id,
+                )
         logger.info("Instrument activated: id=%s", command.instrument_id)
@@ -1,6 +1,8 @@
 import logging
 from dataclasses import dataclass
 
+from src.domain.events.instrument_events import InstrumentHalted
+from src.domain.ports.event_publisher import EventPublisher
 from src.domain.ports.unit_of_work import UnitOfWork
 from src.domain.value_objects.instrument_id import InstrumentId
 
@@ -13,8 +15,11 @@ class HaltInstrumentCommand:
 
 
 class HaltInstrumentHandler:
-    def __init__(self, uow: UnitOfWork) -> None:
+    def __init__(
+        self, uow: UnitOfWork, event_publisher: EventPublisher | None = None
+    ) -> None:
         self._uow = uow
+        self._event_publisher = event_publisher
 
     async def handle(self, command: HaltInstrumentCommand) -> None:
         logger.info("Halting instrument: id=%s", command.instrument_id)
@@ -23,8 +28,24 @@ class HaltInstrumentHandler:
                 InstrumentId(command.instrument_id)
             )
             instrument.halt()
-            if instrument.is_changed():
+            changed = instrument.is_changed()
+            if changed:
                 await self._uow.instruments.update(instrument)
                 await self._uow.commit()
                 instrument.clear_changes()
+        if changed and self._event_publisher is not None:
+            try:
+                await self._event_publisher.publish(
+                    InstrumentHalted(
+                        instrument_id=instrument.id.value,
+                        symbol=instrument.symbol,
+                        status=instrument.status.value,
+                    )
+                )
+            except Exception:
+                # Already committed; OIS picks the status up on its next
+                # reload of /instruments/statuses.
+                logger.exception(
+                    "Failed to publish InstrumentHalted: id=%s", command.instrument_id
+                )
         logger.info("Instrument halted: id=%s", command.instrument_id)
@@ -0,0 +1,22 @@
+import logging
+
+from src.application.DTOs.instrument import InstrumentStatusDTO
+from src.domain.ports.unit_of_work import UnitOfWork
+
+logger = logging.getLogger(__name__)
+
+
+class ListInstrumentStatusesHandler:
+    """Id and status of every instrument, for services that mirror them."""
+
+    def __init__(self, uow: UnitOfWork) -> None:
+        self._uow = uow
+
+    async def handle(self) -> list[InstrumentStatusDTO]:
+        logger.info("Listing instrument statuses")
+        async with self._uow:
+            statuses = await self._uow.instruments.list_statuses()
+        return [
+            InstrumentStatusDTO(instrument_id=id_, status=status.value)
+            for id_, status in sorted(statuses.items())
+        ]
@@ -0,0 +1,42 @@
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+
+@dataclass(frozen=True, slots=True)
+class DomainEvent:
+    """Base integration event published to the event bus."""
+
+    event_type: str
+    occurred_at: datetime = field(
+        default_factory=lambda: datetime.now(timezone.utc),
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class InstrumentStatusChanged(DomainEvent):
+    """Base of the lifecycle events; ``status`` is the status after it."""
+
+    instrument_id: str = ""
+    symbol: str = ""
+    status: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class InstrumentActivated(InstrumentStatusChanged):
+    """Emitted when an instrument becomes ACTIVE (from PENDING or HALTED)."""
+
+    event_type: str = "InstrumentActivated"
+
+
+@dataclass(frozen=True, slots=True)
+class InstrumentHalted(InstrumentStatusChanged):
+    """Emitted when trading in an ACTIVE instrument is halted."""
+
+    event_type: str = "InstrumentHalted"
+
+
+@dataclass(frozen=True, slots=True)
+class InstrumentDelisted(InstrumentStatusChanged):
+    """Emitted when an instrument is delisted; it never trades again."""
+
+    event_type: str = "InstrumentDelisted"
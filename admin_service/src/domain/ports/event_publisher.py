@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+
+from src.domain.events.instrument_events import DomainEvent
+
+
+class EventPublisher(ABC):
+    """Outbound port for publishing domain events to the event bus."""
+
+    @abstractmethod
+    async def publish(self, event: DomainEvent) -> None:
+        """Publish a single domain event.
+
+        Raises:
+            MessagingError: If the event cannot be delivered to the bus.
+        """
+        raise NotImplementedError
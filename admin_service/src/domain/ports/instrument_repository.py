@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 
 from src.domain.entities.instrument import Instrument
 from src.domain.value_objects.instrument_id import InstrumentId
+from src.domain.value_objects.instrument_status import InstrumentStatus
 
 
 class InstrumentRepository(ABC):
@@ -26,3 +27,8 @@ class InstrumentRepository(ABC):
     @abstractmethod
     async def list_all(self) -> list[Instrument]:
         raise NotImplementedError
+
+    @abstractmethod
+    async def list_statuses(self) -> dict[str, InstrumentStatus]:
+        """Status of every instrument by id, without loading the aggregates."""
+        raise NotImplementedError
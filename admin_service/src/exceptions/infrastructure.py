@@ -18,3 +18,15 @@ class DatabaseTimeoutError(DatabaseError):
 
 class DatabaseOperationError(DatabaseError):
     pass
+
+
+class MessagingError(InfrastructureError):
+    pass
+
+
+class MessagingConnectionError(MessagingError):
+    pass
+
+
+class MessagingPublishError(MessagingError):
+    pass
@@ -12,6 +12,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.domain.entities.instrument import Instrument
 from src.domain.ports.instrument_repository import InstrumentRepository
 from src.domain.value_objects.instrument_id import InstrumentId
+from src.domain.value_objects.instrument_status import InstrumentStatus
 from src.exceptions import (
     DatabaseConnectionError,
     DatabaseOperationError,
@@ -83,6 +84,14 @@ class SQLAlchemyInstrumentRepository(InstrumentRepository):
         )
         return [model_to_instrument(m) for m in result.scalars().all()]
 
+    async def list_statuses(self) -> dict[str, InstrumentStatus]:
+        result = await self._execute(
+            "list_instrument_statuses",
+            self._session.execute,
+            select(InstrumentModel.id, InstrumentModel.status),
+        )
+        return {id_: InstrumentStatus(status) for id_, status in result.all()}
+
     async def _execute(self, operation: str, coro, *args, **kwargs):
         try:
             return await coro(*args, **kwargs)
@@ -21,6 +21,7 @@ from src.application.delist_instrument import (
 )
 from src.application.get_instrument import GetInstrumentHandler, GetInstrumentQuery
 from src.application.halt_instrument import HaltInstrumentCommand, HaltInstrumentHandler
+from src.application.list_instrument_statuses import ListInstrumentStatusesHandler
 from src.application.list_instruments import ListInstrumentsHandler
 from src.exceptions import (
     DatabaseConnectionError,
@@ -39,9 +40,10 @@ from src.presentation.api.v1.schemas.requests import (
 from src.presentation.api.v1.schemas.responses import (
     CreateInstrumentResponse,
     InstrumentResponse,
+    InstrumentStatusResponse,
 )
 from src.presentation.auth import AdminClaims
-from src.presentation.dependencies import UoWFactory
+from src.presentation.dependencies import EventPublisherDep, UoWFactory
 
 logger = logging.getLogger(__name__)
 
@@ -149,6 +151,39 @@ async def list_instruments(
     return [_to_response(d) for d in dtos]
 
 
+@router.get(
+    "/statuses",
+    response_model=list[InstrumentStatusResponse],
+    status_code=status.HTTP_200_OK,
+    summary="List instrument statuses",
+)
+async def list_instrument_statuses(
+    uow_factory: UoWFactory,
+    _claims: AdminClaims,
+) -> list[InstrumentStatusResponse]:
+    handler = ListInstrumentStatusesHandler(uow_factory())
+    try:
+        dtos = await handler.handle()
+    except (DatabaseConnectionError, DatabaseTimeoutError) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc)
+        )
+    except DatabaseOperationError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(exc)
+        )
+    except Exception:
+        logger.exception("Unexpected error listing instrument statuses")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An unexpected error occurred.",
+        )
+    return [
+        InstrumentStatusResponse(instrument_id=d.instrument_id, status=d.status)
+        for d in dtos
+    ]
+
+
 @router.get(
     "/{instrument_id}",
     response_model=InstrumentResponse,
@@ -194,9 +229,10 @@ async def get_instrument(
 async def activate_instrument(
     instrument_id: InstrumentIdPath,
     uow_factory: UoWFactory,
+    event_publisher: EventPublisherDep,
     _claims: AdminClaims,
 ) -> Response:
-    handler = ActivateInstrumentHandler(uow_factory())
+    handler = ActivateInstrumentHandler(uow_factory(), event_publisher)
     try:
         await handler.handle(ActivateInstrumentCommand(instrument_id=instrument_id))
     except InstrumentNotFoundError as exc:
@@ -232,9 +268,10 @@ async def activate_instrument(
 async def halt_instrument(
     instrument_id: InstrumentIdPath,
     uow_factory: UoWFactory,
+    event_publisher: EventPublisherDep,
     _claims: AdminClaims,
 ) -> Response:
-    handler = HaltInstrumentHandler(uow_factory())
+    handler = HaltInstrumentHandler(uow_factory(), event_publisher)
     try:
         await handler.handle(HaltInstrumentCommand(instrument_id=instrument_id))
     except InstrumentNotFoundError as exc:
@@ -270,9 +307,10 @@ async def halt_instrument(
 async def delist_instrument(
     instrument_id: InstrumentIdPath,
     uow_factory: UoWFactory,
+    event_publisher: EventPublisherDep,
     _claims: AdminClaims,
 ) -> Response:
-    handler = DelistInstrumentHandler(uow_factory())
+    handler = DelistInstrumentHandler(uow_factory(), event_publisher)
     try:
         await handler.handle(DelistInstrumentCommand(instrument_id=instrument_id))
     except InstrumentNotFoundError as exc:
@@ -22,5 +22,10 @@ class InstrumentResponse(BaseModel):
     updated_at: datetime
 
 
+class InstrumentStatusResponse(BaseModel):
+    instrument_id: str
+    status: str
+
+
 class CreateInstrumentResponse(BaseModel):
     instrument_id: str
@@ -4,6 +4,7 @@ from typing import Annotated
 from fastapi import Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from src.domain.ports.event_publisher import EventPublisher
 from src.domain.ports.unit_of_work import UnitOfWork
 from src.infrastructure.persistence.unit_of_work import SQLAlchemyUnitOfWork
 
@@ -24,4 +25,9 @@ def get_uow_factory(
     return factory
 
 
+def get_event_publisher(request: Request) -> EventPublisher:
+    return request.app.state.event_publisher
+
+
 UoWFactory = Annotated[Callable[[], UnitOfWork], Depends(get_uow_factory)]
+EventPublisherDep = Annotated[EventPublisher, Depends(get_event_publisher)]
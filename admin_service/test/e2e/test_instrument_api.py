@@ -130,3 +130,18 @@ class TestLifecycleAndAllocation:
         response = client.get(BASE, headers=admin_headers)
         assert response.status_code == 200
         assert len(response.json()) == 2
+
+    def test_list_instrument_statuses(
+        self,
+        client: TestClient,
+        admin_headers: dict[str, str],
+        instrument_payload: dict,
+    ) -> None:
+        created = client.post(BASE, json=instrument_payload, headers=admin_headers)
+        instrument_id = created.json()["instrument_id"]
+        client.post(f"{BASE}/{instrument_id}/activate", headers=admin_headers)
+
+        response = client.get(f"{BASE}/statuses", headers=admin_headers)
+
+        assert response.status_code == 200, response.text
+        assert {"instrument_id": instrument_id, "status": "ACTIVE"} in response.json()
@@ -3,6 +3,7 @@ from unittest.mock import AsyncMock
 import pytest
 
 from src.domain.entities.instrument import Instrument
+from src.domain.ports.event_publisher import EventPublisher
 from src.domain.ports.instrument_repository import InstrumentRepository
 from src.domain.ports.unit_of_work import UnitOfWork
 from src.domain.value_objects.currency import Currency
@@ -19,9 +20,17 @@ def mock_instrument_repository() -> AsyncMock:
     repo.get_by_symbol = AsyncMock()
     repo.update = AsyncMock()
     repo.list_all = AsyncMock()
+    repo.list_statuses = AsyncMock()
     return repo
 
 
+@pytest.fixture
+def mock_event_publisher() -> AsyncMock:
+    publisher = AsyncMock(spec=EventPublisher)
+    publisher.publish = AsyncMock()
+    return publisher
+
+
 @pytest.fixture
 def mock_uow(mock_instrument_repository: AsyncMock) -> AsyncMock:
     uow = AsyncMock(spec=UnitOfWork)
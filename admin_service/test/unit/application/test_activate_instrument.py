@@ -7,6 +7,7 @@ from src.application.activate_instrument import (
     ActivateInstrumentHandler,
 )
 from src.domain.entities.instrument import Instrument
+from src.domain.events.instrument_events import InstrumentActivated
 from src.domain.value_objects.instrument_status import InstrumentStatus
 from src.exceptions import InvalidInstrumentStateError
 
@@ -76,3 +77,23 @@ async def test_raises_when_delisted(
         await ActivateInstrumentHandler(mock_uow).handle(
             ActivateInstrumentCommand(instrument_id=sample_instrument.id.value)
         )
+
+
+async def test_publishes_activated_after_commit(
+    mock_uow: AsyncMock,
+    mock_instrument_repository: AsyncMock,
+    mock_event_publisher: AsyncMock,
+    sample_instrument: Instrument,
+) -> None:
+    mock_instrument_repository.get_by_id.return_value = sample_instrument
+
+    await ActivateInstrumentHandler(mock_uow, mock_event_publisher).handle(
+        ActivateInstrumentCommand(instrument_id=sample_instrument.id.value)
+    )
+
+    mock_uow.commit.assert_awaited_once()
+    event = mock_event_publisher.publish.await_args.args[0]
+    assert isinstance(event, InstrumentActivated)
+    assert event.instrument_id == sample_instrument.id.value
+    assert event.symbol == "AAPL"
+    assert event.status == "ACTIVE"
@@ -7,6 +7,7 @@ from src.application.delist_instrument import (
     DelistInstrumentHandler,
 )
 from src.domain.entities.instrument import Instrument
+from src.domain.events.instrument_events import InstrumentDelisted
 from src.domain.value_objects.instrument_status import InstrumentStatus
 from src.exceptions import InvalidInstrumentStateError
 
@@ -60,3 +61,23 @@ async def test_raises_when_already_delisted(
 
     mock_instrument_repository.update.assert_not_awaited()
     mock_uow.commit.assert_not_awaited()
+
+
+async def test_publishes_delisted_after_commit(
+    mock_uow: AsyncMock,
+    mock_instrument_repository: AsyncMock,
+    mock_event_publisher: AsyncMock,
+    sample_instrument: Instrument,
+) -> None:
+    mock_instrument_repository.get_by_id.return_value = sample_instrument
+
+    await DelistInstrumentHandler(mock_uow, mock_event_publisher).handle(
+        DelistInstrumentCommand(instrument_id=sample_instrument.id.value)
+    )
+
+    mock_uow.commit.assert_awaited_once()
+    event = mock_event_publisher.publish.await_args.args[0]
+    assert isinstance(event, InstrumentDelisted)
+    assert event.instrument_id == sample_instrument.id.value
+    assert event.symbol == "AAPL"
+    assert event.status == "DELISTED"
@@ -4,8 +4,9 @@ import pytest
 
 from src.application.halt_instrument import HaltInstrumentCommand, HaltInstrumentHandler
 from src.domain.entities.instrument import Instrument
+from src.domain.events.instrument_events import InstrumentHalted
 from src.domain.value_objects.instrument_status import InstrumentStatus
-from src.exceptions import InvalidInstrumentStateError
+from src.exceptions import InvalidInstrumentStateError, MessagingPublishError
 
 
 async def test_halts_active_instrument(
@@ -56,3 +57,44 @@ async def test_raises_when_already_halted(
         await HaltInstrumentHandler(mock_uow).handle(
             HaltInstrumentCommand(instrument_id=sample_instrument.id.value)
         )
+
+
+async def test_publishes_halted_after_commit(
+    mock_uow: AsyncMock,
+    mock_instrument_repository: AsyncMock,
+    mock_event_publisher: AsyncMock,
+    sample_instrument: Instrument,
+) -> None:
+    sample_instrument.activate()
+    sample_instrument.clear_changes()
+    mock_instrument_repository.get_by_id.return_value = sample_instrument
+
+    await HaltInstrumentHandler(mock_uow, mock_event_publisher).handle(
+        HaltInstrumentCommand(instrument_id=sample_instrument.id.value)
+    )
+
+    mock_uow.commit.assert_awaited_once()
+    event = mock_event_publisher.publish.await_args.args[0]
+    assert isinstance(event, InstrumentHalted)
+    assert event.instrument_id == sample_instrument.id.value
+    assert event.symbol == "AAPL"
+    assert event.status == "HALTED"
+
+
+async def test_publish_failure_after_commit_is_not_raised(
+    mock_uow: AsyncMock,
+    mock_instrument_repository: AsyncMock,
+    mock_event_publisher: AsyncMock,
+    sample_instrument: Instrument,
+) -> None:
+    sample_instrument.activate()
+    sample_instrument.clear_changes()
+    mock_instrument_repository.get_by_id.return_value = sample_instrument
+    mock_event_publisher.publish.side_effect = MessagingPublishError("nack")
+
+    await HaltInstrumentHandler(mock_uow, mock_event_publisher).handle(
+        HaltInstrumentCommand(instrument_id=sample_instrument.id.value)
+    )
+
+    mock_uow.commit.assert_awaited_once()
+    assert sample_instrument.status == InstrumentStatus.HALTED
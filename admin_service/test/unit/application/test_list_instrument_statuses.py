@@ -0,0 +1,22 @@
+from unittest.mock import AsyncMock
+
+from src.application.DTOs.instrument import InstrumentStatusDTO
+from src.application.list_instrument_statuses import ListInstrumentStatusesHandler
+from src.domain.value_objects.instrument_status import InstrumentStatus
+
+
+async def test_returns_statuses_ordered_by_id(
+    mock_uow: AsyncMock,
+    mock_instrument_repository: AsyncMock,
+) -> None:
+    mock_instrument_repository.list_statuses.return_value = {
+        "b": InstrumentStatus.HALTED,
+        "a": InstrumentStatus.ACTIVE,
+    }
+
+    result = await ListInstrumentStatusesHandler(mock_uow).handle()
+
+    assert result == [
+        InstrumentStatusDTO(instrument_id="a", status="ACTIVE"),
+        InstrumentStatusDTO(instrument_id="b", status="HALTED"),
+    ]
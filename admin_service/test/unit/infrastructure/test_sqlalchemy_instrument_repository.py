@@ -93,6 +93,23 @@ async def test_list_all_empty(
     assert await repository.list_all() == []
 
 
+async def test_list_statuses(
+    repository: SQLAlchemyInstrumentRepository,
+    session: AsyncSession,
+    sample_instrument: Instrument,
+    other_instrument: Instrument,
+) -> None:
+    sample_instrument.activate()
+    await repository.add(sample_instrument)
+    await repository.add(other_instrument)
+    await session.commit()
+
+    assert await repository.list_statuses() == {
+        sample_instrument.id.value: InstrumentStatus.ACTIVE,
+        other_instrument.id.value: InstrumentStatus.PENDING,
+    }
+
+
 async def test_update_status_change(
     repository: SQLAlchemyInstrumentRepository,
     session: AsyncSession,
@@ -0,0 +1,154 @@
+import math
+from collections.abc import Iterable, Mapping
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from src.domain.entities.candle import CANDLE_INTERVALS, Candle
+
+
+class _Bar:
+    """Mutable open bar; turned into a ``Candle`` only when published."""
+
+    __slots__ = (
+        "open_ts",
+        "open",
+        "high",
+        "low",
+        "close",
+        "volume",
+        "notional",
+        "count",
+        "currency",
+    )
+
+    def __init__(self, open_ts: int, price: Decimal, currency: str) -> None:
+        self.open_ts = open_ts
+        self.open = self.high = self.low = self.close = price
+        self.volume = 0
+        self.notional = Decimal(0)
+        self.count = 0
+        self.currency = currency
+
+    def add(self, price: Decimal, quantity: int) -> None:
+        if price > self.high:
+            self.high = price
+        elif price < self.low:
+            self.low = price
+        self.close = price
+        self.volume += quantity
+        self.notional += price * quantity
+        self.count += 1
+
+    def to_candle(self, instrument_id: str, interval: str) -> Candle:
+        return Candle(
+            instrument_id=instrument_id,
+            interval=interval,
+            open_time=datetime.fromtimestamp(self.open_ts, timezone.utc),
+            open=self.open,
+            high=self.high,
+            low=self.low,
+            close=self.close,
+            volume=self.volume,
+            notional=self.notional,
+            trade_count=self.count,
+            currency=self.currency,
+        )
+
+    @classmethod
+    def from_candle(cls, candle: Candle) -> "_Bar":
+        bar = cls(int(candle.open_time.timestamp()), candle.open, candle.currency)
+        bar.high = candle.high
+        bar.low = candle.low
+        bar.close = candle.close
+        bar.volume = candle.volume
+        bar.notional = candle.notional
+        bar.count = candle.trade_count
+        return bar
+
+
+class CandleAggregator:
+    """Folds trades into one open bar per (instrument, interval).
+
+    A bar is finalized when a trade lands in a later window or when
+    ``expire`` passes its end, whichever comes first. Trades for a window
+    that has already been finalized are counted in ``late`` and left out of
+    that interval, so a persisted bar is never rewritten with partial data.
+    Bars carry running notional, so VWAP costs nothing extra per trade.
+    """
+
+    def __init__(self, intervals: Mapping[str, int] = CANDLE_INTERVALS) -> None:
+        self._intervals = tuple(intervals.items())
+        self._seconds = dict(intervals)
+        self._open: dict[tuple[str, str], _Bar] = {}
+        self._closed_until: dict[tuple[str, str], int] = {}
+        self._dirty: set[tuple[str, str]] = set()
+        self._finalized: list[Candle] = []
+        self.late = 0
+
+    def add_trade(
+        self,
+        instrument_id: str,
+        price: Decimal,
+        quantity: int,
+        currency: str,
+        executed_at: datetime,
+    ) -> None:
+        ts = math.floor(executed_at.timestamp())
+        late = False
+        for interval, seconds in self._intervals:
+            key = (instrument_id, interval)
+            open_ts = ts - ts % seconds
+            if open_ts < self._closed_until.get(key, 0):
+                late = True
+                continue
+            bar = self._open.get(key)
+            if bar is not None and bar.open_ts != open_ts:
+                self._finalize(key, bar)
+                bar = None
+            if bar is None:
+                bar = self._open[key] = _Bar(open_ts, price, currency)
+            bar.add(price, quantity)
+            self._dirty.add(key)
+        if late:
+            self.late += 1
+
+    def expire(self, now: datetime) -> None:
+        """Finalize every open bar whose window ended at or before ``now``."""
+        ts = now.timestamp()
+        expired = [
+            (key, bar)
+            for key, bar in self._open.items()
+            if bar.open_ts + self._seconds[key[1]] <= ts
+        ]
+        for key, bar in expired:
+            self._finalize(key, bar)
+
+    def drain(self) -> tuple[list[Candle], list[Candle]]:
+        """Return ``(open bars changed, bars finalized)`` since the last drain."""
+        open_bars = [
+            self._open[key].to_candle(*key) for key in self._dirty if key in self._open
+        ]
+        finalized = self._finalized
+        self._dirty = set()
+        self._finalized = []
+        return open_bars, finalized
+
+    def open_bars(self, instrument_id: str) -> list[Candle]:
+        return [
+            self._open[key].to_candle(*key)
+            for key in ((instrument_id, interval) for interval, _ in self._intervals)
+            if key in self._open
+        ]
+
+    def restore(self, candles: Iterable[Candle]) -> None:
+        """Resume open bars (e.g. from the cache) that have seen no trade yet."""
+        for candle in candles:
+            key = (candle.instrument_id, candle.interval)
+            if candle.interval in self._seconds and key not in self._open:
+                self._open[key] = _Bar.from_candle(candle)
+
+    def _finalize(self, key: tuple[str, str], bar: _Bar) -> None:
+        del self._open[key]
+        self._dirty.discard(key)
+        self._closed_until[key] = bar.open_ts + self._seconds[key[1]]
+        self._finalized.append(bar.to_candle(*key))
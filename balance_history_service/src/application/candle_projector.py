@@ -0,0 +1,119 @@
+import asyncio
+import logging
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+
+from src.application.candle_aggregator import CandleAggregator
+from src.application.record_trade import RecordTradeCommand
+from src.domain.entities.candle import Candle
+from src.domain.ports.candle_cache import CandleCache
+from src.domain.ports.unit_of_work import UnitOfWork
+
+logger = logging.getLogger(__name__)
+
+
+class CandleProjector:
+    """Turns recorded trades into candles and writes them out in batches.
+
+    Trades are folded in memory as they are recorded. Every
+    ``flush_interval`` seconds the bars whose window ended more than
+    ``finalize_grace`` ago are finalized, the changed bars are published to
+    the cache in one round trip and finalized bars are saved with one bulk
+    insert per ``batch_size``. Writes that fail are kept and retried on the
+    next flush.
+    """
+
+    def __init__(
+        self,
+        aggregator: CandleAggregator,
+        cache: CandleCache,
+        uow_factory: Callable[[], UnitOfWork],
+        flush_interval: float = 0.25,
+        finalize_grace: float = 2.0,
+        batch_size: int = 500,
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ) -> None:
+        self._aggregator = aggregator
+        self._cache = cache
+        self._uow_factory = uow_factory
+        self._flush_interval = flush_interval
+        self._grace = timedelta(seconds=finalize_grace)
+        self._batch_size = batch_size
+        self._clock = clock
+        self._open: dict[tuple[str, str], Candle] = {}
+        self._unpublished: list[Candle] = []
+        self._unsaved: list[Candle] = []
+        self._task: asyncio.Task | None = None
+        self.saved = 0
+
+    def on_trade(self, command: RecordTradeCommand) -> None:
+        self._aggregator.add_trade(
+            command.instrument_id,
+            command.execution_price,
+            command.quantity,
+            command.execution_price_currency,
+            command.executed_at or self._clock(),
+        )
+
+    async def start(self) -> None:
+        try:
+            self._aggregator.restore(await self._cache.load_open_bars())
+        except Exception:
+            logger.exception("Could not restore open candles; starting empty")
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await self.flush()
+
+    async def flush(self) -> None:
+        self._aggregator.expire(self._clock() - self._grace)
+        open_bars, finalized = self._aggregator.drain()
+        for candle in open_bars:
+            self._open[(candle.instrument_id, candle.interval)] = candle
+        for candle in finalized:
+            key = (candle.instrument_id, candle.interval)
+            pending = self._open.get(key)
+            if pending is not None and pending.open_time == candle.open_time:
+                del self._open[key]
+        self._unpublished.extend(finalized)
+        self._unsaved.extend(finalized)
+        await self._publish()
+        await self._save()
+
+    @property
+    def pending(self) -> int:
+        return len(self._unsaved)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._flush_interval)
+            await self.flush()
+
+    async def _publish(self) -> None:
+        if not self._open and not self._unpublished:
+            return
+        try:
+            await self._cache.publish(list(self._open.values()), self._unpublished)
+        except Exception:
+            logger.exception("Failed to publish candles; will retry")
+            return
+        self._open = {}
+        self._unpublished = []
+
+    async def _save(self) -> None:
+        while self._unsaved:
+            batch = self._unsaved[: self._batch_size]
+            try:
+                async with self._uow_factory() as uow:
+                    await uow.candles.add_many(batch)
+                    await uow.commit()
+            except Exception:
+                logger.exception("Failed to save %s candles; will retry", len(batch))
+                return
+            del self._unsaved[: len(batch)]
+            self.saved += len(batch)
@@ -0,0 +1,65 @@
+from collections.abc import Sequence
+from decimal import Decimal
+
+from src.domain.entities.position import AMOUNT_PLACES, Position
+from src.domain.entities.trade_record import TradeRecord
+from src.domain.ports.unit_of_work import UnitOfWork
+
+PositionKey = tuple[str, str]
+
+
+class PositionUpdater:
+    """Folds recorded trades into per-(trader, instrument) positions.
+
+    Each trade is a buy of ``quantity`` for the buyer and a sell for the
+    seller, each charged ``fee_rate`` of the notional. ``apply`` runs inside
+    the caller's unit of work, so positions commit with the trades: it
+    inserts empty rows for keys not stored yet, locks the affected rows,
+    folds the trades in order and writes the results back with one upsert.
+    Without the empty rows, two writers could both find a new key missing
+    and the second upsert would drop the first one's trade.
+    """
+
+    def __init__(self, fee_rate: Decimal = Decimal("0")) -> None:
+        self._fee_rate = fee_rate
+
+    async def apply(self, uow: UnitOfWork, trades: Sequence[TradeRecord]) -> None:
+        if not trades:
+            return
+        blanks = {
+            (trader_id, trade.instrument_id): Position(
+                trader_id=trader_id,
+                instrument_id=trade.instrument_id,
+                currency=trade.execution_price_currency,
+            )
+            for trade in trades
+            for trader_id in (trade.buyer_id, trade.seller_id)
+        }
+        keys = sorted(blanks)
+        await uow.positions.insert_missing([blanks[key] for key in keys])
+        positions = await uow.positions.get_many(keys, for_update=True)
+        for trade in trades:
+            self.fold(positions, trade)
+        await uow.positions.upsert_many([positions[key] for key in keys])
+
+    def fold(self, positions: dict[PositionKey, Position], trade: TradeRecord) -> None:
+        fee = (trade.execution_price * trade.quantity * self._fee_rate).quantize(
+            AMOUNT_PLACES
+        )
+        for trader_id, quantity in (
+            (trade.buyer_id, trade.quantity),
+            (trade.seller_id, -trade.quantity),
+        ):
+            key = (trader_id, trade.instrument_id)
+            position = positions.get(key) or Position(
+                trader_id=trader_id,
+                instrument_id=trade.instrument_id,
+                currency=trade.execution_price_currency,
+            )
+            positions[key] = position.apply_fill(
+                quantity,
+                trade.execution_price,
+                fee,
+                trade.trade_id,
+                trade.executed_at,
+            )
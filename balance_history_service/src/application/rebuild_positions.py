@@ -0,0 +1,81 @@
+import asyncio
+import logging
+from collections.abc import Callable
+
+from src.application.position_updater import PositionKey, PositionUpdater
+from src.domain.entities.position import Position
+from src.domain.entities.trade_page import ReplayCursor
+from src.domain.ports.unit_of_work import UnitOfWork
+
+logger = logging.getLogger(__name__)
+
+
+class RebuildPositionsHandler:
+    """Recompute every position from the recorded trades.
+
+    Positions of different instruments are independent, so instruments are
+    replayed concurrently, ``workers`` at a time, each on its own unit of
+    work: trades are read in execution order (time, then engine sequence
+    number) in chunks of ``chunk_size`` (keyset on the instrument/time
+    index), folded in memory and the instrument's
+    positions written with one upsert per ``chunk_size``. Stored positions
+    are overwritten, not deleted first. Run it with the consumer stopped;
+    trades already archived out of the database are not replayed.
+    """
+
+    def __init__(
+        self,
+        uow_factory: Callable[[], UnitOfWork],
+        updater: PositionUpdater,
+        workers: int = 4,
+        chunk_size: int = 5000,
+    ) -> None:
+        self._uow_factory = uow_factory
+        self._updater = updater
+        self._workers = workers
+        self._chunk_size = chunk_size
+
+    async def handle(self) -> int:
+        """Return the number of positions written."""
+        async with self._uow_factory() as uow:
+            instruments = await uow.trades.list_instruments()
+        semaphore = asyncio.Semaphore(self._workers)
+
+        async def replay(instrument_id: str) -> int:
+            async with semaphore:
+                return await self._replay(instrument_id)
+
+        counts = await asyncio.gather(*(replay(i) for i in instruments))
+        logger.info(
+            "Rebuilt %s positions across %s instruments", sum(counts), len(instruments)
+        )
+        return sum(counts)
+
+    async def _replay(self, instrument_id: str) -> int:
+        positions: dict[PositionKey, Position] = {}
+        cursor: ReplayCursor | None = None
+        trades = 0
+        while True:
+            async with self._uow_factory() as uow:
+                chunk = await uow.trades.list_after(
+                    instrument_id, cursor, self._chunk_size
+                )
+            for trade in chunk:
+                self._updater.fold(positions, trade)
+            trades += len(chunk)
+            if len(chunk) < self._chunk_size:
+                break
+            cursor = ReplayCursor.after(chunk[-1])
+
+        rows = list(positions.values())
+        async with self._uow_factory() as uow:
+            for start in range(0, len(rows), self._chunk_size):
+                await uow.positions.upsert_many(rows[start : start + self._chunk_size])
+            await uow.commit()
+        logger.info(
+            "Replayed %s trades into %s positions instrument=%s",
+            trades,
+            len(rows),
+            instrument_id,
+        )
+        return len(rows)
@@ -0,0 +1,66 @@
+import logging
+from dataclasses import dataclass, field
+
+from src.application.position_updater import PositionUpdater
+from src.application.record_order_event import (
+    RecordOrderEventCommand,
+    entry_from_command,
+)
+from src.application.record_trade import RecordTradeCommand, trade_from_command
+from src.domain.ports.unit_of_work import UnitOfWork
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class RecordHistoryBatchCommand:
+    trades: tuple[RecordTradeCommand, ...] = field(default_factory=tuple)
+    order_events: tuple[RecordOrderEventCommand, ...] = field(default_factory=tuple)
+
+
+class RecordHistoryBatchHandler:
+    """Project a batch of trade and order events in one transaction.
+
+    Trades go in with one ``INSERT ... ON CONFLICT DO NOTHING``, so a trade
+    already recorded (a redelivery) is skipped rather than failing the
+    batch, as ``RecordTradeHandler`` skips it with ``DuplicateTradeError``.
+    Returns the commands of the trades that were newly recorded, in order.
+    With a ``positions`` updater, those trades also move positions in the
+    same transaction.
+    """
+
+    def __init__(
+        self, uow: UnitOfWork, positions: PositionUpdater | None = None
+    ) -> None:
+        self._uow = uow
+        self._positions = positions
+
+    async def handle(
+        self, command: RecordHistoryBatchCommand
+    ) -> list[RecordTradeCommand]:
+        # A trade redelivered within the batch counts once.
+        trades: dict[str, RecordTradeCommand] = {}
+        for trade in command.trades:
+            trades.setdefault(trade.trade_id, trade)
+        records = [trade_from_command(t) for t in trades.values()]
+        async with self._uow:
+            inserted = await self._uow.trades.add_many(records)
+            await self._uow.order_history.add_many(
+                [entry_from_command(e) for e in command.order_events]
+            )
+            if self._positions is not None:
+                await self._positions.apply(
+                    self._uow, [r for r in records if r.trade_id in inserted]
+                )
+            await self._uow.commit()
+
+        recorded = [t for trade_id, t in trades.items() if trade_id in inserted]
+        skipped = len(command.trades) - len(recorded)
+        if skipped:
+            logger.info("Skipped %s duplicate trades in batch", skipped)
+        logger.info(
+            "History batch recorded: trades=%s order_events=%s",
+            len(recorded),
+            len(command.order_events),
+        )
+        return recorded
@@ -27,6 +27,25 @@ class RecordOrderEventCommand:
     occurred_at: datetime | None = None
 
 
+def entry_from_command(command: RecordOrderEventCommand) -> OrderHistoryEntry:
+    return OrderHistoryEntry(
+        entry_id=str(uuid.uuid4()),
+        order_id=command.order_id,
+        trader_id=command.trader_id,
+        instrument_id=command.instrument_id,
+        event_type=command.event_type,
+        side=command.side,
+        order_type=command.order_type,
+        quantity=command.quantity,
+        filled_quantity=command.filled_quantity,
+        remaining_quantity=command.remaining_quantity,
+        price=command.price,
+        price_currency=command.price_currency,
+        status=command.status,
+        occurred_at=command.occurred_at or datetime.now(timezone.utc),
+    )
+
+
 class RecordOrderEventHandler:
     """Append an order lifecycle event to order history."""
 
@@ -39,22 +58,7 @@ class RecordOrderEventHandler:
             command.order_id,
             command.event_type,
         )
-        entry = OrderHistoryEntry(
-            entry_id=str(uuid.uuid4()),
-            order_id=command.order_id,
-            trader_id=command.trader_id,
-            instrument_id=command.instrument_id,
-            event_type=command.event_type,
-            side=command.side,
-            order_type=command.order_type,
-            quantity=command.quantity,
-            filled_quantity=command.filled_quantity,
-            remaining_quantity=command.remaining_quantity,
-            price=command.price,
-            price_currency=command.price_currency,
-            status=command.status,
-            occurred_at=command.occurred_at or datetime.now(timezone.utc),
-        )
+        entry = entry_from_command(command)
         async with self._uow:
             await self._uow.order_history.add(entry)
             await self._uow.commit()
@@ -3,6 +3,7 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from decimal import Decimal
 
+from src.application.position_updater import PositionUpdater
 from src.domain.entities.trade_record import TradeRecord
 from src.domain.ports.unit_of_work import UnitOfWork
 from src.exceptions import DuplicateTradeError
@@ -25,11 +26,30 @@ class RecordTradeCommand:
     executed_at: datetime | None = None
 
 
+def trade_from_command(command: RecordTradeCommand) -> TradeRecord:
+    return TradeRecord(
+        trade_id=command.trade_id,
+        maker_order_id=command.maker_order_id,
+        taker_order_id=command.taker_order_id,
+        buyer_id=command.buyer_id,
+        seller_id=command.seller_id,
+        instrument_id=command.instrument_id,
+        quantity=command.quantity,
+        execution_price=command.execution_price,
+        execution_price_currency=command.execution_price_currency,
+        sequence_number=command.sequence_number,
+        executed_at=command.executed_at or datetime.now(timezone.utc),
+    )
+
+
 class RecordTradeHandler:
     """Project a TradeExecuted event into the trade history store."""
 
-    def __init__(self, uow: UnitOfWork) -> None:
+    def __init__(
+        self, uow: UnitOfWork, positions: PositionUpdater | None = None
+    ) -> None:
         self._uow = uow
+        self._positions = positions
 
     async def handle(self, command: RecordTradeCommand) -> None:
         logger.info(
@@ -43,19 +63,9 @@ class RecordTradeHandler:
                 raise DuplicateTradeError(
                     f"Trade '{command.trade_id}' already recorded."
                 )
-            trade = TradeRecord(
-                trade_id=command.trade_id,
-                maker_order_id=command.maker_order_id,
-                taker_order_id=command.taker_order_id,
-                buyer_id=command.buyer_id,
-                seller_id=command.seller_id,
-                instrument_id=command.instrument_id,
-                quantity=command.quantity,
-                execution_price=command.execution_price,
-                execution_price_currency=command.execution_price_currency,
-                sequence_number=command.sequence_number,
-                executed_at=command.executed_at or datetime.now(timezone.utc),
-            )
+            trade = trade_from_command(command)
             await self._uow.trades.add(trade)
+            if self._positions is not None:
+                await self._positions.apply(self._uow, [trade])
             await self._uow.commit()
         logger.info("Trade recorded: trade_id=%s", command.trade_id)
@@ -0,0 +1,200 @@
+import math
+from collections import deque
+from collections.abc import Hashable
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from src.domain.entities.ticker import Ticker
+
+
+class TimerWheel:
+    """Hashed timer wheel over integer ticks.
+
+    ``schedule`` is O(1); ``advance`` visits each elapsed slot once (at most
+    ``size`` slots however long the gap) and returns the items now due.
+    Items due more than one revolution ahead stay in their slot until a
+    later pass.
+    """
+
+    def __init__(self, size: int) -> None:
+        self._slots: list[list[tuple[int, Hashable]]] = [[] for _ in range(size)]
+        self._size = size
+        self._tick: int | None = None
+
+    def schedule(self, deadline: int, item: Hashable) -> None:
+        self._slots[deadline % self._size].append((deadline, item))
+
+    def advance(self, tick: int) -> list[Hashable]:
+        if self._tick is None:
+            self._tick = tick - self._size
+        if tick <= self._tick:
+            return []
+        due: list[Hashable] = []
+        first = max(self._tick + 1, tick - self._size + 1)
+        for current in range(first, tick + 1):
+            slot = self._slots[current % self._size]
+            if not slot:
+                continue
+            keep = [entry for entry in slot if entry[0] > tick]
+            due.extend(item for deadline, item in slot if deadline <= tick)
+            self._slots[current % self._size] = keep
+        self._tick = tick
+        return due
+
+
+class _Bucket:
+    __slots__ = ("tick", "open", "volume", "notional", "count")
+
+    def __init__(self, tick: int, price: Decimal) -> None:
+        self.tick = tick
+        self.open = price
+        self.volume = 0
+        self.notional = Decimal(0)
+        self.count = 0
+
+
+class _Window:
+    """Per-instrument ring of non-empty buckets plus running totals.
+
+    High and low come from monotonic deques of ``(tick, price)``, so both
+    updates and expiry are O(1) amortized per trade.
+    """
+
+    __slots__ = (
+        "buckets",
+        "highs",
+        "lows",
+        "volume",
+        "notional",
+        "count",
+        "last",
+        "currency",
+    )
+
+    def __init__(self, currency: str) -> None:
+        self.buckets: deque[_Bucket] = deque()
+        self.highs: deque[tuple[int, Decimal]] = deque()
+        self.lows: deque[tuple[int, Decimal]] = deque()
+        self.volume = 0
+        self.notional = Decimal(0)
+        self.count = 0
+        self.last = Decimal(0)
+        self.currency = currency
+
+    def add(self, tick: int, price: Decimal, quantity: int) -> bool:
+        """Add a trade; return ``True`` if it opened a new bucket.
+
+        A trade older than the newest bucket is counted in that bucket.
+        """
+        new = not self.buckets or tick > self.buckets[-1].tick
+        if new:
+            self.buckets.append(_Bucket(tick, price))
+        bucket = self.buckets[-1]
+        bucket.volume += quantity
+        bucket.notional += price * quantity
+        bucket.count += 1
+        while self.highs and self.highs[-1][1] <= price:
+            self.highs.pop()
+        self.highs.append((bucket.tick, price))
+        while self.lows and self.lows[-1][1] >= price:
+            self.lows.pop()
+        self.lows.append((bucket.tick, price))
+        self.volume += quantity
+        self.notional += price * quantity
+        self.count += 1
+        self.last = price
+        return new
+
+    def expire(self, cutoff: int) -> None:
+        """Drop buckets with ``tick <= cutoff``."""
+        while self.buckets and self.buckets[0].tick <= cutoff:
+            bucket = self.buckets.popleft()
+            self.volume -= bucket.volume
+            self.notional -= bucket.notional
+            self.count -= bucket.count
+        while self.highs and self.highs[0][0] <= cutoff:
+            self.highs.popleft()
+        while self.lows and self.lows[0][0] <= cutoff:
+            self.lows.popleft()
+
+
+class TickerEngine:
+    """Sliding-window ticker per instrument, O(1) amortized per trade.
+
+    Trades are bucketed into ``bucket_seconds`` slots of their execution
+    time. Each new bucket schedules its own expiry on a timer wheel, so
+    ``advance`` touches only instruments with a bucket leaving the window
+    instead of scanning them all. Totals are exact Decimal sums; adding a
+    bucket's figures on entry and subtracting them on expiry never drifts.
+    """
+
+    def __init__(self, window_seconds: int = 86_400, bucket_seconds: int = 60) -> None:
+        self._window_seconds = window_seconds
+        self._bucket_seconds = bucket_seconds
+        self._ticks = window_seconds // bucket_seconds
+        self._wheel = TimerWheel(self._ticks + 1)
+        self._windows: dict[str, _Window] = {}
+        self._dirty: set[str] = set()
+        self._now_tick: int | None = None
+        self.stale = 0
+
+    def add_trade(
+        self,
+        instrument_id: str,
+        price: Decimal,
+        quantity: int,
+        currency: str,
+        executed_at: datetime,
+    ) -> None:
+        tick = math.floor(executed_at.timestamp()) // self._bucket_seconds
+        if self._now_tick is not None and tick <= self._now_tick - self._ticks:
+            self.stale += 1
+            return
+        window = self._windows.get(instrument_id)
+        if window is None:
+            window = self._windows[instrument_id] = _Window(currency)
+        if window.add(tick, price, quantity):
+            self._wheel.schedule(tick + self._ticks, instrument_id)
+        self._dirty.add(instrument_id)
+
+    def advance(self, now: datetime) -> None:
+        """Expire buckets that have left the window as of ``now``."""
+        tick = math.floor(now.timestamp()) // self._bucket_seconds
+        if self._now_tick is not None and tick <= self._now_tick:
+            return
+        self._now_tick = tick
+        cutoff = tick - self._ticks
+        for instrument_id in self._wheel.advance(tick):
+            self._windows[instrument_id].expire(cutoff)
+            self._dirty.add(instrument_id)
+
+    def ticker(self, instrument_id: str, now: datetime | None = None) -> Ticker | None:
+        window = self._windows.get(instrument_id)
+        if window is None:
+            return None
+        return self._to_ticker(instrument_id, window, now or datetime.now(timezone.utc))
+
+    def drain(self, now: datetime | None = None) -> list[Ticker]:
+        """Tickers changed since the last drain."""
+        now = now or datetime.now(timezone.utc)
+        tickers = [
+            self._to_ticker(instrument_id, self._windows[instrument_id], now)
+            for instrument_id in self._dirty
+        ]
+        self._dirty = set()
+        return tickers
+
+    def _to_ticker(self, instrument_id: str, window: _Window, now: datetime) -> Ticker:
+        return Ticker(
+            instrument_id=instrument_id,
+            window_seconds=self._window_seconds,
+            last_price=window.last,
+            open_price=window.buckets[0].open if window.buckets else None,
+            high=window.highs[0][1] if window.highs else None,
+            low=window.lows[0][1] if window.lows else None,
+            volume=window.volume,
+            notional=window.notional,
+            trade_count=window.count,
+            currency=window.currency,
+            updated_at=now,
+        )
@@ -0,0 +1,101 @@
+import asyncio
+import logging
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+
+from src.application.record_trade import RecordTradeCommand
+from src.application.ticker_engine import TickerEngine
+from src.domain.entities.ticker import Ticker
+from src.domain.ports.ticker_cache import TickerCache
+from src.domain.ports.unit_of_work import UnitOfWork
+
+logger = logging.getLogger(__name__)
+
+
+class TickerPublisher:
+    """Feeds recorded trades to a ``TickerEngine`` and publishes its tickers.
+
+    On start the window is rebuilt from the trades recorded in the last
+    ``window_seconds``. Every ``flush_interval`` seconds the engine's timer
+    wheel is advanced and the tickers that changed are published in one
+    write; a failed write is retried on the next flush.
+    """
+
+    def __init__(
+        self,
+        engine: TickerEngine,
+        cache: TickerCache,
+        uow_factory: Callable[[], UnitOfWork],
+        window_seconds: int = 86_400,
+        flush_interval: float = 0.5,
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ) -> None:
+        self._engine = engine
+        self._cache = cache
+        self._uow_factory = uow_factory
+        self._window = timedelta(seconds=window_seconds)
+        self._flush_interval = flush_interval
+        self._clock = clock
+        self._unpublished: dict[str, Ticker] = {}
+        self._task: asyncio.Task | None = None
+
+    def on_trade(self, command: RecordTradeCommand) -> None:
+        self._engine.add_trade(
+            command.instrument_id,
+            command.execution_price,
+            command.quantity,
+            command.execution_price_currency,
+            command.executed_at or self._clock(),
+        )
+
+    async def start(self) -> None:
+        await self._warm_up()
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await self.flush()
+
+    async def flush(self) -> None:
+        now = self._clock()
+        self._engine.advance(now)
+        for ticker in self._engine.drain(now):
+            self._unpublished[ticker.instrument_id] = ticker
+        if not self._unpublished:
+            return
+        try:
+            await self._cache.publish(list(self._unpublished.values()))
+        except Exception:
+            logger.exception("Failed to publish tickers; will retry")
+            return
+        self._unpublished = {}
+
+    async def _warm_up(self) -> None:
+        since = self._clock() - self._window
+        try:
+            async with self._uow_factory() as uow:
+                trades = await uow.trades.list_since(since)
+        except Exception:
+            logger.exception("Could not rebuild tickers; starting empty")
+            return
+        for trade in trades:
+            executed_at = trade.executed_at
+            if executed_at.tzinfo is None:
+                executed_at = executed_at.replace(tzinfo=timezone.utc)
+            self._engine.add_trade(
+                trade.instrument_id,
+                trade.execution_price,
+                trade.quantity,
+                trade.execution_price_currency,
+                executed_at,
+            )
+        logger.info("Rebuilt tickers from %s trades", len(trades))
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._flush_interval)
+            await self.flush()
@@ -41,3 +41,69 @@ class Config:
         "RABBITMQ_HISTORY_QUEUE",
         "balance_history.events",
     )
+
+    # Write history events in batches: one transaction per HISTORY_BATCH_SIZE
+    # messages or HISTORY_BATCH_MAX_WAIT_MS, whichever comes first.
+    HISTORY_BATCH_ENABLED: bool = os.getenv(
+        "HISTORY_BATCH_ENABLED", "true"
+    ).lower() in (
+        "1",
+        "true",
+        "yes",
+    )
+    HISTORY_BATCH_SIZE: int = int(os.getenv("HISTORY_BATCH_SIZE", "200"))
+    HISTORY_BATCH_MAX_WAIT_MS: int = int(os.getenv("HISTORY_BATCH_MAX_WAIT_MS", "50"))
+
+    # Monthly partitions of trades / order_history (PostgreSQL). Months older
+    # than HISTORY_RETENTION_MONTHS are archived to HISTORY_ARCHIVE_DIR as
+    # gzipped CSV and dropped; 0 keeps everything.
+    HISTORY_PARTITION_PREMAKE_MONTHS: int = int(
+        os.getenv("HISTORY_PARTITION_PREMAKE_MONTHS", "2")
+    )
+    HISTORY_RETENTION_MONTHS: int = int(os.getenv("HISTORY_RETENTION_MONTHS", "0"))
+    HISTORY_ARCHIVE_DIR: str = os.getenv("HISTORY_ARCHIVE_DIR", "archive")
+    HISTORY_PARTITION_MAINTENANCE_INTERVAL_SECONDS: int = int(
+        os.getenv("HISTORY_PARTITION_MAINTENANCE_INTERVAL_SECONDS", "3600")
+    )
+
+    # Per-(trader, instrument) positions updated with every recorded trade.
+    # No fees arrive with TradeExecuted; POSITION_FEE_BPS charges both sides.
+    POSITIONS_ENABLED: bool = os.getenv("POSITIONS_ENABLED", "true").lower() in (
+        "1",
+        "true",
+        "yes",
+    )
+    POSITION_FEE_BPS: str = os.getenv("POSITION_FEE_BPS", "0")
+    POSITION_REBUILD_WORKERS: int = int(os.getenv("POSITION_REBUILD_WORKERS", "4"))
+    POSITION_REBUILD_CHUNK_SIZE: int = int(
+        os.getenv("POSITION_REBUILD_CHUNK_SIZE", "5000")
+    )
+
+    REDIS_ENABLED: bool = os.getenv("REDIS_ENABLED", "false").lower() in (
+        "1",
+        "true",
+        "yes",
+    )
+    REDIS_URL: str = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+    # OHLCV candles from TradeExecuted (published to Redis, needs REDIS_ENABLED).
+    CANDLES_ENABLED: bool = os.getenv("CANDLES_ENABLED", "true").lower() in (
+        "1",
+        "true",
+        "yes",
+    )
+    CANDLE_FLUSH_INTERVAL_MS: int = int(os.getenv("CANDLE_FLUSH_INTERVAL_MS", "250"))
+    CANDLE_FINALIZE_GRACE_MS: int = int(os.getenv("CANDLE_FINALIZE_GRACE_MS", "2000"))
+    CANDLE_PERSIST_BATCH_SIZE: int = int(os.getenv("CANDLE_PERSIST_BATCH_SIZE", "500"))
+    # Finalized bars kept in Redis per (instrument, interval).
+    CANDLE_HISTORY_LIMIT: int = int(os.getenv("CANDLE_HISTORY_LIMIT", "1000"))
+
+    # Rolling ticker from TradeExecuted (published to Redis, needs REDIS_ENABLED).
+    TICKERS_ENABLED: bool = os.getenv("TICKERS_ENABLED", "true").lower() in (
+        "1",
+        "true",
+        "yes",
+    )
+    TICKER_WINDOW_SECONDS: int = int(os.getenv("TICKER_WINDOW_SECONDS", "86400"))
+    TICKER_BUCKET_SECONDS: int = int(os.getenv("TICKER_BUCKET_SECONDS", "60"))
+    TICKER_FLUSH_INTERVAL_MS: int = int(os.getenv("TICKER_FLUSH_INTERVAL_MS", "500"))
@@ -0,0 +1,36 @@
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+
+CANDLE_INTERVALS: dict[str, int] = {
+    "1s": 1,
+    "1m": 60,
+    "5m": 300,
+    "1h": 3600,
+    "1d": 86400,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class Candle:
+    """OHLCV bar for one instrument over ``[open_time, open_time + interval)``.
+
+    ``notional`` is the sum of price * quantity, so ``vwap`` stays exact and
+    bars can be merged without re-reading trades.
+    """
+
+    instrument_id: str
+    interval: str
+    open_time: datetime
+    open: Decimal
+    high: Decimal
+    low: Decimal
+    close: Decimal
+    volume: int
+    notional: Decimal
+    trade_count: int
+    currency: str
+
+    @property
+    def vwap(self) -> Decimal:
+        return self.notional / self.volume if self.volume else self.close
@@ -0,0 +1,68 @@
+from dataclasses import dataclass, replace
+from datetime import datetime
+from decimal import Decimal
+
+# Average cost, P&L and fees are kept to this precision, so a position
+# folded trade by trade equals the one stored and reloaded between trades.
+AMOUNT_PLACES = Decimal("0.00000001")
+_ZERO = Decimal("0")
+
+
+@dataclass(frozen=True, slots=True)
+class Position:
+    """One trader's net position and P&L in one instrument.
+
+    Uses the average cost method: buys that add to a long (or sells that add
+    to a short) move ``average_cost``; fills against the position realize
+    ``(price - average_cost) * closed quantity`` with the position's sign. A
+    fill larger than the position flips it, opening the rest at the fill
+    price. ``turnover`` is the traded notional, ``fees`` are kept apart
+    from ``realized_pnl``.
+    """
+
+    trader_id: str
+    instrument_id: str
+    currency: str
+    net_quantity: int = 0
+    average_cost: Decimal = _ZERO
+    realized_pnl: Decimal = _ZERO
+    fees: Decimal = _ZERO
+    turnover: Decimal = _ZERO
+    trade_count: int = 0
+    last_trade_id: str | None = None
+    updated_at: datetime | None = None
+
+    def apply_fill(
+        self,
+        quantity: int,
+        price: Decimal,
+        fee: Decimal,
+        trade_id: str,
+        executed_at: datetime,
+    ) -> "Position":
+        """Return the position after a fill; ``quantity`` > 0 buys, < 0 sells."""
+        net = self.net_quantity
+        average = self.average_cost
+        realized = self.realized_pnl
+        if net == 0 or (net > 0) == (quantity > 0):
+            size = abs(net) + abs(quantity)
+            average = (average * abs(net) + price * abs(quantity)) / size
+        else:
+            closed = min(abs(quantity), abs(net))
+            direction = 1 if net > 0 else -1
+            realized += (price - average) * closed * direction
+            if abs(quantity) > abs(net):
+                average = price
+            elif abs(quantity) == abs(net):
+                average = _ZERO
+        return replace(
+            self,
+            net_quantity=net + quantity,
+            average_cost=average.quantize(AMOUNT_PLACES),
+            realized_pnl=realized.quantize(AMOUNT_PLACES),
+            fees=(self.fees + fee).quantize(AMOUNT_PLACES),
+            turnover=self.turnover + price * abs(quantity),
+            trade_count=self.trade_count + 1,
+            last_trade_id=trade_id,
+            updated_at=executed_at,
+        )
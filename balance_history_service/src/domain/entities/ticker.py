@@ -0,0 +1,40 @@
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+
+
+@dataclass(frozen=True, slots=True)
+class Ticker:
+    """Rolling-window statistics for one instrument (24h by default).
+
+    Window fields are ``None`` once every trade has aged out; ``last_price``
+    keeps the most recent trade regardless.
+    """
+
+    instrument_id: str
+    window_seconds: int
+    last_price: Decimal
+    open_price: Decimal | None
+    high: Decimal | None
+    low: Decimal | None
+    volume: int
+    notional: Decimal
+    trade_count: int
+    currency: str
+    updated_at: datetime
+
+    @property
+    def vwap(self) -> Decimal | None:
+        return self.notional / self.volume if self.volume else None
+
+    @property
+    def price_change(self) -> Decimal | None:
+        if self.open_price is None:
+            return None
+        return self.last_price - self.open_price
+
+    @property
+    def price_change_percent(self) -> Decimal | None:
+        if not self.open_price:
+            return None
+        return (self.last_price - self.open_price) * 100 / self.open_price
@@ -0,0 +1,53 @@
+import base64
+import binascii
+from dataclasses import dataclass
+from datetime import datetime
+
+from src.domain.entities.trade_record import TradeRecord
+from src.exceptions import InvalidCursorError
+
+MAX_PAGE_SIZE = 500
+
+
+@dataclass(frozen=True, slots=True)
+class TradeCursor:
+    """Keyset position after a trade in ``(executed_at, trade_id)`` order."""
+
+    executed_at: datetime
+    trade_id: str
+
+    def encode(self) -> str:
+        raw = f"{self.executed_at.isoformat()}|{self.trade_id}".encode()
+        return base64.urlsafe_b64encode(raw).decode("ascii")
+
+    @classmethod
+    def decode(cls, token: str) -> "TradeCursor":
+        try:
+            raw = base64.urlsafe_b64decode(token.encode("ascii")).decode()
+            executed_at, trade_id = raw.split("|", 1)
+            return cls(datetime.fromisoformat(executed_at), trade_id)
+        except (binascii.Error, UnicodeError, ValueError) as exc:
+            raise InvalidCursorError(f"Invalid trade cursor '{token}'.") from exc
+
+
+@dataclass(frozen=True, slots=True)
+class ReplayCursor:
+    """Keyset position after a trade in ``(executed_at, sequence_number,
+    trade_id)`` order: trades sharing a timestamp keep the engine's order,
+    which a random trade id would not."""
+
+    executed_at: datetime
+    sequence_number: int
+    trade_id: str
+
+    @classmethod
+    def after(cls, trade: TradeRecord) -> "ReplayCursor":
+        return cls(trade.executed_at, trade.sequence_number, trade.trade_id)
+
+
+@dataclass(frozen=True, slots=True)
+class TradePage:
+    """Trades newest first; ``next_cursor`` is ``None`` on the last page."""
+
+    trades: list[TradeRecord]
+    next_cursor: TradeCursor | None
@@ -0,0 +1,22 @@
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+
+from src.domain.entities.candle import Candle
+
+
+class CandleCache(ABC):
+    """Outbound port for the candles served by the market data service."""
+
+    @abstractmethod
+    async def publish(
+        self,
+        open_bars: Sequence[Candle],
+        finalized: Sequence[Candle],
+    ) -> None:
+        """Replace the live bars and append finalized ones to the history."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def load_open_bars(self) -> list[Candle]:
+        """Live bars last published, to resume aggregation after a restart."""
+        raise NotImplementedError
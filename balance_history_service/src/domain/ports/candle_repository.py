@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from datetime import datetime
+
+from src.domain.entities.candle import Candle
+
+
+class CandleRepository(ABC):
+    @abstractmethod
+    async def add_many(self, candles: Sequence[Candle]) -> None:
+        """Insert finalized bars; a bar already stored for the same
+        ``(instrument_id, interval, open_time)`` is merged with the new one
+        (its open kept, high/low widened, close taken from the new bar,
+        volume, notional and trade count added)."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_range(
+        self,
+        instrument_id: str,
+        interval: str,
+        start: datetime,
+        end: datetime,
+    ) -> list[Candle]:
+        """Bars with ``start <= open_time < end``, oldest first."""
+        raise NotImplementedError
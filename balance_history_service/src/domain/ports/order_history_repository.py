@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 
 from src.domain.entities.order_history_entry import OrderHistoryEntry
 
@@ -8,6 +9,11 @@ class OrderHistoryRepository(ABC):
     async def add(self, entry: OrderHistoryEntry) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def add_many(self, entries: Sequence[OrderHistoryEntry]) -> None:
+        """Insert the entries, skipping any whose ``entry_id`` exists."""
+        raise NotImplementedError
+
     @abstractmethod
     async def list_by_order(self, order_id: str) -> list[OrderHistoryEntry]:
         raise NotImplementedError
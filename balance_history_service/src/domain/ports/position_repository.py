@@ -0,0 +1,37 @@
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Sequence
+
+from src.domain.entities.position import Position
+
+
+class PositionRepository(ABC):
+    @abstractmethod
+    async def get(self, trader_id: str, instrument_id: str) -> Position | None:
+        """Primary-key lookup of one position."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_by_trader(self, trader_id: str) -> list[Position]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_many(
+        self,
+        keys: Iterable[tuple[str, str]],
+        *,
+        for_update: bool = False,
+    ) -> dict[tuple[str, str], Position]:
+        """Positions by ``(trader_id, instrument_id)``; missing keys are left
+        out. ``for_update`` locks the rows until the transaction ends."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def insert_missing(self, positions: Sequence[Position]) -> None:
+        """Insert the positions whose key is not stored yet; leave the others
+        untouched."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def upsert_many(self, positions: Sequence[Position]) -> None:
+        """Insert the positions, replacing any stored under the same key."""
+        raise NotImplementedError
@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+
+from src.domain.entities.ticker import Ticker
+
+
+class TickerCache(ABC):
+    """Outbound port for the tickers served by the market data service."""
+
+    @abstractmethod
+    async def publish(self, tickers: Sequence[Ticker]) -> None:
+        raise NotImplementedError
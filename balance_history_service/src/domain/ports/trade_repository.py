@@ -1,5 +1,8 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from datetime import datetime
 
+from src.domain.entities.trade_page import ReplayCursor, TradeCursor, TradePage
 from src.domain.entities.trade_record import TradeRecord
 
 
@@ -8,16 +11,68 @@ class TradeRepository(ABC):
     async def add(self, trade: TradeRecord) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def add_many(self, trades: Sequence[TradeRecord]) -> set[str]:
+        """Insert the trades not already recorded; return their ids.
+
+        Trades whose ``trade_id`` exists are skipped, not raised.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def get_by_id(self, trade_id: str) -> TradeRecord:
         raise NotImplementedError
 
     @abstractmethod
-    async def list_by_trader(self, trader_id: str) -> list[TradeRecord]:
+    async def list_by_trader(
+        self,
+        trader_id: str,
+        *,
+        limit: int = 100,
+        cursor: TradeCursor | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> TradePage:
+        """One page of the trader's trades (as buyer or seller), newest first.
+
+        ``since`` is inclusive, ``until`` exclusive; ``limit`` is capped at
+        ``MAX_PAGE_SIZE``. Pass the returned ``next_cursor`` to continue.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_by_instrument(
+        self,
+        instrument_id: str,
+        *,
+        limit: int = 100,
+        cursor: TradeCursor | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> TradePage:
+        """One page of the instrument's trades; see ``list_by_trader``."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_since(self, since: datetime) -> list[TradeRecord]:
+        """Trades of every instrument executed at or after ``since``, oldest
+        first."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_after(
+        self,
+        instrument_id: str,
+        cursor: ReplayCursor | None,
+        limit: int,
+    ) -> list[TradeRecord]:
+        """Up to ``limit`` of the instrument's trades after ``cursor``, in
+        execution order; for replaying history in chunks."""
         raise NotImplementedError
 
     @abstractmethod
-    async def list_by_instrument(self, instrument_id: str) -> list[TradeRecord]:
+    async def list_instruments(self) -> list[str]:
+        """Every instrument with at least one recorded trade."""
         raise NotImplementedError
 
     @abstractmethod
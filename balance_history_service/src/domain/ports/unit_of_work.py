@@ -2,13 +2,17 @@ from abc import ABC, abstractmethod
 from types import TracebackType
 from typing import Self
 
+from src.domain.ports.candle_repository import CandleRepository
 from src.domain.ports.order_history_repository import OrderHistoryRepository
+from src.domain.ports.position_repository import PositionRepository
 from src.domain.ports.trade_repository import TradeRepository
 
 
 class UnitOfWork(ABC):
     trades: TradeRepository
     order_history: OrderHistoryRepository
+    candles: CandleRepository
+    positions: PositionRepository
 
     @abstractmethod
     async def __aenter__(self) -> Self:
@@ -26,3 +26,7 @@ class InvalidQuantityError(DomainError):
 
 class InvalidMoneyAmountError(DomainError):
     pass
+
+
+class InvalidCursorError(DomainError):
+    pass
@@ -30,3 +30,15 @@ class MessagingConnectionError(MessagingError):
 
 class MessagingConsumeError(MessagingError):
     pass
+
+
+class CacheError(InfrastructureError):
+    pass
+
+
+class CacheConnectionError(CacheError):
+    pass
+
+
+class CacheOperationError(CacheError):
+    pass
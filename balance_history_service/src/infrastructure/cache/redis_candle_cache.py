@@ -0,0 +1,143 @@
+import json
+import logging
+from collections.abc import Sequence
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from src.domain.entities.candle import CANDLE_INTERVALS, Candle
+from src.domain.ports.candle_cache import CandleCache
+from src.exceptions import CacheConnectionError, CacheOperationError
+
+logger = logging.getLogger(__name__)
+
+_LIVE_KEY = "md:candle:{instrument_id}:{interval}"
+_HISTORY_KEY = "md:candles:{instrument_id}:{interval}"
+_INSTRUMENTS_KEY = "md:candle:instruments"
+
+
+def candle_to_json(candle: Candle) -> str:
+    return json.dumps(
+        {
+            "instrument_id": candle.instrument_id,
+            "interval": candle.interval,
+            "open_time": int(candle.open_time.timestamp()),
+            "open": str(candle.open),
+            "high": str(candle.high),
+            "low": str(candle.low),
+            "close": str(candle.close),
+            "volume": candle.volume,
+            "notional": str(candle.notional),
+            "vwap": str(candle.vwap),
+            "trade_count": candle.trade_count,
+            "currency": candle.currency,
+        },
+        separators=(",", ":"),
+    )
+
+
+def candle_from_json(raw: str) -> Candle:
+    data = json.loads(raw)
+    return Candle(
+        instrument_id=data["instrument_id"],
+        interval=data["interval"],
+        open_time=datetime.fromtimestamp(int(data["open_time"]), timezone.utc),
+        open=Decimal(data["open"]),
+        high=Decimal(data["high"]),
+        low=Decimal(data["low"]),
+        close=Decimal(data["close"]),
+        volume=int(data["volume"]),
+        notional=Decimal(data["notional"]),
+        trade_count=int(data["trade_count"]),
+        currency=data["currency"],
+    )
+
+
+class RedisCandleCache(CandleCache):
+    """Live bars as ``md:candle:{id}:{interval}`` strings, finalized bars in
+    ``md:candles:{id}:{interval}`` sorted sets scored by open time (epoch
+    seconds) and trimmed to the newest ``history_limit`` bars."""
+
+    def __init__(self, url: str, history_limit: int = 1000) -> None:
+        self._url = url
+        self._history_limit = history_limit
+        self._client = None
+
+    async def connect(self) -> None:
+        try:
+            from redis.asyncio import Redis
+        except ImportError as exc:
+            raise CacheConnectionError(
+                "redis is required for RedisCandleCache. "
+                "Install it with: pip install redis"
+            ) from exc
+
+        try:
+            self._client = Redis.from_url(self._url, decode_responses=True)
+            await self._client.ping()
+            logger.info("Connected to Redis: %s", self._url)
+        except Exception as exc:
+            logger.exception("Failed to connect to Redis")
+            raise CacheConnectionError(f"Failed to connect to Redis: {exc}") from exc
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def publish(
+        self,
+        open_bars: Sequence[Candle],
+        finalized: Sequence[Candle],
+    ) -> None:
+        client = await self._ensure_client()
+        try:
+            pipe = client.pipeline(transaction=False)
+            if open_bars:
+                pipe.mset(
+                    {
+                        _LIVE_KEY.format(
+                            instrument_id=c.instrument_id, interval=c.interval
+                        ): candle_to_json(c)
+                        for c in open_bars
+                    }
+                )
+                pipe.sadd(_INSTRUMENTS_KEY, *{c.instrument_id for c in open_bars})
+            trimmed: set[str] = set()
+            for candle in finalized:
+                key = _HISTORY_KEY.format(
+                    instrument_id=candle.instrument_id, interval=candle.interval
+                )
+                score = int(candle.open_time.timestamp())
+                # One member per open time, even if a bar is finalized twice.
+                pipe.zremrangebyscore(key, score, score)
+                pipe.zadd(key, {candle_to_json(candle): score})
+                trimmed.add(key)
+            for key in trimmed:
+                pipe.zremrangebyrank(key, 0, -self._history_limit - 1)
+            await pipe.execute()
+        except Exception as exc:
+            logger.exception("Failed to publish candles")
+            raise CacheOperationError(f"Failed to publish candles: {exc}") from exc
+
+    async def load_open_bars(self) -> list[Candle]:
+        client = await self._ensure_client()
+        try:
+            instrument_ids = sorted(await client.smembers(_INSTRUMENTS_KEY))
+            if not instrument_ids:
+                return []
+            raws = await client.mget(
+                [
+                    _LIVE_KEY.format(instrument_id=instrument_id, interval=interval)
+                    for instrument_id in instrument_ids
+                    for interval in CANDLE_INTERVALS
+                ]
+            )
+        except Exception as exc:
+            logger.exception("Failed to load open candles")
+            raise CacheOperationError(f"Failed to load open candles: {exc}") from exc
+        return [candle_from_json(raw) for raw in raws if raw is not None]
+
+    async def _ensure_client(self):
+        if self._client is None:
+            await self.connect()
+        return self._client
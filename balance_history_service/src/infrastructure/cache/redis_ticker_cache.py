@@ -0,0 +1,84 @@
+import json
+import logging
+from collections.abc import Sequence
+
+from src.domain.entities.ticker import Ticker
+from src.domain.ports.ticker_cache import TickerCache
+from src.exceptions import CacheConnectionError, CacheOperationError
+
+logger = logging.getLogger(__name__)
+
+_TICKER_KEY = "md:ticker:{instrument_id}"
+
+
+def _decimal(value) -> str | None:
+    return str(value) if value is not None else None
+
+
+def ticker_to_json(ticker: Ticker) -> str:
+    change_percent = ticker.price_change_percent
+    return json.dumps(
+        {
+            "instrument_id": ticker.instrument_id,
+            "window_seconds": ticker.window_seconds,
+            "last_price": str(ticker.last_price),
+            "open_price": _decimal(ticker.open_price),
+            "high": _decimal(ticker.high),
+            "low": _decimal(ticker.low),
+            "volume": ticker.volume,
+            "vwap": _decimal(ticker.vwap),
+            "price_change": _decimal(ticker.price_change),
+            "price_change_percent": (
+                str(round(change_percent, 4)) if change_percent is not None else None
+            ),
+            "trade_count": ticker.trade_count,
+            "currency": ticker.currency,
+            "updated_at": ticker.updated_at.isoformat(),
+        },
+        separators=(",", ":"),
+    )
+
+
+class RedisTickerCache(TickerCache):
+    """Writes tickers to ``md:ticker:{instrument_id}``, next to ``md:ltp:*``."""
+
+    def __init__(self, url: str) -> None:
+        self._url = url
+        self._client = None
+
+    async def connect(self) -> None:
+        try:
+            from redis.asyncio import Redis
+        except ImportError as exc:
+            raise CacheConnectionError(
+                "redis is required for RedisTickerCache. "
+                "Install it with: pip install redis"
+            ) from exc
+
+        try:
+            self._client = Redis.from_url(self._url, decode_responses=True)
+            await self._client.ping()
+        except Exception as exc:
+            logger.exception("Failed to connect to Redis")
+            raise CacheConnectionError(f"Failed to connect to Redis: {exc}") from exc
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def publish(self, tickers: Sequence[Ticker]) -> None:
+        if not tickers:
+            return
+        if self._client is None:
+            await self.connect()
+        try:
+            await self._client.mset(
+                {
+                    _TICKER_KEY.format(instrument_id=t.instrument_id): ticker_to_json(t)
+                    for t in tickers
+                }
+            )
+        except Exception as exc:
+            logger.exception("Failed to publish %s tickers", len(tickers))
+            raise CacheOperationError(f"Failed to publish tickers: {exc}") from exc
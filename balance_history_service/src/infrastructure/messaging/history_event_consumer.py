@@ -1,9 +1,15 @@
+import asyncio
 import json
 import logging
 from datetime import datetime
 from decimal import Decimal, InvalidOperation
+from collections.abc import Awaitable
 from typing import Any
 
+from src.application.record_history_batch import (
+    RecordHistoryBatchCommand,
+    RecordHistoryBatchHandler,
+)
 from src.application.record_order_event import (
     RecordOrderEventCommand,
     RecordOrderEventHandler,
@@ -33,7 +39,16 @@ _ORDER_EVENTS = frozenset(
 
 
 class HistoryEventConsumer:
-    """Consumes trade.events and order.events and projects history rows."""
+    """Consumes trade.events and order.events and projects history rows.
+
+    With a ``record_batch_handler``, messages are buffered until
+    ``batch_size`` are pending or ``batch_max_wait`` seconds have passed
+    since the first, then written in one transaction and acked.
+    If the batch write fails, its messages are retried one at a time so a
+    poison message is rejected on its own, as without batching. An ack that
+    fails (channel lost) is logged; the broker redelivers the message and
+    the projections skip what they already hold.
+    """
 
     def __init__(
         self,
@@ -45,15 +60,29 @@ class HistoryEventConsumer:
         record_order_handler: RecordOrderEventHandler,
         exchange_type: str = "topic",
         prefetch_count: int = 32,
+        record_batch_handler: RecordHistoryBatchHandler | None = None,
+        batch_size: int = 200,
+        batch_max_wait: float = 0.05,
     ) -> None:
         self._url = url
         self._trade_exchange = trade_exchange
         self._order_exchange = order_exchange
         self._queue_name = queue_name
         self._exchange_type = exchange_type
-        self._prefetch_count = prefetch_count
         self._record_trade = record_trade_handler
         self._record_order = record_order_handler
+        self._record_batch = record_batch_handler
+        self._batch_size = batch_size
+        self._batch_max_wait = batch_max_wait
+        # The broker must be able to deliver a whole batch before any ack.
+        self._prefetch_count = (
+            max(prefetch_count, batch_size)
+            if record_batch_handler is not None
+            else prefetch_count
+        )
+        self._pending: list[tuple[Any, str, Any]] = []
+        self._flush_lock = asyncio.Lock()
+        self._timer: asyncio.Task | None = None
         self._connection = None
         self._channel = None
 
@@ -100,6 +129,14 @@ class HistoryEventConsumer:
             ) from exc
 
     async def stop(self) -> None:
+        if self._timer is not None:
+            # Still sleeping; its messages are flushed here instead.
+            self._timer.cancel()
+            await asyncio.gather(self._timer, return_exceptions=True)
+            self._timer = None
+        if self._channel is not None:
+            # Also waits out a flush the timer already started.
+            await self._flush()
         if self._connection is not None and not self._connection.is_closed:
             await self._connection.close()
             logger.info("HistoryEventConsumer stopped")
@@ -107,6 +144,9 @@ class HistoryEventConsumer:
         self._channel = None
 
     async def _on_message(self, message: Any) -> None:
+        if self._record_batch is not None:
+            await self._buffer(message)
+            return
         async with message.process(requeue=False):
             try:
                 payload = json.loads(message.body.decode("utf-8"))
@@ -134,6 +174,93 @@ class HistoryEventConsumer:
         else:
             logger.debug("Ignoring event_type=%s", event_type)
 
+    async def _buffer(self, message: Any) -> None:
+        try:
+            payload = json.loads(message.body.decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+            logger.error("Invalid message body: %s", exc)
+            await message.ack()
+            return
+
+        event_type = payload.get("event_type") or message.routing_key
+        try:
+            if event_type in _TRADE_EVENTS:
+                command = self._to_trade_command(payload)
+            elif event_type in _ORDER_EVENTS:
+                command = self._to_order_command(event_type, payload)
+            else:
+                logger.debug("Ignoring event_type=%s", event_type)
+                await message.ack()
+                return
+        except Exception:
+            logger.exception("Failed to handle event_type=%s", event_type)
+            await message.reject(requeue=False)
+            return
+
+        self._pending.append((message, event_type, command))
+        if len(self._pending) >= self._batch_size:
+            await self._flush()
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self._batch_max_wait)
+        self._timer = None
+        try:
+            await self._flush()
+        except Exception:
+            # Nobody awaits this task; don't lose the error with it.
+            logger.exception("History batch flush failed")
+
+    async def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        # Batches commit in arrival order.
+        async with self._flush_lock:
+            if not batch:
+                return
+            try:
+                await self._record_batch.handle(
+                    RecordHistoryBatchCommand(
+                        trades=tuple(c for _, t, c in batch if t in _TRADE_EVENTS),
+                        order_events=tuple(
+                            c for _, t, c in batch if t in _ORDER_EVENTS
+                        ),
+                    )
+                )
+            except Exception:
+                logger.exception(
+                    "History batch of %s failed; retrying one by one", len(batch)
+                )
+                for message, event_type, command in batch:
+                    await self._handle_one(message, event_type, command)
+                return
+            for message, _, _ in batch:
+                await self._settle(message.ack())
+
+    async def _handle_one(self, message: Any, event_type: str, command: Any) -> None:
+        try:
+            if event_type in _TRADE_EVENTS:
+                await self._record_trade.handle(command)
+            else:
+                await self._record_order.handle(command)
+        except DuplicateTradeError:
+            logger.info("Skipping duplicate trade: trade_id=%s", command.trade_id)
+        except Exception:
+            logger.exception("Failed to handle event_type=%s", event_type)
+            await self._settle(message.reject(requeue=False))
+            return
+        await self._settle(message.ack())
+
+    @staticmethod
+    async def _settle(outcome: Awaitable[None]) -> None:
+        try:
+            await outcome
+        except Exception:
+            logger.exception("Failed to settle message; the broker will redeliver")
+
     @staticmethod
     def _to_trade_command(payload: dict[str, Any]) -> RecordTradeCommand:
         price_raw = payload.get("execution_price")
@@ -144,10 +271,15 @@ class HistoryEventConsumer:
         except (InvalidOperation, ValueError) as exc:
             raise MessagingConsumeError("Invalid execution_price") from exc
 
+        # Part of the trades key (the table is partitioned on it), so a
+        # stand-in time would let a redelivery insert the trade again.
         occurred = payload.get("occurred_at")
-        executed_at = None
-        if occurred:
+        if not occurred:
+            raise MessagingConsumeError("TradeExecuted missing occurred_at")
+        try:
             executed_at = datetime.fromisoformat(str(occurred).replace("Z", "+00:00"))
+        except ValueError as exc:
+            raise MessagingConsumeError("Invalid occurred_at") from exc
 
         return RecordTradeCommand(
             trade_id=str(payload["trade_id"]),
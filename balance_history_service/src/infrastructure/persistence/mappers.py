@@ -1,10 +1,24 @@
+from datetime import timezone
+from typing import Any
+
+from src.domain.entities.candle import Candle
 from src.domain.entities.order_history_entry import OrderHistoryEntry
+from src.domain.entities.position import Position
 from src.domain.entities.trade_record import TradeRecord
-from src.infrastructure.persistence.models import OrderHistoryModel, TradeModel
+from src.infrastructure.persistence.models import (
+    CandleModel,
+    OrderHistoryModel,
+    PositionModel,
+    TradeModel,
+)
 
 
 def trade_to_model(trade: TradeRecord) -> TradeModel:
-    return TradeModel(
+    return TradeModel(**trade_to_row(trade))
+
+
+def trade_to_row(trade: TradeRecord) -> dict[str, Any]:
+    return dict(
         trade_id=trade.trade_id,
         maker_order_id=trade.maker_order_id,
         taker_order_id=trade.taker_order_id,
@@ -36,7 +50,11 @@ def model_to_trade(model: TradeModel) -> TradeRecord:
 
 
 def entry_to_model(entry: OrderHistoryEntry) -> OrderHistoryModel:
-    return OrderHistoryModel(
+    return OrderHistoryModel(**entry_to_row(entry))
+
+
+def entry_to_row(entry: OrderHistoryEntry) -> dict[str, Any]:
+    return dict(
         entry_id=entry.entry_id,
         order_id=entry.order_id,
         trader_id=entry.trader_id,
@@ -71,3 +89,73 @@ def model_to_entry(model: OrderHistoryModel) -> OrderHistoryEntry:
         status=model.status,
         occurred_at=model.occurred_at,
     )
+
+
+def candle_to_row(candle: Candle) -> dict[str, Any]:
+    return {
+        "instrument_id": candle.instrument_id,
+        "interval": candle.interval,
+        "open_time": candle.open_time,
+        "open": candle.open,
+        "high": candle.high,
+        "low": candle.low,
+        "close": candle.close,
+        "volume": candle.volume,
+        "notional": candle.notional,
+        "trade_count": candle.trade_count,
+        "currency": candle.currency,
+    }
+
+
+def model_to_candle(model: CandleModel) -> Candle:
+    open_time = model.open_time
+    if open_time.tzinfo is None:
+        open_time = open_time.replace(tzinfo=timezone.utc)
+    return Candle(
+        instrument_id=model.instrument_id,
+        interval=model.interval,
+        open_time=open_time,
+        open=model.open,
+        high=model.high,
+        low=model.low,
+        close=model.close,
+        volume=model.volume,
+        notional=model.notional,
+        trade_count=model.trade_count,
+        currency=model.currency,
+    )
+
+
+def position_to_row(position: Position) -> dict[str, Any]:
+    return {
+        "trader_id": position.trader_id,
+        "instrument_id": position.instrument_id,
+        "currency": position.currency,
+        "net_quantity": position.net_quantity,
+        "average_cost": position.average_cost,
+        "realized_pnl": position.realized_pnl,
+        "fees": position.fees,
+        "turnover": position.turnover,
+        "trade_count": position.trade_count,
+        "last_trade_id": position.last_trade_id,
+        "updated_at": position.updated_at,
+    }
+
+
+def model_to_position(model: PositionModel) -> Position:
+    updated_at = model.updated_at
+    if updated_at is not None and updated_at.tzinfo is None:
+        updated_at = updated_at.replace(tzinfo=timezone.utc)
+    return Position(
+        trader_id=model.trader_id,
+        instrument_id=model.instrument_id,
+        currency=model.currency,
+        net_quantity=model.net_quantity,
+        average_cost=model.average_cost,
+        realized_pnl=model.realized_pnl,
+        fees=model.fees,
+        turnover=model.turnover,
+        trade_count=model.trade_count,
+        last_trade_id=model.last_trade_id,
+        updated_at=updated_at,
+    )
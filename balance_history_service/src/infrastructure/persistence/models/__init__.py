@@ -1,3 +1,5 @@
 from src.infrastructure.persistence.models.base import *
+from src.infrastructure.persistence.models.candle import *
 from src.infrastructure.persistence.models.order_history import *
+from src.infrastructure.persistence.models.position import *
 from src.infrastructure.persistence.models.trade import *
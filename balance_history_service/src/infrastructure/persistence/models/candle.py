@@ -0,0 +1,25 @@
+from datetime import datetime
+from decimal import Decimal
+
+from sqlalchemy import DateTime, Integer, Numeric, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.infrastructure.persistence.models.base import Base
+
+
+class CandleModel(Base):
+    __tablename__ = "candles"
+
+    instrument_id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    interval: Mapped[str] = mapped_column(String(3), primary_key=True)
+    open_time: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), primary_key=True
+    )
+    open: Mapped[Decimal] = mapped_column(Numeric(18, 2), nullable=False)
+    high: Mapped[Decimal] = mapped_column(Numeric(18, 2), nullable=False)
+    low: Mapped[Decimal] = mapped_column(Numeric(18, 2), nullable=False)
+    close: Mapped[Decimal] = mapped_column(Numeric(18, 2), nullable=False)
+    volume: Mapped[int] = mapped_column(Integer, nullable=False)
+    notional: Mapped[Decimal] = mapped_column(Numeric(28, 2), nullable=False)
+    trade_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    currency: Mapped[str] = mapped_column(String(3), nullable=False)
@@ -1,7 +1,7 @@
 from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import DateTime, Integer, Numeric, String
+from sqlalchemy import DateTime, Index, Integer, Numeric, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.infrastructure.persistence.models.base import Base
@@ -9,11 +9,19 @@ from src.infrastructure.persistence.models.base import Base
 
 class OrderHistoryModel(Base):
     __tablename__ = "order_history"
+    # Reads are per order, trader or instrument in time order. On PostgreSQL
+    # the table is range-partitioned by month on occurred_at.
+    __table_args__ = (
+        Index("ix_order_history_order_time", "order_id", "occurred_at"),
+        Index("ix_order_history_trader_time", "trader_id", "occurred_at"),
+        Index("ix_order_history_instrument_time", "instrument_id", "occurred_at"),
+        {"postgresql_partition_by": "RANGE (occurred_at)"},
+    )
 
     entry_id: Mapped[str] = mapped_column(String(36), primary_key=True)
-    order_id: Mapped[str] = mapped_column(String(36), nullable=False, index=True)
-    trader_id: Mapped[str] = mapped_column(String(36), nullable=False, index=True)
-    instrument_id: Mapped[str] = mapped_column(String(36), nullable=False, index=True)
+    order_id: Mapped[str] = mapped_column(String(36), nullable=False)
+    trader_id: Mapped[str] = mapped_column(String(36), nullable=False)
+    instrument_id: Mapped[str] = mapped_column(String(36), nullable=False)
     event_type: Mapped[str] = mapped_column(String(64), nullable=False)
     side: Mapped[str | None] = mapped_column(String(8), nullable=True)
     order_type: Mapped[str | None] = mapped_column(String(16), nullable=True)
@@ -24,5 +32,5 @@ class OrderHistoryModel(Base):
     price_currency: Mapped[str | None] = mapped_column(String(3), nullable=True)
     status: Mapped[str | None] = mapped_column(String(32), nullable=True)
     occurred_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), nullable=False
+        DateTime(timezone=True), primary_key=True
     )
@@ -0,0 +1,25 @@
+from datetime import datetime
+from decimal import Decimal
+
+from sqlalchemy import DateTime, Integer, Numeric, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.infrastructure.persistence.models.base import Base
+
+
+class PositionModel(Base):
+    __tablename__ = "positions"
+
+    trader_id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    instrument_id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    currency: Mapped[str] = mapped_column(String(3), nullable=False)
+    net_quantity: Mapped[int] = mapped_column(Integer, nullable=False)
+    average_cost: Mapped[Decimal] = mapped_column(Numeric(28, 8), nullable=False)
+    realized_pnl: Mapped[Decimal] = mapped_column(Numeric(28, 8), nullable=False)
+    fees: Mapped[Decimal] = mapped_column(Numeric(28, 8), nullable=False)
+    turnover: Mapped[Decimal] = mapped_column(Numeric(28, 2), nullable=False)
+    trade_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    last_trade_id: Mapped[str | None] = mapped_column(String(36), nullable=True)
+    updated_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
@@ -1,7 +1,7 @@
 from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import DateTime, Integer, Numeric, String
+from sqlalchemy import DateTime, Index, Integer, Numeric, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.infrastructure.persistence.models.base import Base
@@ -9,17 +9,27 @@ from src.infrastructure.persistence.models.base import Base
 
 class TradeModel(Base):
     __tablename__ = "trades"
+    # Keyset pagination reads (party, executed_at, trade_id) ranges newest
+    # first; the party-only prefixes are covered by the same indexes.
+    # On PostgreSQL the table is range-partitioned by month on executed_at
+    # (see ``partitions.py``), so the key has to include it.
+    __table_args__ = (
+        Index("ix_trades_buyer_time", "buyer_id", "executed_at", "trade_id"),
+        Index("ix_trades_seller_time", "seller_id", "executed_at", "trade_id"),
+        Index("ix_trades_instrument_time", "instrument_id", "executed_at", "trade_id"),
+        {"postgresql_partition_by": "RANGE (executed_at)"},
+    )
 
     trade_id: Mapped[str] = mapped_column(String(36), primary_key=True)
     maker_order_id: Mapped[str] = mapped_column(String(36), nullable=False, index=True)
     taker_order_id: Mapped[str] = mapped_column(String(36), nullable=False, index=True)
-    buyer_id: Mapped[str] = mapped_column(String(36), nullable=False, index=True)
-    seller_id: Mapped[str] = mapped_column(String(36), nullable=False, index=True)
-    instrument_id: Mapped[str] = mapped_column(String(36), nullable=False, index=True)
+    buyer_id: Mapped[str] = mapped_column(String(36), nullable=False)
+    seller_id: Mapped[str] = mapped_column(String(36), nullable=False)
+    instrument_id: Mapped[str] = mapped_column(String(36), nullable=False)
     quantity: Mapped[int] = mapped_column(Integer, nullable=False)
     execution_price: Mapped[Decimal] = mapped_column(Numeric(18, 2), nullable=False)
     execution_price_currency: Mapped[str] = mapped_column(String(3), nullable=False)
     sequence_number: Mapped[int] = mapped_column(Integer, nullable=False)
     executed_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), nullable=False
+        DateTime(timezone=True), primary_key=True, index=True
     )
@@ -0,0 +1,311 @@
+import asyncio
+import csv
+import gzip
+import logging
+import os
+import re
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+from sqlalchemy import Column, Table, func, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from src.infrastructure.persistence.models import OrderHistoryModel, TradeModel
+
+logger = logging.getLogger(__name__)
+
+# Append-only tables, each range-partitioned by month on its event time.
+PARTITIONED_TABLES: tuple[tuple[Table, Column], ...] = (
+    (TradeModel.__table__, TradeModel.__table__.c.executed_at),
+    (OrderHistoryModel.__table__, OrderHistoryModel.__table__.c.occurred_at),
+)
+
+_ARCHIVE_CHUNK = 10_000
+# Serialises partition DDL between workers sharing the database.
+_LOCK_KEY = 0x6268735F70617274
+
+
+def month_start(moment: datetime) -> datetime:
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc).replace(
+        day=1, hour=0, minute=0, second=0, microsecond=0
+    )
+
+
+def add_months(month: datetime, count: int) -> datetime:
+    index = month.year * 12 + month.month - 1 + count
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+def partition_name(table: str, month: datetime) -> str:
+    return f"{table}_p{month:%Y_%m}"
+
+
+class PartitionManager:
+    """Keeps monthly partitions ahead of the clock and archives expired ones.
+
+    ``ensure_partitions`` attaches the current month, ``premake_months``
+    future months and a DEFAULT partition (for stray timestamps) to each
+    table in ``PARTITIONED_TABLES``, one transaction per partition. Rows the
+    DEFAULT partition already holds for a new month are moved into it as it
+    is attached. ``archive_expired`` writes every month older than
+    ``retention_months`` to ``<archive_dir>/<table>/<table>_pYYYY_MM.csv.gz``
+    and only once the file is synced detaches and drops the partition, or
+    deletes the month's rows from the DEFAULT partition. ``start`` runs both
+    every ``interval`` seconds.
+
+    Partitioning is PostgreSQL-only; on other databases (SQLite in tests)
+    the tables are plain, nothing is created and expired months are
+    archived and then deleted row-wise.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        archive_dir: str | Path,
+        retention_months: int = 0,
+        premake_months: int = 2,
+        interval: float = 3600.0,
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ) -> None:
+        self._engine = engine
+        self._archive_dir = Path(archive_dir)
+        self._retention_months = retention_months
+        self._premake_months = premake_months
+        self._interval = interval
+        self._clock = clock
+        self._task: asyncio.Task | None = None
+
+    @property
+    def partitioned(self) -> bool:
+        return self._engine.dialect.name == "postgresql"
+
+    async def start(self) -> None:
+        await self.maintain()
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def maintain(self) -> None:
+        try:
+            await self.ensure_partitions()
+            await self.archive_expired()
+        except Exception:
+            logger.exception("History partition maintenance failed")
+
+    async def ensure_partitions(self, since: datetime | None = None) -> list[str]:
+        """Create missing partitions from ``since`` (default: this month)
+        through ``premake_months`` ahead; return the names created."""
+        if not self.partitioned:
+            return []
+        current = month_start(self._clock())
+        first = month_start(since) if since is not None else current
+        last = add_months(current, self._premake_months)
+        created: list[str] = []
+        for table, column in PARTITIONED_TABLES:
+            async with self._engine.connect() as conn:
+                if not await is_partitioned(conn, table.name):
+                    logger.warning(
+                        "Table %s is not partitioned; run src.migrate_partitions",
+                        table.name,
+                    )
+                    continue
+                existing = set(await _partitions(conn, table.name))
+            default = f"{table.name}_default"
+            if default not in existing:
+                async with self._locked() as conn:
+                    await conn.execute(
+                        text(
+                            f'CREATE TABLE IF NOT EXISTS "{default}" '
+                            f'PARTITION OF "{table.name}" DEFAULT'
+                        )
+                    )
+                created.append(default)
+            month = first
+            while month <= last:
+                name = partition_name(table.name, month)
+                if name not in existing:
+                    try:
+                        if await self._create_month(table, column, month):
+                            created.append(name)
+                    except Exception:
+                        # One bad month must not hold back the others.
+                        logger.exception("Could not create partition %s", name)
+                month = add_months(month, 1)
+        if created:
+            logger.info("Created history partitions: %s", ", ".join(created))
+        return created
+
+    async def archive_expired(self) -> list[Path]:
+        """Archive and drop months older than the retention period; return
+        the archive files written. A no-op when ``retention_months`` is 0."""
+        if self._retention_months <= 0:
+            return []
+        cutoff = add_months(month_start(self._clock()), -self._retention_months)
+        archived: list[Path] = []
+        for table, column in PARTITIONED_TABLES:
+            for month in await self._expired_months(table, column, cutoff):
+                path = await self._export(table, column, month)
+                await self._drop(table, column, month)
+                logger.info(
+                    "Archived %s to %s", partition_name(table.name, month), path
+                )
+                archived.append(path)
+        return archived
+
+    @asynccontextmanager
+    async def _locked(self) -> AsyncIterator[AsyncConnection]:
+        """A transaction holding the partition DDL lock."""
+        async with self._engine.begin() as conn:
+            await conn.execute(text(f"SELECT pg_advisory_xact_lock({_LOCK_KEY})"))
+            yield conn
+
+    async def _create_month(
+        self, table: Table, column: Column, month: datetime
+    ) -> bool:
+        """Attach ``month``'s partition, first moving in any rows the DEFAULT
+        partition holds for it (attaching would fail on them otherwise).
+        False if another worker got there first."""
+        name = partition_name(table.name, month)
+        end = add_months(month, 1)
+        async with self._locked() as conn:
+            if name in await _partitions(conn, table.name):
+                return False
+            await conn.execute(
+                text(
+                    f'CREATE TABLE "{name}" (LIKE "{table.name}" '
+                    "INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+                )
+            )
+            moved = await conn.execute(
+                text(
+                    f'WITH moved AS (DELETE FROM "{table.name}_default" '
+                    f'WHERE "{column.name}" >= :start AND "{column.name}" < :end '
+                    f'RETURNING *) INSERT INTO "{name}" SELECT * FROM moved'
+                ),
+                {"start": month, "end": end},
+            )
+            await conn.execute(
+                text(
+                    f'ALTER TABLE "{table.name}" ATTACH PARTITION "{name}" '
+                    f"FOR VALUES FROM ('{month.isoformat()}') "
+                    f"TO ('{end.isoformat()}')"
+                )
+            )
+        if moved.rowcount:
+            logger.info(
+                "Moved %s rows from the DEFAULT partition into %s", moved.rowcount, name
+            )
+        return True
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            await self.maintain()
+
+    async def _expired_months(
+        self, table: Table, column: Column, cutoff: datetime
+    ) -> list[datetime]:
+        months: set[datetime] = set()
+        async with self._engine.connect() as conn:
+            if self.partitioned:
+                pattern = re.compile(rf"^{re.escape(table.name)}_p(\d{{4}})_(\d{{2}})$")
+                partitions = await _partitions(conn, table.name)
+                for name in partitions:
+                    match = pattern.match(name)
+                    if match:
+                        month = datetime(
+                            int(match[1]), int(match[2]), 1, tzinfo=timezone.utc
+                        )
+                        if month < cutoff:
+                            months.add(month)
+                oldest = None
+                default = f"{table.name}_default"
+                if default in partitions:
+                    # Stray rows in the DEFAULT partition expire too.
+                    oldest = (
+                        await conn.execute(
+                            text(f'SELECT min("{column.name}") FROM "{default}"')
+                        )
+                    ).scalar()
+            else:
+                oldest = (await conn.execute(select(func.min(column)))).scalar()
+        if oldest is not None:
+            month = month_start(oldest)
+            while month < cutoff:
+                months.add(month)
+                month = add_months(month, 1)
+        return sorted(months)
+
+    async def _export(self, table: Table, column: Column, month: datetime) -> Path:
+        """Stream one month to a gzipped CSV (with header), written under a
+        temporary name and renamed once synced, so a file that exists is
+        complete."""
+        directory = self._archive_dir / table.name
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"{partition_name(table.name, month)}.csv.gz"
+        partial = path.with_name(path.name + ".partial")
+        statement = (
+            select(table)
+            .where(column >= month, column < add_months(month, 1))
+            .order_by(column)
+        )
+        async with self._engine.connect() as conn:
+            result = await conn.stream(statement)
+            with open(partial, "wb") as raw:
+                with gzip.open(raw, "wt", newline="") as archive:
+                    writer = csv.writer(archive)
+                    writer.writerow(table.columns.keys())
+                    async for rows in result.partitions(_ARCHIVE_CHUNK):
+                        await asyncio.to_thread(writer.writerows, rows)
+                raw.flush()
+                os.fsync(raw.fileno())
+        os.replace(partial, path)
+        return path
+
+    async def _drop(self, table: Table, column: Column, month: datetime) -> None:
+        name = partition_name(table.name, month)
+        async with self._engine.begin() as conn:
+            if self.partitioned and name in await _partitions(conn, table.name):
+                await conn.execute(
+                    text(f'ALTER TABLE "{table.name}" DETACH PARTITION "{name}"')
+                )
+                await conn.execute(text(f'DROP TABLE "{name}"'))
+            else:
+                # Plain table, or a month only the DEFAULT partition holds.
+                await conn.execute(
+                    table.delete().where(column >= month, column < add_months(month, 1))
+                )
+
+
+async def is_partitioned(conn: AsyncConnection, table: str) -> bool:
+    result = await conn.execute(
+        text(
+            "SELECT 1 FROM pg_partitioned_table p "
+            "JOIN pg_class c ON c.oid = p.partrelid "
+            "WHERE c.relname = :table AND pg_table_is_visible(c.oid)"
+        ),
+        {"table": table},
+    )
+    return result.first() is not None
+
+
+async def _partitions(conn: AsyncConnection, table: str) -> list[str]:
+    result = await conn.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits i "
+            "JOIN pg_class parent ON parent.oid = i.inhparent "
+            "JOIN pg_class child ON child.oid = i.inhrelid "
+            "WHERE parent.relname = :table AND pg_table_is_visible(parent.oid)"
+        ),
+        {"table": table},
+    )
+    return list(result.scalars())
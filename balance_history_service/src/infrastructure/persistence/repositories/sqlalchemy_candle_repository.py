@@ -0,0 +1,87 @@
+from collections.abc import Sequence
+from datetime import datetime
+
+from sqlalchemy import case, select
+from sqlalchemy.exc import (
+    IntegrityError,
+    OperationalError,
+    SQLAlchemyError,
+    TimeoutError,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities.candle import Candle
+from src.domain.ports.candle_repository import CandleRepository
+from src.exceptions import (
+    DatabaseConnectionError,
+    DatabaseOperationError,
+    DatabaseTimeoutError,
+)
+from src.infrastructure.persistence.dialect import dialect_insert
+from src.infrastructure.persistence.mappers import candle_to_row, model_to_candle
+from src.infrastructure.persistence.models import CandleModel
+
+
+class SQLAlchemyCandleRepository(CandleRepository):
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def add_many(self, candles: Sequence[Candle]) -> None:
+        """One multi-row ``INSERT ... ON CONFLICT DO UPDATE`` per call.
+
+        A conflicting row is merged rather than replaced: the projector only
+        sees newly recorded trades, so a second bar for the same window (a
+        late trade after a restart) holds trades the stored one does not.
+        """
+        if not candles:
+            return
+        statement = dialect_insert(self._session, CandleModel).values(
+            [candle_to_row(c) for c in candles]
+        )
+        stored = CandleModel.__table__.c
+        new = statement.excluded
+        statement = statement.on_conflict_do_update(
+            index_elements=["instrument_id", "interval", "open_time"],
+            set_={
+                "high": case((new.high > stored.high, new.high), else_=stored.high),
+                "low": case((new.low < stored.low, new.low), else_=stored.low),
+                "close": new.close,
+                "volume": stored.volume + new.volume,
+                "notional": stored.notional + new.notional,
+                "trade_count": stored.trade_count + new.trade_count,
+            },
+        )
+        await self._execute("add_candles", self._session.execute, statement)
+
+    async def list_range(
+        self,
+        instrument_id: str,
+        interval: str,
+        start: datetime,
+        end: datetime,
+    ) -> list[Candle]:
+        result = await self._execute(
+            "list_candles",
+            self._session.execute,
+            select(CandleModel)
+            .where(
+                CandleModel.instrument_id == instrument_id,
+                CandleModel.interval == interval,
+                CandleModel.open_time >= start,
+                CandleModel.open_time < end,
+            )
+            .order_by(CandleModel.open_time),
+        )
+        return [model_to_candle(m) for m in result.scalars().all()]
+
+    async def _execute(self, operation: str, coro, *args, **kwargs):
+        try:
+            return await coro(*args, **kwargs)
+        except IntegrityError as e:
+            raise DatabaseOperationError(f"Database integrity error: {e}") from e
+        except OperationalError as e:
+            raise DatabaseConnectionError(f"Failed to connect to database: {e}") from e
+        except TimeoutError as e:
+            raise DatabaseTimeoutError(f"Database operation timed out: {e}") from e
+        except SQLAlchemyError as e:
+            raise DatabaseOperationError(f"Database operation failed: {e}") from e
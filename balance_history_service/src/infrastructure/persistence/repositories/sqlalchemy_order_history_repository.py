@@ -1,3 +1,5 @@
+from collections.abc import Sequence
+
 from sqlalchemy import select
 from sqlalchemy.exc import (
     IntegrityError,
@@ -14,7 +16,12 @@ from src.exceptions import (
     DatabaseOperationError,
     DatabaseTimeoutError,
 )
-from src.infrastructure.persistence.mappers import entry_to_model, model_to_entry
+from src.infrastructure.persistence.dialect import dialect_insert
+from src.infrastructure.persistence.mappers import (
+    entry_to_model,
+    entry_to_row,
+    model_to_entry,
+)
 from src.infrastructure.persistence.models import OrderHistoryModel
 
 
@@ -26,6 +33,17 @@ class SQLAlchemyOrderHistoryRepository(OrderHistoryRepository):
         self._session.add(entry_to_model(entry))
         await self._execute("add_order_history", self._session.flush)
 
+    async def add_many(self, entries: Sequence[OrderHistoryEntry]) -> None:
+        """One multi-row ``INSERT ... ON CONFLICT DO NOTHING``."""
+        if not entries:
+            return
+        statement = (
+            dialect_insert(self._session, OrderHistoryModel)
+            .values([entry_to_row(e) for e in entries])
+            .on_conflict_do_nothing(index_elements=["entry_id", "occurred_at"])
+        )
+        await self._execute("add_order_history_many", self._session.execute, statement)
+
     async def list_by_order(self, order_id: str) -> list[OrderHistoryEntry]:
         result = await self._execute(
             "list_order_history_by_order",
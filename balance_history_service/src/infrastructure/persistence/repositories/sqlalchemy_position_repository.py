@@ -0,0 +1,125 @@
+from collections.abc import Iterable, Sequence
+
+from sqlalchemy import select, tuple_
+from sqlalchemy.exc import (
+    IntegrityError,
+    OperationalError,
+    SQLAlchemyError,
+    TimeoutError,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities.position import Position
+from src.domain.ports.position_repository import PositionRepository
+from src.exceptions import (
+    DatabaseConnectionError,
+    DatabaseOperationError,
+    DatabaseTimeoutError,
+)
+from src.infrastructure.persistence.dialect import dialect_insert
+from src.infrastructure.persistence.mappers import model_to_position, position_to_row
+from src.infrastructure.persistence.models import PositionModel
+
+_UPSERT_COLUMNS = (
+    "currency",
+    "net_quantity",
+    "average_cost",
+    "realized_pnl",
+    "fees",
+    "turnover",
+    "trade_count",
+    "last_trade_id",
+    "updated_at",
+)
+# Keys per IN list, well under the bind parameter limits.
+_KEY_CHUNK = 1000
+
+
+class SQLAlchemyPositionRepository(PositionRepository):
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def get(self, trader_id: str, instrument_id: str) -> Position | None:
+        model = await self._execute(
+            "get_position",
+            self._session.get,
+            PositionModel,
+            (trader_id, instrument_id),
+        )
+        return model_to_position(model) if model is not None else None
+
+    async def list_by_trader(self, trader_id: str) -> list[Position]:
+        result = await self._execute(
+            "list_positions_by_trader",
+            self._session.execute,
+            select(PositionModel)
+            .where(PositionModel.trader_id == trader_id)
+            .order_by(PositionModel.instrument_id),
+        )
+        return [model_to_position(m) for m in result.scalars().all()]
+
+    async def get_many(
+        self,
+        keys: Iterable[tuple[str, str]],
+        *,
+        for_update: bool = False,
+    ) -> dict[tuple[str, str], Position]:
+        # Sorted, so concurrent writers lock rows in the same order.
+        ordered = sorted(set(keys))
+        positions: dict[tuple[str, str], Position] = {}
+        for start in range(0, len(ordered), _KEY_CHUNK):
+            statement = (
+                select(PositionModel)
+                .where(
+                    tuple_(PositionModel.trader_id, PositionModel.instrument_id).in_(
+                        ordered[start : start + _KEY_CHUNK]
+                    )
+                )
+                .order_by(PositionModel.trader_id, PositionModel.instrument_id)
+            )
+            if for_update:
+                statement = statement.with_for_update()
+            result = await self._execute(
+                "get_positions", self._session.execute, statement
+            )
+            for model in result.scalars().all():
+                positions[(model.trader_id, model.instrument_id)] = model_to_position(
+                    model
+                )
+        return positions
+
+    async def insert_missing(self, positions: Sequence[Position]) -> None:
+        """One multi-row ``INSERT ... ON CONFLICT DO NOTHING`` per call."""
+        if not positions:
+            return
+        statement = (
+            dialect_insert(self._session, PositionModel)
+            .values([position_to_row(p) for p in positions])
+            .on_conflict_do_nothing(index_elements=["trader_id", "instrument_id"])
+        )
+        await self._execute("insert_positions", self._session.execute, statement)
+
+    async def upsert_many(self, positions: Sequence[Position]) -> None:
+        """One multi-row ``INSERT ... ON CONFLICT DO UPDATE`` per call."""
+        if not positions:
+            return
+        statement = dialect_insert(self._session, PositionModel).values(
+            [position_to_row(p) for p in positions]
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=["trader_id", "instrument_id"],
+            set_={name: statement.excluded[name] for name in _UPSERT_COLUMNS},
+        )
+        await self._execute("upsert_positions", self._session.execute, statement)
+
+    async def _execute(self, operation: str, coro, *args, **kwargs):
+        try:
+            return await coro(*args, **kwargs)
+        except IntegrityError as e:
+            raise DatabaseOperationError(f"Database integrity error: {e}") from e
+        except OperationalError as e:
+            raise DatabaseConnectionError(f"Failed to connect to database: {e}") from e
+        except TimeoutError as e:
+            raise DatabaseTimeoutError(f"Database operation timed out: {e}") from e
+        except SQLAlchemyError as e:
+            raise DatabaseOperationError(f"Database operation failed: {e}") from e
@@ -1,4 +1,7 @@
-from sqlalchemy import or_, select
+from collections.abc import Sequence
+from datetime import datetime
+
+from sqlalchemy import Select, select, tuple_, union
 from sqlalchemy.exc import (
     IntegrityError,
     OperationalError,
@@ -7,6 +10,12 @@ from sqlalchemy.exc import (
 )
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.domain.entities.trade_page import (
+    MAX_PAGE_SIZE,
+    ReplayCursor,
+    TradeCursor,
+    TradePage,
+)
 from src.domain.entities.trade_record import TradeRecord
 from src.domain.ports.trade_repository import TradeRepository
 from src.exceptions import (
@@ -15,7 +24,12 @@ from src.exceptions import (
     DatabaseTimeoutError,
     TradeNotFoundError,
 )
-from src.infrastructure.persistence.mappers import model_to_trade, trade_to_model
+from src.infrastructure.persistence.dialect import dialect_insert
+from src.infrastructure.persistence.mappers import (
+    model_to_trade,
+    trade_to_model,
+    trade_to_row,
+)
 from src.infrastructure.persistence.models import TradeModel
 
 
@@ -27,6 +41,24 @@ class SQLAlchemyTradeRepository(TradeRepository):
         self._session.add(trade_to_model(trade))
         await self._execute("add_trade", self._session.flush)
 
+    async def add_many(self, trades: Sequence[TradeRecord]) -> set[str]:
+        """One multi-row ``INSERT ... ON CONFLICT DO NOTHING RETURNING``.
+
+        The primary key settles duplicates, so no ``exists`` read is needed.
+        It includes ``executed_at`` (the partition key); a redelivered event
+        carries the same ``occurred_at``, so it still conflicts.
+        """
+        if not trades:
+            return set()
+        statement = (
+            dialect_insert(self._session, TradeModel)
+            .values([trade_to_row(t) for t in trades])
+            .on_conflict_do_nothing(index_elements=["trade_id", "executed_at"])
+            .returning(TradeModel.trade_id)
+        )
+        result = await self._execute("add_trades", self._session.execute, statement)
+        return set(result.scalars().all())
+
     async def get_by_id(self, trade_id: str) -> TradeRecord:
         result = await self._execute(
             "get_trade",
@@ -38,31 +70,104 @@ class SQLAlchemyTradeRepository(TradeRepository):
             raise TradeNotFoundError(f"Trade '{trade_id}' does not exist.")
         return model_to_trade(model)
 
-    async def list_by_trader(self, trader_id: str) -> list[TradeRecord]:
+    async def list_by_trader(
+        self,
+        trader_id: str,
+        *,
+        limit: int = 100,
+        cursor: TradeCursor | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> TradePage:
+        """UNION of the buyer-side and seller-side pages, each a range scan
+        of its ``(party, executed_at, trade_id)`` index, instead of an OR
+        that cannot use either index for ordering."""
+        size = _page_size(limit)
+        legs = [
+            _keyset(
+                select(TradeModel.trade_id, TradeModel.executed_at).where(
+                    column == trader_id
+                ),
+                size + 1,
+                cursor,
+                since,
+                until,
+            ).subquery()
+            for column in (TradeModel.buyer_id, TradeModel.seller_id)
+        ]
+        # UNION (not ALL): a self-trade appears on both sides.
+        page = union(*(select(leg) for leg in legs)).subquery()
         result = await self._execute(
             "list_trades_by_trader",
             self._session.execute,
             select(TradeModel)
-            .where(
-                or_(
-                    TradeModel.buyer_id == trader_id,
-                    TradeModel.seller_id == trader_id,
-                )
-            )
-            .order_by(TradeModel.executed_at.desc()),
+            .join(page, TradeModel.trade_id == page.c.trade_id)
+            .order_by(page.c.executed_at.desc(), page.c.trade_id.desc())
+            .limit(size + 1),
         )
-        return [model_to_trade(m) for m in result.scalars().all()]
+        return _to_page(result.scalars().all(), size)
 
-    async def list_by_instrument(self, instrument_id: str) -> list[TradeRecord]:
+    async def list_by_instrument(
+        self,
+        instrument_id: str,
+        *,
+        limit: int = 100,
+        cursor: TradeCursor | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> TradePage:
+        size = _page_size(limit)
         result = await self._execute(
             "list_trades_by_instrument",
             self._session.execute,
+            _keyset(
+                select(TradeModel).where(TradeModel.instrument_id == instrument_id),
+                size + 1,
+                cursor,
+                since,
+                until,
+            ),
+        )
+        return _to_page(result.scalars().all(), size)
+
+    async def list_since(self, since: datetime) -> list[TradeRecord]:
+        result = await self._execute(
+            "list_trades_since",
+            self._session.execute,
             select(TradeModel)
-            .where(TradeModel.instrument_id == instrument_id)
-            .order_by(TradeModel.executed_at.desc()),
+            .where(TradeModel.executed_at >= since)
+            .order_by(TradeModel.executed_at),
         )
         return [model_to_trade(m) for m in result.scalars().all()]
 
+    async def list_after(
+        self,
+        instrument_id: str,
+        cursor: ReplayCursor | None,
+        limit: int,
+    ) -> list[TradeRecord]:
+        key = (TradeModel.executed_at, TradeModel.sequence_number, TradeModel.trade_id)
+        statement = select(TradeModel).where(TradeModel.instrument_id == instrument_id)
+        if cursor is not None:
+            statement = statement.where(
+                tuple_(*key)
+                > tuple_(cursor.executed_at, cursor.sequence_number, cursor.trade_id)
+            )
+        result = await self._execute(
+            "list_trades_after",
+            self._session.execute,
+            statement.order_by(*key).limit(limit),
+        )
+        return [model_to_trade(m) for m in result.scalars().all()]
+
+    async def list_instruments(self) -> list[str]:
+        result = await self._execute(
+            "list_trade_instruments",
+            self._session.execute,
+            select(TradeModel.instrument_id).distinct(),
+        )
+        return list(result.scalars().all())
+
     async def exists(self, trade_id: str) -> bool:
         result = await self._execute(
             "trade_exists",
@@ -82,3 +187,39 @@ class SQLAlchemyTradeRepository(TradeRepository):
             raise DatabaseTimeoutError(f"Database operation timed out: {e}") from e
         except SQLAlchemyError as e:
             raise DatabaseOperationError(f"Database operation failed: {e}") from e
+
+
+def _page_size(limit: int) -> int:
+    return max(1, min(limit, MAX_PAGE_SIZE))
+
+
+def _keyset(
+    statement: Select,
+    limit: int,
+    cursor: TradeCursor | None,
+    since: datetime | None,
+    until: datetime | None,
+) -> Select:
+    """Newest-first page after ``cursor`` within ``[since, until)``."""
+    if cursor is not None:
+        statement = statement.where(
+            tuple_(TradeModel.executed_at, TradeModel.trade_id)
+            < tuple_(cursor.executed_at, cursor.trade_id)
+        )
+    if since is not None:
+        statement = statement.where(TradeModel.executed_at >= since)
+    if until is not None:
+        statement = statement.where(TradeModel.executed_at < until)
+    return statement.order_by(
+        TradeModel.executed_at.desc(), TradeModel.trade_id.desc()
+    ).limit(limit)
+
+
+def _to_page(models, size: int) -> TradePage:
+    """``models`` holds up to ``size + 1`` rows; the extra one means more."""
+    trades = [model_to_trade(m) for m in models[:size]]
+    next_cursor = None
+    if len(models) > size:
+        last = trades[-1]
+        next_cursor = TradeCursor(last.executed_at, last.trade_id)
+    return TradePage(trades=trades, next_cursor=next_cursor)
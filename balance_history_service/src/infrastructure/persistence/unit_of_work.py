@@ -9,9 +9,15 @@ from src.exceptions import (
     DatabaseOperationError,
     DatabaseTimeoutError,
 )
+from src.infrastructure.persistence.repositories.sqlalchemy_candle_repository import (
+    SQLAlchemyCandleRepository,
+)
 from src.infrastructure.persistence.repositories.sqlalchemy_order_history_repository import (
     SQLAlchemyOrderHistoryRepository,
 )
+from src.infrastructure.persistence.repositories.sqlalchemy_position_repository import (
+    SQLAlchemyPositionRepository,
+)
 from src.infrastructure.persistence.repositories.sqlalchemy_trade_repository import (
     SQLAlchemyTradeRepository,
 )
@@ -23,11 +29,15 @@ class SQLAlchemyUnitOfWork(UnitOfWork):
         self._session: AsyncSession | None = None
         self.trades: SQLAlchemyTradeRepository
         self.order_history: SQLAlchemyOrderHistoryRepository
+        self.candles: SQLAlchemyCandleRepository
+        self.positions: SQLAlchemyPositionRepository
 
     async def __aenter__(self) -> "SQLAlchemyUnitOfWork":
         self._session = self._session_factory()
         self.trades = SQLAlchemyTradeRepository(self._session)
         self.order_history = SQLAlchemyOrderHistoryRepository(self._session)
+        self.candles = SQLAlchemyCandleRepository(self._session)
+        self.positions = SQLAlchemyPositionRepository(self._session)
         return self
 
     async def __aexit__(
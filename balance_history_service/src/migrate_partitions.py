@@ -0,0 +1,139 @@
+"""Move trades / order_history from plain tables to monthly partitions.
+
+PostgreSQL only. Stop the worker first (events wait in the durable queue),
+then run:
+
+    PYTHONPATH=.:balance_history_service python -m src.migrate_partitions
+
+Each plain table (and its indexes) is renamed to ``<table>_legacy``, the
+partitioned table is created with partitions from the oldest row's month
+onwards, and rows are copied one month per transaction with
+``ON CONFLICT DO NOTHING``. An interrupted run can be started again: it
+resumes copying from whatever ``<table>_legacy`` still exists. The legacy
+table is dropped once copied unless ``--keep-legacy`` is given.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.conf import Config
+from src.database import engine
+from src.infrastructure.persistence.models import Base
+from src.infrastructure.persistence.partitions import (
+    PARTITIONED_TABLES,
+    PartitionManager,
+    add_months,
+    is_partitioned,
+    month_start,
+)
+from src.logging_config import setup_logging
+
+logger = logging.getLogger(__name__)
+
+
+async def migrate(db: AsyncEngine, keep_legacy: bool = False) -> None:
+    if db.dialect.name != "postgresql":
+        raise SystemExit("Partitioned storage requires PostgreSQL.")
+
+    async with db.begin() as conn:
+        for table, _ in PARTITIONED_TABLES:
+            if await _exists(conn, table.name) and not await is_partitioned(
+                conn, table.name
+            ):
+                await _rename_legacy(conn, table.name)
+        await conn.run_sync(
+            Base.metadata.create_all, tables=[t for t, _ in PARTITIONED_TABLES]
+        )
+
+    manager = PartitionManager(
+        db,
+        archive_dir=Config.HISTORY_ARCHIVE_DIR,
+        premake_months=Config.HISTORY_PARTITION_PREMAKE_MONTHS,
+    )
+    for table, column in PARTITIONED_TABLES:
+        legacy = f"{table.name}_legacy"
+        async with db.connect() as conn:
+            if not await _exists(conn, legacy):
+                continue
+            oldest = (
+                await conn.execute(text(f'SELECT min("{column.name}") FROM "{legacy}"'))
+            ).scalar()
+        if oldest is not None:
+            await manager.ensure_partitions(since=oldest)
+            await _copy(db, table, column, legacy, month_start(oldest))
+        if not keep_legacy:
+            async with db.begin() as conn:
+                await conn.execute(text(f'DROP TABLE "{legacy}"'))
+            logger.info("Dropped %s", legacy)
+    await manager.ensure_partitions()
+
+
+async def _copy(db: AsyncEngine, table, column, legacy: str, first) -> None:
+    names = ", ".join(f'"{name}"' for name in table.columns.keys())
+    keys = ", ".join(f'"{c.name}"' for c in table.primary_key.columns)
+    async with db.connect() as conn:
+        newest = (
+            await conn.execute(text(f'SELECT max("{column.name}") FROM "{legacy}"'))
+        ).scalar()
+    month = first
+    while month <= newest:
+        end = add_months(month, 1)
+        async with db.begin() as conn:
+            result = await conn.execute(
+                text(
+                    f'INSERT INTO "{table.name}" ({names}) '
+                    f'SELECT {names} FROM "{legacy}" '
+                    f'WHERE "{column.name}" >= :start AND "{column.name}" < :end '
+                    f"ON CONFLICT ({keys}) DO NOTHING"
+                ),
+                {"start": month, "end": end},
+            )
+        logger.info(
+            "Copied %s rows of %s for %s", result.rowcount, table.name, f"{month:%Y-%m}"
+        )
+        month = end
+
+
+async def _rename_legacy(conn, table: str) -> None:
+    legacy = f"{table}_legacy"
+    indexes = await conn.execute(
+        text("SELECT indexname FROM pg_indexes WHERE tablename = :table"),
+        {"table": table},
+    )
+    for (index,) in indexes.all():
+        # Index names are schema-wide; the new table reuses them.
+        await conn.execute(text(f'ALTER INDEX "{index}" RENAME TO "{index}_legacy"'))
+    await conn.execute(text(f'ALTER TABLE "{table}" RENAME TO "{legacy}"'))
+    logger.info("Renamed %s to %s", table, legacy)
+
+
+async def _exists(conn, table: str) -> bool:
+    result = await conn.execute(
+        text("SELECT to_regclass(:table) IS NOT NULL"), {"table": table}
+    )
+    return bool(result.scalar())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--keep-legacy", action="store_true")
+    args = parser.parse_args()
+    setup_logging()
+    asyncio.run(_main(args.keep_legacy))
+
+
+async def _main(keep_legacy: bool) -> None:
+    try:
+        await migrate(engine, keep_legacy=keep_legacy)
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Recompute the positions table from recorded trades.
+
+Stop the worker first (events wait in the durable queue), then run:
+
+    PYTHONPATH=.:balance_history_service python -m src.rebuild_positions
+
+Instruments are replayed in parallel (``POSITION_REBUILD_WORKERS``) in
+chunks of ``POSITION_REBUILD_CHUNK_SIZE`` trades; see
+``RebuildPositionsHandler``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from decimal import Decimal
+
+from src.application.position_updater import PositionUpdater
+from src.application.rebuild_positions import RebuildPositionsHandler
+from src.conf import Config
+from src.database import async_session_maker, engine
+from src.infrastructure.persistence.models import Base
+from src.infrastructure.persistence.unit_of_work import SQLAlchemyUnitOfWork
+from src.logging_config import setup_logging
+
+logger = logging.getLogger(__name__)
+
+
+async def run() -> None:
+    setup_logging()
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    handler = RebuildPositionsHandler(
+        lambda: SQLAlchemyUnitOfWork(async_session_maker),
+        PositionUpdater(fee_rate=Decimal(Config.POSITION_FEE_BPS) / 10_000),
+        workers=Config.POSITION_REBUILD_WORKERS,
+        chunk_size=Config.POSITION_REBUILD_CHUNK_SIZE,
+    )
+    try:
+        await handler.handle()
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
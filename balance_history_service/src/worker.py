@@ -22,6 +22,61 @@ from src.logging_config import setup_logging
 logger = logging.getLogger(__name__)
 
 
+def _build_position_updater():
+    """Return the ``PositionUpdater``, or ``None`` when disabled."""
+    if not Config.POSITIONS_ENABLED:
+        return None
+    from decimal import Decimal
+
+    from src.application.position_updater import PositionUpdater
+
+    return PositionUpdater(fee_rate=Decimal(Config.POSITION_FEE_BPS) / 10_000)
+
+
+def _build_candle_projector(uow_factory):
+    """Return ``(projector, cache)``, or ``(None, None)`` when disabled."""
+    if not (Config.CANDLES_ENABLED and Config.REDIS_ENABLED):
+        return None, None
+    from src.application.candle_aggregator import CandleAggregator
+    from src.application.candle_projector import CandleProjector
+    from src.infrastructure.cache.redis_candle_cache import RedisCandleCache
+
+    cache = RedisCandleCache(
+        url=Config.REDIS_URL, history_limit=Config.CANDLE_HISTORY_LIMIT
+    )
+    projector = CandleProjector(
+        CandleAggregator(),
+        cache,
+        uow_factory,
+        flush_interval=Config.CANDLE_FLUSH_INTERVAL_MS / 1000,
+        finalize_grace=Config.CANDLE_FINALIZE_GRACE_MS / 1000,
+        batch_size=Config.CANDLE_PERSIST_BATCH_SIZE,
+    )
+    return projector, cache
+
+
+def _build_ticker_publisher(uow_factory):
+    """Return ``(publisher, cache)``, or ``(None, None)`` when disabled."""
+    if not (Config.TICKERS_ENABLED and Config.REDIS_ENABLED):
+        return None, None
+    from src.application.ticker_engine import TickerEngine
+    from src.application.ticker_publisher import TickerPublisher
+    from src.infrastructure.cache.redis_ticker_cache import RedisTickerCache
+
+    cache = RedisTickerCache(url=Config.REDIS_URL)
+    publisher = TickerPublisher(
+        TickerEngine(
+            window_seconds=Config.TICKER_WINDOW_SECONDS,
+            bucket_seconds=Config.TICKER_BUCKET_SECONDS,
+        ),
+        cache,
+        uow_factory,
+        window_seconds=Config.TICKER_WINDOW_SECONDS,
+        flush_interval=Config.TICKER_FLUSH_INTERVAL_MS / 1000,
+    )
+    return publisher, cache
+
+
 async def run() -> None:
     setup_logging()
     logger.info("Starting Balance & History worker env=%s", Config.APP_ENV)
@@ -29,24 +84,62 @@ async def run() -> None:
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
+    from src.infrastructure.persistence.partitions import PartitionManager
+
+    partitions = PartitionManager(
+        engine,
+        archive_dir=Config.HISTORY_ARCHIVE_DIR,
+        retention_months=Config.HISTORY_RETENTION_MONTHS,
+        premake_months=Config.HISTORY_PARTITION_PREMAKE_MONTHS,
+        interval=Config.HISTORY_PARTITION_MAINTENANCE_INTERVAL_SECONDS,
+    )
+    await partitions.start()
+
     def uow_factory() -> SQLAlchemyUnitOfWork:
         return SQLAlchemyUnitOfWork(async_session_maker)
 
+    from src.application.record_history_batch import RecordHistoryBatchHandler
     from src.application.record_order_event import RecordOrderEventHandler
     from src.application.record_trade import RecordTradeHandler
 
+    positions = _build_position_updater()
+
+    # Read models fed by every newly recorded trade (duplicates raise first).
+    projections = []
+    caches = []
+    for projection, cache in (
+        _build_candle_projector(uow_factory),
+        _build_ticker_publisher(uow_factory),
+    ):
+        if projection is not None:
+            projections.append(projection)
+            caches.append(cache)
+
     class _TradeHandler:
         async def handle(self, command):
-            await RecordTradeHandler(uow_factory()).handle(command)
+            await RecordTradeHandler(uow_factory(), positions).handle(command)
+            for projection in projections:
+                projection.on_trade(command)
 
     class _OrderHandler:
         async def handle(self, command):
             await RecordOrderEventHandler(uow_factory()).handle(command)
 
+    class _BatchHandler:
+        async def handle(self, command):
+            recorded = await RecordHistoryBatchHandler(uow_factory(), positions).handle(
+                command
+            )
+            for trade in recorded:
+                for projection in projections:
+                    projection.on_trade(trade)
+            return recorded
+
     if not Config.RABBITMQ_ENABLED:
         logger.error(
             "RABBITMQ_ENABLED=false — BHS is an event consumer and cannot run without the bus."
         )
+        await partitions.stop()
         return
 
     from src.infrastructure.messaging.history_event_consumer import (
@@ -61,7 +154,16 @@ async def run() -> None:
         record_trade_handler=_TradeHandler(),  # type: ignore[arg-type]
         record_order_handler=_OrderHandler(),  # type: ignore[arg-type]
         exchange_type=Config.RABBITMQ_EXCHANGE_TYPE,
+        record_batch_handler=(
+            _BatchHandler()  # type: ignore[arg-type]
+            if Config.HISTORY_BATCH_ENABLED
+            else None
+        ),
+        batch_size=Config.HISTORY_BATCH_SIZE,
+        batch_max_wait=Config.HISTORY_BATCH_MAX_WAIT_MS / 1000,
     )
+    for projection in projections:
+        await projection.start()
     await consumer.start()
 
     stop_event = asyncio.Event()
@@ -79,6 +181,11 @@ async def run() -> None:
 
     await stop_event.wait()
     await consumer.stop()
+    for projection in projections:
+        await projection.stop()
+    for cache in caches:
+        await cache.close()
+    await partitions.stop()
     await engine.dispose()
     logger.info("Balance & History worker stopped")
 
@@ -5,7 +5,9 @@ from unittest.mock import AsyncMock
 import pytest
 
 from src.domain.entities.trade_record import TradeRecord
+from src.domain.ports.candle_repository import CandleRepository
 from src.domain.ports.order_history_repository import OrderHistoryRepository
+from src.domain.ports.position_repository import PositionRepository
 from src.domain.ports.trade_repository import TradeRepository
 from src.domain.ports.unit_of_work import UnitOfWork
 
@@ -14,9 +16,13 @@ from src.domain.ports.unit_of_work import UnitOfWork
 def mock_trade_repo() -> AsyncMock:
     repo = AsyncMock(spec=TradeRepository)
     repo.add = AsyncMock()
+    repo.add_many = AsyncMock(return_value=set())
     repo.get_by_id = AsyncMock()
     repo.list_by_trader = AsyncMock()
     repo.list_by_instrument = AsyncMock()
+    repo.list_since = AsyncMock(return_value=[])
+    repo.list_after = AsyncMock(return_value=[])
+    repo.list_instruments = AsyncMock(return_value=[])
     repo.exists = AsyncMock(return_value=False)
     return repo
 
@@ -25,19 +31,43 @@ def mock_trade_repo() -> AsyncMock:
 def mock_order_history_repo() -> AsyncMock:
     repo = AsyncMock(spec=OrderHistoryRepository)
     repo.add = AsyncMock()
+    repo.add_many = AsyncMock()
     repo.list_by_order = AsyncMock()
     repo.list_by_trader = AsyncMock()
     return repo
 
 
+@pytest.fixture
+def mock_candle_repo() -> AsyncMock:
+    repo = AsyncMock(spec=CandleRepository)
+    repo.add_many = AsyncMock()
+    repo.list_range = AsyncMock()
+    return repo
+
+
+@pytest.fixture
+def mock_position_repo() -> AsyncMock:
+    repo = AsyncMock(spec=PositionRepository)
+    repo.get = AsyncMock(return_value=None)
+    repo.list_by_trader = AsyncMock(return_value=[])
+    repo.get_many = AsyncMock(return_value={})
+    repo.insert_missing = AsyncMock()
+    repo.upsert_many = AsyncMock()
+    return repo
+
+
 @pytest.fixture
 def mock_uow(
     mock_trade_repo: AsyncMock,
     mock_order_history_repo: AsyncMock,
+    mock_candle_repo: AsyncMock,
+    mock_position_repo: AsyncMock,
 ) -> AsyncMock:
     uow = AsyncMock(spec=UnitOfWork)
     uow.trades = mock_trade_repo
     uow.order_history = mock_order_history_repo
+    uow.candles = mock_candle_repo
+    uow.positions = mock_position_repo
     uow.commit = AsyncMock()
     uow.rollback = AsyncMock()
     uow.__aenter__ = AsyncMock(return_value=uow)
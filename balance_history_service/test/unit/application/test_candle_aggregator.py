@@ -0,0 +1,88 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+from src.application.candle_aggregator import CandleAggregator
+
+INSTRUMENT = "66666666-6666-4666-8666-666666666666"
+T0 = datetime(2026, 1, 5, 10, 0, 0, tzinfo=timezone.utc)
+
+
+def _trade(aggregator: CandleAggregator, price: str, qty: int, at: datetime) -> None:
+    aggregator.add_trade(INSTRUMENT, Decimal(price), qty, "USD", at)
+
+
+def test_builds_ohlcv_and_vwap_for_every_interval() -> None:
+    aggregator = CandleAggregator()
+    _trade(aggregator, "10.00", 1, T0)
+    _trade(aggregator, "12.00", 2, T0 + timedelta(milliseconds=300))
+    _trade(aggregator, "9.00", 1, T0 + timedelta(milliseconds=600))
+
+    open_bars, finalized = aggregator.drain()
+
+    assert finalized == []
+    assert sorted(c.interval for c in open_bars) == ["1d", "1h", "1m", "1s", "5m"]
+    bar = next(c for c in open_bars if c.interval == "1s")
+    assert (bar.open, bar.high, bar.low, bar.close) == (
+        Decimal("10.00"),
+        Decimal("12.00"),
+        Decimal("9.00"),
+        Decimal("9.00"),
+    )
+    assert bar.volume == 4
+    assert bar.trade_count == 3
+    assert bar.vwap == Decimal("10.75")
+    assert bar.open_time == T0
+
+
+def test_trade_in_next_window_finalizes_bar() -> None:
+    aggregator = CandleAggregator({"1s": 1, "1m": 60})
+    _trade(aggregator, "10.00", 1, T0)
+    _trade(aggregator, "11.00", 1, T0 + timedelta(seconds=1))
+
+    open_bars, finalized = aggregator.drain()
+
+    assert [(c.interval, c.close) for c in finalized] == [("1s", Decimal("10.00"))]
+    assert {c.interval: c.volume for c in open_bars} == {"1s": 1, "1m": 2}
+
+
+def test_expire_finalizes_idle_bars() -> None:
+    aggregator = CandleAggregator({"1s": 1, "1m": 60})
+    _trade(aggregator, "10.00", 1, T0)
+    aggregator.drain()
+
+    aggregator.expire(T0 + timedelta(seconds=2))
+
+    open_bars, finalized = aggregator.drain()
+    assert [c.interval for c in finalized] == ["1s"]
+    assert open_bars == []
+    assert [c.interval for c in aggregator.open_bars(INSTRUMENT)] == ["1m"]
+
+
+def test_late_trade_does_not_rewrite_finalized_bar() -> None:
+    aggregator = CandleAggregator({"1s": 1, "1m": 60})
+    _trade(aggregator, "10.00", 1, T0 + timedelta(seconds=1))
+    aggregator.expire(T0 + timedelta(seconds=5))
+    aggregator.drain()
+
+    _trade(aggregator, "99.00", 1, T0)
+
+    open_bars, finalized = aggregator.drain()
+    assert finalized == []
+    assert aggregator.late == 1
+    assert [c.interval for c in open_bars] == ["1m"]
+
+
+def test_restore_resumes_open_bar() -> None:
+    first = CandleAggregator({"1m": 60})
+    _trade(first, "10.00", 2, T0)
+    open_bars, _ = first.drain()
+
+    second = CandleAggregator({"1m": 60})
+    second.restore(open_bars)
+    _trade(second, "13.00", 1, T0 + timedelta(seconds=30))
+
+    [bar] = second.open_bars(INSTRUMENT)
+    assert bar.volume == 3
+    assert bar.open == Decimal("10.00")
+    assert bar.high == Decimal("13.00")
+    assert bar.vwap == Decimal("11.00")
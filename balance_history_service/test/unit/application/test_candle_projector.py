@@ -0,0 +1,92 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import AsyncMock
+
+from src.application.candle_aggregator import CandleAggregator
+from src.application.candle_projector import CandleProjector
+from src.application.record_trade import RecordTradeCommand
+from src.domain.ports.candle_cache import CandleCache
+
+T0 = datetime(2026, 1, 5, 10, 0, 0, tzinfo=timezone.utc)
+
+
+def _command(price: str, at: datetime) -> RecordTradeCommand:
+    return RecordTradeCommand(
+        trade_id="11111111-1111-4111-8111-111111111111",
+        maker_order_id="22222222-2222-4222-8222-222222222222",
+        taker_order_id="33333333-3333-4333-8333-333333333333",
+        buyer_id="44444444-4444-4444-8444-444444444444",
+        seller_id="55555555-5555-4555-8555-555555555555",
+        instrument_id="66666666-6666-4666-8666-666666666666",
+        quantity=5,
+        execution_price=Decimal(price),
+        execution_price_currency="USD",
+        sequence_number=1,
+        executed_at=at,
+    )
+
+
+def _projector(mock_uow: AsyncMock, cache: AsyncMock, now: list[datetime]):
+    return CandleProjector(
+        CandleAggregator({"1s": 1, "1m": 60}),
+        cache,
+        lambda: mock_uow,
+        finalize_grace=1.0,
+        batch_size=1,
+        clock=lambda: now[0],
+    )
+
+
+async def test_flush_publishes_open_bars_and_saves_finalized(
+    mock_uow: AsyncMock, mock_candle_repo: AsyncMock
+) -> None:
+    cache = AsyncMock(spec=CandleCache)
+    now = [T0]
+    projector = _projector(mock_uow, cache, now)
+    projector.on_trade(_command("10.00", T0))
+    projector.on_trade(_command("11.00", T0 + timedelta(seconds=1)))
+
+    await projector.flush()
+
+    open_bars, finalized = cache.publish.await_args.args
+    assert sorted(c.interval for c in open_bars) == ["1m", "1s"]
+    assert [c.close for c in finalized] == [Decimal("10.00")]
+    mock_candle_repo.add_many.assert_awaited_once_with(finalized)
+    mock_uow.commit.assert_awaited_once()
+
+
+async def test_idle_bars_are_finalized_after_grace(
+    mock_uow: AsyncMock, mock_candle_repo: AsyncMock
+) -> None:
+    cache = AsyncMock(spec=CandleCache)
+    now = [T0]
+    projector = _projector(mock_uow, cache, now)
+    projector.on_trade(_command("10.00", T0))
+    await projector.flush()
+    mock_candle_repo.add_many.assert_not_awaited()
+
+    now[0] = T0 + timedelta(minutes=2)
+    await projector.flush()
+
+    # batch_size=1: one insert per finalized bar.
+    assert mock_candle_repo.add_many.await_count == 2
+    assert projector.saved == 2
+
+
+async def test_failed_writes_are_retried(
+    mock_uow: AsyncMock, mock_candle_repo: AsyncMock
+) -> None:
+    cache = AsyncMock(spec=CandleCache)
+    cache.publish.side_effect = [RuntimeError("down"), None]
+    mock_candle_repo.add_many.side_effect = [RuntimeError("down"), None]
+    now = [T0 + timedelta(seconds=5)]
+    projector = _projector(mock_uow, cache, now)
+    projector.on_trade(_command("10.00", T0))
+
+    await projector.flush()
+    assert projector.pending == 1
+
+    await projector.flush()
+    assert projector.pending == 0
+    assert projector.saved == 1
+    assert [c.interval for c in cache.publish.await_args.args[1]] == ["1s"]
@@ -0,0 +1,71 @@
+from dataclasses import replace
+from decimal import Decimal
+from unittest.mock import AsyncMock
+
+from src.application.position_updater import PositionUpdater
+from src.domain.entities.position import Position
+from src.domain.entities.trade_record import TradeRecord
+
+
+def test_fold_moves_buyer_and_seller(sample_trade: TradeRecord) -> None:
+    positions: dict = {}
+
+    PositionUpdater(fee_rate=Decimal("0.001")).fold(positions, sample_trade)
+
+    buyer = positions[(sample_trade.buyer_id, sample_trade.instrument_id)]
+    seller = positions[(sample_trade.seller_id, sample_trade.instrument_id)]
+    assert buyer.net_quantity == 10
+    assert seller.net_quantity == -10
+    assert buyer.average_cost == seller.average_cost == Decimal("100.50")
+    assert buyer.fees == seller.fees == Decimal("1.005")
+    assert buyer.turnover == Decimal("1005.00")
+
+
+def test_self_trade_is_flat(sample_trade: TradeRecord) -> None:
+    positions: dict = {}
+    trade = replace(sample_trade, seller_id=sample_trade.buyer_id)
+
+    PositionUpdater().fold(positions, trade)
+
+    (position,) = positions.values()
+    assert position.net_quantity == 0
+    assert position.realized_pnl == 0
+    assert position.trade_count == 2
+
+
+async def test_apply_locks_folds_and_upserts(
+    mock_uow: AsyncMock,
+    mock_position_repo: AsyncMock,
+    sample_trade: TradeRecord,
+) -> None:
+    buyer_key = (sample_trade.buyer_id, sample_trade.instrument_id)
+    mock_position_repo.get_many.return_value = {
+        buyer_key: Position(
+            *buyer_key, currency="USD", net_quantity=-10, average_cost=Decimal("110")
+        )
+    }
+
+    await PositionUpdater().apply(mock_uow, [sample_trade])
+
+    blanks = mock_position_repo.insert_missing.await_args.args[0]
+    assert {(p.trader_id, p.instrument_id) for p in blanks} == {
+        buyer_key,
+        (sample_trade.seller_id, sample_trade.instrument_id),
+    }
+    assert all(p.net_quantity == 0 and p.trade_count == 0 for p in blanks)
+    assert mock_position_repo.get_many.await_args.kwargs == {"for_update": True}
+    written = {
+        (p.trader_id, p.instrument_id): p
+        for p in mock_position_repo.upsert_many.await_args.args[0]
+    }
+    assert written[buyer_key].net_quantity == 0
+    assert written[buyer_key].realized_pnl == Decimal("95.00")
+    assert len(written) == 2
+
+
+async def test_apply_without_trades_does_nothing(
+    mock_uow: AsyncMock, mock_position_repo: AsyncMock
+) -> None:
+    await PositionUpdater().apply(mock_uow, [])
+
+    mock_position_repo.get_many.assert_not_awaited()
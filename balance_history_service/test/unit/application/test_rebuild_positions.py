@@ -0,0 +1,32 @@
+from dataclasses import replace
+from unittest.mock import AsyncMock
+
+from src.application.position_updater import PositionUpdater
+from src.application.rebuild_positions import RebuildPositionsHandler
+from src.domain.entities.trade_page import ReplayCursor
+from src.domain.entities.trade_record import TradeRecord
+
+
+async def test_replays_instruments_in_chunks(
+    mock_uow: AsyncMock,
+    mock_trade_repo: AsyncMock,
+    mock_position_repo: AsyncMock,
+    sample_trade: TradeRecord,
+) -> None:
+    trades = [
+        replace(sample_trade, trade_id=f"trade-{index}", quantity=index + 1)
+        for index in range(3)
+    ]
+    mock_trade_repo.list_instruments.return_value = [sample_trade.instrument_id]
+    mock_trade_repo.list_after.side_effect = [trades[:2], trades[2:]]
+
+    written = await RebuildPositionsHandler(
+        lambda: mock_uow, PositionUpdater(), workers=2, chunk_size=2
+    ).handle()
+
+    assert written == 2
+    cursors = [call.args[1] for call in mock_trade_repo.list_after.await_args_list]
+    assert cursors == [None, ReplayCursor.after(trades[1])]
+    positions = mock_position_repo.upsert_many.await_args.args[0]
+    assert sorted(p.net_quantity for p in positions) == [-6, 6]
+    mock_uow.commit.assert_awaited_once()
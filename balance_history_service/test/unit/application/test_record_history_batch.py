@@ -0,0 +1,84 @@
+from dataclasses import replace
+from decimal import Decimal
+from unittest.mock import AsyncMock
+
+from src.application.record_history_batch import (
+    RecordHistoryBatchCommand,
+    RecordHistoryBatchHandler,
+)
+from src.application.record_order_event import RecordOrderEventCommand
+from src.application.record_trade import RecordTradeCommand
+
+_TRADE = RecordTradeCommand(
+    trade_id="11111111-1111-4111-8111-111111111111",
+    maker_order_id="22222222-2222-4222-8222-222222222222",
+    taker_order_id="33333333-3333-4333-8333-333333333333",
+    buyer_id="44444444-4444-4444-8444-444444444444",
+    seller_id="55555555-5555-4555-8555-555555555555",
+    instrument_id="66666666-6666-4666-8666-666666666666",
+    quantity=5,
+    execution_price=Decimal("10.00"),
+    execution_price_currency="USD",
+    sequence_number=1,
+)
+_ORDER_EVENT = RecordOrderEventCommand(
+    order_id="22222222-2222-4222-8222-222222222222",
+    trader_id="44444444-4444-4444-8444-444444444444",
+    instrument_id="66666666-6666-4666-8666-666666666666",
+    event_type="OrderFilled",
+)
+
+
+async def test_records_batch_in_one_transaction(
+    mock_uow: AsyncMock,
+    mock_trade_repo: AsyncMock,
+    mock_order_history_repo: AsyncMock,
+) -> None:
+    second = replace(_TRADE, trade_id="77777777-7777-4777-8777-777777777777")
+    mock_trade_repo.add_many.return_value = {_TRADE.trade_id, second.trade_id}
+
+    recorded = await RecordHistoryBatchHandler(mock_uow).handle(
+        RecordHistoryBatchCommand(
+            trades=(_TRADE, second), order_events=(_ORDER_EVENT, _ORDER_EVENT)
+        )
+    )
+
+    assert recorded == [_TRADE, second]
+    trades = mock_trade_repo.add_many.await_args.args[0]
+    assert [t.trade_id for t in trades] == [_TRADE.trade_id, second.trade_id]
+    assert len(mock_order_history_repo.add_many.await_args.args[0]) == 2
+    mock_trade_repo.exists.assert_not_awaited()
+    mock_uow.commit.assert_awaited_once()
+
+
+async def test_duplicates_are_not_returned(
+    mock_uow: AsyncMock,
+    mock_trade_repo: AsyncMock,
+) -> None:
+    redelivered = replace(_TRADE, trade_id="77777777-7777-4777-8777-777777777777")
+    mock_trade_repo.add_many.return_value = {_TRADE.trade_id}
+
+    recorded = await RecordHistoryBatchHandler(mock_uow).handle(
+        RecordHistoryBatchCommand(trades=(_TRADE, _TRADE, redelivered))
+    )
+
+    assert recorded == [_TRADE]
+    # The in-batch repeat is dropped before the insert.
+    assert len(mock_trade_repo.add_many.await_args.args[0]) == 2
+
+
+async def test_newly_recorded_trades_update_positions(
+    mock_uow: AsyncMock,
+    mock_trade_repo: AsyncMock,
+) -> None:
+    redelivered = replace(_TRADE, trade_id="77777777-7777-4777-8777-777777777777")
+    mock_trade_repo.add_many.return_value = {_TRADE.trade_id}
+    positions = AsyncMock()
+
+    await RecordHistoryBatchHandler(mock_uow, positions).handle(
+        RecordHistoryBatchCommand(trades=(_TRADE, redelivered))
+    )
+
+    uow, trades = positions.apply.await_args.args
+    assert uow is mock_uow
+    assert [t.trade_id for t in trades] == [_TRADE.trade_id]
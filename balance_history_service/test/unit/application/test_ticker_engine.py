@@ -0,0 +1,101 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+from src.application.ticker_engine import TickerEngine, TimerWheel
+
+INSTRUMENT = "66666666-6666-4666-8666-666666666666"
+T0 = datetime(2026, 1, 5, 0, 0, 0, tzinfo=timezone.utc)
+
+
+def _trade(engine: TickerEngine, price: str, qty: int, at: datetime) -> None:
+    engine.add_trade(INSTRUMENT, Decimal(price), qty, "USD", at)
+
+
+class TestTimerWheel:
+    def test_returns_due_items_once(self) -> None:
+        wheel = TimerWheel(10)
+        wheel.advance(100)
+        wheel.schedule(103, "a")
+        wheel.schedule(105, "b")
+
+        assert wheel.advance(102) == []
+        assert wheel.advance(104) == ["a"]
+        assert wheel.advance(104) == []
+        assert wheel.advance(200) == ["b"]
+
+    def test_keeps_items_due_after_a_full_revolution(self) -> None:
+        wheel = TimerWheel(4)
+        wheel.advance(0)
+        wheel.schedule(6, "late")
+
+        assert wheel.advance(3) == []
+        assert wheel.advance(6) == ["late"]
+
+
+class TestTickerEngine:
+    def test_window_stats(self) -> None:
+        engine = TickerEngine(window_seconds=3600, bucket_seconds=60)
+        _trade(engine, "100.00", 2, T0)
+        _trade(engine, "110.00", 1, T0 + timedelta(minutes=10))
+        _trade(engine, "95.00", 1, T0 + timedelta(minutes=20))
+
+        ticker = engine.ticker(INSTRUMENT, T0 + timedelta(minutes=20))
+
+        assert ticker.open_price == Decimal("100.00")
+        assert ticker.last_price == Decimal("95.00")
+        assert (ticker.high, ticker.low) == (Decimal("110.00"), Decimal("95.00"))
+        assert ticker.volume == 4
+        assert ticker.trade_count == 3
+        assert ticker.vwap == Decimal("101.25")
+        assert ticker.price_change == Decimal("-5.00")
+        assert ticker.price_change_percent == Decimal("-5")
+
+    def test_buckets_expire_from_the_window(self) -> None:
+        engine = TickerEngine(window_seconds=3600, bucket_seconds=60)
+        _trade(engine, "120.00", 5, T0)
+        _trade(engine, "100.00", 1, T0 + timedelta(minutes=30))
+        engine.drain()
+
+        engine.advance(T0 + timedelta(minutes=60))
+
+        [ticker] = engine.drain()
+        assert ticker.volume == 1
+        assert ticker.open_price == Decimal("100.00")
+        assert ticker.high == Decimal("100.00")
+
+        engine.advance(T0 + timedelta(minutes=95))
+        [ticker] = engine.drain()
+        assert ticker.volume == 0
+        assert ticker.trade_count == 0
+        assert ticker.high is None
+        assert ticker.vwap is None
+        assert ticker.last_price == Decimal("100.00")
+
+    def test_advance_only_touches_expiring_instruments(self) -> None:
+        engine = TickerEngine(window_seconds=120, bucket_seconds=60)
+        _trade(engine, "10.00", 1, T0)
+        engine.add_trade("other", Decimal("5.00"), 1, "USD", T0 + timedelta(minutes=1))
+        engine.drain()
+
+        engine.advance(T0 + timedelta(minutes=2))
+
+        assert [t.instrument_id for t in engine.drain()] == [INSTRUMENT]
+
+    def test_trades_older_than_the_window_are_ignored(self) -> None:
+        engine = TickerEngine(window_seconds=3600, bucket_seconds=60)
+        engine.advance(T0 + timedelta(hours=2))
+
+        _trade(engine, "10.00", 1, T0)
+
+        assert engine.ticker(INSTRUMENT) is None
+        assert engine.stale == 1
+
+    def test_out_of_order_trade_joins_newest_bucket(self) -> None:
+        engine = TickerEngine(window_seconds=3600, bucket_seconds=60)
+        _trade(engine, "10.00", 1, T0 + timedelta(minutes=5))
+        _trade(engine, "12.00", 1, T0 + timedelta(minutes=1))
+
+        engine.advance(T0 + timedelta(minutes=64))
+        assert engine.ticker(INSTRUMENT).volume == 2
+        engine.advance(T0 + timedelta(minutes=65))
+        assert engine.ticker(INSTRUMENT).volume == 0
@@ -0,0 +1,71 @@
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock
+
+from src.application.record_trade import RecordTradeCommand
+from src.application.ticker_engine import TickerEngine
+from src.application.ticker_publisher import TickerPublisher
+from src.domain.entities.trade_record import TradeRecord
+from src.domain.ports.ticker_cache import TickerCache
+
+NOW = datetime(2026, 1, 5, 12, 0, tzinfo=timezone.utc)
+
+
+def _publisher(mock_uow: AsyncMock, cache: AsyncMock) -> TickerPublisher:
+    return TickerPublisher(
+        TickerEngine(window_seconds=3600, bucket_seconds=60),
+        cache,
+        lambda: mock_uow,
+        window_seconds=3600,
+        clock=lambda: NOW,
+    )
+
+
+async def test_start_rebuilds_window_from_recent_trades(
+    mock_uow: AsyncMock,
+    mock_trade_repo: AsyncMock,
+    sample_trade: TradeRecord,
+) -> None:
+    mock_trade_repo.list_since.return_value = [
+        replace(sample_trade, executed_at=NOW - timedelta(minutes=30))
+    ]
+    cache = AsyncMock(spec=TickerCache)
+    publisher = _publisher(mock_uow, cache)
+
+    await publisher.start()
+    await publisher.stop()
+
+    mock_trade_repo.list_since.assert_awaited_once_with(NOW - timedelta(hours=1))
+    [ticker] = cache.publish.await_args.args[0]
+    assert ticker.volume == sample_trade.quantity
+
+
+async def test_flush_publishes_changed_tickers_and_retries(
+    mock_uow: AsyncMock, sample_trade: TradeRecord
+) -> None:
+    cache = AsyncMock(spec=TickerCache)
+    cache.publish.side_effect = [RuntimeError("down"), None]
+    publisher = _publisher(mock_uow, cache)
+    publisher.on_trade(
+        RecordTradeCommand(
+            trade_id=sample_trade.trade_id,
+            maker_order_id=sample_trade.maker_order_id,
+            taker_order_id=sample_trade.taker_order_id,
+            buyer_id=sample_trade.buyer_id,
+            seller_id=sample_trade.seller_id,
+            instrument_id=sample_trade.instrument_id,
+            quantity=3,
+            execution_price=sample_trade.execution_price,
+            execution_price_currency="USD",
+            sequence_number=1,
+            executed_at=NOW,
+        )
+    )
+
+    await publisher.flush()
+    await publisher.flush()
+    await publisher.flush()
+
+    assert cache.publish.await_count == 2
+    [ticker] = cache.publish.await_args.args[0]
+    assert ticker.volume == 3
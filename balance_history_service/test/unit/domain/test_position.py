@@ -0,0 +1,51 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from src.domain.entities.position import Position
+
+_AT = datetime(2026, 10, 1, tzinfo=timezone.utc)
+
+
+def _fill(position: Position, quantity: int, price: str) -> Position:
+    return position.apply_fill(quantity, Decimal(price), Decimal("0.10"), "t", _AT)
+
+
+def test_adding_to_a_position_averages_the_cost() -> None:
+    position = _fill(
+        _fill(Position("trader", "instrument", "USD"), 10, "100"), 30, "104"
+    )
+
+    assert position.net_quantity == 40
+    assert position.average_cost == Decimal("103")
+    assert position.realized_pnl == 0
+    assert position.turnover == Decimal("4120")
+    assert position.fees == Decimal("0.20")
+    assert position.trade_count == 2
+
+
+def test_reducing_a_long_realizes_pnl_at_average_cost() -> None:
+    position = _fill(
+        _fill(Position("trader", "instrument", "USD"), 10, "100"), -4, "110"
+    )
+
+    assert position.net_quantity == 6
+    assert position.average_cost == Decimal("100")
+    assert position.realized_pnl == Decimal("40")
+
+
+def test_covering_a_short_realizes_pnl() -> None:
+    position = _fill(_fill(Position("trader", "instrument", "USD"), -5, "50"), 5, "45")
+
+    assert position.net_quantity == 0
+    assert position.average_cost == 0
+    assert position.realized_pnl == Decimal("25")
+
+
+def test_flipping_opens_the_remainder_at_the_fill_price() -> None:
+    position = _fill(_fill(Position("trader", "instrument", "USD"), 3, "10"), -5, "12")
+
+    assert position.net_quantity == -2
+    assert position.average_cost == Decimal("12")
+    assert position.realized_pnl == Decimal("6")
+    assert position.last_trade_id == "t"
+    assert position.updated_at == _AT
@@ -0,0 +1,107 @@
+import csv
+import gzip
+from dataclasses import replace
+from datetime import datetime, timezone
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.domain.entities.order_history_entry import OrderHistoryEntry
+from src.domain.entities.trade_record import TradeRecord
+from src.infrastructure.persistence.models import OrderHistoryModel, TradeModel
+from src.infrastructure.persistence.partitions import (
+    PartitionManager,
+    add_months,
+    month_start,
+    partition_name,
+)
+from src.infrastructure.persistence.repositories.sqlalchemy_order_history_repository import (
+    SQLAlchemyOrderHistoryRepository,
+)
+from src.infrastructure.persistence.repositories.sqlalchemy_trade_repository import (
+    SQLAlchemyTradeRepository,
+)
+
+_NOW = datetime(2026, 10, 18, 12, tzinfo=timezone.utc)
+
+
+def test_month_arithmetic() -> None:
+    month = month_start(datetime(2026, 12, 31, 23, 59, tzinfo=timezone.utc))
+
+    assert month == datetime(2026, 12, 1, tzinfo=timezone.utc)
+    assert add_months(month, 1) == datetime(2027, 1, 1, tzinfo=timezone.utc)
+    assert add_months(month, -12) == datetime(2025, 12, 1, tzinfo=timezone.utc)
+    assert partition_name("trades", month) == "trades_p2026_12"
+
+
+async def test_archives_and_deletes_expired_months(
+    session_factory: async_sessionmaker[AsyncSession],
+    sample_trade: TradeRecord,
+    sample_order_entry: OrderHistoryEntry,
+    tmp_path,
+) -> None:
+    times = [
+        datetime(2026, 6, 30, 23, tzinfo=timezone.utc),
+        datetime(2026, 7, 1, 1, tzinfo=timezone.utc),
+        datetime(2026, 8, 2, tzinfo=timezone.utc),
+        datetime(2026, 9, 3, tzinfo=timezone.utc),
+    ]
+    async with session_factory() as session:
+        await SQLAlchemyTradeRepository(session).add_many(
+            [
+                replace(sample_trade, trade_id=f"trade-{index}", executed_at=at)
+                for index, at in enumerate(times)
+            ]
+        )
+        await SQLAlchemyOrderHistoryRepository(session).add_many(
+            [replace(sample_order_entry, occurred_at=times[-1])]
+        )
+        await session.commit()
+    manager = PartitionManager(
+        session_factory.kw["bind"],
+        archive_dir=tmp_path,
+        retention_months=2,
+        clock=lambda: _NOW,
+    )
+
+    assert await manager.ensure_partitions() == []
+    archived = await manager.archive_expired()
+
+    assert [path.name for path in archived] == [
+        "trades_p2026_06.csv.gz",
+        "trades_p2026_07.csv.gz",
+    ]
+    with gzip.open(archived[0], "rt", newline="") as archive:
+        rows = list(csv.DictReader(archive))
+    assert [row["trade_id"] for row in rows] == ["trade-0"]
+    assert rows[0]["execution_price"] == "100.50"
+    assert not list(tmp_path.rglob("*.partial"))
+    async with session_factory() as session:
+        remaining = await session.execute(
+            select(TradeModel.trade_id).order_by(TradeModel.executed_at)
+        )
+        assert remaining.scalars().all() == ["trade-2", "trade-3"]
+        entries = await session.execute(select(func.count(OrderHistoryModel.entry_id)))
+        assert entries.scalar() == 1
+
+
+async def test_retention_zero_keeps_everything(
+    session_factory: async_sessionmaker[AsyncSession],
+    sample_trade: TradeRecord,
+    tmp_path,
+) -> None:
+    async with session_factory() as session:
+        await SQLAlchemyTradeRepository(session).add_many(
+            [
+                replace(
+                    sample_trade, executed_at=datetime(2020, 1, 1, tzinfo=timezone.utc)
+                )
+            ]
+        )
+        await session.commit()
+    manager = PartitionManager(
+        session_factory.kw["bind"], archive_dir=tmp_path, clock=lambda: _NOW
+    )
+
+    assert await manager.archive_expired() == []
+    assert not list(tmp_path.iterdir())
@@ -0,0 +1,66 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+from src.domain.entities.candle import Candle
+from src.infrastructure.cache.redis_candle_cache import (
+    RedisCandleCache,
+    candle_from_json,
+    candle_to_json,
+)
+
+CANDLE = Candle(
+    instrument_id="66666666-6666-4666-8666-666666666666",
+    interval="1m",
+    open_time=datetime(2026, 1, 5, 10, 0, tzinfo=timezone.utc),
+    open=Decimal("10.00"),
+    high=Decimal("11.00"),
+    low=Decimal("9.00"),
+    close=Decimal("10.50"),
+    volume=4,
+    notional=Decimal("41.00"),
+    trade_count=2,
+    currency="USD",
+)
+
+
+def _cache() -> tuple[RedisCandleCache, MagicMock, MagicMock]:
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    client = MagicMock()
+    client.pipeline.return_value = pipe
+    cache = RedisCandleCache(url="redis://unused", history_limit=100)
+    cache._client = client
+    return cache, client, pipe
+
+
+def test_json_round_trip() -> None:
+    assert candle_from_json(candle_to_json(CANDLE)) == CANDLE
+
+
+async def test_publish_writes_live_and_history_in_one_round_trip() -> None:
+    cache, _, pipe = _cache()
+
+    await cache.publish([CANDLE], [CANDLE])
+
+    live_key = f"md:candle:{CANDLE.instrument_id}:1m"
+    history_key = f"md:candles:{CANDLE.instrument_id}:1m"
+    assert list(pipe.mset.call_args.args[0]) == [live_key]
+    score = int(CANDLE.open_time.timestamp())
+    pipe.zremrangebyscore.assert_called_once_with(history_key, score, score)
+    assert pipe.zadd.call_args.args == (
+        history_key,
+        {candle_to_json(CANDLE): score},
+    )
+    pipe.zremrangebyrank.assert_called_once_with(history_key, 0, -101)
+    pipe.execute.assert_awaited_once()
+
+
+async def test_load_open_bars() -> None:
+    cache, client, _ = _cache()
+    client.smembers = AsyncMock(return_value={CANDLE.instrument_id})
+    client.mget = AsyncMock(
+        return_value=[None, candle_to_json(CANDLE), None, None, None]
+    )
+
+    assert await cache.load_open_bars() == [CANDLE]
@@ -0,0 +1,37 @@
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+from src.domain.entities.ticker import Ticker
+from src.infrastructure.cache.redis_ticker_cache import RedisTickerCache
+
+
+async def test_publish_writes_all_tickers_with_one_mset() -> None:
+    client = MagicMock()
+    client.mset = AsyncMock()
+    cache = RedisTickerCache(url="redis://unused")
+    cache._client = client
+    ticker = Ticker(
+        instrument_id="66666666-6666-4666-8666-666666666666",
+        window_seconds=86400,
+        last_price=Decimal("99.00"),
+        open_price=Decimal("90.00"),
+        high=Decimal("101.00"),
+        low=Decimal("89.00"),
+        volume=10,
+        notional=Decimal("950.00"),
+        trade_count=4,
+        currency="USD",
+        updated_at=datetime(2026, 1, 5, tzinfo=timezone.utc),
+    )
+
+    await cache.publish([ticker])
+
+    [(key, raw)] = client.mset.await_args.args[0].items()
+    assert key == "md:ticker:66666666-6666-4666-8666-666666666666"
+    data = json.loads(raw)
+    assert data["vwap"] == "95.00"
+    assert data["price_change"] == "9.00"
+    assert data["price_change_percent"] == "10.0000"
+    assert data["high"] == "101.00"
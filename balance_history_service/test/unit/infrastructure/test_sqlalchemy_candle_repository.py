@@ -0,0 +1,79 @@
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities.candle import Candle
+from src.infrastructure.persistence.repositories.sqlalchemy_candle_repository import (
+    SQLAlchemyCandleRepository,
+)
+
+T0 = datetime(2026, 1, 5, 10, 0, tzinfo=timezone.utc)
+
+
+def _candle(minute: int, close: str = "10.00") -> Candle:
+    return Candle(
+        instrument_id="66666666-6666-4666-8666-666666666666",
+        interval="1m",
+        open_time=T0 + timedelta(minutes=minute),
+        open=Decimal("10.00"),
+        high=Decimal("11.00"),
+        low=Decimal("9.00"),
+        close=Decimal(close),
+        volume=10,
+        notional=Decimal("100.00"),
+        trade_count=3,
+        currency="USD",
+    )
+
+
+async def test_add_many_and_list_range(session: AsyncSession) -> None:
+    repository = SQLAlchemyCandleRepository(session)
+    await repository.add_many([_candle(minute) for minute in range(5)])
+    await session.commit()
+
+    candles = await repository.list_range(
+        "66666666-6666-4666-8666-666666666666",
+        "1m",
+        T0 + timedelta(minutes=1),
+        T0 + timedelta(minutes=4),
+    )
+
+    assert [c.open_time for c in candles] == [
+        T0 + timedelta(minutes=m) for m in (1, 2, 3)
+    ]
+    assert candles[0].vwap == Decimal("10")
+
+
+async def test_add_many_merges_with_existing_bar(session: AsyncSession) -> None:
+    repository = SQLAlchemyCandleRepository(session)
+    await repository.add_many([_candle(0)])
+    await session.commit()
+    late = replace(
+        _candle(0, close="12.00"),
+        open=Decimal("12.00"),
+        high=Decimal("12.00"),
+        low=Decimal("12.00"),
+        volume=1,
+        notional=Decimal("12.00"),
+        trade_count=1,
+    )
+    await repository.add_many([late])
+    await session.commit()
+
+    [candle] = await repository.list_range(
+        "66666666-6666-4666-8666-666666666666", "1m", T0, T0 + timedelta(hours=1)
+    )
+
+    assert (candle.open, candle.high, candle.low, candle.close) == (
+        Decimal("10.00"),
+        Decimal("12.00"),
+        Decimal("9.00"),
+        Decimal("12.00"),
+    )
+    assert (candle.volume, candle.notional, candle.trade_count) == (
+        11,
+        Decimal("112.00"),
+        4,
+    )
@@ -1,3 +1,5 @@
+from dataclasses import replace
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.entities.order_history_entry import OrderHistoryEntry
@@ -46,3 +48,22 @@ async def test_list_empty(
         )
         == []
     )
+
+
+async def test_add_many_ignores_existing_entries(
+    order_history_repository: SQLAlchemyOrderHistoryRepository,
+    session: AsyncSession,
+    sample_order_entry: OrderHistoryEntry,
+) -> None:
+    second = replace(
+        sample_order_entry,
+        entry_id="99999999-9999-4999-8999-999999999999",
+        event_type="OrderFilled",
+    )
+
+    await order_history_repository.add_many([sample_order_entry, second])
+    await order_history_repository.add_many([sample_order_entry])
+    await session.commit()
+
+    entries = await order_history_repository.list_by_order(sample_order_entry.order_id)
+    assert sorted(e.event_type for e in entries) == ["OrderFilled", "OrderOpened"]
@@ -0,0 +1,74 @@
+from dataclasses import replace
+from decimal import Decimal
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities.position import Position
+from src.infrastructure.persistence.repositories.sqlalchemy_position_repository import (
+    SQLAlchemyPositionRepository,
+)
+
+_POSITION = Position(
+    trader_id="44444444-4444-4444-8444-444444444444",
+    instrument_id="66666666-6666-4666-8666-666666666666",
+    currency="USD",
+    net_quantity=10,
+    average_cost=Decimal("100.5"),
+    turnover=Decimal("1005.00"),
+    trade_count=1,
+    last_trade_id="11111111-1111-4111-8111-111111111111",
+)
+
+
+async def test_upsert_and_get(session: AsyncSession) -> None:
+    repository = SQLAlchemyPositionRepository(session)
+
+    await repository.upsert_many([_POSITION])
+    await repository.upsert_many([replace(_POSITION, net_quantity=4, trade_count=2)])
+    await session.commit()
+    session.expunge_all()
+
+    loaded = await repository.get(_POSITION.trader_id, _POSITION.instrument_id)
+    assert loaded is not None
+    assert loaded.net_quantity == 4
+    assert loaded.average_cost == Decimal("100.5")
+    assert loaded.trade_count == 2
+    assert await repository.get(_POSITION.trader_id, "missing") is None
+
+
+async def test_get_many_and_list_by_trader(session: AsyncSession) -> None:
+    repository = SQLAlchemyPositionRepository(session)
+    other = replace(_POSITION, instrument_id="77777777-7777-4777-8777-777777777777")
+    await repository.upsert_many([_POSITION, other])
+    await session.commit()
+
+    found = await repository.get_many(
+        [
+            (_POSITION.trader_id, _POSITION.instrument_id),
+            ("99999999-9999-4999-8999-999999999999", _POSITION.instrument_id),
+        ],
+        for_update=True,
+    )
+
+    assert list(found) == [(_POSITION.trader_id, _POSITION.instrument_id)]
+    listed = await repository.list_by_trader(_POSITION.trader_id)
+    assert [p.instrument_id for p in listed] == [
+        _POSITION.instrument_id,
+        other.instrument_id,
+    ]
+
+
+async def test_insert_missing_keeps_stored_positions(session: AsyncSession) -> None:
+    repository = SQLAlchemyPositionRepository(session)
+    await repository.upsert_many([_POSITION])
+    blank = Position(_POSITION.trader_id, _POSITION.instrument_id, currency="USD")
+    new = replace(blank, instrument_id="77777777-7777-4777-8777-777777777777")
+
+    await repository.insert_missing([blank, new])
+    await session.commit()
+    session.expunge_all()
+
+    stored = await repository.get(_POSITION.trader_id, _POSITION.instrument_id)
+    assert stored.net_quantity == 10
+    inserted = await repository.get(_POSITION.trader_id, new.instrument_id)
+    assert (inserted.net_quantity, inserted.trade_count) == (0, 0)
@@ -1,10 +1,13 @@
+from dataclasses import replace
+from datetime import timedelta
 from decimal import Decimal
 
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.domain.entities.trade_page import ReplayCursor, TradeCursor
 from src.domain.entities.trade_record import TradeRecord
-from src.exceptions import TradeNotFoundError
+from src.exceptions import InvalidCursorError, TradeNotFoundError
 from src.infrastructure.persistence.repositories.sqlalchemy_trade_repository import (
     SQLAlchemyTradeRepository,
 )
@@ -55,14 +58,15 @@ async def test_list_by_trader_includes_buyer_and_seller(
 
     as_buyer = await trade_repository.list_by_trader(sample_trade.buyer_id)
     as_seller = await trade_repository.list_by_trader(sample_trade.seller_id)
-
-    assert len(as_buyer) == 1
-    assert len(as_seller) == 1
-    assert (
-        await trade_repository.list_by_trader("00000000-0000-4000-8000-000000000000")
-        == []
+    nobody = await trade_repository.list_by_trader(
+        "00000000-0000-4000-8000-000000000000"
     )
 
+    assert len(as_buyer.trades) == 1
+    assert len(as_seller.trades) == 1
+    assert as_buyer.next_cursor is None
+    assert nobody.trades == []
+
 
 async def test_list_by_instrument(
     trade_repository: SQLAlchemyTradeRepository,
@@ -73,5 +77,188 @@ async def test_list_by_instrument(
     await session.commit()
 
     listed = await trade_repository.list_by_instrument(sample_trade.instrument_id)
-    assert len(listed) == 1
-    assert listed[0].trade_id == sample_trade.trade_id
+    assert len(listed.trades) == 1
+    assert listed.trades[0].trade_id == sample_trade.trade_id
+
+
+async def test_list_since_returns_recent_trades_oldest_first(
+    trade_repository: SQLAlchemyTradeRepository,
+    session: AsyncSession,
+    sample_trade: TradeRecord,
+) -> None:
+    now = sample_trade.executed_at
+    old = replace(
+        sample_trade,
+        trade_id="77777777-7777-4777-8777-777777777777",
+        executed_at=now - timedelta(days=2),
+    )
+    earlier = replace(
+        sample_trade,
+        trade_id="88888888-8888-4888-8888-888888888888",
+        executed_at=now - timedelta(hours=1),
+    )
+    for trade in (sample_trade, old, earlier):
+        await trade_repository.add(trade)
+    await session.commit()
+
+    trades = await trade_repository.list_since(now - timedelta(days=1))
+
+    assert [t.trade_id for t in trades] == [earlier.trade_id, sample_trade.trade_id]
+
+
+def _trades(sample_trade: TradeRecord, count: int, **overrides) -> list[TradeRecord]:
+    return [
+        replace(
+            sample_trade,
+            trade_id=f"{index:08d}-0000-4000-8000-000000000000",
+            executed_at=sample_trade.executed_at - timedelta(minutes=index // 2),
+            **overrides,
+        )
+        for index in range(count)
+    ]
+
+
+async def test_list_by_trader_pages_through_both_sides_without_gaps(
+    trade_repository: SQLAlchemyTradeRepository,
+    session: AsyncSession,
+    sample_trade: TradeRecord,
+) -> None:
+    trader = sample_trade.buyer_id
+    trades = _trades(sample_trade, 7)
+    # Odd trades: the trader sells; trade 0 is a self-trade.
+    trades = [
+        (
+            replace(
+                t, buyer_id="99999999-9999-4999-8999-999999999999", seller_id=trader
+            )
+            if i % 2
+            else t
+        )
+        for i, t in enumerate(trades)
+    ]
+    trades[0] = replace(trades[0], seller_id=trader)
+    for trade in trades:
+        await trade_repository.add(trade)
+    await session.commit()
+
+    seen: list[str] = []
+    cursor = None
+    pages = 0
+    while True:
+        page = await trade_repository.list_by_trader(trader, limit=3, cursor=cursor)
+        seen += [t.trade_id for t in page.trades]
+        pages += 1
+        if page.next_cursor is None:
+            break
+        cursor = TradeCursor.decode(page.next_cursor.encode())
+
+    assert pages == 3
+    # Newest first, ties broken by trade_id descending, each trade once.
+    expected = sorted(trades, key=lambda t: (t.executed_at, t.trade_id), reverse=True)
+    assert seen == [t.trade_id for t in expected]
+
+
+async def test_list_by_instrument_filters_by_time_range(
+    trade_repository: SQLAlchemyTradeRepository,
+    session: AsyncSession,
+    sample_trade: TradeRecord,
+) -> None:
+    trades = _trades(sample_trade, 10)
+    for trade in trades:
+        await trade_repository.add(trade)
+    await session.commit()
+    now = sample_trade.executed_at
+
+    page = await trade_repository.list_by_instrument(
+        sample_trade.instrument_id,
+        since=now - timedelta(minutes=3),
+        until=now - timedelta(minutes=1),
+    )
+
+    assert sorted(t.trade_id for t in page.trades) == sorted(
+        t.trade_id for t in trades[4:8]
+    )
+
+
+async def test_page_size_is_capped(
+    trade_repository: SQLAlchemyTradeRepository,
+    session: AsyncSession,
+    sample_trade: TradeRecord,
+) -> None:
+    for trade in _trades(sample_trade, 3):
+        await trade_repository.add(trade)
+    await session.commit()
+
+    page = await trade_repository.list_by_instrument(
+        sample_trade.instrument_id, limit=0
+    )
+
+    assert len(page.trades) == 1
+    assert page.next_cursor is not None
+
+
+def test_invalid_cursor_raises() -> None:
+    with pytest.raises(InvalidCursorError):
+        TradeCursor.decode("not-a-cursor")
+
+
+async def test_add_many_skips_recorded_trades(
+    trade_repository: SQLAlchemyTradeRepository,
+    session: AsyncSession,
+    sample_trade: TradeRecord,
+) -> None:
+    await trade_repository.add(sample_trade)
+    await session.commit()
+    fresh = replace(sample_trade, trade_id="77777777-7777-4777-8777-777777777777")
+
+    inserted = await trade_repository.add_many([sample_trade, fresh])
+    await session.commit()
+
+    assert inserted == {fresh.trade_id}
+    assert await trade_repository.exists(fresh.trade_id)
+    assert await trade_repository.add_many([]) == set()
+
+
+async def test_list_after_replays_oldest_first(
+    trade_repository: SQLAlchemyTradeRepository,
+    session: AsyncSession,
+    sample_trade: TradeRecord,
+) -> None:
+    trades = [
+        replace(
+            sample_trade,
+            trade_id=f"trade-{index}",
+            executed_at=sample_trade.executed_at + timedelta(seconds=index),
+        )
+        for index in range(3)
+    ]
+    await trade_repository.add_many(list(reversed(trades)))
+    await session.commit()
+
+    first = await trade_repository.list_after(sample_trade.instrument_id, None, 2)
+    cursor = ReplayCursor.after(first[-1])
+    rest = await trade_repository.list_after(sample_trade.instrument_id, cursor, 2)
+
+    assert [t.trade_id for t in first + rest] == ["trade-0", "trade-1", "trade-2"]
+    assert await trade_repository.list_instruments() == [sample_trade.instrument_id]
+
+
+async def test_list_after_breaks_time_ties_on_sequence_number(
+    trade_repository: SQLAlchemyTradeRepository,
+    session: AsyncSession,
+    sample_trade: TradeRecord,
+) -> None:
+    # Trade ids sort against execution order.
+    trades = [
+        replace(sample_trade, trade_id=f"trade-{9 - index}", sequence_number=index)
+        for index in range(3)
+    ]
+    await trade_repository.add_many(trades)
+    await session.commit()
+
+    first = await trade_repository.list_after(sample_trade.instrument_id, None, 2)
+    rest = await trade_repository.list_after(
+        sample_trade.instrument_id, ReplayCursor.after(first[-1]), 2
+    )
+
+    assert [t.sequence_number for t in first + rest] == [0, 1, 2]
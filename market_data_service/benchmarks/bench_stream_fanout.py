@@ -0,0 +1,210 @@
+"""Order-book fan-out latency with many subscribers, some of them slow.
+
+Run from the service directory::
+
+    PYTHONPATH=..:. python benchmarks/bench_stream_fanout.py --subscribers 1000
+    PYTHONPATH=..:. python benchmarks/bench_stream_fanout.py --transport none \\
+        --subscribers 10000
+
+``--subscribers`` consumers are spread over ``--instruments`` books and
+``--updates-per-second`` engine notices are fed to the ``OrderBookStreamHub``,
+backed by an ``InMemoryMarketDataReader``. ``--slow-fraction`` of the
+consumers sleep ``--slow-ms`` per book. Latency is notice-to-delivery of the
+book a consumer actually receives; "conflated" counts books the hub skipped
+for a consumer that had not taken the previous one.
+
+With ``--transport websocket`` (default) the service app is served by
+uvicorn on ``--port`` and every consumer is a ``websockets`` client on
+``/ws/v1/market-data/{id}/order-book``, so rendering, framing, the loopback
+TCP stack and client parsing are all included (needs ``pip install uvicorn
+websockets``, and ``ulimit -n`` above twice the subscriber count). With
+``--transport none`` consumers read the hub's mailboxes directly, which
+measures the hub's own overhead only.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import time
+import uuid
+from decimal import Decimal
+
+from src.application.order_book_stream_hub import OrderBookStreamHub
+from src.domain.read_models.order_book_snapshot import OrderBookSnapshot, PriceLevel
+from src.infrastructure.cache.in_memory_market_data_reader import (
+    InMemoryMarketDataReader,
+)
+
+
+def _book(instrument_id: str, sequence: int) -> OrderBookSnapshot:
+    # The update's sequence rides in the best bid's quantity, so it survives
+    # the REST-shaped JSON the websocket sends.
+    return OrderBookSnapshot(
+        instrument_id=instrument_id,
+        bids=(PriceLevel(Decimal("1"), sequence),),
+        asks=(),
+        last_trade_price=None,
+        last_trade_currency=None,
+        sequence=sequence,
+    )
+
+
+async def _consume(subscription, sent: dict[int, float], latencies, delay: float):
+    while (payload := await subscription.next()) is not None:
+        latencies.append(time.perf_counter() - sent[int(payload)])
+        if delay:
+            await asyncio.sleep(delay)
+
+
+async def _consume_socket(websockets, url: str, sent, latencies, delay: float):
+    async with websockets.connect(url) as socket:
+        async for message in socket:
+            sequence = json.loads(message)["bids"][0]["quantity"]
+            latencies.append(time.perf_counter() - sent[sequence])
+            if delay:
+                await asyncio.sleep(delay)
+
+
+async def _serve(args):
+    """Start the service app under uvicorn; return ``(server, task, hub, reader)``."""
+    try:
+        import uvicorn
+    except ImportError as exc:
+        raise SystemExit(
+            "--transport websocket needs uvicorn: pip install uvicorn websockets"
+        ) from exc
+
+    # In-memory reader, no read-through cache: updates are seen at once.
+    os.environ["REDIS_ENABLED"] = "false"
+    os.environ["MARKET_DATA_CACHE_TTL_MS"] = "0"
+    os.environ["MARKET_DATA_STREAM_MAX_SUBSCRIBERS"] = str(args.subscribers)
+    from src.app import app
+
+    server = uvicorn.Server(
+        uvicorn.Config(app, host="127.0.0.1", port=args.port, log_level="warning")
+    )
+    task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+    return server, task, app.state.order_book_stream_hub, app.state.market_data_reader
+
+
+async def run(args) -> dict:
+    rng = random.Random(7)
+    instruments = [str(uuid.uuid4()) for _ in range(args.instruments)]
+    books = {instrument_id: _book(instrument_id, 0) for instrument_id in instruments}
+
+    server = serving = websockets = None
+    if args.transport == "websocket":
+        try:
+            import websockets
+        except ImportError as exc:
+            raise SystemExit(
+                "--transport websocket needs websockets: pip install websockets"
+            ) from exc
+        server, serving, hub, reader = await _serve(args)
+    else:
+        reader = InMemoryMarketDataReader()
+        hub = OrderBookStreamHub(
+            reader,
+            render=lambda snapshot: str(snapshot.sequence),
+            max_subscribers=args.subscribers,
+        )
+    for book in books.values():
+        reader.seed_book(book)
+
+    sent = {0: time.perf_counter()}
+    fast: list[float] = []
+    slow: list[float] = []
+    consumers = []
+    for index in range(args.subscribers):
+        instrument_id = instruments[index % len(instruments)]
+        is_slow = rng.random() < args.slow_fraction
+        latencies = slow if is_slow else fast
+        delay = args.slow_ms / 1000 if is_slow else 0
+        if websockets is not None:
+            url = (
+                f"ws://127.0.0.1:{args.port}"
+                f"/ws/v1/market-data/{instrument_id}/order-book"
+            )
+            consume = _consume_socket(websockets, url, sent, latencies, delay)
+        else:
+            consume = _consume(hub.subscribe(instrument_id), sent, latencies, delay)
+        consumers.append(asyncio.create_task(consume))
+    while hub.stats().subscribers < args.subscribers:
+        await asyncio.sleep(0.05)
+    await asyncio.sleep(0.1)
+    fast.clear()
+    slow.clear()
+
+    total = int(args.updates_per_second * args.seconds)
+    start = time.perf_counter()
+    for sequence in range(1, total + 1):
+        instrument_id = rng.choice(instruments)
+        books[instrument_id] = _book(instrument_id, sequence)
+        reader.seed_book(books[instrument_id])
+        sent[sequence] = time.perf_counter()
+        hub.notify([instrument_id])
+        ahead = sequence / args.updates_per_second - (time.perf_counter() - start)
+        await asyncio.sleep(max(ahead, 0))
+    await asyncio.sleep(args.slow_ms / 1000 + 0.05)
+    elapsed = time.perf_counter() - start
+
+    stats = hub.stats()
+    if server is not None:
+        for consumer in consumers:
+            consumer.cancel()
+        await asyncio.gather(*consumers, return_exceptions=True)
+        server.should_exit = True
+        await serving
+    else:
+        await hub.close()
+        await asyncio.gather(*consumers)
+    return {
+        "updates/s": total / elapsed,
+        "fast": fast,
+        "slow": slow,
+        "refreshes": stats.refreshes,
+        "deliveries": stats.deliveries,
+        "conflated": stats.conflated,
+    }
+
+
+def _percentiles(samples: list[float]) -> str:
+    if len(samples) < 2:
+        return f"{'-':>8} {'-':>8}"
+    cuts = statistics.quantiles(samples, n=100)
+    return f"{cuts[49] * 1000:>8.2f} {cuts[98] * 1000:>8.2f}"
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--transport", choices=("websocket", "none"), default="websocket"
+    )
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--subscribers", type=int, default=1_000)
+    parser.add_argument("--instruments", type=int, default=50)
+    parser.add_argument("--updates-per-second", type=int, default=500)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--slow-fraction", type=float, default=0.05)
+    parser.add_argument("--slow-ms", type=float, default=250)
+    args = parser.parse_args()
+
+    result = await run(args)
+    print(
+        f"transport {args.transport}  updates/s {result['updates/s']:.0f}  "
+        f"refreshes {result['refreshes']}  deliveries {result['deliveries']}  "
+        f"conflated {result['conflated']}"
+    )
+    print(f"{'consumers':>10} {'books':>9} {'p50 ms':>8} {'p99 ms':>8}")
+    for name in ("fast", "slow"):
+        samples = result[name]
+        print(f"{name:>10} {len(samples):>9} {_percentiles(samples)}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -2,15 +2,28 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
+from src.application.order_book_stream_hub import OrderBookStreamHub
 from src.conf import Config
 from src.infrastructure.cache.in_memory_market_data_reader import (
     InMemoryMarketDataReader,
 )
 from src.logging_config import setup_logging
 from src.presentation.api.v1 import api_v1_router
+from src.presentation.api.v1.routers.market_data import render_order_book
+from src.presentation.websocket_router import router as websocket_router
 
 
 def _build_reader():
+    if Config.REDIS_ENABLED and Config.MARKET_DATA_REPLICA_ENABLED:
+        from src.infrastructure.cache.replicated_market_data_reader import (
+            ReplicatedMarketDataReader,
+        )
+
+        return ReplicatedMarketDataReader(
+            url=Config.REDIS_URL,
+            block_ms=Config.MARKET_DATA_REPLICA_BLOCK_MS,
+            max_replicas=Config.MARKET_DATA_REPLICA_MAX_BOOKS,
+        )
     if Config.REDIS_ENABLED:
         from src.infrastructure.cache.redis_market_data_reader import (
             RedisMarketDataReader,
@@ -20,15 +33,108 @@ def _build_reader():
     return InMemoryMarketDataReader()
 
 
+def _build_candle_reader():
+    if Config.REDIS_ENABLED:
+        from src.infrastructure.cache.redis_candle_reader import RedisCandleReader
+
+        reader = RedisCandleReader(url=Config.REDIS_URL)
+    else:
+        from src.infrastructure.cache.in_memory_candle_reader import (
+            InMemoryCandleReader,
+        )
+
+        reader = InMemoryCandleReader()
+    if not Config.CANDLE_HISTORY_DB_ENABLED:
+        return reader
+    from src.infrastructure.cache.history_fallback_candle_reader import (
+        HistoryFallbackCandleReader,
+    )
+    from src.infrastructure.persistence.sqlalchemy_candle_reader import (
+        SQLAlchemyCandleReader,
+    )
+
+    return HistoryFallbackCandleReader(
+        reader, SQLAlchemyCandleReader(url=Config.DATABASE_URL)
+    )
+
+
+def _build_cache(reader):
+    if Config.MARKET_DATA_CACHE_TTL_MS <= 0:
+        return None
+    from src.infrastructure.cache.caching_market_data_reader import (
+        CachingMarketDataReader,
+    )
+
+    cache = CachingMarketDataReader(
+        reader,
+        ttl_seconds=Config.MARKET_DATA_CACHE_TTL_MS / 1000,
+        max_entries=Config.MARKET_DATA_CACHE_MAX_ENTRIES,
+    )
+    if hasattr(reader, "add_change_listener"):
+        # md:updates can beat the replica's XREAD; drop the book again once
+        # the delta is applied so the pre-update read isn't kept for the TTL.
+        reader.add_change_listener(cache.invalidate)
+    return cache
+
+
+def _build_listener(cache, hub, notify_hub: bool):
+    """Route the engine's ``md:updates`` notices to the cache and the hub.
+
+    With the order book replica the hub is notified by the replica instead
+    (``notify_hub=False``), since the notice can arrive before the delta.
+    """
+    if not Config.REDIS_ENABLED:
+        return None
+    from src.infrastructure.cache.redis_update_listener import RedisUpdateListener
+
+    def on_updates(instrument_ids: list[str]) -> None:
+        if cache is not None:
+            cache.invalidate(instrument_ids)
+        if notify_hub:
+            hub.notify(instrument_ids)
+
+    def on_reset() -> None:
+        if cache is not None:
+            cache.clear()
+        hub.refresh_all()
+
+    return RedisUpdateListener(
+        url=Config.REDIS_URL, on_updates=on_updates, on_reset=on_reset
+    )
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     setup_logging()
     reader = app.state.market_data_reader
-    if hasattr(reader, "connect"):
-        await reader.connect()
+    hub = OrderBookStreamHub(
+        reader,
+        render=render_order_book,
+        max_subscribers=Config.MARKET_DATA_STREAM_MAX_SUBSCRIBERS,
+    )
+    app.state.order_book_stream_hub = hub
+    source = app.state.market_data_source
+    replicated = hasattr(source, "add_change_listener")
+    if replicated:
+        # Registered after the cache's own listener, so the hub's read
+        # already misses the invalidated entry.
+        source.add_change_listener(hub.notify)
+    listener = _build_listener(
+        app.state.market_data_cache, hub, notify_hub=not replicated
+    )
+    candle_reader = app.state.candle_reader
+    for resource in (reader, candle_reader):
+        if hasattr(resource, "connect"):
+            await resource.connect()
+    if listener is not None:
+        await listener.start()
     yield
-    if hasattr(reader, "close"):
-        await reader.close()
+    if listener is not None:
+        await listener.stop()
+    await hub.close()
+    for resource in (reader, candle_reader):
+        if hasattr(resource, "close"):
+            await resource.close()
 
 
 app = FastAPI(
@@ -38,8 +144,14 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
-app.state.market_data_reader = _build_reader()
+_reader = _build_reader()
+_cache = _build_cache(_reader)
+app.state.market_data_source = _reader
+app.state.market_data_reader = _cache or _reader
+app.state.market_data_cache = _cache
+app.state.candle_reader = _build_candle_reader()
 app.include_router(api_v1_router)
+app.include_router(websocket_router)
 
 
 @app.get("/health", tags=["health"])
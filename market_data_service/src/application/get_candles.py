@@ -0,0 +1,48 @@
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+
+from src.domain.ports.candle_reader import CandleReader
+from src.domain.read_models.candle import CANDLE_INTERVALS, Candle
+from src.domain.value_objects.instrument_id import InstrumentId
+from src.exceptions import InvalidCandleIntervalError
+
+logger = logging.getLogger(__name__)
+
+MAX_CANDLES = 1000
+
+
+@dataclass(frozen=True, slots=True)
+class GetCandlesQuery:
+    instrument_id: str
+    interval: str
+    start: datetime | None = None
+    end: datetime | None = None
+    limit: int = 500
+
+
+class GetCandlesHandler:
+    """Return OHLCV bars for an instrument and interval over a time range."""
+
+    def __init__(self, reader: CandleReader) -> None:
+        self._reader = reader
+
+    async def handle(self, query: GetCandlesQuery) -> list[Candle]:
+        logger.info(
+            "Getting candles: instrument_id=%s interval=%s",
+            query.instrument_id,
+            query.interval,
+        )
+        instrument_id = InstrumentId(query.instrument_id)
+        if query.interval not in CANDLE_INTERVALS:
+            raise InvalidCandleIntervalError(
+                f"Unsupported candle interval '{query.interval}'; "
+                f"expected one of {', '.join(CANDLE_INTERVALS)}."
+            )
+        return await self._reader.get_candles(
+            instrument_id,
+            query.interval,
+            query.start,
+            query.end,
+            min(query.limit, MAX_CANDLES),
+        )
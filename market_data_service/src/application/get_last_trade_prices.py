@@ -0,0 +1,39 @@
+import logging
+from dataclasses import dataclass
+
+from src.domain.ports.market_data_reader import MarketDataReader
+from src.domain.read_models.order_book_snapshot import LastTradePrice
+from src.domain.value_objects.instrument_id import InstrumentId
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class GetLastTradePricesQuery:
+    instrument_ids: tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class LastTradePricesResult:
+    last_trade_prices: list[LastTradePrice]
+    missing: list[str]
+
+
+class GetLastTradePricesHandler:
+    """Return last trade prices for many instruments, listing those without one."""
+
+    def __init__(self, reader: MarketDataReader) -> None:
+        self._reader = reader
+
+    async def handle(self, query: GetLastTradePricesQuery) -> LastTradePricesResult:
+        logger.info("Getting LTPs: count=%s", len(query.instrument_ids))
+        instrument_ids = [
+            InstrumentId(value) for value in dict.fromkeys(query.instrument_ids)
+        ]
+        prices = await self._reader.get_last_trade_prices(instrument_ids)
+        return LastTradePricesResult(
+            last_trade_prices=[
+                prices[i.value] for i in instrument_ids if i.value in prices
+            ],
+            missing=[i.value for i in instrument_ids if i.value not in prices],
+        )
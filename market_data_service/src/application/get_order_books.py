@@ -0,0 +1,37 @@
+import logging
+from dataclasses import dataclass
+
+from src.domain.ports.market_data_reader import MarketDataReader
+from src.domain.read_models.order_book_snapshot import OrderBookSnapshot
+from src.domain.value_objects.instrument_id import InstrumentId
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class GetOrderBooksQuery:
+    instrument_ids: tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class OrderBooksResult:
+    order_books: list[OrderBookSnapshot]
+    missing: list[str]
+
+
+class GetOrderBooksHandler:
+    """Return snapshots for many instruments, listing those without one."""
+
+    def __init__(self, reader: MarketDataReader) -> None:
+        self._reader = reader
+
+    async def handle(self, query: GetOrderBooksQuery) -> OrderBooksResult:
+        logger.info("Getting order books: count=%s", len(query.instrument_ids))
+        instrument_ids = [
+            InstrumentId(value) for value in dict.fromkeys(query.instrument_ids)
+        ]
+        books = await self._reader.get_order_books(instrument_ids)
+        return OrderBooksResult(
+            order_books=[books[i.value] for i in instrument_ids if i.value in books],
+            missing=[i.value for i in instrument_ids if i.value not in books],
+        )
@@ -0,0 +1,31 @@
+import logging
+from dataclasses import dataclass
+
+from src.domain.ports.market_data_reader import MarketDataReader
+from src.domain.read_models.ticker import Ticker
+from src.domain.value_objects.instrument_id import InstrumentId
+from src.exceptions import MarketDataNotFoundError
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class GetTickerQuery:
+    instrument_id: str
+
+
+class GetTickerHandler:
+    """Return the rolling-window ticker for an instrument."""
+
+    def __init__(self, reader: MarketDataReader) -> None:
+        self._reader = reader
+
+    async def handle(self, query: GetTickerQuery) -> Ticker:
+        logger.info("Getting ticker: instrument_id=%s", query.instrument_id)
+        instrument_id = InstrumentId(query.instrument_id)
+        ticker = await self._reader.get_ticker(instrument_id)
+        if ticker is None:
+            raise MarketDataNotFoundError(
+                f"No ticker for instrument '{query.instrument_id}'."
+            )
+        return ticker
@@ -0,0 +1,37 @@
+import logging
+from dataclasses import dataclass
+
+from src.domain.ports.market_data_reader import MarketDataReader
+from src.domain.read_models.ticker import Ticker
+from src.domain.value_objects.instrument_id import InstrumentId
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class GetTickersQuery:
+    instrument_ids: tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class TickersResult:
+    tickers: list[Ticker]
+    missing: list[str]
+
+
+class GetTickersHandler:
+    """Return tickers for many instruments, listing those without one."""
+
+    def __init__(self, reader: MarketDataReader) -> None:
+        self._reader = reader
+
+    async def handle(self, query: GetTickersQuery) -> TickersResult:
+        logger.info("Getting tickers: count=%s", len(query.instrument_ids))
+        instrument_ids = [
+            InstrumentId(value) for value in dict.fromkeys(query.instrument_ids)
+        ]
+        tickers = await self._reader.get_tickers(instrument_ids)
+        return TickersResult(
+            tickers=[tickers[i.value] for i in instrument_ids if i.value in tickers],
+            missing=[i.value for i in instrument_ids if i.value not in tickers],
+        )
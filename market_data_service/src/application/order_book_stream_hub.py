@@ -0,0 +1,182 @@
+import asyncio
+import logging
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+
+from src.domain.ports.market_data_reader import MarketDataReader
+from src.domain.read_models.order_book_snapshot import OrderBookSnapshot
+from src.domain.value_objects.instrument_id import InstrumentId
+from src.exceptions import StreamCapacityError
+
+logger = logging.getLogger(__name__)
+
+
+class OrderBookSubscription:
+    """One subscriber's conflating mailbox: holds only the newest payload.
+
+    The send queue is bounded at one book: an update that arrives while the
+    previous one is still unsent replaces it (counted in ``conflated``), so a
+    slow client skips intermediate books instead of building a backlog.
+    """
+
+    __slots__ = ("instrument_id", "conflated", "_latest", "_ready", "_closed")
+
+    def __init__(self, instrument_id: str) -> None:
+        self.instrument_id = instrument_id
+        self.conflated = 0
+        self._latest: str | None = None
+        self._ready = asyncio.Event()
+        self._closed = False
+
+    def offer(self, payload: str) -> None:
+        if self._latest is not None:
+            self.conflated += 1
+        self._latest = payload
+        self._ready.set()
+
+    async def next(self) -> str | None:
+        """Wait for the newest payload; ``None`` once the subscription closes."""
+        await self._ready.wait()
+        self._ready.clear()
+        if self._closed:
+            return None
+        payload, self._latest = self._latest, None
+        return payload
+
+    def close(self) -> None:
+        self._closed = True
+        self._ready.set()
+
+
+@dataclass(frozen=True, slots=True)
+class StreamStats:
+    subscribers: int
+    instruments: int
+    refreshes: int
+    deliveries: int
+    conflated: int
+
+
+class OrderBookStreamHub:
+    """Fans order-book updates out to many subscribers per instrument.
+
+    ``notify`` (called for each engine update notice, or by the order book
+    replica once it has applied the update) triggers at most one
+    read of the book per instrument at a time; notices that arrive during a
+    read are folded into one follow-up read. The book is rendered once and
+    offered to every subscriber's mailbox, so the cost per update is one read
+    plus O(subscribers) cheap offers, independent of client speed.
+    """
+
+    def __init__(
+        self,
+        reader: MarketDataReader,
+        render: Callable[[OrderBookSnapshot], str],
+        max_subscribers: int = 10_000,
+    ) -> None:
+        self._reader = reader
+        self._render = render
+        self._max_subscribers = max_subscribers
+        self._subscribers: dict[str, set[OrderBookSubscription]] = {}
+        self._count = 0
+        self._latest: dict[str, str] = {}
+        self._refreshing: set[str] = set()
+        self._pending: set[str] = set()
+        self._tasks: set[asyncio.Task] = set()
+        self._refreshes = 0
+        self._deliveries = 0
+        self._conflated_closed = 0
+
+    def subscribe(self, instrument_id: str) -> OrderBookSubscription:
+        if self._count >= self._max_subscribers:
+            raise StreamCapacityError(
+                f"Stream subscriber limit of {self._max_subscribers} reached."
+            )
+        subscription = OrderBookSubscription(instrument_id)
+        subscribers = self._subscribers.setdefault(instrument_id, set())
+        subscribers.add(subscription)
+        self._count += 1
+        latest = self._latest.get(instrument_id)
+        if latest is not None:
+            subscription.offer(latest)
+        else:
+            self.notify([instrument_id])
+        return subscription
+
+    def unsubscribe(self, subscription: OrderBookSubscription) -> None:
+        subscription.close()
+        subscribers = self._subscribers.get(subscription.instrument_id)
+        if subscribers is None or subscription not in subscribers:
+            return
+        subscribers.discard(subscription)
+        self._count -= 1
+        self._conflated_closed += subscription.conflated
+        if not subscribers:
+            del self._subscribers[subscription.instrument_id]
+            self._latest.pop(subscription.instrument_id, None)
+
+    def notify(self, instrument_ids: Iterable[str]) -> None:
+        """Schedule a refresh of each listed instrument that has subscribers."""
+        for instrument_id in instrument_ids:
+            if instrument_id not in self._subscribers:
+                continue
+            if instrument_id in self._refreshing:
+                self._pending.add(instrument_id)
+                continue
+            self._refreshing.add(instrument_id)
+            task = asyncio.create_task(self._refresh(instrument_id))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    def refresh_all(self) -> None:
+        """Re-read every subscribed book, e.g. after update notices were lost."""
+        self.notify(list(self._subscribers))
+
+    async def close(self) -> None:
+        for subscribers in list(self._subscribers.values()):
+            for subscription in list(subscribers):
+                self.unsubscribe(subscription)
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def stats(self) -> StreamStats:
+        conflated = self._conflated_closed + sum(
+            subscription.conflated
+            for subscribers in self._subscribers.values()
+            for subscription in subscribers
+        )
+        return StreamStats(
+            subscribers=self._count,
+            instruments=len(self._subscribers),
+            refreshes=self._refreshes,
+            deliveries=self._deliveries,
+            conflated=conflated,
+        )
+
+    async def _refresh(self, instrument_id: str) -> None:
+        try:
+            while True:
+                self._pending.discard(instrument_id)
+                try:
+                    snapshot = await self._reader.get_order_book(
+                        InstrumentId(instrument_id)
+                    )
+                except Exception:
+                    logger.exception(
+                        "Order book stream refresh failed instrument_id=%s",
+                        instrument_id,
+                    )
+                    snapshot = None
+                self._refreshes += 1
+                subscribers = self._subscribers.get(instrument_id)
+                if snapshot is not None and subscribers:
+                    payload = self._render(snapshot)
+                    self._latest[instrument_id] = payload
+                    for subscription in subscribers:
+                        subscription.offer(payload)
+                    self._deliveries += len(subscribers)
+                if instrument_id not in self._pending:
+                    return
+        finally:
+            self._refreshing.discard(instrument_id)
@@ -20,3 +20,39 @@ class Config:
         "yes",
     )
     REDIS_URL: str = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+    # Candle history older than the Redis window (BHS's CANDLE_HISTORY_LIMIT
+    # bars) is read from the candles table the Balance & History Service
+    # persists.
+    CANDLE_HISTORY_DB_ENABLED: bool = os.getenv(
+        "CANDLE_HISTORY_DB_ENABLED", "false"
+    ).lower() in ("1", "true", "yes")
+    DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+
+    # Serve order books from local replicas fed by the engine's delta streams.
+    MARKET_DATA_REPLICA_ENABLED: bool = os.getenv(
+        "MARKET_DATA_REPLICA_ENABLED", "true"
+    ).lower() in ("1", "true", "yes")
+    MARKET_DATA_REPLICA_BLOCK_MS: int = int(
+        os.getenv("MARKET_DATA_REPLICA_BLOCK_MS", "1000")
+    )
+    # Books kept (and delta streams followed) at once; least recently read go.
+    MARKET_DATA_REPLICA_MAX_BOOKS: int = int(
+        os.getenv("MARKET_DATA_REPLICA_MAX_BOOKS", "10000")
+    )
+
+    # In-process cache of parsed books/LTPs; 0 disables it.
+    MARKET_DATA_CACHE_TTL_MS: float = float(
+        os.getenv("MARKET_DATA_CACHE_TTL_MS", "500")
+    )
+    MARKET_DATA_CACHE_MAX_ENTRIES: int = int(
+        os.getenv("MARKET_DATA_CACHE_MAX_ENTRIES", "100000")
+    )
+
+    # Order book streaming (WebSocket / SSE) fan-out.
+    MARKET_DATA_STREAM_MAX_SUBSCRIBERS: int = int(
+        os.getenv("MARKET_DATA_STREAM_MAX_SUBSCRIBERS", "10000")
+    )
+    MARKET_DATA_STREAM_SEND_TIMEOUT_SECONDS: float = float(
+        os.getenv("MARKET_DATA_STREAM_SEND_TIMEOUT_SECONDS", "5")
+    )
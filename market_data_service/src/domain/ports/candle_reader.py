@@ -0,0 +1,23 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from src.domain.read_models.candle import Candle
+from src.domain.value_objects.instrument_id import InstrumentId
+
+
+class CandleReader(ABC):
+    """Inbound cache port — reads candles written by the Balance & History
+    Service's candle projector."""
+
+    @abstractmethod
+    async def get_candles(
+        self,
+        instrument_id: InstrumentId,
+        interval: str,
+        start: datetime | None,
+        end: datetime | None,
+        limit: int,
+    ) -> list[Candle]:
+        """Up to ``limit`` most recent bars with ``start <= open_time < end``,
+        oldest first; the still-open bar is last, with ``final=False``."""
+        raise NotImplementedError
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 
 from src.domain.read_models.order_book_snapshot import LastTradePrice, OrderBookSnapshot
+from src.domain.read_models.ticker import Ticker
 from src.domain.value_objects.instrument_id import InstrumentId
 
 
@@ -20,3 +22,31 @@ class MarketDataReader(ABC):
         instrument_id: InstrumentId,
     ) -> LastTradePrice | None:
         raise NotImplementedError
+
+    @abstractmethod
+    async def get_order_books(
+        self,
+        instrument_ids: Sequence[InstrumentId],
+    ) -> dict[str, OrderBookSnapshot]:
+        """Snapshots keyed by instrument id; missing instruments are left out."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_last_trade_prices(
+        self,
+        instrument_ids: Sequence[InstrumentId],
+    ) -> dict[str, LastTradePrice]:
+        """Last trade prices keyed by instrument id; missing ones are left out."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_ticker(self, instrument_id: InstrumentId) -> Ticker | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_tickers(
+        self,
+        instrument_ids: Sequence[InstrumentId],
+    ) -> dict[str, Ticker]:
+        """Tickers keyed by instrument id; missing instruments are left out."""
+        raise NotImplementedError
@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+
+CANDLE_INTERVALS: tuple[str, ...] = ("1s", "1m", "5m", "1h", "1d")
+
+
+@dataclass(frozen=True, slots=True)
+class Candle:
+    """OHLCV + VWAP bar for ``[open_time, open_time + interval)`` (from cache)."""
+
+    instrument_id: str
+    interval: str
+    open_time: datetime
+    open: Decimal
+    high: Decimal
+    low: Decimal
+    close: Decimal
+    volume: int
+    vwap: Decimal
+    trade_count: int
+    currency: str
+    final: bool = True
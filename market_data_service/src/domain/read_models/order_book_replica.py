@@ -0,0 +1,73 @@
+from dataclasses import dataclass
+from decimal import Decimal
+
+from src.domain.read_models.order_book_snapshot import OrderBookSnapshot, PriceLevel
+
+
+@dataclass(frozen=True, slots=True)
+class BookDelta:
+    """Per-level changes of one book between two consecutive sequences.
+
+    ``changes`` holds ``(side, price, quantity)`` with side ``"bid"`` or
+    ``"ask"``; a quantity of ``0`` removes the level.
+    """
+
+    sequence: int
+    previous_sequence: int
+    changes: tuple[tuple[str, Decimal, int], ...]
+    last_trade_price: Decimal | None
+    last_trade_currency: str | None
+
+
+class OrderBookReplica:
+    """Local copy of one book, kept current by applying ``BookDelta``s.
+
+    Built from a sequenced snapshot; a delta applies only on top of the
+    sequence it was computed against, so a missed delta is detected and the
+    owner must rebuild the replica from a newer snapshot.
+    """
+
+    def __init__(self, snapshot: OrderBookSnapshot) -> None:
+        self.instrument_id = snapshot.instrument_id
+        self.sequence = snapshot.sequence or 0
+        self._bids = {level.price: level.quantity for level in snapshot.bids}
+        self._asks = {level.price: level.quantity for level in snapshot.asks}
+        self._last_trade_price = snapshot.last_trade_price
+        self._last_trade_currency = snapshot.last_trade_currency
+        self._snapshot: OrderBookSnapshot | None = snapshot
+
+    def apply(self, delta: BookDelta) -> bool:
+        """Apply ``delta``; ``False`` means a gap (the replica is now stale)."""
+        if delta.sequence <= self.sequence:
+            return True
+        if delta.previous_sequence != self.sequence:
+            return False
+        for side, price, quantity in delta.changes:
+            levels = self._bids if side == "bid" else self._asks
+            if quantity:
+                levels[price] = quantity
+            else:
+                levels.pop(price, None)
+        self._last_trade_price = delta.last_trade_price
+        self._last_trade_currency = delta.last_trade_currency
+        self.sequence = delta.sequence
+        self._snapshot = None
+        return True
+
+    def snapshot(self) -> OrderBookSnapshot:
+        if self._snapshot is None:
+            self._snapshot = OrderBookSnapshot(
+                instrument_id=self.instrument_id,
+                bids=tuple(
+                    PriceLevel(price=price, quantity=self._bids[price])
+                    for price in sorted(self._bids, reverse=True)
+                ),
+                asks=tuple(
+                    PriceLevel(price=price, quantity=self._asks[price])
+                    for price in sorted(self._asks)
+                ),
+                last_trade_price=self._last_trade_price,
+                last_trade_currency=self._last_trade_currency,
+                sequence=self.sequence,
+            )
+        return self._snapshot
@@ -19,6 +19,7 @@ class OrderBookSnapshot:
     asks: tuple[PriceLevel, ...]
     last_trade_price: Decimal | None
     last_trade_currency: str | None
+    sequence: int | None = None
 
 
 @dataclass(frozen=True, slots=True)
@@ -0,0 +1,25 @@
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+
+
+@dataclass(frozen=True, slots=True)
+class Ticker:
+    """Rolling-window (24h by default) statistics for an instrument.
+
+    Window fields are ``None`` when no trade falls inside the window.
+    """
+
+    instrument_id: str
+    window_seconds: int
+    last_price: Decimal
+    open_price: Decimal | None
+    high: Decimal | None
+    low: Decimal | None
+    volume: int
+    vwap: Decimal | None
+    price_change: Decimal | None
+    price_change_percent: Decimal | None
+    trade_count: int
+    currency: str
+    updated_at: datetime
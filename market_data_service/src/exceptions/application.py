@@ -6,3 +6,7 @@ class ApplicationError(Exception):
 
 class MarketDataNotFoundError(ApplicationError):
     pass
+
+
+class StreamCapacityError(ApplicationError):
+    pass
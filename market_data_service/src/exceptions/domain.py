@@ -6,3 +6,7 @@ class DomainError(Exception):
 
 class InvalidInstrumentIdError(DomainError):
     pass
+
+
+class InvalidCandleIntervalError(DomainError):
+    pass
@@ -14,3 +14,15 @@ class CacheConnectionError(CacheError):
 
 class CacheOperationError(CacheError):
     pass
+
+
+class DatabaseError(InfrastructureError):
+    pass
+
+
+class DatabaseConnectionError(DatabaseError):
+    pass
+
+
+class DatabaseOperationError(DatabaseError):
+    pass
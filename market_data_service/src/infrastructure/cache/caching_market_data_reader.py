@@ -0,0 +1,238 @@
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from src.domain.ports.market_data_reader import MarketDataReader
+from src.domain.read_models.order_book_snapshot import LastTradePrice, OrderBookSnapshot
+from src.domain.read_models.ticker import Ticker
+from src.domain.value_objects.instrument_id import InstrumentId
+
+
+@dataclass(frozen=True, slots=True)
+class CacheStats:
+    hits: int
+    misses: int
+    invalidations: int
+    entries: int
+
+
+class CachingMarketDataReader(MarketDataReader):
+    """Read-through, per-instrument cache of parsed market data.
+
+    Order books, last trade prices and tickers are kept for ``ttl_seconds``
+    or until ``invalidate`` is called for the
+    instrument, normally on the engine's ``md:updates`` notice
+    (``RedisUpdateListener``) and, with the order book replica, again once
+    the replica has applied the delta. Tickers are written by the Balance & History
+    Service, which sends no notices, so they are only as fresh as the TTL.
+    Concurrent misses for the same key share one read of ``inner``, and a
+    read that overlaps an invalidation is returned but not cached. "Not
+    found" is never cached, so unknown ids cannot fill the cache; at most
+    ``max_entries`` are kept, least recently used first out, and expired
+    entries are dropped when next looked up.
+    """
+
+    def __init__(
+        self,
+        inner: MarketDataReader,
+        ttl_seconds: float = 0.5,
+        clock: Callable[[], float] = time.monotonic,
+        max_entries: int = 100_000,
+    ) -> None:
+        self._inner = inner
+        self._ttl = ttl_seconds
+        self._clock = clock
+        self._max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str], tuple[float, Any]] = OrderedDict()
+        self._inflight: dict[tuple[str, str], asyncio.Future] = {}
+        self._generations: dict[str, int] = {}
+        self._loading: dict[str, int] = {}
+        self._epoch = 0
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    async def connect(self) -> None:
+        if hasattr(self._inner, "connect"):
+            await self._inner.connect()
+
+    async def close(self) -> None:
+        if hasattr(self._inner, "close"):
+            await self._inner.close()
+
+    async def get_order_book(
+        self,
+        instrument_id: InstrumentId,
+    ) -> OrderBookSnapshot | None:
+        return await self._get("book", instrument_id, self._inner.get_order_book)
+
+    async def get_last_trade_price(
+        self,
+        instrument_id: InstrumentId,
+    ) -> LastTradePrice | None:
+        return await self._get("ltp", instrument_id, self._inner.get_last_trade_price)
+
+    async def get_order_books(
+        self,
+        instrument_ids: Sequence[InstrumentId],
+    ) -> dict[str, OrderBookSnapshot]:
+        return await self._get_many("book", instrument_ids, self._inner.get_order_books)
+
+    async def get_last_trade_prices(
+        self,
+        instrument_ids: Sequence[InstrumentId],
+    ) -> dict[str, LastTradePrice]:
+        return await self._get_many(
+            "ltp", instrument_ids, self._inner.get_last_trade_prices
+        )
+
+    async def get_ticker(self, instrument_id: InstrumentId) -> Ticker | None:
+        return await self._get("ticker", instrument_id, self._inner.get_ticker)
+
+    async def get_tickers(
+        self,
+        instrument_ids: Sequence[InstrumentId],
+    ) -> dict[str, Ticker]:
+        return await self._get_many("ticker", instrument_ids, self._inner.get_tickers)
+
+    def invalidate(self, instrument_ids: Iterable[str]) -> None:
+        for instrument_id in instrument_ids:
+            self._entries.pop(("book", instrument_id), None)
+            self._entries.pop(("ltp", instrument_id), None)
+            self._entries.pop(("ticker", instrument_id), None)
+            if instrument_id in self._loading:
+                # A read in progress may return pre-update data.
+                self._generations[instrument_id] = (
+                    self._generations.get(instrument_id, 0) + 1
+                )
+            self._invalidations += 1
+
+    def clear(self) -> None:
+        """Drop everything, e.g. after invalidations may have been missed."""
+        self._epoch += 1
+        self._invalidations += len(self._entries)
+        self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            invalidations=self._invalidations,
+            entries=len(self._entries),
+        )
+
+    async def _get(
+        self,
+        kind: str,
+        instrument_id: InstrumentId,
+        load: Callable[[InstrumentId], Awaitable[Any]],
+    ) -> Any:
+        key = (kind, instrument_id.value)
+        entry = self._lookup(key, self._clock())
+        if entry is not None:
+            self._hits += 1
+            return entry
+
+        self._misses += 1
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        generation = self._generation(instrument_id.value)
+        self._begin_load([instrument_id.value])
+        try:
+            value = await load(instrument_id)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            # Waiters re-raise it; don't warn if there were none.
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+            if (
+                value is not None
+                and self._generation(instrument_id.value) == generation
+            ):
+                self._store(key, self._clock() + self._ttl, value)
+            return value
+        finally:
+            del self._inflight[key]
+            self._end_load([instrument_id.value])
+
+    async def _get_many(
+        self,
+        kind: str,
+        instrument_ids: Sequence[InstrumentId],
+        load_many: Callable[[list[InstrumentId]], Awaitable[dict[str, Any]]],
+    ) -> dict[str, Any]:
+        now = self._clock()
+        found: dict[str, Any] = {}
+        missing: list[InstrumentId] = []
+        for instrument_id in instrument_ids:
+            entry = self._lookup((kind, instrument_id.value), now)
+            if entry is not None:
+                self._hits += 1
+                found[instrument_id.value] = entry
+            else:
+                self._misses += 1
+                missing.append(instrument_id)
+        if not missing:
+            return found
+
+        # Batch misses are not coalesced with concurrent reads.
+        ids = [instrument_id.value for instrument_id in missing]
+        generations = [self._generation(instrument_id) for instrument_id in ids]
+        self._begin_load(ids)
+        try:
+            loaded = await load_many(missing)
+        finally:
+            self._end_load(ids)
+        expires = self._clock() + self._ttl
+        for instrument_id, generation in zip(ids, generations):
+            value = loaded.get(instrument_id)
+            if value is None:
+                continue
+            found[instrument_id] = value
+            if self._generation(instrument_id) == generation:
+                self._store((kind, instrument_id), expires, value)
+        return found
+
+    def _lookup(self, key: tuple[str, str], now: float) -> Any:
+        """The live cached value for ``key``, or ``None``; drops it if expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= now:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def _store(self, key: tuple[str, str], expires: float, value: Any) -> None:
+        self._entries[key] = (expires, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def _begin_load(self, instrument_ids: list[str]) -> None:
+        for instrument_id in instrument_ids:
+            self._loading[instrument_id] = self._loading.get(instrument_id, 0) + 1
+
+    def _end_load(self, instrument_ids: list[str]) -> None:
+        for instrument_id in instrument_ids:
+            remaining = self._loading[instrument_id] - 1
+            if remaining:
+                self._loading[instrument_id] = remaining
+            else:
+                del self._loading[instrument_id]
+
+    def _generation(self, instrument_id: str) -> tuple[int, int]:
+        return self._epoch, self._generations.get(instrument_id, 0)
@@ -0,0 +1,52 @@
+from datetime import datetime
+
+from src.domain.ports.candle_reader import CandleReader
+from src.domain.read_models.candle import Candle
+from src.domain.value_objects.instrument_id import InstrumentId
+
+
+class HistoryFallbackCandleReader(CandleReader):
+    """Serves recent bars from ``recent`` (Redis, which keeps only the newest
+    ``CANDLE_HISTORY_LIMIT`` bars per series) and tops up from ``history``
+    (the database) when that comes back short.
+
+    The database is asked only for bars opening before the oldest one
+    ``recent`` returned, so the two never overlap and a request Redis fills
+    on its own costs no query.
+    """
+
+    def __init__(self, recent: CandleReader, history: CandleReader) -> None:
+        self._recent = recent
+        self._history = history
+
+    async def connect(self) -> None:
+        for reader in (self._recent, self._history):
+            if hasattr(reader, "connect"):
+                await reader.connect()
+
+    async def close(self) -> None:
+        for reader in (self._recent, self._history):
+            if hasattr(reader, "close"):
+                await reader.close()
+
+    async def get_candles(
+        self,
+        instrument_id: InstrumentId,
+        interval: str,
+        start: datetime | None,
+        end: datetime | None,
+        limit: int,
+    ) -> list[Candle]:
+        candles = await self._recent.get_candles(
+            instrument_id, interval, start, end, limit
+        )
+        if len(candles) >= limit:
+            return candles
+        older = await self._history.get_candles(
+            instrument_id,
+            interval,
+            start,
+            candles[0].open_time if candles else end,
+            limit - len(candles),
+        )
+        return older + candles
@@ -0,0 +1,33 @@
+from datetime import datetime
+
+from src.domain.ports.candle_reader import CandleReader
+from src.domain.read_models.candle import Candle
+from src.domain.value_objects.instrument_id import InstrumentId
+
+
+class InMemoryCandleReader(CandleReader):
+    """Process-local store for tests and Redis-disabled runs."""
+
+    def __init__(self) -> None:
+        self._candles: dict[tuple[str, str], list[Candle]] = {}
+
+    def seed_candle(self, candle: Candle) -> None:
+        bars = self._candles.setdefault((candle.instrument_id, candle.interval), [])
+        bars.append(candle)
+        bars.sort(key=lambda c: c.open_time)
+
+    async def get_candles(
+        self,
+        instrument_id: InstrumentId,
+        interval: str,
+        start: datetime | None,
+        end: datetime | None,
+        limit: int,
+    ) -> list[Candle]:
+        bars = [
+            c
+            for c in self._candles.get((instrument_id.value, interval), [])
+            if (start is None or c.open_time >= start)
+            and (end is None or c.open_time < end)
+        ]
+        return bars[-limit:] if limit > 0 else []
@@ -1,5 +1,8 @@
+from collections.abc import Sequence
+
 from src.domain.ports.market_data_reader import MarketDataReader
 from src.domain.read_models.order_book_snapshot import LastTradePrice, OrderBookSnapshot
+from src.domain.read_models.ticker import Ticker
 from src.domain.value_objects.instrument_id import InstrumentId
 
 
@@ -9,6 +12,7 @@ class InMemoryMarketDataReader(MarketDataReader):
     def __init__(self) -> None:
         self._books: dict[str, OrderBookSnapshot] = {}
         self._ltp: dict[str, LastTradePrice] = {}
+        self._tickers: dict[str, Ticker] = {}
 
     def seed_book(self, snapshot: OrderBookSnapshot) -> None:
         self._books[snapshot.instrument_id] = snapshot
@@ -16,6 +20,9 @@ class InMemoryMarketDataReader(MarketDataReader):
     def seed_ltp(self, ltp: LastTradePrice) -> None:
         self._ltp[ltp.instrument_id] = ltp
 
+    def seed_ticker(self, ticker: Ticker) -> None:
+        self._tickers[ticker.instrument_id] = ticker
+
     async def get_order_book(
         self,
         instrument_id: InstrumentId,
@@ -27,3 +34,34 @@ class InMemoryMarketDataReader(MarketDataReader):
         instrument_id: InstrumentId,
     ) -> LastTradePrice | None:
         return self._ltp.get(instrument_id.value)
+
+    async def get_order_books(
+        self,
+        instrument_ids: Sequence[InstrumentId],
+    ) -> dict[str, OrderBookSnapshot]:
+        return {
+            i.value: self._books[i.value]
+            for i in instrument_ids
+            if i.value in self._books
+        }
+
+    async def get_last_trade_prices(
+        self,
+        instrument_ids: Sequence[InstrumentId],
+    ) -> dict[str, LastTradePrice]:
+        return {
+            i.value: self._ltp[i.value] for i in instrument_ids if i.value in self._ltp
+        }
+
+    async def get_ticker(self, instrument_id: InstrumentId) -> Ticker | None:
+        return self._tickers.get(instrument_id.value)
+
+    async def get_tickers(
+        self,
+        instrument_ids: Sequence[InstrumentId],
+    ) -> dict[str, Ticker]:
+        return {
+            i.value: self._tickers[i.value]
+            for i in instrument_ids
+            if i.value in self._tickers
+        }
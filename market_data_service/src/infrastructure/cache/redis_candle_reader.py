@@ -0,0 +1,109 @@
+import json
+import logging
+from datetime import datetime, timezone
+from decimal import Decimal, InvalidOperation
+
+from src.domain.ports.candle_reader import CandleReader
+from src.domain.read_models.candle import Candle
+from src.domain.value_objects.instrument_id import InstrumentId
+from src.exceptions import CacheConnectionError, CacheOperationError
+
+logger = logging.getLogger(__name__)
+
+_LIVE_KEY = "md:candle:{instrument_id}:{interval}"
+_HISTORY_KEY = "md:candles:{instrument_id}:{interval}"
+
+
+class RedisCandleReader(CandleReader):
+    """Reads candles from Redis: finalized bars from the
+    ``md:candles:{id}:{interval}`` sorted set (scored by open time) and the
+    open bar from ``md:candle:{id}:{interval}``, in one round trip."""
+
+    def __init__(self, url: str) -> None:
+        self._url = url
+        self._client = None
+
+    async def connect(self) -> None:
+        try:
+            from redis.asyncio import Redis
+        except ImportError as exc:
+            raise CacheConnectionError(
+                "redis is required for RedisCandleReader. "
+                "Install it with: pip install redis"
+            ) from exc
+
+        try:
+            self._client = Redis.from_url(self._url, decode_responses=True)
+            await self._client.ping()
+        except Exception as exc:
+            logger.exception("Failed to connect to Redis")
+            raise CacheConnectionError(f"Failed to connect to Redis: {exc}") from exc
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def get_candles(
+        self,
+        instrument_id: InstrumentId,
+        interval: str,
+        start: datetime | None,
+        end: datetime | None,
+        limit: int,
+    ) -> list[Candle]:
+        if limit <= 0:
+            return []
+        client = await self._ensure_client()
+        keys = {"instrument_id": instrument_id.value, "interval": interval}
+        low = int(start.timestamp()) if start is not None else "-inf"
+        high = f"({int(end.timestamp())}" if end is not None else "+inf"
+        try:
+            pipe = client.pipeline(transaction=False)
+            pipe.zrevrangebyscore(
+                _HISTORY_KEY.format(**keys), high, low, start=0, num=limit
+            )
+            pipe.get(_LIVE_KEY.format(**keys))
+            history, live = await pipe.execute()
+        except Exception as exc:
+            logger.exception("Failed to read candles instrument_id=%s", keys)
+            raise CacheOperationError(f"Failed to read candles: {exc}") from exc
+
+        candles = [self._parse(raw, final=True) for raw in reversed(history)]
+        if live is not None:
+            bar = self._parse(live, final=False)
+            newest = candles[-1].open_time if candles else None
+            in_range = (start is None or bar.open_time >= start) and (
+                end is None or bar.open_time < end
+            )
+            # The live key keeps the last bar after it is finalized.
+            if in_range and (newest is None or bar.open_time > newest):
+                candles.append(bar)
+        return candles[-limit:]
+
+    @staticmethod
+    def _parse(raw: str, final: bool) -> Candle:
+        try:
+            data = json.loads(raw)
+            return Candle(
+                instrument_id=data["instrument_id"],
+                interval=data["interval"],
+                open_time=datetime.fromtimestamp(int(data["open_time"]), timezone.utc),
+                open=Decimal(data["open"]),
+                high=Decimal(data["high"]),
+                low=Decimal(data["low"]),
+                close=Decimal(data["close"]),
+                volume=int(data["volume"]),
+                vwap=Decimal(data["vwap"]),
+                trade_count=int(data["trade_count"]),
+                currency=data["currency"],
+                final=final,
+            )
+        except (json.JSONDecodeError, KeyError, InvalidOperation, TypeError) as exc:
+            logger.exception("Corrupt candle")
+            raise CacheOperationError("Corrupt candle in cache.") from exc
+
+    async def _ensure_client(self):
+        if self._client is None:
+            await self.connect()
+        return self._client
@@ -1,6 +1,9 @@
 import json
 import logging
+from collections.abc import Callable, Sequence
+from datetime import datetime
 from decimal import Decimal, InvalidOperation
+from typing import Any
 
 from src.domain.ports.market_data_reader import MarketDataReader
 from src.domain.read_models.order_book_snapshot import (
@@ -8,6 +11,7 @@ from src.domain.read_models.order_book_snapshot import (
     OrderBookSnapshot,
     PriceLevel,
 )
+from src.domain.read_models.ticker import Ticker
 from src.domain.value_objects.instrument_id import InstrumentId
 from src.exceptions import CacheConnectionError, CacheOperationError
 
@@ -15,6 +19,8 @@ logger = logging.getLogger(__name__)
 
 _BOOK_KEY = "md:book:{instrument_id}"
 _LTP_KEY = "md:ltp:{instrument_id}"
+_TICKER_KEY = "md:ticker:{instrument_id}"
+_MGET_CHUNK = 100
 
 
 class RedisMarketDataReader(MarketDataReader):
@@ -61,7 +67,98 @@ class RedisMarketDataReader(MarketDataReader):
 
         if raw is None:
             return None
+        return self._parse_book(raw, instrument_id.value)
 
+    async def get_last_trade_price(
+        self,
+        instrument_id: InstrumentId,
+    ) -> LastTradePrice | None:
+        client = await self._ensure_client()
+        key = _LTP_KEY.format(instrument_id=instrument_id.value)
+        try:
+            raw = await client.get(key)
+        except Exception as exc:
+            logger.exception("Failed to read LTP key=%s", key)
+            raise CacheOperationError(f"Failed to read LTP: {exc}") from exc
+
+        if raw is None:
+            return None
+        return self._parse_ltp(raw, instrument_id.value)
+
+    async def get_ticker(self, instrument_id: InstrumentId) -> Ticker | None:
+        client = await self._ensure_client()
+        key = _TICKER_KEY.format(instrument_id=instrument_id.value)
+        try:
+            raw = await client.get(key)
+        except Exception as exc:
+            logger.exception("Failed to read ticker key=%s", key)
+            raise CacheOperationError(f"Failed to read ticker: {exc}") from exc
+
+        if raw is None:
+            return None
+        return self._parse_ticker(raw, instrument_id.value)
+
+    async def get_order_books(
+        self,
+        instrument_ids: Sequence[InstrumentId],
+    ) -> dict[str, OrderBookSnapshot]:
+        return await self._get_many(_BOOK_KEY, instrument_ids, self._parse_book)
+
+    async def get_last_trade_prices(
+        self,
+        instrument_ids: Sequence[InstrumentId],
+    ) -> dict[str, LastTradePrice]:
+        return await self._get_many(_LTP_KEY, instrument_ids, self._parse_ltp)
+
+    async def get_tickers(
+        self,
+        instrument_ids: Sequence[InstrumentId],
+    ) -> dict[str, Ticker]:
+        return await self._get_many(_TICKER_KEY, instrument_ids, self._parse_ticker)
+
+    async def _get_many(
+        self,
+        key_format: str,
+        instrument_ids: Sequence[InstrumentId],
+        parse: Callable[[str, str], Any],
+    ) -> dict[str, Any]:
+        """One round trip: ``MGET`` chunks of ``_MGET_CHUNK`` keys, pipelined.
+
+        Missing keys, and corrupt values (logged), are left out of the result.
+        """
+        ids = list(
+            dict.fromkeys(instrument_id.value for instrument_id in instrument_ids)
+        )
+        if not ids:
+            return {}
+        client = await self._ensure_client()
+        try:
+            pipe = client.pipeline(transaction=False)
+            for start in range(0, len(ids), _MGET_CHUNK):
+                pipe.mget(
+                    [
+                        key_format.format(instrument_id=instrument_id)
+                        for instrument_id in ids[start : start + _MGET_CHUNK]
+                    ]
+                )
+            chunks = await pipe.execute()
+        except Exception as exc:
+            logger.exception("Failed to read %s market data keys", len(ids))
+            raise CacheOperationError(f"Failed to read market data: {exc}") from exc
+
+        result: dict[str, Any] = {}
+        values = (raw for chunk in chunks for raw in chunk)
+        for instrument_id, raw in zip(ids, values):
+            if raw is None:
+                continue
+            try:
+                result[instrument_id] = parse(raw, instrument_id)
+            except CacheOperationError:
+                continue
+        return result
+
+    @staticmethod
+    def _parse_book(raw: str, instrument_id: str) -> OrderBookSnapshot:
         try:
             data = json.loads(raw)
             bids = tuple(
@@ -75,46 +172,66 @@ class RedisMarketDataReader(MarketDataReader):
             ltp_raw = data.get("last_trade_price")
             ltp = Decimal(str(ltp_raw)) if ltp_raw is not None else None
             return OrderBookSnapshot(
-                instrument_id=data.get("instrument_id", instrument_id.value),
+                instrument_id=data.get("instrument_id", instrument_id),
                 bids=bids,
                 asks=asks,
                 last_trade_price=ltp,
                 last_trade_currency=data.get("last_trade_currency"),
+                sequence=data.get("sequence"),
             )
         except (json.JSONDecodeError, InvalidOperation, TypeError, ValueError) as exc:
-            logger.exception("Corrupt book snapshot key=%s", key)
+            logger.exception("Corrupt book snapshot instrument_id=%s", instrument_id)
             raise CacheOperationError(
-                f"Corrupt order book snapshot for '{instrument_id.value}'."
+                f"Corrupt order book snapshot for '{instrument_id}'."
             ) from exc
 
-    async def get_last_trade_price(
-        self,
-        instrument_id: InstrumentId,
-    ) -> LastTradePrice | None:
-        client = await self._ensure_client()
-        key = _LTP_KEY.format(instrument_id=instrument_id.value)
-        try:
-            raw = await client.get(key)
-        except Exception as exc:
-            logger.exception("Failed to read LTP key=%s", key)
-            raise CacheOperationError(f"Failed to read LTP: {exc}") from exc
-
-        if raw is None:
-            return None
-
+    @staticmethod
+    def _parse_ltp(raw: str, instrument_id: str) -> LastTradePrice:
         try:
             data = json.loads(raw)
             return LastTradePrice(
-                instrument_id=instrument_id.value,
+                instrument_id=instrument_id,
                 price=Decimal(str(data["price"])),
                 currency=str(data["currency"]),
             )
         except (json.JSONDecodeError, KeyError, InvalidOperation, TypeError) as exc:
-            logger.exception("Corrupt LTP key=%s", key)
+            logger.exception("Corrupt LTP instrument_id=%s", instrument_id)
             raise CacheOperationError(
-                f"Corrupt last trade price for '{instrument_id.value}'."
+                f"Corrupt last trade price for '{instrument_id}'."
             ) from exc
 
+    @staticmethod
+    def _parse_ticker(raw: str, instrument_id: str) -> Ticker:
+        def decimal(value) -> Decimal | None:
+            return Decimal(value) if value is not None else None
+
+        try:
+            data = json.loads(raw)
+            return Ticker(
+                instrument_id=instrument_id,
+                window_seconds=int(data["window_seconds"]),
+                last_price=Decimal(data["last_price"]),
+                open_price=decimal(data.get("open_price")),
+                high=decimal(data.get("high")),
+                low=decimal(data.get("low")),
+                volume=int(data["volume"]),
+                vwap=decimal(data.get("vwap")),
+                price_change=decimal(data.get("price_change")),
+                price_change_percent=decimal(data.get("price_change_percent")),
+                trade_count=int(data["trade_count"]),
+                currency=str(data["currency"]),
+                updated_at=datetime.fromisoformat(data["updated_at"]),
+            )
+        except (
+            json.JSONDecodeError,
+            KeyError,
+            InvalidOperation,
+            TypeError,
+            ValueError,
+        ) as exc:
+            logger.exception("Corrupt ticker instrument_id=%s", instrument_id)
+            raise CacheOperationError(f"Corrupt ticker for '{instrument_id}'.") from exc
+
     async def _ensure_client(self):
         if self._client is None:
             await self.connect()
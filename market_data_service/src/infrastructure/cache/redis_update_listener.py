@@ -0,0 +1,71 @@
+import asyncio
+import json
+import logging
+from collections.abc import Callable
+
+from src.exceptions import CacheConnectionError
+
+logger = logging.getLogger(__name__)
+
+UPDATES_CHANNEL = "md:updates"
+
+
+class RedisUpdateListener:
+    """Follows the engine's ``md:updates`` notices.
+
+    Each message is a JSON list of instrument ids the engine just rewrote and
+    is passed to ``on_updates``. Notices published while the subscription is
+    down are lost, so ``on_reset`` is called whenever it (re)subscribes or
+    drops.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        on_updates: Callable[[list[str]], None],
+        on_reset: Callable[[], None],
+        channel: str = UPDATES_CHANNEL,
+        retry_delay: float = 1.0,
+    ) -> None:
+        self._url = url
+        self._on_updates = on_updates
+        self._on_reset = on_reset
+        self._channel = channel
+        self._retry_delay = retry_delay
+        self._task: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        try:
+            from redis.asyncio import Redis
+        except ImportError as exc:
+            raise CacheConnectionError(
+                "redis is required for RedisUpdateListener. "
+                "Install it with: pip install redis"
+            ) from exc
+        self._task = asyncio.create_task(self._listen(Redis))
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _listen(self, redis_cls) -> None:
+        while True:
+            client = redis_cls.from_url(self._url, decode_responses=True)
+            try:
+                async with client.pubsub() as pubsub:
+                    await pubsub.subscribe(self._channel)
+                    self._on_reset()
+                    logger.info("Subscribed to %s", self._channel)
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            self._on_updates(json.loads(message["data"]))
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Market data update subscription lost")
+                self._on_reset()
+                await asyncio.sleep(self._retry_delay)
+            finally:
+                await client.aclose()
@@ -0,0 +1,177 @@
+import asyncio
+import json
+import logging
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from decimal import Decimal
+
+from src.domain.read_models.order_book_replica import BookDelta, OrderBookReplica
+from src.domain.read_models.order_book_snapshot import OrderBookSnapshot
+from src.domain.value_objects.instrument_id import InstrumentId
+from src.infrastructure.cache.redis_market_data_reader import RedisMarketDataReader
+
+logger = logging.getLogger(__name__)
+
+_DELTA_STREAM = "md:deltas:{instrument_id}"
+
+
+class ReplicatedMarketDataReader(RedisMarketDataReader):
+    """Serves order books from local replicas fed by the engine's delta streams.
+
+    The first read of an instrument builds its replica from the
+    ``md:book:*`` snapshot and starts following ``md:deltas:*`` from the
+    stream position taken just before that snapshot (the engine writes both
+    in one transaction, so no delta is skipped). A single follower task reads
+    all followed streams with one blocking ``XREAD``. On a sequence gap, or
+    when the engine restarts, the replica is rebuilt from the snapshot.
+    Last trade prices are still read from Redis.
+
+    Only instruments with a sequenced snapshot get a replica and are
+    followed; for the rest the plain snapshot (or ``None``) is returned and
+    the next read tries again. At most ``max_replicas`` books are kept; the
+    least recently read one stops being followed when another is added.
+
+    The engine's ``md:updates`` notice can arrive before this reader has
+    applied the matching delta, so consumers that must not see the old book
+    (cache invalidation, stream refresh) register with
+    ``add_change_listener`` and are called with the instruments each batch
+    of deltas changed, after it is applied.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        block_ms: int = 1000,
+        batch_size: int = 500,
+        max_replicas: int = 10_000,
+    ) -> None:
+        super().__init__(url)
+        self._block_ms = block_ms
+        self._batch_size = batch_size
+        self._max_replicas = max_replicas
+        self._replicas: OrderedDict[str, OrderBookReplica] = OrderedDict()
+        self._cursors: dict[str, str] = {}
+        self._followed = asyncio.Event()
+        self._follower: asyncio.Task | None = None
+        self._change_listeners: list[Callable[[list[str]], None]] = []
+
+    def add_change_listener(self, listener: Callable[[list[str]], None]) -> None:
+        self._change_listeners.append(listener)
+
+    async def connect(self) -> None:
+        await super().connect()
+        if self._follower is None:
+            self._follower = asyncio.create_task(self._follow())
+
+    async def close(self) -> None:
+        if self._follower is not None:
+            self._follower.cancel()
+            await asyncio.gather(self._follower, return_exceptions=True)
+            self._follower = None
+        await super().close()
+
+    async def get_order_book(
+        self,
+        instrument_id: InstrumentId,
+    ) -> OrderBookSnapshot | None:
+        key = instrument_id.value
+        replica = self._replicas.get(key)
+        if replica is None:
+            return await self._resync(key)
+        self._replicas.move_to_end(key)
+        return replica.snapshot()
+
+    async def get_order_books(
+        self,
+        instrument_ids: Sequence[InstrumentId],
+    ) -> dict[str, OrderBookSnapshot]:
+        keys = list(
+            dict.fromkeys(instrument_id.value for instrument_id in instrument_ids)
+        )
+        new = [key for key in keys if key not in self._replicas]
+        resynced = await asyncio.gather(*(self._resync(key) for key in new))
+        result = {key: snapshot for key, snapshot in zip(new, resynced) if snapshot}
+        for key in keys:
+            replica = self._replicas.get(key)
+            if key not in result and replica is not None:
+                self._replicas.move_to_end(key)
+                result[key] = replica.snapshot()
+        return result
+
+    async def _resync(self, instrument_id: str) -> OrderBookSnapshot | None:
+        client = await self._ensure_client()
+        stream = _DELTA_STREAM.format(instrument_id=instrument_id)
+        latest = await client.xrevrange(stream, count=1)
+        snapshot = await super().get_order_book(InstrumentId(instrument_id))
+        if snapshot is None or snapshot.sequence is None:
+            # Nothing to follow yet: serve what Redis has, retry next read.
+            self._unfollow(instrument_id)
+            return snapshot
+        replica = OrderBookReplica(snapshot)
+        self._replicas[instrument_id] = replica
+        self._replicas.move_to_end(instrument_id)
+        self._cursors[stream] = latest[0][0] if latest else "0-0"
+        while len(self._replicas) > self._max_replicas:
+            self._unfollow(next(iter(self._replicas)))
+        self._followed.set()
+        return replica.snapshot()
+
+    def _unfollow(self, instrument_id: str) -> None:
+        self._replicas.pop(instrument_id, None)
+        self._cursors.pop(_DELTA_STREAM.format(instrument_id=instrument_id), None)
+        if not self._cursors:
+            self._followed.clear()
+
+    async def _follow(self) -> None:
+        while True:
+            await self._followed.wait()
+            try:
+                await self._poll()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Order book delta stream read failed")
+                await asyncio.sleep(1)
+
+    async def _poll(self) -> None:
+        """Read and apply one batch of deltas across followed streams."""
+        if not self._cursors:
+            return
+        client = await self._ensure_client()
+        response = await client.xread(
+            dict(self._cursors), count=self._batch_size, block=self._block_ms
+        )
+        stale: set[str] = set()
+        changed: list[str] = []
+        for stream, entries in response or []:
+            instrument_id = stream.split(":", 2)[2]
+            if stream not in self._cursors:
+                continue  # Evicted while the read was in flight.
+            changed.append(instrument_id)
+            for entry_id, fields in entries:
+                self._cursors[stream] = entry_id
+                if instrument_id in stale:
+                    continue
+                replica = self._replicas.get(instrument_id)
+                if replica is None or not replica.apply(self._parse_delta(fields)):
+                    stale.add(instrument_id)
+        for instrument_id in stale:
+            logger.info("Resyncing order book replica instrument=%s", instrument_id)
+            await self._resync(instrument_id)
+        if changed:
+            for listener in self._change_listeners:
+                listener(changed)
+
+    @staticmethod
+    def _parse_delta(fields: dict[str, str]) -> BookDelta:
+        ltp = fields.get("last_trade_price")
+        return BookDelta(
+            sequence=int(fields["sequence"]),
+            previous_sequence=int(fields["previous"]),
+            changes=tuple(
+                (side, Decimal(price), int(quantity))
+                for side, price, quantity in json.loads(fields["changes"])
+            ),
+            last_trade_price=Decimal(ltp) if ltp else None,
+            last_trade_currency=fields.get("last_trade_currency") or None,
+        )
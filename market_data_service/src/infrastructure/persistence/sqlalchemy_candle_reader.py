@@ -0,0 +1,124 @@
+import logging
+from datetime import datetime, timezone
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Integer,
+    MetaData,
+    Numeric,
+    String,
+    Table,
+    select,
+)
+from sqlalchemy.exc import OperationalError, SQLAlchemyError
+
+from src.domain.ports.candle_reader import CandleReader
+from src.domain.read_models.candle import Candle
+from src.domain.value_objects.instrument_id import InstrumentId
+from src.exceptions import DatabaseConnectionError, DatabaseOperationError
+
+logger = logging.getLogger(__name__)
+
+# Owned and migrated by the Balance & History Service; only the columns read
+# here are declared.
+candles = Table(
+    "candles",
+    MetaData(),
+    Column("instrument_id", String(36), primary_key=True),
+    Column("interval", String(3), primary_key=True),
+    Column("open_time", DateTime(timezone=True), primary_key=True),
+    Column("open", Numeric(18, 2), nullable=False),
+    Column("high", Numeric(18, 2), nullable=False),
+    Column("low", Numeric(18, 2), nullable=False),
+    Column("close", Numeric(18, 2), nullable=False),
+    Column("volume", Integer, nullable=False),
+    Column("notional", Numeric(28, 2), nullable=False),
+    Column("trade_count", Integer, nullable=False),
+    Column("currency", String(3), nullable=False),
+)
+
+
+def _utc(value: datetime) -> datetime:
+    # SQLite hands back naive datetimes for timezone-aware columns.
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+
+class SQLAlchemyCandleReader(CandleReader):
+    """Reads finalized bars from the ``candles`` table the Balance & History
+    Service persists. Holds no open bar; every candle is ``final``."""
+
+    def __init__(self, url: str) -> None:
+        self._url = url
+        self._engine = None
+
+    async def connect(self) -> None:
+        from sqlalchemy.ext.asyncio import create_async_engine
+
+        try:
+            self._engine = create_async_engine(self._url, pool_pre_ping=True)
+        except Exception as exc:
+            logger.exception("Failed to create database engine")
+            raise DatabaseConnectionError(
+                f"Failed to connect to database: {exc}"
+            ) from exc
+
+    async def close(self) -> None:
+        if self._engine is not None:
+            await self._engine.dispose()
+            self._engine = None
+
+    async def get_candles(
+        self,
+        instrument_id: InstrumentId,
+        interval: str,
+        start: datetime | None,
+        end: datetime | None,
+        limit: int,
+    ) -> list[Candle]:
+        if limit <= 0:
+            return []
+        if self._engine is None:
+            await self.connect()
+        stmt = (
+            select(candles)
+            .where(
+                candles.c.instrument_id == instrument_id.value,
+                candles.c.interval == interval,
+            )
+            .order_by(candles.c.open_time.desc())
+            .limit(limit)
+        )
+        if start is not None:
+            stmt = stmt.where(candles.c.open_time >= start)
+        if end is not None:
+            stmt = stmt.where(candles.c.open_time < end)
+        try:
+            async with self._engine.connect() as conn:
+                rows = (await conn.execute(stmt)).all()
+        except OperationalError as exc:
+            logger.exception("Failed to read candles instrument_id=%s", instrument_id)
+            raise DatabaseConnectionError(
+                f"Failed to connect to database: {exc}"
+            ) from exc
+        except SQLAlchemyError as exc:
+            logger.exception("Failed to read candles instrument_id=%s", instrument_id)
+            raise DatabaseOperationError(f"Failed to read candles: {exc}") from exc
+        return [self._to_candle(row) for row in reversed(rows)]
+
+    @staticmethod
+    def _to_candle(row) -> Candle:
+        return Candle(
+            instrument_id=row.instrument_id,
+            interval=row.interval,
+            open_time=_utc(row.open_time),
+            open=row.open,
+            high=row.high,
+            low=row.low,
+            close=row.close,
+            volume=row.volume,
+            vwap=row.notional / row.volume if row.volume else row.close,
+            trade_count=row.trade_count,
+            currency=row.currency,
+            final=True,
+        )
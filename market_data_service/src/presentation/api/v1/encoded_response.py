@@ -0,0 +1,78 @@
+import hashlib
+import json
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from fastapi import Request, Response, status
+
+
+@dataclass(frozen=True, slots=True)
+class EncodedBody:
+    body: bytes
+    etag: str
+
+
+class EncodedBodyCache:
+    """Canonical JSON bytes and ETag of the latest read model per instrument.
+
+    Readers hand out the same read-model object until the data changes (the
+    in-process cache and book replicas both do), so the body is encoded and
+    hashed once per version and reused by identity after that.
+    """
+
+    def __init__(self, to_json: Callable[[Any], dict[str, Any]]) -> None:
+        self._to_json = to_json
+        self._entries: dict[str, tuple[Any, EncodedBody]] = {}
+
+    def get(self, instrument_id: str, model: Any) -> EncodedBody:
+        entry = self._entries.get(instrument_id)
+        if entry is not None and entry[0] is model:
+            return entry[1]
+        # Same separators and Decimal-as-string shape as FastAPI's JSONResponse.
+        body = json.dumps(
+            self._to_json(model), ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+        encoded = EncodedBody(
+            body=body, etag=f'"{hashlib.blake2b(body, digest_size=12).hexdigest()}"'
+        )
+        self._entries[instrument_id] = (model, encoded)
+        return encoded
+
+
+def encoded_response(request: Request, encoded: EncodedBody) -> Response:
+    """200 with the pre-encoded body, or 304 if ``If-None-Match`` matches."""
+    headers = {"ETag": encoded.etag, "Cache-Control": "no-cache"}
+    if _etag_matches(request.headers.get("if-none-match"), encoded.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(
+        content=encoded.body, media_type="application/json", headers=headers
+    )
+
+
+def _etag_matches(header: str | None, etag: str) -> bool:
+    if not header:
+        return False
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def encoded_batch_response(
+    field: str, bodies: list[EncodedBody], missing: list[str]
+) -> Response:
+    """``{field: [...], "missing": [...]}`` spliced from pre-encoded bodies."""
+    content = b"".join(
+        (
+            b'{"',
+            field.encode("utf-8"),
+            b'":[',
+            b",".join(encoded.body for encoded in bodies),
+            b'],"missing":',
+            json.dumps(missing, separators=(",", ":")).encode("utf-8"),
+            b"}",
+        )
+    )
+    return Response(content=content, media_type="application/json")
@@ -1,36 +1,159 @@
 import logging
-from typing import Annotated
+from datetime import datetime, timezone
+from typing import Annotated, Any
 
-from fastapi import APIRouter, HTTPException, Path, status
+from fastapi import APIRouter, HTTPException, Path, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 
+from src.application.get_candles import (
+    MAX_CANDLES,
+    GetCandlesHandler,
+    GetCandlesQuery,
+)
 from src.application.get_last_trade_price import (
     GetLastTradePriceHandler,
     GetLastTradePriceQuery,
 )
+from src.application.get_last_trade_prices import (
+    GetLastTradePricesHandler,
+    GetLastTradePricesQuery,
+)
 from src.application.get_order_book import GetOrderBookHandler, GetOrderBookQuery
+from src.application.get_order_books import GetOrderBooksHandler, GetOrderBooksQuery
+from src.application.get_ticker import GetTickerHandler, GetTickerQuery
+from src.application.get_tickers import GetTickersHandler, GetTickersQuery
+from src.domain.value_objects.instrument_id import InstrumentId
 from src.exceptions import (
     CacheConnectionError,
     CacheOperationError,
+    DatabaseConnectionError,
+    DatabaseOperationError,
+    InvalidCandleIntervalError,
     InvalidInstrumentIdError,
     MarketDataNotFoundError,
+    StreamCapacityError,
+)
+from src.domain.read_models.order_book_snapshot import LastTradePrice, OrderBookSnapshot
+from src.domain.read_models.ticker import Ticker
+from src.presentation.api.v1.encoded_response import (
+    EncodedBodyCache,
+    encoded_batch_response,
+    encoded_response,
 )
+from src.presentation.api.v1.schemas.requests import InstrumentIdsRequest
 from src.presentation.api.v1.schemas.responses import (
+    CacheStatsResponse,
+    CandleResponse,
+    CandlesResponse,
     LastTradePriceResponse,
+    LastTradePricesResponse,
     OrderBookResponse,
-    PriceLevelResponse,
+    OrderBooksResponse,
+    TickerResponse,
+    TickersResponse,
+)
+from src.presentation.dependencies import (
+    CandleReaderDep,
+    MarketDataCacheDep,
+    MarketDataReaderDep,
+    OrderBookStreamHubDep,
 )
-from src.presentation.dependencies import MarketDataReaderDep
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/market-data", tags=["market-data"])
 
+
+def _order_book_json(snapshot: OrderBookSnapshot) -> dict[str, Any]:
+    return {
+        "instrument_id": snapshot.instrument_id,
+        "bids": [
+            {"price": str(level.price), "quantity": level.quantity}
+            for level in snapshot.bids
+        ],
+        "asks": [
+            {"price": str(level.price), "quantity": level.quantity}
+            for level in snapshot.asks
+        ],
+        "last_trade_price": (
+            str(snapshot.last_trade_price)
+            if snapshot.last_trade_price is not None
+            else None
+        ),
+        "last_trade_currency": snapshot.last_trade_currency,
+    }
+
+
+def _last_trade_price_json(ltp: LastTradePrice) -> dict[str, Any]:
+    return {
+        "instrument_id": ltp.instrument_id,
+        "price": str(ltp.price),
+        "currency": ltp.currency,
+    }
+
+
+def _ticker_json(ticker: Ticker) -> dict[str, Any]:
+    def decimal(value) -> str | None:
+        return str(value) if value is not None else None
+
+    return {
+        "instrument_id": ticker.instrument_id,
+        "window_seconds": ticker.window_seconds,
+        "last_price": str(ticker.last_price),
+        "open_price": decimal(ticker.open_price),
+        "high": decimal(ticker.high),
+        "low": decimal(ticker.low),
+        "volume": ticker.volume,
+        "vwap": decimal(ticker.vwap),
+        "price_change": decimal(ticker.price_change),
+        "price_change_percent": decimal(ticker.price_change_percent),
+        "trade_count": ticker.trade_count,
+        "currency": ticker.currency,
+        "updated_at": ticker.updated_at.isoformat(),
+    }
+
+
+# Responses are served as pre-encoded bytes with an ETag; the response models
+# still document the shape.
+_order_book_bodies = EncodedBodyCache(_order_book_json)
+_last_trade_price_bodies = EncodedBodyCache(_last_trade_price_json)
+_ticker_bodies = EncodedBodyCache(_ticker_json)
+
+
+def render_order_book(snapshot: OrderBookSnapshot) -> str:
+    """Order-book JSON as served by the REST endpoint, for streaming."""
+    return _order_book_bodies.get(snapshot.instrument_id, snapshot).body.decode("utf-8")
+
+
 InstrumentIdPath = Annotated[
     str,
     Path(..., min_length=36, max_length=36, description="Instrument UUID v4."),
 ]
 
 
+@router.get(
+    "/cache-stats",
+    response_model=CacheStatsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get in-process market data cache counters",
+)
+async def get_cache_stats(cache: MarketDataCacheDep) -> CacheStatsResponse:
+    if cache is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Market data cache is disabled.",
+        )
+    stats = cache.stats()
+    lookups = stats.hits + stats.misses
+    return CacheStatsResponse(
+        hits=stats.hits,
+        misses=stats.misses,
+        invalidations=stats.invalidations,
+        entries=stats.entries,
+        hit_ratio=stats.hits / lookups if lookups else 0.0,
+    )
+
+
 @router.get(
     "/{instrument_id}/order-book",
     response_model=OrderBookResponse,
@@ -40,7 +163,8 @@ InstrumentIdPath = Annotated[
 async def get_order_book(
     instrument_id: InstrumentIdPath,
     reader: MarketDataReaderDep,
-) -> OrderBookResponse:
+    request: Request,
+) -> Response:
     handler = GetOrderBookHandler(reader)
     try:
         snapshot = await handler.handle(GetOrderBookQuery(instrument_id=instrument_id))
@@ -65,18 +189,44 @@ async def get_order_book(
             detail="An unexpected error occurred.",
         )
 
-    return OrderBookResponse(
-        instrument_id=snapshot.instrument_id,
-        bids=[
-            PriceLevelResponse(price=level.price, quantity=level.quantity)
-            for level in snapshot.bids
-        ],
-        asks=[
-            PriceLevelResponse(price=level.price, quantity=level.quantity)
-            for level in snapshot.asks
-        ],
-        last_trade_price=snapshot.last_trade_price,
-        last_trade_currency=snapshot.last_trade_currency,
+    return encoded_response(
+        request, _order_book_bodies.get(snapshot.instrument_id, snapshot)
+    )
+
+
+@router.get(
+    "/{instrument_id}/order-book/stream",
+    status_code=status.HTTP_200_OK,
+    summary="Stream order book updates (Server-Sent Events)",
+    response_class=StreamingResponse,
+)
+async def stream_order_book(
+    instrument_id: InstrumentIdPath,
+    hub: OrderBookStreamHubDep,
+) -> StreamingResponse:
+    try:
+        InstrumentId(instrument_id)
+        subscription = hub.subscribe(instrument_id)
+    except InvalidInstrumentIdError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=str(exc)
+        )
+    except StreamCapacityError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc)
+        )
+
+    async def events():
+        try:
+            while (payload := await subscription.next()) is not None:
+                yield f"event: order-book\ndata: {payload}\n\n"
+        finally:
+            hub.unsubscribe(subscription)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
 
 
@@ -89,7 +239,8 @@ async def get_order_book(
 async def get_last_trade_price(
     instrument_id: InstrumentIdPath,
     reader: MarketDataReaderDep,
-) -> LastTradePriceResponse:
+    request: Request,
+) -> Response:
     handler = GetLastTradePriceHandler(reader)
     try:
         ltp = await handler.handle(GetLastTradePriceQuery(instrument_id=instrument_id))
@@ -114,8 +265,235 @@ async def get_last_trade_price(
             detail="An unexpected error occurred.",
         )
 
-    return LastTradePriceResponse(
-        instrument_id=ltp.instrument_id,
-        price=ltp.price,
-        currency=ltp.currency,
+    return encoded_response(
+        request, _last_trade_price_bodies.get(ltp.instrument_id, ltp)
+    )
+
+
+def _as_utc(value: datetime | None) -> datetime | None:
+    # Bar open times are UTC; a time without an offset is taken as UTC too.
+    if value is None or value.tzinfo is not None:
+        return value
+    return value.replace(tzinfo=timezone.utc)
+
+
+@router.get(
+    "/{instrument_id}/candles",
+    response_model=CandlesResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get OHLCV candles",
+)
+async def get_candles(
+    instrument_id: InstrumentIdPath,
+    reader: CandleReaderDep,
+    interval: Annotated[str, Query(description="1s, 1m, 5m, 1h or 1d.")] = "1m",
+    start: Annotated[
+        datetime | None, Query(description="Earliest bar open time.")
+    ] = None,
+    end: Annotated[
+        datetime | None, Query(description="Bars opening before this time.")
+    ] = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_CANDLES)] = 500,
+) -> CandlesResponse:
+    handler = GetCandlesHandler(reader)
+    try:
+        candles = await handler.handle(
+            GetCandlesQuery(
+                instrument_id=instrument_id,
+                interval=interval,
+                start=_as_utc(start),
+                end=_as_utc(end),
+                limit=limit,
+            )
+        )
+    except (InvalidInstrumentIdError, InvalidCandleIntervalError) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=str(exc)
+        )
+    except (CacheConnectionError, DatabaseConnectionError) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc)
+        )
+    except (CacheOperationError, DatabaseOperationError) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(exc)
+        )
+    except Exception:
+        logger.exception("Unexpected error getting candles")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An unexpected error occurred.",
+        )
+
+    return CandlesResponse(
+        instrument_id=instrument_id,
+        interval=interval,
+        candles=[CandleResponse.model_validate(candle) for candle in candles],
+    )
+
+
+@router.get(
+    "/{instrument_id}/ticker",
+    response_model=TickerResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get rolling 24h ticker",
+)
+async def get_ticker(
+    instrument_id: InstrumentIdPath,
+    reader: MarketDataReaderDep,
+    request: Request,
+) -> Response:
+    handler = GetTickerHandler(reader)
+    try:
+        ticker = await handler.handle(GetTickerQuery(instrument_id=instrument_id))
+    except MarketDataNotFoundError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc))
+    except InvalidInstrumentIdError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=str(exc)
+        )
+    except CacheConnectionError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc)
+        )
+    except CacheOperationError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(exc)
+        )
+    except Exception:
+        logger.exception("Unexpected error getting ticker")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An unexpected error occurred.",
+        )
+
+    return encoded_response(request, _ticker_bodies.get(ticker.instrument_id, ticker))
+
+
+@router.post(
+    "/order-books",
+    response_model=OrderBooksResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get order book snapshots for many instruments",
+)
+async def get_order_books(
+    body: InstrumentIdsRequest,
+    reader: MarketDataReaderDep,
+) -> Response:
+    handler = GetOrderBooksHandler(reader)
+    try:
+        result = await handler.handle(
+            GetOrderBooksQuery(instrument_ids=tuple(body.instrument_ids))
+        )
+    except InvalidInstrumentIdError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=str(exc)
+        )
+    except CacheConnectionError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc)
+        )
+    except CacheOperationError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(exc)
+        )
+    except Exception:
+        logger.exception("Unexpected error getting order books")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An unexpected error occurred.",
+        )
+
+    return encoded_batch_response(
+        "order_books",
+        [
+            _order_book_bodies.get(snapshot.instrument_id, snapshot)
+            for snapshot in result.order_books
+        ],
+        result.missing,
+    )
+
+
+@router.post(
+    "/last-trade-prices",
+    response_model=LastTradePricesResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get last trade prices for many instruments",
+)
+async def get_last_trade_prices(
+    body: InstrumentIdsRequest,
+    reader: MarketDataReaderDep,
+) -> Response:
+    handler = GetLastTradePricesHandler(reader)
+    try:
+        result = await handler.handle(
+            GetLastTradePricesQuery(instrument_ids=tuple(body.instrument_ids))
+        )
+    except InvalidInstrumentIdError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=str(exc)
+        )
+    except CacheConnectionError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc)
+        )
+    except CacheOperationError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(exc)
+        )
+    except Exception:
+        logger.exception("Unexpected error getting LTPs")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An unexpected error occurred.",
+        )
+
+    return encoded_batch_response(
+        "last_trade_prices",
+        [
+            _last_trade_price_bodies.get(ltp.instrument_id, ltp)
+            for ltp in result.last_trade_prices
+        ],
+        result.missing,
+    )
+
+
+@router.post(
+    "/tickers",
+    response_model=TickersResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get rolling 24h tickers for many instruments",
+)
+async def get_tickers(
+    body: InstrumentIdsRequest,
+    reader: MarketDataReaderDep,
+) -> Response:
+    handler = GetTickersHandler(reader)
+    try:
+        result = await handler.handle(
+            GetTickersQuery(instrument_ids=tuple(body.instrument_ids))
+        )
+    except InvalidInstrumentIdError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=str(exc)
+        )
+    except CacheConnectionError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc)
+        )
+    except CacheOperationError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(exc)
+        )
+    except Exception:
+        logger.exception("Unexpected error getting tickers")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An unexpected error occurred.",
+        )
+
+    return encoded_batch_response(
+        "tickers",
+        [_ticker_bodies.get(ticker.instrument_id, ticker) for ticker in result.tickers],
+        result.missing,
     )
@@ -0,0 +1,9 @@
+from pydantic import BaseModel, Field
+
+MAX_BATCH_INSTRUMENTS = 500
+
+
+class InstrumentIdsRequest(BaseModel):
+    instrument_ids: list[str] = Field(
+        ..., min_length=1, max_length=MAX_BATCH_INSTRUMENTS
+    )
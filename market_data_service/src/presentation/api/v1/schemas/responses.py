@@ -1,3 +1,4 @@
+from datetime import datetime
 from decimal import Decimal
 
 from pydantic import BaseModel, ConfigDict
@@ -24,3 +25,65 @@ class LastTradePriceResponse(BaseModel):
     instrument_id: str
     price: Decimal
     currency: str
+
+
+class CacheStatsResponse(BaseModel):
+    hits: int
+    misses: int
+    invalidations: int
+    entries: int
+    hit_ratio: float
+
+
+class OrderBooksResponse(BaseModel):
+    order_books: list[OrderBookResponse]
+    missing: list[str]
+
+
+class LastTradePricesResponse(BaseModel):
+    last_trade_prices: list[LastTradePriceResponse]
+    missing: list[str]
+
+
+class CandleResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    open_time: datetime
+    open: Decimal
+    high: Decimal
+    low: Decimal
+    close: Decimal
+    volume: int
+    vwap: Decimal
+    trade_count: int
+    currency: str
+    final: bool
+
+
+class CandlesResponse(BaseModel):
+    instrument_id: str
+    interval: str
+    candles: list[CandleResponse]
+
+
+class TickerResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    instrument_id: str
+    window_seconds: int
+    last_price: Decimal
+    open_price: Decimal | None
+    high: Decimal | None
+    low: Decimal | None
+    volume: int
+    vwap: Decimal | None
+    price_change: Decimal | None
+    price_change_percent: Decimal | None
+    trade_count: int
+    currency: str
+    updated_at: datetime
+
+
+class TickersResponse(BaseModel):
+    tickers: list[TickerResponse]
+    missing: list[str]
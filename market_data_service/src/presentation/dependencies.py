@@ -1,7 +1,9 @@
-from typing import Annotated
+from typing import Annotated, Any
 
 from fastapi import Depends, Request
 
+from src.application.order_book_stream_hub import OrderBookStreamHub
+from src.domain.ports.candle_reader import CandleReader
 from src.domain.ports.market_data_reader import MarketDataReader
 
 
@@ -9,4 +11,22 @@ def get_market_data_reader(request: Request) -> MarketDataReader:
     return request.app.state.market_data_reader
 
 
+def get_market_data_cache(request: Request) -> Any:
+    """The in-process cache (exposes ``stats()``), or ``None`` if disabled."""
+    return getattr(request.app.state, "market_data_cache", None)
+
+
+def get_candle_reader(request: Request) -> CandleReader:
+    return request.app.state.candle_reader
+
+
+def get_order_book_stream_hub(request: Request) -> OrderBookStreamHub:
+    return request.app.state.order_book_stream_hub
+
+
 MarketDataReaderDep = Annotated[MarketDataReader, Depends(get_market_data_reader)]
+MarketDataCacheDep = Annotated[Any, Depends(get_market_data_cache)]
+CandleReaderDep = Annotated[CandleReader, Depends(get_candle_reader)]
+OrderBookStreamHubDep = Annotated[
+    OrderBookStreamHub, Depends(get_order_book_stream_hub)
+]
@@ -0,0 +1,63 @@
+import asyncio
+import logging
+
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect, status
+
+from src.conf import Config
+from src.domain.value_objects.instrument_id import InstrumentId
+from src.exceptions import InvalidInstrumentIdError, StreamCapacityError
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(tags=["websocket"])
+
+
+@router.websocket("/ws/v1/market-data/{instrument_id}/order-book")
+async def order_book_stream(websocket: WebSocket, instrument_id: str) -> None:
+    """Push the latest order book on every engine update.
+
+    Slow clients are conflated to the newest book; a client that does not
+    accept a frame within ``MARKET_DATA_STREAM_SEND_TIMEOUT_SECONDS`` is
+    disconnected so it cannot hold server resources.
+    """
+    hub = websocket.app.state.order_book_stream_hub
+    try:
+        InstrumentId(instrument_id)
+        subscription = hub.subscribe(instrument_id)
+    except InvalidInstrumentIdError:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+    except StreamCapacityError:
+        await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER)
+        return
+
+    await websocket.accept()
+    sender = asyncio.create_task(_send_updates(websocket, subscription))
+    try:
+        while True:
+            # Keep-alive / client pings; payload ignored.
+            await websocket.receive_text()
+    except WebSocketDisconnect:
+        pass
+    except Exception:
+        logger.exception("WebSocket error instrument_id=%s", instrument_id)
+    finally:
+        hub.unsubscribe(subscription)
+        sender.cancel()
+        await asyncio.gather(sender, return_exceptions=True)
+
+
+async def _send_updates(websocket: WebSocket, subscription) -> None:
+    while (payload := await subscription.next()) is not None:
+        try:
+            await asyncio.wait_for(
+                websocket.send_text(payload),
+                Config.MARKET_DATA_STREAM_SEND_TIMEOUT_SECONDS,
+            )
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Closing slow order book subscriber instrument_id=%s",
+                subscription.instrument_id,
+            )
+            await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER)
+            return
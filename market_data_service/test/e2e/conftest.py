@@ -1,5 +1,6 @@
 import os
 from collections.abc import Iterator
+from datetime import datetime, timezone
 from decimal import Decimal
 
 import pytest
@@ -9,12 +10,15 @@ os.environ["APP_ENV"] = "development"
 os.environ["REDIS_ENABLED"] = "false"
 
 from src.app import app  # noqa: E402
+from src.domain.read_models.candle import Candle
 from src.domain.read_models.order_book_snapshot import (
     LastTradePrice,
     OrderBookSnapshot,
     PriceLevel,
 )
+from src.domain.read_models.ticker import Ticker
 from src.domain.value_objects.instrument_id import InstrumentId
+from src.infrastructure.cache.in_memory_candle_reader import InMemoryCandleReader
 from src.infrastructure.cache.in_memory_market_data_reader import (
     InMemoryMarketDataReader,
 )
@@ -47,7 +51,43 @@ def client(instrument_id: str) -> Iterator[TestClient]:
             currency="USD",
         )
     )
+    reader.seed_ticker(
+        Ticker(
+            instrument_id=instrument_id,
+            window_seconds=86400,
+            last_price=Decimal("100.25"),
+            open_price=Decimal("98.00"),
+            high=Decimal("101.00"),
+            low=Decimal("97.50"),
+            volume=1200,
+            vwap=Decimal("99.80"),
+            price_change=Decimal("2.25"),
+            price_change_percent=Decimal("2.2959"),
+            trade_count=87,
+            currency="USD",
+            updated_at=datetime(2026, 1, 5, 12, 0, tzinfo=timezone.utc),
+        )
+    )
     app.state.market_data_reader = reader
+    candles = InMemoryCandleReader()
+    for minute, close in enumerate(("100.00", "100.50", "100.25")):
+        candles.seed_candle(
+            Candle(
+                instrument_id=instrument_id,
+                interval="1m",
+                open_time=datetime(2026, 1, 5, 10, minute, tzinfo=timezone.utc),
+                open=Decimal("100.00"),
+                high=Decimal("101.00"),
+                low=Decimal("99.00"),
+                close=Decimal(close),
+                volume=10,
+                vwap=Decimal("100.10"),
+                trade_count=4,
+                currency="USD",
+                final=minute < 2,
+            )
+        )
+    app.state.candle_reader = candles
 
     with TestClient(app) as test_client:
         yield test_client
@@ -1,8 +1,20 @@
+import json
 import uuid
 
+import pytest
 from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
 
+from src.application.order_book_stream_hub import OrderBookStreamHub
+from src.domain.read_models.order_book_snapshot import OrderBookSnapshot
 from src.domain.value_objects.instrument_id import InstrumentId
+from src.infrastructure.cache.in_memory_market_data_reader import (
+    InMemoryMarketDataReader,
+)
+from src.presentation.api.v1.routers.market_data import (
+    render_order_book,
+    stream_order_book,
+)
 
 BASE = "/api/v1/market-data"
 
@@ -20,6 +32,27 @@ class TestOrderBook:
         assert body["last_trade_price"] == "100.25"
         assert body["last_trade_currency"] == "USD"
 
+    def test_etag_revalidation(self, client: TestClient, instrument_id: str) -> None:
+        first = client.get(f"{BASE}/{instrument_id}/order-book")
+        etag = first.headers["etag"]
+
+        repeat = client.get(f"{BASE}/{instrument_id}/order-book")
+        assert repeat.headers["etag"] == etag
+        assert repeat.content == first.content
+
+        cached = client.get(
+            f"{BASE}/{instrument_id}/order-book",
+            headers={"If-None-Match": f'"other", W/{etag}'},
+        )
+        assert cached.status_code == 304
+        assert cached.content == b""
+        assert cached.headers["etag"] == etag
+
+        stale = client.get(
+            f"{BASE}/{instrument_id}/order-book", headers={"If-None-Match": '"old"'}
+        )
+        assert stale.status_code == 200
+
     def test_order_book_not_found(self, client: TestClient) -> None:
         missing = InstrumentId.generate().value
         response = client.get(f"{BASE}/{missing}/order-book")
@@ -39,7 +72,192 @@ class TestLastTradePrice:
         assert body["price"] == "100.25"
         assert body["currency"] == "USD"
 
+    def test_ltp_not_modified(self, client: TestClient, instrument_id: str) -> None:
+        etag = client.get(f"{BASE}/{instrument_id}/last-trade-price").headers["etag"]
+        response = client.get(
+            f"{BASE}/{instrument_id}/last-trade-price",
+            headers={"If-None-Match": etag},
+        )
+        assert response.status_code == 304
+
     def test_ltp_not_found(self, client: TestClient) -> None:
         missing = str(uuid.uuid4())
         response = client.get(f"{BASE}/{missing}/last-trade-price")
         assert response.status_code == 404
+
+
+class TestCacheStats:
+    def test_reports_counters(self, client: TestClient) -> None:
+        response = client.get(f"{BASE}/cache-stats")
+        assert response.status_code == 200
+        body = response.json()
+        assert set(body) == {"hits", "misses", "invalidations", "entries", "hit_ratio"}
+
+
+class TestBatch:
+    def test_order_books_partial(self, client: TestClient, instrument_id: str) -> None:
+        missing = InstrumentId.generate().value
+        response = client.post(
+            f"{BASE}/order-books", json={"instrument_ids": [instrument_id, missing]}
+        )
+        assert response.status_code == 200
+        body = response.json()
+        assert [book["instrument_id"] for book in body["order_books"]] == [
+            instrument_id
+        ]
+        assert body["order_books"][0]["bids"][0] == {
+            "price": "100.00",
+            "quantity": 50,
+        }
+        assert body["missing"] == [missing]
+
+    def test_last_trade_prices_partial(
+        self, client: TestClient, instrument_id: str
+    ) -> None:
+        missing = InstrumentId.generate().value
+        response = client.post(
+            f"{BASE}/last-trade-prices",
+            json={"instrument_ids": [missing, instrument_id]},
+        )
+        assert response.status_code == 200
+        assert response.json() == {
+            "last_trade_prices": [
+                {"instrument_id": instrument_id, "price": "100.25", "currency": "USD"}
+            ],
+            "missing": [missing],
+        }
+
+    def test_rejects_invalid_and_oversized_batches(self, client: TestClient) -> None:
+        invalid = client.post(
+            f"{BASE}/last-trade-prices", json={"instrument_ids": ["nope"]}
+        )
+        assert invalid.status_code == 422
+        too_many = client.post(
+            f"{BASE}/order-books",
+            json={"instrument_ids": [str(uuid.uuid4()) for _ in range(501)]},
+        )
+        assert too_many.status_code == 422
+
+
+class TestOrderBookStreaming:
+    def test_websocket_pushes_order_book(
+        self, client: TestClient, instrument_id: str
+    ) -> None:
+        with client.websocket_connect(
+            f"/ws/v1/market-data/{instrument_id}/order-book"
+        ) as websocket:
+            book = websocket.receive_json()
+        assert book["instrument_id"] == instrument_id
+        assert book["bids"][0] == {"price": "100.00", "quantity": 50}
+        assert client.app.state.order_book_stream_hub.stats().subscribers == 0
+
+    def test_websocket_rejects_invalid_instrument(self, client: TestClient) -> None:
+        with pytest.raises(WebSocketDisconnect) as exc_info:
+            with client.websocket_connect("/ws/v1/market-data/nope/order-book"):
+                pass
+        assert exc_info.value.code == 1008
+
+    async def test_sse_streams_order_book(self, instrument_id: str) -> None:
+        # TestClient buffers whole bodies, so read the endless stream directly.
+        reader = InMemoryMarketDataReader()
+        reader.seed_book(
+            OrderBookSnapshot(
+                instrument_id=instrument_id,
+                bids=(),
+                asks=(),
+                last_trade_price=None,
+                last_trade_currency=None,
+            )
+        )
+        hub = OrderBookStreamHub(reader, render=render_order_book)
+
+        response = await stream_order_book(instrument_id, hub)
+        event = await anext(response.body_iterator)
+        await response.body_iterator.aclose()
+
+        assert response.media_type == "text/event-stream"
+        assert event.startswith("event: order-book\ndata: ")
+        data = json.loads(event.split("data: ", 1)[1])
+        assert data["instrument_id"] == instrument_id
+        assert hub.stats().subscribers == 0
+
+    def test_sse_rejects_invalid_instrument(self, client: TestClient) -> None:
+        response = client.get(f"{BASE}/nope/order-book/stream")
+        assert response.status_code == 422
+
+
+class TestCandles:
+    def test_get_candles_in_range(self, client: TestClient, instrument_id: str) -> None:
+        response = client.get(
+            f"{BASE}/{instrument_id}/candles",
+            params={"interval": "1m", "start": "2026-01-05T10:01:00Z", "limit": 10},
+        )
+        assert response.status_code == 200
+        body = response.json()
+        assert body["instrument_id"] == instrument_id
+        assert body["interval"] == "1m"
+        assert [c["close"] for c in body["candles"]] == ["100.50", "100.25"]
+        assert body["candles"][0] == {
+            "open_time": "2026-01-05T10:01:00Z",
+            "open": "100.00",
+            "high": "101.00",
+            "low": "99.00",
+            "close": "100.50",
+            "volume": 10,
+            "vwap": "100.10",
+            "trade_count": 4,
+            "currency": "USD",
+            "final": True,
+        }
+        assert body["candles"][-1]["final"] is False
+
+    def test_limit_keeps_most_recent(
+        self, client: TestClient, instrument_id: str
+    ) -> None:
+        response = client.get(f"{BASE}/{instrument_id}/candles", params={"limit": 1})
+        assert [c["close"] for c in response.json()["candles"]] == ["100.25"]
+
+    def test_naive_range_is_taken_as_utc(
+        self, client: TestClient, instrument_id: str
+    ) -> None:
+        response = client.get(
+            f"{BASE}/{instrument_id}/candles",
+            params={"start": "2026-01-05T10:01:00", "end": "2026-01-05T10:02:00"},
+        )
+        assert response.status_code == 200
+        assert [c["close"] for c in response.json()["candles"]] == ["100.50"]
+
+    def test_rejects_unknown_interval(
+        self, client: TestClient, instrument_id: str
+    ) -> None:
+        response = client.get(
+            f"{BASE}/{instrument_id}/candles", params={"interval": "2m"}
+        )
+        assert response.status_code == 422
+
+
+class TestTickers:
+    def test_get_ticker(self, client: TestClient, instrument_id: str) -> None:
+        response = client.get(f"{BASE}/{instrument_id}/ticker")
+        assert response.status_code == 200
+        body = response.json()
+        assert body["instrument_id"] == instrument_id
+        assert body["volume"] == 1200
+        assert body["price_change_percent"] == "2.2959"
+        assert body["high"] == "101.00"
+        assert response.headers["etag"]
+
+    def test_ticker_not_found(self, client: TestClient) -> None:
+        response = client.get(f"{BASE}/{InstrumentId.generate().value}/ticker")
+        assert response.status_code == 404
+
+    def test_tickers_partial(self, client: TestClient, instrument_id: str) -> None:
+        missing = InstrumentId.generate().value
+        response = client.post(
+            f"{BASE}/tickers", json={"instrument_ids": [instrument_id, missing]}
+        )
+        assert response.status_code == 200
+        body = response.json()
+        assert [t["instrument_id"] for t in body["tickers"]] == [instrument_id]
+        assert body["tickers"][0]["vwap"] == "99.80"
+        assert body["missing"] == [missing]
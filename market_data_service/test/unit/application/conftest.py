@@ -48,4 +48,8 @@ def mock_reader() -> AsyncMock:
     reader = AsyncMock(spec=MarketDataReader)
     reader.get_order_book = AsyncMock()
     reader.get_last_trade_price = AsyncMock()
+    reader.get_order_books = AsyncMock()
+    reader.get_last_trade_prices = AsyncMock()
+    reader.get_ticker = AsyncMock()
+    reader.get_tickers = AsyncMock()
     return reader
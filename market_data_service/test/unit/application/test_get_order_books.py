@@ -0,0 +1,54 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.application.get_last_trade_prices import (
+    GetLastTradePricesHandler,
+    GetLastTradePricesQuery,
+)
+from src.application.get_order_books import GetOrderBooksHandler, GetOrderBooksQuery
+from src.domain.read_models.order_book_snapshot import LastTradePrice, OrderBookSnapshot
+from src.domain.value_objects.instrument_id import InstrumentId
+from src.exceptions import InvalidInstrumentIdError
+
+
+async def test_returns_found_books_and_lists_missing(
+    mock_reader: AsyncMock,
+    instrument_id: InstrumentId,
+    sample_book: OrderBookSnapshot,
+) -> None:
+    missing = InstrumentId.generate().value
+    mock_reader.get_order_books.return_value = {instrument_id.value: sample_book}
+
+    result = await GetOrderBooksHandler(mock_reader).handle(
+        GetOrderBooksQuery(instrument_ids=(missing, instrument_id.value, missing))
+    )
+
+    assert result.order_books == [sample_book]
+    assert result.missing == [missing]
+    (requested,) = mock_reader.get_order_books.await_args[0]
+    assert [i.value for i in requested] == [missing, instrument_id.value]
+
+
+async def test_last_trade_prices_partial_result(
+    mock_reader: AsyncMock,
+    instrument_id: InstrumentId,
+    sample_ltp: LastTradePrice,
+) -> None:
+    missing = InstrumentId.generate().value
+    mock_reader.get_last_trade_prices.return_value = {instrument_id.value: sample_ltp}
+
+    result = await GetLastTradePricesHandler(mock_reader).handle(
+        GetLastTradePricesQuery(instrument_ids=(instrument_id.value, missing))
+    )
+
+    assert result.last_trade_prices == [sample_ltp]
+    assert result.missing == [missing]
+
+
+async def test_rejects_invalid_instrument_id(mock_reader: AsyncMock) -> None:
+    with pytest.raises(InvalidInstrumentIdError):
+        await GetOrderBooksHandler(mock_reader).handle(
+            GetOrderBooksQuery(instrument_ids=("not-a-uuid",))
+        )
+    mock_reader.get_order_books.assert_not_awaited()
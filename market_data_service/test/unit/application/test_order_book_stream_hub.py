@@ -0,0 +1,152 @@
+import asyncio
+import dataclasses
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.application.order_book_stream_hub import OrderBookStreamHub
+from src.domain.read_models.order_book_snapshot import OrderBookSnapshot
+from src.domain.value_objects.instrument_id import InstrumentId
+from src.exceptions import StreamCapacityError
+
+
+def _render(snapshot: OrderBookSnapshot) -> str:
+    return f"{snapshot.instrument_id}:{snapshot.sequence}"
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestOrderBookStreamHub:
+    async def test_first_subscriber_triggers_read(
+        self,
+        mock_reader: AsyncMock,
+        instrument_id: InstrumentId,
+        sample_book: OrderBookSnapshot,
+    ) -> None:
+        mock_reader.get_order_book.return_value = sample_book
+        hub = OrderBookStreamHub(mock_reader, render=_render)
+
+        subscription = hub.subscribe(instrument_id.value)
+
+        assert await subscription.next() == f"{instrument_id.value}:None"
+        mock_reader.get_order_book.assert_awaited_once_with(instrument_id)
+
+    async def test_later_subscriber_gets_latest_without_read(
+        self,
+        mock_reader: AsyncMock,
+        instrument_id: InstrumentId,
+        sample_book: OrderBookSnapshot,
+    ) -> None:
+        mock_reader.get_order_book.return_value = sample_book
+        hub = OrderBookStreamHub(mock_reader, render=_render)
+        first = hub.subscribe(instrument_id.value)
+        await first.next()
+
+        second = hub.subscribe(instrument_id.value)
+
+        assert await second.next() == f"{instrument_id.value}:None"
+        assert mock_reader.get_order_book.await_count == 1
+
+    async def test_slow_subscriber_is_conflated_to_newest(
+        self,
+        mock_reader: AsyncMock,
+        instrument_id: InstrumentId,
+        sample_book: OrderBookSnapshot,
+    ) -> None:
+        hub = OrderBookStreamHub(mock_reader, render=_render)
+        mock_reader.get_order_book.return_value = sample_book
+        subscription = hub.subscribe(instrument_id.value)
+        await _settle()
+        for sequence in (1, 2, 3):
+            mock_reader.get_order_book.return_value = dataclasses.replace(
+                sample_book, sequence=sequence
+            )
+            hub.notify([instrument_id.value])
+            await _settle()
+
+        assert await subscription.next() == f"{instrument_id.value}:3"
+        assert hub.stats().conflated == 3
+        assert hub.stats().deliveries == 4
+
+    async def test_notices_during_read_coalesce_into_one_follow_up(
+        self,
+        mock_reader: AsyncMock,
+        instrument_id: InstrumentId,
+        sample_book: OrderBookSnapshot,
+    ) -> None:
+        release = asyncio.Event()
+
+        async def slow_read(_):
+            await release.wait()
+            return sample_book
+
+        mock_reader.get_order_book.side_effect = slow_read
+        hub = OrderBookStreamHub(mock_reader, render=_render)
+        hub.subscribe(instrument_id.value)
+        await _settle()
+        for _ in range(10):
+            hub.notify([instrument_id.value])
+        release.set()
+        await _settle()
+
+        assert mock_reader.get_order_book.await_count == 2
+        assert hub.stats().refreshes == 2
+
+    async def test_notify_ignores_instruments_without_subscribers(
+        self, mock_reader: AsyncMock, instrument_id: InstrumentId
+    ) -> None:
+        hub = OrderBookStreamHub(mock_reader, render=_render)
+
+        hub.notify([instrument_id.value])
+        await _settle()
+
+        mock_reader.get_order_book.assert_not_awaited()
+
+    async def test_read_failure_keeps_subscription_open(
+        self,
+        mock_reader: AsyncMock,
+        instrument_id: InstrumentId,
+        sample_book: OrderBookSnapshot,
+    ) -> None:
+        mock_reader.get_order_book.side_effect = [RuntimeError("down"), sample_book]
+        hub = OrderBookStreamHub(mock_reader, render=_render)
+        subscription = hub.subscribe(instrument_id.value)
+        await _settle()
+
+        hub.notify([instrument_id.value])
+
+        assert await subscription.next() == f"{instrument_id.value}:None"
+
+    async def test_capacity_limit(
+        self, mock_reader: AsyncMock, instrument_id: InstrumentId
+    ) -> None:
+        mock_reader.get_order_book.return_value = None
+        hub = OrderBookStreamHub(mock_reader, render=_render, max_subscribers=1)
+        subscription = hub.subscribe(instrument_id.value)
+
+        with pytest.raises(StreamCapacityError):
+            hub.subscribe(instrument_id.value)
+
+        hub.unsubscribe(subscription)
+        hub.subscribe(instrument_id.value)
+
+    async def test_unsubscribe_and_close_end_streams(
+        self, mock_reader: AsyncMock, instrument_id: InstrumentId
+    ) -> None:
+        mock_reader.get_order_book.return_value = None
+        hub = OrderBookStreamHub(mock_reader, render=_render)
+        first = hub.subscribe(instrument_id.value)
+        second = hub.subscribe(instrument_id.value)
+
+        hub.unsubscribe(first)
+        hub.unsubscribe(first)
+        assert await first.next() is None
+        assert hub.stats().subscribers == 1
+
+        await hub.close()
+        assert await second.next() is None
+        assert hub.stats().subscribers == 0
+        assert hub.stats().instruments == 0
@@ -0,0 +1,55 @@
+from decimal import Decimal
+
+from src.domain.read_models.order_book_replica import BookDelta, OrderBookReplica
+from src.domain.read_models.order_book_snapshot import OrderBookSnapshot, PriceLevel
+
+
+def _replica(sequence: int = 10) -> OrderBookReplica:
+    return OrderBookReplica(
+        OrderBookSnapshot(
+            instrument_id="i",
+            bids=(PriceLevel(Decimal("10"), 5), PriceLevel(Decimal("9"), 1)),
+            asks=(PriceLevel(Decimal("11"), 2),),
+            last_trade_price=None,
+            last_trade_currency=None,
+            sequence=sequence,
+        )
+    )
+
+
+def _delta(sequence: int, previous: int, *changes) -> BookDelta:
+    return BookDelta(sequence, previous, tuple(changes), Decimal("10.5"), "USD")
+
+
+def test_applies_level_changes_in_sequence() -> None:
+    replica = _replica()
+
+    assert replica.apply(
+        _delta(
+            12,
+            10,
+            ("bid", Decimal("10.5"), 3),
+            ("bid", Decimal("9"), 0),
+            ("ask", Decimal("11"), 1),
+        )
+    )
+
+    snapshot = replica.snapshot()
+    assert [(level.price, level.quantity) for level in snapshot.bids] == [
+        (Decimal("10.5"), 3),
+        (Decimal("10"), 5),
+    ]
+    assert [(level.price, level.quantity) for level in snapshot.asks] == [
+        (Decimal("11"), 1)
+    ]
+    assert (snapshot.sequence, snapshot.last_trade_price) == (12, Decimal("10.5"))
+
+
+def test_old_deltas_are_ignored_and_gaps_detected() -> None:
+    replica = _replica()
+    before = replica.snapshot()
+
+    assert replica.apply(_delta(9, 8, ("bid", Decimal("10"), 0)))
+    assert replica.snapshot() is before
+    assert not replica.apply(_delta(15, 13, ("bid", Decimal("10"), 0)))
+    assert replica.sequence == 10
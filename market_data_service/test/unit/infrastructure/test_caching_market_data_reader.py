@@ -0,0 +1,166 @@
+import asyncio
+from decimal import Decimal
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.domain.read_models.order_book_snapshot import LastTradePrice
+from src.domain.value_objects.instrument_id import InstrumentId
+from src.exceptions import CacheOperationError
+from src.infrastructure.cache.caching_market_data_reader import (
+    CachingMarketDataReader,
+)
+from src.infrastructure.cache.in_memory_market_data_reader import (
+    InMemoryMarketDataReader,
+)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _CountingReader(InMemoryMarketDataReader):
+    def __init__(self) -> None:
+        super().__init__()
+        self.reads = 0
+        self.gate: asyncio.Event | None = None
+        self.error: Exception | None = None
+
+    async def get_last_trade_price(self, instrument_id):
+        self.reads += 1
+        if self.gate is not None:
+            await self.gate.wait()
+        if self.error is not None:
+            raise self.error
+        return await super().get_last_trade_price(instrument_id)
+
+
+def _seed(reader: InMemoryMarketDataReader, instrument_id: InstrumentId, price: str):
+    reader.seed_ltp(LastTradePrice(instrument_id.value, Decimal(price), "USD"))
+
+
+async def test_hits_until_ttl_expires() -> None:
+    inner, clock = _CountingReader(), _Clock()
+    cache = CachingMarketDataReader(inner, ttl_seconds=1.0, clock=clock)
+    instrument_id = InstrumentId.generate()
+    _seed(inner, instrument_id, "10")
+
+    await cache.get_last_trade_price(instrument_id)
+    _seed(inner, instrument_id, "11")
+    cached = await cache.get_last_trade_price(instrument_id)
+    clock.now = 1.5
+    fresh = await cache.get_last_trade_price(instrument_id)
+
+    assert (cached.price, fresh.price) == (Decimal("10"), Decimal("11"))
+    assert inner.reads == 2
+    stats = cache.stats()
+    assert (stats.hits, stats.misses) == (1, 2)
+
+
+async def test_not_found_is_not_cached_and_invalidation_refreshes() -> None:
+    inner = _CountingReader()
+    cache = CachingMarketDataReader(inner, ttl_seconds=60)
+    instrument_id = InstrumentId.generate()
+
+    assert await cache.get_last_trade_price(instrument_id) is None
+    _seed(inner, instrument_id, "10")
+    assert (await cache.get_last_trade_price(instrument_id)).price == Decimal("10")
+    assert cache.stats().entries == 1
+
+    _seed(inner, instrument_id, "11")
+    cache.invalidate([instrument_id.value])
+    assert (await cache.get_last_trade_price(instrument_id)).price == Decimal("11")
+    assert inner.reads == 3
+    assert cache.stats().invalidations == 1
+
+
+async def test_entries_are_bounded_and_expired_ones_dropped() -> None:
+    clock = _Clock()
+    inner = _CountingReader()
+    cache = CachingMarketDataReader(inner, ttl_seconds=1, clock=clock, max_entries=2)
+    first, second, third = (InstrumentId.generate() for _ in range(3))
+    for instrument_id in (first, second, third):
+        _seed(inner, instrument_id, "10")
+
+    await cache.get_last_trade_price(first)
+    await cache.get_last_trade_price(second)
+    await cache.get_last_trade_price(first)
+    await cache.get_last_trade_price(third)
+    assert cache.stats().entries == 2
+    await cache.get_last_trade_price(first)
+    assert inner.reads == 3  # second was the least recently used
+
+    clock.now = 5
+    await cache.get_last_trade_price(first)
+    assert (inner.reads, cache.stats().entries) == (4, 2)
+
+
+async def test_concurrent_misses_share_one_read() -> None:
+    inner = _CountingReader()
+    inner.gate = asyncio.Event()
+    cache = CachingMarketDataReader(inner, ttl_seconds=60)
+    instrument_id = InstrumentId.generate()
+    _seed(inner, instrument_id, "10")
+
+    reads = [
+        asyncio.create_task(cache.get_last_trade_price(instrument_id)) for _ in range(5)
+    ]
+    await asyncio.sleep(0)
+    inner.gate.set()
+    results = await asyncio.gather(*reads)
+
+    assert inner.reads == 1
+    assert {result.price for result in results} == {Decimal("10")}
+
+
+async def test_read_overlapping_invalidation_is_not_cached() -> None:
+    inner = _CountingReader()
+    inner.gate = asyncio.Event()
+    cache = CachingMarketDataReader(inner, ttl_seconds=60)
+    instrument_id = InstrumentId.generate()
+    _seed(inner, instrument_id, "10")
+
+    read = asyncio.create_task(cache.get_last_trade_price(instrument_id))
+    await asyncio.sleep(0)
+    cache.invalidate([instrument_id.value])
+    inner.gate.set()
+    await read
+
+    assert cache.stats().entries == 0
+
+
+async def test_errors_propagate_and_are_not_cached() -> None:
+    inner = _CountingReader()
+    inner.error = CacheOperationError("boom")
+    cache = CachingMarketDataReader(inner, ttl_seconds=60)
+    instrument_id = InstrumentId.generate()
+
+    with pytest.raises(CacheOperationError):
+        await cache.get_last_trade_price(instrument_id)
+    inner.error = None
+    assert await cache.get_last_trade_price(instrument_id) is None
+    assert inner.reads == 2
+
+
+async def test_batch_reads_only_fetch_misses() -> None:
+    inner = InMemoryMarketDataReader()
+    cache = CachingMarketDataReader(inner, ttl_seconds=60)
+    cached, fresh, absent = (InstrumentId.generate() for _ in range(3))
+    _seed(inner, cached, "10")
+    _seed(inner, fresh, "20")
+    await cache.get_last_trade_price(cached)
+    inner.get_last_trade_prices = AsyncMock(wraps=inner.get_last_trade_prices)
+
+    result = await cache.get_last_trade_prices([cached, fresh, absent])
+    again = await cache.get_last_trade_prices([fresh, absent])
+
+    assert set(result) == {cached.value, fresh.value}
+    assert set(again) == {fresh.value}
+    (requested,) = inner.get_last_trade_prices.await_args[0]
+    # Not found is not cached, so ``absent`` is asked for again.
+    assert requested == [absent]
+    assert inner.get_last_trade_prices.await_count == 2
@@ -0,0 +1,96 @@
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.domain.value_objects.instrument_id import InstrumentId
+from src.exceptions import CacheOperationError
+from src.infrastructure.cache.redis_candle_reader import RedisCandleReader
+
+
+def _bar(instrument_id: str, minute: int, close: str) -> str:
+    return json.dumps(
+        {
+            "instrument_id": instrument_id,
+            "interval": "1m",
+            "open_time": int(
+                datetime(2026, 1, 5, 10, minute, tzinfo=timezone.utc).timestamp()
+            ),
+            "open": "10.00",
+            "high": "11.00",
+            "low": "9.00",
+            "close": close,
+            "volume": 4,
+            "notional": "41.00",
+            "vwap": "10.25",
+            "trade_count": 2,
+            "currency": "USD",
+        }
+    )
+
+
+def _reader(
+    history: list[str], live: str | None
+) -> tuple[RedisCandleReader, MagicMock]:
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[history, live])
+    client = MagicMock()
+    client.pipeline.return_value = pipe
+    reader = RedisCandleReader(url="redis://unused")
+    reader._client = client
+    return reader, pipe
+
+
+async def test_reads_history_and_open_bar_in_one_round_trip() -> None:
+    instrument_id = InstrumentId.generate()
+    newest_first = [
+        _bar(instrument_id.value, 1, "10.75"),
+        _bar(instrument_id.value, 0, "10.50"),
+    ]
+    reader, pipe = _reader(newest_first, _bar(instrument_id.value, 2, "10.90"))
+    start = datetime(2026, 1, 5, 10, 0, tzinfo=timezone.utc)
+
+    candles = await reader.get_candles(instrument_id, "1m", start, None, 10)
+
+    pipe.zrevrangebyscore.assert_called_once_with(
+        f"md:candles:{instrument_id.value}:1m",
+        "+inf",
+        int(start.timestamp()),
+        start=0,
+        num=10,
+    )
+    assert [c.close for c in candles] == [
+        Decimal("10.50"),
+        Decimal("10.75"),
+        Decimal("10.90"),
+    ]
+    assert [c.final for c in candles] == [True, True, False]
+
+
+async def test_skips_open_bar_already_finalized() -> None:
+    instrument_id = InstrumentId.generate()
+    bar = _bar(instrument_id.value, 1, "10.75")
+    reader, _ = _reader([bar], bar)
+
+    candles = await reader.get_candles(instrument_id, "1m", None, None, 10)
+
+    assert len(candles) == 1
+    assert candles[0].final is True
+
+
+async def test_end_bound_is_exclusive_and_filters_open_bar() -> None:
+    instrument_id = InstrumentId.generate()
+    reader, pipe = _reader([], _bar(instrument_id.value, 2, "10.90"))
+    end = datetime(2026, 1, 5, 10, 2, tzinfo=timezone.utc)
+
+    assert await reader.get_candles(instrument_id, "1m", None, end, 10) == []
+    assert pipe.zrevrangebyscore.call_args.args[1] == f"({int(end.timestamp())}"
+
+
+async def test_corrupt_candle_raises() -> None:
+    reader, _ = _reader(["{"], None)
+
+    with pytest.raises(CacheOperationError):
+        await reader.get_candles(InstrumentId.generate(), "1m", None, None, 10)
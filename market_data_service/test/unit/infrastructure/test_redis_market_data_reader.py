@@ -111,3 +111,74 @@ async def test_connect_raises_when_redis_package_missing() -> None:
         ):
             with pytest.raises(CacheConnectionError):
                 await reader.connect()
+
+
+async def test_get_last_trade_prices_uses_pipelined_mget() -> None:
+    found, corrupt, missing = (InstrumentId.generate() for _ in range(3))
+    client = MagicMock()
+    pipe = client.pipeline.return_value
+    pipe.execute = AsyncMock(
+        return_value=[[json.dumps({"price": "10.5", "currency": "USD"}), "{", None]]
+    )
+    reader = _reader_with_client(client)
+
+    result = await reader.get_last_trade_prices([found, corrupt, missing, found])
+
+    pipe.mget.assert_called_once_with(
+        [f"md:ltp:{i.value}" for i in (found, corrupt, missing)]
+    )
+    assert list(result) == [found.value]
+    assert result[found.value].price == Decimal("10.5")
+
+
+async def test_get_order_books_chunks_large_batches() -> None:
+    ids = [InstrumentId.generate() for _ in range(150)]
+    book = json.dumps({"bids": [["1", 2]], "asks": []})
+    client = MagicMock()
+    pipe = client.pipeline.return_value
+    pipe.execute = AsyncMock(return_value=[[book] * 100, [book] * 49 + [None]])
+    reader = _reader_with_client(client)
+
+    result = await reader.get_order_books(ids)
+
+    assert pipe.mget.call_count == 2
+    assert len(result) == 149
+    assert ids[-1].value not in result
+
+
+async def test_get_ticker_parses_payload() -> None:
+    instrument_id = InstrumentId.generate()
+    payload = {
+        "window_seconds": 86400,
+        "last_price": "99.00",
+        "open_price": None,
+        "high": None,
+        "low": None,
+        "volume": 0,
+        "vwap": None,
+        "price_change": None,
+        "price_change_percent": None,
+        "trade_count": 0,
+        "currency": "USD",
+        "updated_at": "2026-01-05T12:00:00+00:00",
+    }
+    client = AsyncMock()
+    client.get = AsyncMock(return_value=json.dumps(payload))
+    reader = _reader_with_client(client)
+
+    ticker = await reader.get_ticker(instrument_id)
+
+    assert ticker is not None
+    assert ticker.last_price == Decimal("99.00")
+    assert ticker.high is None
+    assert ticker.volume == 0
+    client.get.assert_awaited_once_with(f"md:ticker:{instrument_id.value}")
+
+
+async def test_get_ticker_raises_on_corrupt_payload() -> None:
+    client = AsyncMock()
+    client.get = AsyncMock(return_value=json.dumps({"last_price": "1"}))
+    reader = _reader_with_client(client)
+
+    with pytest.raises(CacheOperationError):
+        await reader.get_ticker(InstrumentId.generate())
@@ -0,0 +1,170 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from src.domain.value_objects.instrument_id import InstrumentId
+from src.infrastructure.cache.replicated_market_data_reader import (
+    ReplicatedMarketDataReader,
+)
+
+_ENGINE_DIR = Path(__file__).resolve().parents[4] / "matching_engine"
+
+# Runs in the matching engine's own interpreter (both services are ``src``):
+# builds the worker's handlers with the default config, a Redis cache whose
+# client only records commands, and prints the commands of each step.
+_ENGINE_SCRIPT = """
+import asyncio, json, sys
+from decimal import Decimal
+
+from src import worker
+from src.application.cancel_resting_order import CancelRestingOrderCommand
+from src.application.process_incoming_order import ProcessIncomingOrderCommand
+
+instrument = sys.argv[1]
+steps = []
+
+
+class Pipe:
+    def mset(self, mapping):
+        steps[-1].append(["mset", mapping])
+
+    def xadd(self, stream, fields, **options):
+        steps[-1].append(["xadd", stream, fields])
+
+    def publish(self, channel, message):
+        steps[-1].append(["publish", channel, message])
+
+    async def execute(self):
+        return []
+
+
+class Client:
+    async def set(self, key, value):
+        steps[-1].append(["mset", {key: value}])
+
+    def pipeline(self, transaction=True):
+        return Pipe()
+
+
+def order(order_id, side, qty):
+    return ProcessIncomingOrderCommand(
+        order_id=order_id,
+        trader_id="00000000-0000-4000-8000-00000000000" + order_id[-1],
+        instrument_id=instrument,
+        side=side,
+        order_type="LIMIT",
+        time_in_force="GTC",
+        quantity=qty,
+        limit_price=Decimal("10.00"),
+        limit_price_currency="USD",
+    )
+
+
+async def main():
+    assert not worker.Config.MATCHING_PIPELINE_ENABLED
+    cache = worker._build_cache()
+    cache._client = Client()
+    process, cancel = worker._build_handlers(
+        worker._build_registry(), worker._build_publisher(), cache, None
+    )
+    maker = "00000000-0000-4000-8000-000000000001"
+    for step in (
+        process.handle(order(maker, "SELL", 5)),
+        process.handle(order("00000000-0000-4000-8000-000000000002", "BUY", 2)),
+        cancel.handle(CancelRestingOrderCommand(maker, instrument)),
+    ):
+        steps.append([])
+        await step
+    print(json.dumps(steps))
+
+
+asyncio.run(main())
+"""
+
+
+class _FakeRedis:
+    """Replays recorded engine commands; serves GET, XREVRANGE and XREAD."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+        self.streams: dict[str, list[tuple[str, dict[str, str]]]] = {}
+
+    def apply(self, commands) -> None:
+        for command, *args in commands:
+            if command == "mset":
+                self.values.update(args[0])
+            elif command == "xadd":
+                stream, fields = args
+                entries = self.streams.setdefault(stream, [])
+                entries.append((f"{len(entries) + 1}-0", fields))
+
+    async def get(self, key: str) -> str | None:
+        return self.values.get(key)
+
+    async def xrevrange(self, stream: str, count: int):
+        return list(reversed(self.streams.get(stream, [])))[:count]
+
+    async def xread(self, cursors: dict[str, str], count: int, block: int):
+        response = []
+        for stream, cursor in cursors.items():
+            after = int(cursor.split("-")[0])
+            entries = [
+                entry
+                for entry in self.streams.get(stream, [])
+                if int(entry[0].split("-")[0]) > after
+            ]
+            if entries:
+                response.append((stream, entries[:count]))
+        return response
+
+
+def _engine_steps(instrument_id: str):
+    env = dict(
+        os.environ,
+        PYTHONPATH=f"{_ENGINE_DIR.parent}{os.pathsep}{_ENGINE_DIR}",
+        REDIS_ENABLED="true",
+        RABBITMQ_ENABLED="false",
+        JOURNAL_ENABLED="false",
+    )
+    env.pop("MATCHING_PIPELINE_ENABLED", None)
+    completed = subprocess.run(
+        [sys.executable, "-c", _ENGINE_SCRIPT, instrument_id],
+        cwd=_ENGINE_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(completed.stdout.splitlines()[-1])
+
+
+async def test_replica_follows_default_config_engine_writes() -> None:
+    instrument_id = InstrumentId.generate()
+    placed, traded, cancelled = _engine_steps(instrument_id.value)
+    for step in (placed, traded, cancelled):
+        assert any(command[0] == "xadd" for command in step)
+        assert any(command[0] == "publish" for command in step)
+
+    redis = _FakeRedis()
+    reader = ReplicatedMarketDataReader(url="redis://localhost:6379/0")
+    reader._client = redis
+    redis.apply(placed)
+    snapshot = await reader.get_order_book(instrument_id)
+    assert [(str(level.price), level.quantity) for level in snapshot.asks] == [
+        ("10.00", 5)
+    ]
+
+    redis.apply(traded)
+    await reader._poll()
+    snapshot = await reader.get_order_book(instrument_id)
+    assert [level.quantity for level in snapshot.asks] == [3]
+    assert str(snapshot.last_trade_price) == "10.00"
+
+    redis.apply(cancelled)
+    await reader._poll()
+    snapshot = await reader.get_order_book(instrument_id)
+    assert not snapshot.asks
+    book = json.loads(redis.values[f"md:book:{instrument_id.value}"])
+    assert snapshot.sequence == book["sequence"]
@@ -0,0 +1,155 @@
+import json
+from unittest.mock import AsyncMock
+
+from src.domain.value_objects.instrument_id import InstrumentId
+from src.infrastructure.cache.replicated_market_data_reader import (
+    ReplicatedMarketDataReader,
+)
+
+
+def _book(instrument_id: InstrumentId, sequence: int | None, bids) -> str:
+    book = {
+        "instrument_id": instrument_id.value,
+        "bids": bids,
+        "asks": [["11.00", 4]],
+        "last_trade_price": None,
+        "last_trade_currency": None,
+    }
+    if sequence is not None:
+        book["sequence"] = sequence
+    return json.dumps(book)
+
+
+def _delta(sequence: int, previous: int, changes) -> dict[str, str]:
+    return {
+        "sequence": str(sequence),
+        "previous": str(previous),
+        "changes": json.dumps(changes),
+        "last_trade_price": "10.50",
+        "last_trade_currency": "USD",
+    }
+
+
+def _reader(client: AsyncMock, **options) -> ReplicatedMarketDataReader:
+    reader = ReplicatedMarketDataReader(url="redis://localhost:6379/0", **options)
+    reader._client = client
+    return reader
+
+
+async def test_replica_follows_deltas_after_snapshot() -> None:
+    instrument_id = InstrumentId.generate()
+    stream = f"md:deltas:{instrument_id.value}"
+    client = AsyncMock()
+    client.xrevrange = AsyncMock(return_value=[("5-0", {})])
+    client.get = AsyncMock(return_value=_book(instrument_id, 7, [["10.00", 5]]))
+    reader = _reader(client)
+
+    snapshot = await reader.get_order_book(instrument_id)
+    assert [level.quantity for level in snapshot.bids] == [5]
+
+    client.xread = AsyncMock(
+        return_value=[
+            (
+                stream,
+                [
+                    ("6-0", _delta(7, 6, [["bid", "10.00", 5]])),
+                    ("7-0", _delta(8, 7, [["bid", "10.00", 2]])),
+                ],
+            )
+        ]
+    )
+    await reader._poll()
+
+    client.xread.assert_awaited_once_with({stream: "5-0"}, count=500, block=1000)
+    snapshot = await reader.get_order_book(instrument_id)
+    assert [level.quantity for level in snapshot.bids] == [2]
+    assert snapshot.sequence == 8
+    assert client.get.await_count == 1
+    assert reader._cursors[stream] == "7-0"
+
+
+async def test_gap_rebuilds_replica_from_snapshot() -> None:
+    instrument_id = InstrumentId.generate()
+    stream = f"md:deltas:{instrument_id.value}"
+    client = AsyncMock()
+    client.xrevrange = AsyncMock(return_value=[])
+    client.get = AsyncMock(return_value=_book(instrument_id, 7, [["10.00", 5]]))
+    reader = _reader(client)
+    await reader.get_order_book(instrument_id)
+
+    client.get = AsyncMock(return_value=_book(instrument_id, 20, [["9.00", 1]]))
+    client.xrevrange = AsyncMock(return_value=[("9-0", {})])
+    client.xread = AsyncMock(
+        return_value=[(stream, [("8-0", _delta(20, 0, [["bid", "9.00", 1]]))])]
+    )
+    await reader._poll()
+
+    snapshot = await reader.get_order_book(instrument_id)
+    assert [(str(level.price), level.quantity) for level in snapshot.bids] == [
+        ("9.00", 1)
+    ]
+    assert snapshot.sequence == 20
+    assert reader._cursors[stream] == "9-0"
+
+
+async def test_change_listeners_run_after_deltas_apply() -> None:
+    instrument_id = InstrumentId.generate()
+    stream = f"md:deltas:{instrument_id.value}"
+    client = AsyncMock()
+    client.xrevrange = AsyncMock(return_value=[("5-0", {})])
+    client.get = AsyncMock(return_value=_book(instrument_id, 7, [["10.00", 5]]))
+    reader = _reader(client)
+    await reader.get_order_book(instrument_id)
+    seen: list[tuple[list[str], int]] = []
+
+    def on_change(instrument_ids: list[str]) -> None:
+        replica = reader._replicas[instrument_ids[0]]
+        seen.append((instrument_ids, replica.snapshot().sequence))
+
+    reader.add_change_listener(on_change)
+    client.xread = AsyncMock(
+        return_value=[(stream, [("6-0", _delta(8, 7, [["bid", "10.00", 2]]))])]
+    )
+    await reader._poll()
+
+    assert seen == [([instrument_id.value], 8)]
+
+
+async def test_unsequenced_snapshot_is_served_and_retried() -> None:
+    instrument_id = InstrumentId.generate()
+    client = AsyncMock()
+    client.xrevrange = AsyncMock(return_value=[])
+    client.get = AsyncMock(return_value=_book(instrument_id, None, [["10.00", 5]]))
+    reader = _reader(client)
+
+    snapshot = await reader.get_order_book(instrument_id)
+    assert [level.quantity for level in snapshot.bids] == [5]
+    assert reader._cursors == {}
+
+    client.get = AsyncMock(return_value=_book(instrument_id, 3, [["10.00", 1]]))
+    snapshot = await reader.get_order_book(instrument_id)
+    assert snapshot.sequence == 3
+    assert list(reader._cursors) == [f"md:deltas:{instrument_id.value}"]
+
+
+async def test_unknown_ids_are_not_followed_and_replicas_are_bounded() -> None:
+    client = AsyncMock()
+    client.xrevrange = AsyncMock(return_value=[])
+    client.get = AsyncMock(return_value=None)
+    reader = _reader(client, max_replicas=2)
+    assert await reader.get_order_book(InstrumentId.generate()) is None
+    assert (reader._replicas, reader._cursors) == ({}, {})
+
+    first, second, third = (InstrumentId.generate() for _ in range(3))
+    for instrument_id in (first, second):
+        client.get = AsyncMock(return_value=_book(instrument_id, 1, []))
+        await reader.get_order_book(instrument_id)
+    await reader.get_order_book(first)
+    client.get = AsyncMock(return_value=_book(third, 1, []))
+    await reader.get_order_book(third)
+
+    assert list(reader._replicas) == [first.value, third.value]
+    assert set(reader._cursors) == {
+        f"md:deltas:{first.value}",
+        f"md:deltas:{third.value}",
+    }
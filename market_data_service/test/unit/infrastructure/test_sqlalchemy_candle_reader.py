@@ -0,0 +1,116 @@
+from collections.abc import AsyncIterator
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.domain.read_models.candle import Candle
+from src.domain.value_objects.instrument_id import InstrumentId
+from src.infrastructure.cache.history_fallback_candle_reader import (
+    HistoryFallbackCandleReader,
+)
+from src.infrastructure.cache.in_memory_candle_reader import InMemoryCandleReader
+from src.infrastructure.persistence.sqlalchemy_candle_reader import (
+    SQLAlchemyCandleReader,
+    candles,
+)
+
+T0 = datetime(2026, 1, 5, 10, 0, tzinfo=timezone.utc)
+INSTRUMENT_ID = InstrumentId.generate()
+
+
+def _row(minute: int) -> dict:
+    return {
+        "instrument_id": INSTRUMENT_ID.value,
+        "interval": "1m",
+        "open_time": T0 + timedelta(minutes=minute),
+        "open": Decimal("10.00"),
+        "high": Decimal("11.00"),
+        "low": Decimal("9.00"),
+        "close": Decimal("10.00") + minute,
+        "volume": 4,
+        "notional": Decimal("41.00"),
+        "trade_count": 2,
+        "currency": "USD",
+    }
+
+
+def _cached(minute: int, final: bool = True) -> Candle:
+    return Candle(
+        instrument_id=INSTRUMENT_ID.value,
+        interval="1m",
+        open_time=T0 + timedelta(minutes=minute),
+        open=Decimal("10.00"),
+        high=Decimal("11.00"),
+        low=Decimal("9.00"),
+        close=Decimal("10.00") + minute,
+        volume=4,
+        vwap=Decimal("10.25"),
+        trade_count=2,
+        currency="USD",
+        final=final,
+    )
+
+
+@pytest_asyncio.fixture
+async def database(tmp_path) -> AsyncIterator[SQLAlchemyCandleReader]:
+    url = f"sqlite+aiosqlite:///{tmp_path / 'candles.db'}"
+    engine = create_async_engine(url)
+    async with engine.begin() as conn:
+        await conn.run_sync(candles.metadata.create_all)
+        await conn.execute(candles.insert(), [_row(minute) for minute in range(5)])
+    await engine.dispose()
+    reader = SQLAlchemyCandleReader(url)
+    yield reader
+    await reader.close()
+
+
+async def test_reads_most_recent_bars_in_range(database) -> None:
+    bars = await database.get_candles(
+        INSTRUMENT_ID, "1m", T0 + timedelta(minutes=1), T0 + timedelta(minutes=4), 2
+    )
+
+    assert [b.open_time for b in bars] == [
+        T0 + timedelta(minutes=2),
+        T0 + timedelta(minutes=3),
+    ]
+    assert bars[0].vwap == Decimal("10.25")
+    assert all(b.final for b in bars)
+
+
+async def test_fallback_skips_database_when_cache_fills_limit(database) -> None:
+    recent = InMemoryCandleReader()
+    for minute in (3, 4):
+        recent.seed_candle(_cached(minute))
+    reader = HistoryFallbackCandleReader(recent, database)
+
+    bars = await reader.get_candles(INSTRUMENT_ID, "1m", None, None, 2)
+
+    assert [b.close for b in bars] == [Decimal("13.00"), Decimal("14.00")]
+
+
+async def test_fallback_tops_up_older_bars_from_database(database) -> None:
+    recent = InMemoryCandleReader()
+    recent.seed_candle(_cached(4))
+    recent.seed_candle(_cached(5, final=False))
+    reader = HistoryFallbackCandleReader(recent, database)
+
+    bars = await reader.get_candles(INSTRUMENT_ID, "1m", T0, None, 4)
+
+    assert [b.open_time for b in bars] == [
+        T0 + timedelta(minutes=m) for m in (2, 3, 4, 5)
+    ]
+    assert [b.final for b in bars] == [True, True, True, False]
+
+
+async def test_fallback_reads_range_older_than_cache(database) -> None:
+    recent = InMemoryCandleReader()
+    recent.seed_candle(_cached(4))
+    reader = HistoryFallbackCandleReader(recent, database)
+
+    bars = await reader.get_candles(
+        INSTRUMENT_ID, "1m", T0, T0 + timedelta(minutes=2), 10
+    )
+
+    assert [b.open_time for b in bars] == [T0, T0 + timedelta(minutes=1)]
@@ -0,0 +1,168 @@
+"""Journal append throughput and snapshot + tail recovery time.
+
+Run from the service directory::
+
+    PYTHONPATH=..:. python benchmarks/bench_journal.py --resting 1000000
+
+Append: ``--writers`` concurrent tasks each record one OrderOpened and await
+``sync()`` (as the handler does), so fsyncs are shared by whoever is waiting;
+throughput is then bounded by writers per flush window. "raw" records
+everything and syncs once, i.e. the encode + write cost alone.
+Recovery: a snapshot holding ``--resting`` orders on one book is written,
+``--tail`` journaled orders are appended, and a fresh registry is rebuilt
+from disk (snapshot load + restore + tail replay).
+"""
+
+import argparse
+import asyncio
+import random
+import tempfile
+import time
+import uuid
+from decimal import Decimal
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+from src.application.cancel_resting_order import CancelRestingOrderHandler
+from src.application.process_incoming_order import ProcessIncomingOrderHandler
+from src.domain.entities.book_state import BookState, LevelImage
+from src.infrastructure.book.in_memory_order_book_registry import (
+    InMemoryOrderBookRegistry,
+)
+from src.infrastructure.journal.book_recovery import BookRecovery
+from src.infrastructure.journal.book_snapshot_store import BookSnapshotStore
+from src.infrastructure.journal.file_order_journal import FileOrderJournal
+
+INSTRUMENT = str(uuid.uuid4())
+
+
+def _open_fields(rng: random.Random, traders: list[str]) -> dict:
+    return dict(
+        order_id=str(uuid.uuid4()),
+        trader_id=rng.choice(traders),
+        instrument_id=INSTRUMENT,
+        side="BUY",
+        order_type="LIMIT",
+        time_in_force="GTC",
+        quantity=rng.randint(1, 100),
+        limit_price=Decimal(rng.randint(5_000, 9_999)) / 100,
+        limit_price_currency="USD",
+    )
+
+
+async def bench_raw_append(directory: Path, records: int) -> float:
+    rng = random.Random(1)
+    traders = [str(uuid.uuid4()) for _ in range(200)]
+    fields = [_open_fields(rng, traders) for _ in range(records)]
+    journal = FileOrderJournal(directory, fsync=True)
+    await journal.start()
+
+    start = time.perf_counter()
+    for item in fields:
+        journal.record_open(**item)
+    await journal.sync()
+    elapsed = time.perf_counter() - start
+    await journal.close()
+    return records / elapsed
+
+
+async def bench_append(directory: Path, records: int, writers: int, fsync: bool):
+    rng = random.Random(1)
+    traders = [str(uuid.uuid4()) for _ in range(200)]
+    fields = [_open_fields(rng, traders) for _ in range(records)]
+    journal = FileOrderJournal(directory, fsync=fsync)
+    await journal.start()
+
+    async def writer(chunk: list[dict]) -> None:
+        for item in chunk:
+            journal.record_open(**item)
+            await journal.sync()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(writer(fields[i::writers]) for i in range(writers)))
+    elapsed = time.perf_counter() - start
+    await journal.close()
+    return records / elapsed
+
+
+def _synthetic_state(resting: int, levels_per_side: int = 1_000) -> BookState:
+    """One book: bids on 40.00-49.99, asks on 150.00-159.99 (never crossed)."""
+    rng = random.Random(2)
+    traders = [str(uuid.uuid4()) for _ in range(1_000)]
+    slots = [("BUY", 4_000 + i) for i in range(levels_per_side)]
+    slots += [("SELL", 15_000 + i) for i in range(levels_per_side)]
+    orders: dict[tuple[str, int], list] = {slot: [] for slot in slots}
+    now = time.time()
+    for sequence in range(1, resting + 1):
+        orders[slots[sequence % len(slots)]].append(
+            (
+                str(uuid.uuid4()),
+                rng.choice(traders),
+                "LIMIT",
+                "GTC",
+                rng.randint(1, 100),
+                sequence,
+                now,
+            )
+        )
+    levels = [
+        LevelImage(side, str(Decimal(cents) / 100), "USD", orders[(side, cents)])
+        for side, cents in slots
+    ]
+    return BookState(INSTRUMENT, resting, 0, None, None, levels)
+
+
+async def bench_recovery(directory: Path, resting: int, tail: int) -> None:
+    store = BookSnapshotStore(directory)
+    store.save(0, [_synthetic_state(resting)])
+
+    rng = random.Random(3)
+    traders = [str(uuid.uuid4()) for _ in range(200)]
+    journal = FileOrderJournal(directory, fsync=False)
+    await journal.start()
+    for _ in range(tail):
+        journal.record_open(**_open_fields(rng, traders))
+    await journal.close()
+
+    registry = InMemoryOrderBookRegistry()
+    publisher, cache = AsyncMock(), AsyncMock()
+    journal = FileOrderJournal(directory, fsync=False)
+    recovery = BookRecovery(
+        registry,
+        journal,
+        store,
+        ProcessIncomingOrderHandler(registry, publisher, cache, journal),
+        CancelRestingOrderHandler(registry, publisher, cache, journal),
+    )
+    await journal.start()
+    stats = recovery.recover()
+    await journal.close()
+    print(
+        f"recovery: {stats.resting_orders:,} resting orders "
+        f"(snapshot + {stats.replayed:,} replayed) in {stats.seconds:.2f}s"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=50_000)
+    parser.add_argument("--writers", type=int, default=32)
+    parser.add_argument("--resting", type=int, default=1_000_000)
+    parser.add_argument("--tail", type=int, default=100_000)
+    args = parser.parse_args()
+
+    for fsync in (False, True):
+        with tempfile.TemporaryDirectory() as tmp:
+            rate = await bench_append(Path(tmp), args.records, args.writers, fsync)
+        print(f"append fsync={fsync!s:<5} writers={args.writers}: {rate:,.0f} rec/s")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        rate = await bench_raw_append(Path(tmp), args.records)
+    print(f"append raw (one sync): {rate:,.0f} rec/s")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        await bench_recovery(Path(tmp), args.resting, args.tail)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,133 @@
+"""Sustained order-stream benchmark: ``OrderBook`` vs ``TickOrderBook``.
+
+Run from the service directory::
+
+    PYTHONPATH=..:. python benchmarks/bench_order_book.py --orders 200000
+
+Both engines receive the same pre-generated stream (VOs are built up front so
+only matching is timed). Mix: ~85% LIMIT GTC around a drifting mid, ~5%
+MARKET IOC, ~10% cancels of live orders.
+"""
+
+import argparse
+import random
+import time
+from decimal import Decimal
+
+from src.domain.entities.order_book import OrderBook
+from src.domain.entities.tick_order_book import TickOrderBook
+from src.domain.value_objects.currency import Currency
+from src.domain.value_objects.instrument_id import InstrumentId
+from src.domain.value_objects.money import Money
+from src.domain.value_objects.order_id import OrderId
+from src.domain.value_objects.order_side import OrderSide
+from src.domain.value_objects.order_type import OrderType
+from src.domain.value_objects.quantity import Quantity
+from src.domain.value_objects.time_in_force import TimeInForce
+from src.domain.value_objects.trader_id import TraderId
+from src.exceptions import OrderNotInBookError
+
+
+def build_stream(n: int, seed: int) -> list[tuple]:
+    rng = random.Random(seed)
+    traders = [TraderId.generate() for _ in range(200)]
+    prices = {
+        cents: Money(Decimal(cents) / 100, Currency.USD)
+        for cents in range(5_000, 15_001)
+    }
+    live: list[OrderId] = []
+    stream: list[tuple] = []
+    mid = 10_000
+
+    for _ in range(n):
+        mid = min(max(mid + rng.randint(-2, 2), 5_100), 14_900)
+        roll = rng.random()
+        if roll < 0.10 and live:
+            stream.append(("cancel", live.pop(rng.randrange(len(live)))))
+            continue
+
+        side = OrderSide.BUY if rng.random() < 0.5 else OrderSide.SELL
+        oid = OrderId.generate()
+        if roll < 0.15:
+            stream.append(
+                (
+                    "submit",
+                    oid,
+                    rng.choice(traders),
+                    side,
+                    OrderType.MARKET,
+                    TimeInForce.IOC,
+                    Quantity(rng.randint(1, 50)),
+                    None,
+                )
+            )
+            continue
+
+        offset = rng.randint(0, 50)
+        cents = mid - offset if side is OrderSide.BUY else mid + offset
+        # A small share of aggressive limits crosses the spread.
+        if rng.random() < 0.2:
+            cents = mid + offset if side is OrderSide.BUY else mid - offset
+        stream.append(
+            (
+                "submit",
+                oid,
+                rng.choice(traders),
+                side,
+                OrderType.LIMIT,
+                TimeInForce.GTC,
+                Quantity(rng.randint(1, 100)),
+                prices[cents],
+            )
+        )
+        live.append(oid)
+    return stream
+
+
+def run(book, stream: list[tuple]) -> tuple[float, int]:
+    trades = 0
+    start = time.perf_counter()
+    for item in stream:
+        if item[0] == "cancel":
+            try:
+                book.cancel(item[1])
+            except OrderNotInBookError:
+                pass
+            continue
+        result = book.submit(*item[1:])
+        trades += len(result.trades)
+    return time.perf_counter() - start, trades
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--orders", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    stream = build_stream(args.orders, args.seed)
+    instrument = InstrumentId.generate()
+
+    results = {}
+    for name, factory in (
+        ("OrderBook (Decimal)", OrderBook),
+        ("TickOrderBook (int ticks)", TickOrderBook),
+    ):
+        # Best of N on a fresh book each time to damp scheduler noise.
+        elapsed, trades = min(
+            run(factory(instrument), stream) for _ in range(args.repeat)
+        )
+        results[name] = elapsed
+        print(
+            f"{name:<28} {elapsed:8.3f}s  "
+            f"{len(stream) / elapsed:>10,.0f} msgs/s  "
+            f"{elapsed / len(stream) * 1e6:6.2f} us/msg  trades={trades}"
+        )
+
+    base, tick = results.values()
+    print(f"speedup: {base / tick:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
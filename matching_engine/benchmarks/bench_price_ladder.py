@@ -0,0 +1,71 @@
+"""Per-operation latency of ``PriceLadder`` implementations vs level count.
+
+Run from the service directory::
+
+    PYTHONPATH=..:. python benchmarks/bench_price_ladder.py
+
+For each level count the ladder is pre-filled with distinct random prices,
+then timed on a steady-state churn: add a new level and discard an existing
+one (both anywhere in the book, i.e. mostly far from the touch). Reported
+numbers are microseconds per add+discard pair.
+"""
+
+import argparse
+import random
+import time
+from decimal import Decimal
+from functools import partial
+
+from src.domain.entities.price_ladder import (
+    DenseTickLadder,
+    SkipListLadder,
+    SortedListLadder,
+)
+
+MAX_CENTS = 2_000_000  # band of 0.01 .. 20000.00
+
+LADDERS = {
+    "sorted-list": SortedListLadder,
+    "skip-list": SkipListLadder,
+    "dense-tick": partial(
+        DenseTickLadder,
+        min_price=Decimal("0.01"),
+        max_price=Decimal(MAX_CENTS) / 100,
+    ),
+}
+
+
+def bench(factory, levels: int, ops: int, seed: int) -> float:
+    rng = random.Random(seed)
+    prices = [Decimal(c) / 100 for c in rng.sample(range(1, MAX_CENTS), levels + ops)]
+    live = prices[:levels]
+    fresh = prices[levels:]
+    victims = [rng.randrange(levels) for _ in range(ops)]
+
+    ladder = factory(descending=True)
+    for price in live:
+        ladder.add(price)
+
+    start = time.perf_counter()
+    for new_price, victim in zip(fresh, victims):
+        ladder.add(new_price)
+        ladder.discard(live[victim])
+        live[victim] = new_price
+    return (time.perf_counter() - start) / ops * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--ops", type=int, default=20_000)
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    counts = [10, 100, 1_000, 10_000, 100_000]
+    print(f"{'levels':>8}  " + "  ".join(f"{name:>12}" for name in LADDERS))
+    for levels in counts:
+        row = [bench(f, levels, args.ops, args.seed) for f in LADDERS.values()]
+        print(f"{levels:>8}  " + "  ".join(f"{us:>10.2f}us" for us in row))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""Redis market data operations per second against order rate.
+
+Run from the service directory::
+
+    PYTHONPATH=..:. python benchmarks/bench_snapshot_writer.py --rates 1000,10000
+
+Orders are applied at each paced rate in ``--rates`` across ``--instruments`` books.
+"inline" writes LTP + snapshot after every order (two ``SET``s, two
+``json.dumps``); "coalesced" marks books dirty for a
+``CoalescingSnapshotWriter`` flushing every ``--interval-ms`` with one
+``MSET``, one delta ``XADD`` per changed book and one ``PUBLISH``. Redis is replaced by a client that only counts commands and keys,
+so the numbers are the load each mode would put on Redis; "orders/s" falling
+short of the target rate shows the engine time spent serialising inline.
+"""
+
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from decimal import Decimal
+from unittest.mock import AsyncMock
+
+from src.application.command_output import write_book_to_cache
+from src.application.process_incoming_order import (
+    ProcessIncomingOrderCommand,
+    ProcessIncomingOrderHandler,
+)
+from src.infrastructure.book.in_memory_order_book_registry import (
+    InMemoryOrderBookRegistry,
+)
+from src.infrastructure.cache.redis_market_data_cache import RedisMarketDataCache
+from src.infrastructure.cache.snapshot_writer import CoalescingSnapshotWriter
+
+
+class CountingRedis:
+    def __init__(self) -> None:
+        self.commands = 0
+        self.keys = 0
+
+    async def set(self, key: str, value: str) -> None:
+        self.commands += 1
+        self.keys += 1
+
+    def pipeline(self, transaction: bool = True) -> "CountingRedis":
+        return self
+
+    def mset(self, mapping: dict[str, str]) -> None:
+        self.commands += 1
+        self.keys += len(mapping)
+
+    def xadd(self, name: str, fields: dict[str, str], **options) -> None:
+        self.commands += 1
+        self.keys += 1
+
+    def publish(self, channel: str, message: str) -> None:
+        self.commands += 1
+
+    async def execute(self) -> None:
+        pass
+
+
+def _commands(count: int, instruments: list[str]) -> list[ProcessIncomingOrderCommand]:
+    rng = random.Random(7)
+    commands = []
+    for _ in range(count):
+        side = rng.choice(("BUY", "SELL"))
+        # Mostly resting orders over a wide band, a few marketable ones.
+        if rng.random() < 0.05:
+            cents = 10_100 if side == "BUY" else 9_900
+        elif side == "BUY":
+            cents = rng.randint(9_000, 9_999)
+        else:
+            cents = rng.randint(10_001, 11_000)
+        commands.append(
+            ProcessIncomingOrderCommand(
+                order_id=str(uuid.uuid4()),
+                trader_id=str(uuid.uuid4()),
+                instrument_id=rng.choice(instruments),
+                side=side,
+                order_type="LIMIT",
+                time_in_force="GTC",
+                quantity=rng.randint(1, 10),
+                limit_price=Decimal(cents) / 100,
+                limit_price_currency="USD",
+            )
+        )
+    return commands
+
+
+async def run(mode: str, rate: int, seconds: float, args) -> dict:
+    instruments = [str(uuid.uuid4()) for _ in range(args.instruments)]
+    commands = _commands(int(rate * seconds), instruments)
+    handler = ProcessIncomingOrderHandler(
+        InMemoryOrderBookRegistry(), AsyncMock(), AsyncMock()
+    )
+    redis = CountingRedis()
+    cache = RedisMarketDataCache(url="redis://unused")
+    cache._client = redis
+    writer = CoalescingSnapshotWriter(cache, flush_interval=args.interval_ms / 1000)
+    if mode == "coalesced":
+        writer.start()
+
+    per_tick = max(1, rate // 1000)
+    start = time.perf_counter()
+    for index in range(0, len(commands), per_tick):
+        for command in commands[index : index + per_tick]:
+            book = handler.execute(command).book
+            if mode == "inline":
+                await write_book_to_cache(cache, book)
+            else:
+                writer.mark_dirty(book)
+        # Pace to ``rate`` orders per second.
+        ahead = (index + per_tick) / rate - (time.perf_counter() - start)
+        await asyncio.sleep(max(ahead, 0))
+    if mode == "coalesced":
+        await writer.stop()
+    elapsed = time.perf_counter() - start
+
+    return {
+        "orders/s": len(commands) / elapsed,
+        "redis cmds/s": redis.commands / elapsed,
+        "keys/s": redis.keys / elapsed,
+        "skipped": writer.skipped,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rates", default="1000,5000,20000")
+    parser.add_argument("--seconds", type=float, default=2.0)
+    parser.add_argument("--instruments", type=int, default=20)
+    parser.add_argument("--interval-ms", type=float, default=50)
+    args = parser.parse_args()
+
+    print(
+        f"{'rate':>7} {'mode':>10} {'orders/s':>10} {'cmds/s':>10} "
+        f"{'keys/s':>10} {'skipped':>8}"
+    )
+    for rate in (int(r) for r in args.rates.split(",")):
+        for mode in ("inline", "coalesced"):
+            result = await run(mode, rate, args.seconds, args)
+            print(
+                f"{rate:>7} {mode:>10} {result['orders/s']:>10.0f} "
+                f"{result['redis cmds/s']:>10.0f} {result['keys/s']:>10.0f} "
+                f"{result['skipped']:>8}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,13 +1,16 @@
 import logging
 from dataclasses import dataclass
 
+from src.application.command_output import CommandOutput, write_book_to_cache
+from src.domain.entities.resting_order import RestingOrder
 from src.domain.events.matching_events import OrderRemoved
 from src.domain.ports.event_publisher import EventPublisher
 from src.domain.ports.market_data_cache import MarketDataCache
-from src.domain.ports.order_book_registry import OrderBookRegistry
+from src.domain.ports.order_book_registry import MatchingBook, OrderBookRegistry
+from src.domain.ports.order_journal import OrderJournal
 from src.domain.value_objects.instrument_id import InstrumentId
 from src.domain.value_objects.order_id import OrderId
-from src.exceptions import OrderNotInBookError
+from src.exceptions import DuplicateCommandError, OrderNotInBookError
 
 logger = logging.getLogger(__name__)
 
@@ -26,18 +29,79 @@ class CancelRestingOrderHandler:
         registry: OrderBookRegistry,
         event_publisher: EventPublisher,
         market_data_cache: MarketDataCache,
+        journal: OrderJournal | None = None,
     ) -> None:
         self._registry = registry
         self._event_publisher = event_publisher
         self._cache = market_data_cache
+        self._journal = journal
 
     async def handle(self, command: CancelRestingOrderCommand) -> None:
+        output = self.execute(command)
+        if self._journal is not None:
+            await self._journal.sync()
+
+        for event in output.events:
+            await self._event_publisher.publish(event)
+        if output.journal_seq is not None:
+            self._journal.record_emitted(output.journal_seq)
+
+        await write_book_to_cache(self._cache, output.book)
+
+        logger.info("Resting order cancelled: order_id=%s", command.order_id)
+
+    def execute(self, command: CancelRestingOrderCommand) -> CommandOutput:
+        """Journal and apply the cancel synchronously; nothing is emitted yet."""
         logger.info(
             "Cancelling resting order: order_id=%s instrument=%s",
             command.order_id,
             command.instrument_id,
         )
 
+        if self._journal is None:
+            return self._output(*self._apply(command))
+
+        if not self._journal.record_cancel(
+            order_id=command.order_id,
+            instrument_id=command.instrument_id,
+        ):
+            raise DuplicateCommandError(
+                f"Cancel of '{command.order_id}' was already processed."
+            )
+        seq = self._journal.last_seq
+        try:
+            book, removed = self._apply(command)
+        except Exception:
+            # Rejected: there is nothing to emit.
+            self._journal.record_emitted(seq)
+            raise
+        return self._output(book, removed, seq)
+
+    def replay(self, command: CancelRestingOrderCommand) -> CommandOutput:
+        """Re-apply a journaled cancel; its events are returned, not emitted."""
+        return self._output(*self._apply(command))
+
+    @staticmethod
+    def _output(
+        book: MatchingBook, removed: RestingOrder, journal_seq: int | None = None
+    ) -> CommandOutput:
+        return CommandOutput(
+            book,
+            [
+                OrderRemoved(
+                    order_id=removed.order_id.value,
+                    trader_id=removed.trader_id.value,
+                    instrument_id=removed.instrument_id.value,
+                    side=removed.side.value,
+                    remaining_quantity=removed.remaining_quantity.value,
+                )
+            ],
+            journal_seq=journal_seq,
+        )
+
+    def _apply(
+        self, command: CancelRestingOrderCommand
+    ) -> tuple[MatchingBook, RestingOrder]:
         order_id = OrderId(command.order_id)
         instrument_id = InstrumentId(command.instrument_id)
         book = self._registry.get(instrument_id)
@@ -45,26 +109,4 @@ class CancelRestingOrderHandler:
             raise OrderNotInBookError(
                 f"No book for instrument '{command.instrument_id}'."
             )
-
-        removed = book.cancel(order_id)
-
-        await self._event_publisher.publish(
-            OrderRemoved(
-                order_id=removed.order_id.value,
-                trader_id=removed.trader_id.value,
-                instrument_id=removed.instrument_id.value,
-                side=removed.side.value,
-                remaining_quantity=removed.remaining_quantity.value,
-            )
-        )
-
-        last = book.last_trade_price
-        await self._cache.write_book_snapshot(
-            book.instrument_id,
-            [(p.amount, q) for p, q in book.depth_bids()],
-            [(p.amount, q) for p, q in book.depth_asks()],
-            last.amount if last is not None else None,
-            last.currency.value if last is not None else None,
-        )
-
-        logger.info("Resting order cancelled: order_id=%s", command.order_id)
+        return book, book.cancel(order_id)
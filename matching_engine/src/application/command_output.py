@@ -0,0 +1,37 @@
+from dataclasses import dataclass
+
+from src.domain.entities.order_book import MatchResult
+from src.domain.events.matching_events import DomainEvent
+from src.domain.ports.market_data_cache import MarketDataCache, MarketDataSnapshot
+from src.domain.ports.order_book_registry import MatchingBook
+
+
+@dataclass(frozen=True, slots=True)
+class CommandOutput:
+    """Result of applying one command: events to publish and the book touched.
+
+    ``journal_seq`` is where the command was journaled, if it was; pass it
+    to ``OrderJournal.record_emitted`` once ``events`` are published.
+    """
+
+    book: MatchingBook
+    events: list[DomainEvent]
+    match_result: MatchResult | None = None
+    journal_seq: int | None = None
+
+
+async def write_book_to_cache(cache: MarketDataCache, book: MatchingBook) -> None:
+    """Write the book's current depth (and last trade price, if any)."""
+    await cache.write_snapshots([book_snapshot(book)])
+
+
+def book_snapshot(book: MatchingBook, levels: int = 10) -> MarketDataSnapshot:
+    """Capture the book's visible depth and last trade price."""
+    last = book.last_trade_price
+    return MarketDataSnapshot(
+        instrument_id=book.instrument_id,
+        bids=[(p.amount, q) for p, q in book.depth_bids(levels)],
+        asks=[(p.amount, q) for p, q in book.depth_asks(levels)],
+        last_trade_price=last.amount if last is not None else None,
+        last_trade_currency=last.currency.value if last is not None else None,
+    )
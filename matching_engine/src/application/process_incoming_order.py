@@ -1,16 +1,20 @@
 import logging
 from dataclasses import dataclass
+from datetime import datetime, timezone
 from decimal import Decimal
 
-from src.domain.entities.order_book import MatchResult, OrderBook
+from src.application.command_output import CommandOutput, write_book_to_cache
+from src.domain.entities.order_book import MatchResult
 from src.domain.events.matching_events import (
+    DomainEvent,
     OrderFilled,
     OrderPlaced,
     TradeExecuted,
 )
 from src.domain.ports.event_publisher import EventPublisher
 from src.domain.ports.market_data_cache import MarketDataCache
-from src.domain.ports.order_book_registry import OrderBookRegistry
+from src.domain.ports.order_book_registry import MatchingBook, OrderBookRegistry
+from src.domain.ports.order_journal import OrderJournal
 from src.domain.value_objects.currency import Currency
 from src.domain.value_objects.instrument_id import InstrumentId
 from src.domain.value_objects.money import Money
@@ -20,7 +24,7 @@ from src.domain.value_objects.order_type import OrderType
 from src.domain.value_objects.quantity import Quantity
 from src.domain.value_objects.time_in_force import TimeInForce
 from src.domain.value_objects.trader_id import TraderId
-from src.exceptions import InvalidIncomingOrderError
+from src.exceptions import DuplicateCommandError, InvalidIncomingOrderError
 
 logger = logging.getLogger(__name__)
 
@@ -38,22 +42,60 @@ class ProcessIncomingOrderCommand:
     quantity: int
     limit_price: Decimal | None = None
     limit_price_currency: str | None = None
+    # Set from the journal on replay; new commands are stamped on execute.
+    received_at: datetime | None = None
 
 
 class ProcessIncomingOrderHandler:
-    """Match an incoming order against the in-memory book and emit events."""
+    """Match an incoming order against the in-memory book and emit events.
+
+    With a journal, the command is recorded before the book changes,
+    events are published only once the journal has synced it, and the
+    publish is then recorded so recovery can re-emit anything that a crash
+    left unpublished. Journaled commands derive their trade ids from the
+    journal sequence and take the journaled receive time as trade time, so
+    a replay emits the same trades.
+    """
 
     def __init__(
         self,
         registry: OrderBookRegistry,
         event_publisher: EventPublisher,
         market_data_cache: MarketDataCache,
+        journal: OrderJournal | None = None,
     ) -> None:
         self._registry = registry
         self._event_publisher = event_publisher
         self._cache = market_data_cache
+        self._journal = journal
 
     async def handle(self, command: ProcessIncomingOrderCommand) -> MatchResult:
+        output = self.execute(command)
+        if self._journal is not None:
+            await self._journal.sync()
+
+        # One batch per match result: confirms overlap instead of N round trips.
+        await self._event_publisher.publish_many(output.events)
+        if output.journal_seq is not None:
+            self._journal.record_emitted(output.journal_seq)
+        await write_book_to_cache(self._cache, output.book)
+
+        result = output.match_result
+        logger.info(
+            "Order processed: order_id=%s trades=%s filled=%s remaining=%s rested=%s",
+            command.order_id,
+            len(result.trades),
+            result.taker_filled_quantity,
+            result.taker_remaining_quantity,
+            result.resting_order is not None,
+        )
+        return result
+
+    def execute(self, command: ProcessIncomingOrderCommand) -> CommandOutput:
+        """Journal and match ``command`` synchronously; nothing is emitted yet.
+
+        Callers must ``sync()`` the journal before publishing ``events``.
+        """
         logger.info(
             "Processing incoming order: order_id=%s instrument=%s side=%s type=%s qty=%s",
             command.order_id,
@@ -63,6 +105,55 @@ class ProcessIncomingOrderHandler:
             command.quantity,
         )
 
+        received_at = command.received_at or datetime.now(timezone.utc)
+        if self._journal is None:
+            book, result = self._apply(command, None, received_at)
+            return CommandOutput(
+                book, self._events(command, result, received_at), result
+            )
+
+        if not self._journal.record_open(
+            order_id=command.order_id,
+            trader_id=command.trader_id,
+            instrument_id=command.instrument_id,
+            side=command.side,
+            order_type=command.order_type,
+            time_in_force=command.time_in_force,
+            quantity=command.quantity,
+            limit_price=command.limit_price,
+            limit_price_currency=command.limit_price_currency,
+            received_at=received_at,
+        ):
+            raise DuplicateCommandError(
+                f"Order '{command.order_id}' was already processed."
+            )
+        seq = self._journal.last_seq
+        try:
+            book, result = self._apply(command, seq, received_at)
+        except Exception:
+            # Rejected: there is nothing to emit.
+            self._journal.record_emitted(seq)
+            raise
+        return CommandOutput(
+            book, self._events(command, result, received_at), result, seq
+        )
+
+    def replay(
+        self, command: ProcessIncomingOrderCommand, seq: int | None = None
+    ) -> CommandOutput:
+        """Re-apply a command journaled at ``seq``; its events are returned,
+        not emitted, and carry the trade ids and times of the original run."""
+        # Entries journaled before receive times were recorded have none.
+        received_at = command.received_at or datetime.now(timezone.utc)
+        book, result = self._apply(command, seq, received_at)
+        return CommandOutput(book, self._events(command, result, received_at), result)
+
+    def _apply(
+        self,
+        command: ProcessIncomingOrderCommand,
+        seq: int | None,
+        received_at: datetime,
+    ) -> tuple[MatchingBook, MatchResult]:
         order_id = OrderId(command.order_id)
         trader_id = TraderId(command.trader_id)
         instrument_id = InstrumentId(command.instrument_id)
@@ -85,46 +176,38 @@ class ProcessIncomingOrderHandler:
             time_in_force=time_in_force,
             quantity=quantity,
             limit_price=limit_price,
+            command_seq=seq,
+            received_at=received_at,
         )
+        return book, result
 
-        await self._publish_result(command, result, book)
-        await self._update_cache(book)
-
-        logger.info(
-            "Order processed: order_id=%s trades=%s filled=%s remaining=%s rested=%s",
-            command.order_id,
-            len(result.trades),
-            result.taker_filled_quantity,
-            result.taker_remaining_quantity,
-            result.resting_order is not None,
-        )
-        return result
-
-    async def _publish_result(
-        self,
+    @staticmethod
+    def _events(
         command: ProcessIncomingOrderCommand,
         result: MatchResult,
-        book: OrderBook,
-    ) -> None:
-        for trade in result.trades:
-            await self._event_publisher.publish(
-                TradeExecuted(
-                    trade_id=trade.id.value,
-                    maker_order_id=trade.maker_order_id.value,
-                    taker_order_id=trade.taker_order_id.value,
-                    buyer_id=trade.buyer_id.value,
-                    seller_id=trade.seller_id.value,
-                    instrument_id=trade.instrument_id.value,
-                    quantity=trade.quantity.value,
-                    execution_price=trade.execution_price.amount,
-                    execution_price_currency=trade.execution_price.currency.value,
-                    sequence_number=trade.sequence_number,
-                )
+        occurred_at: datetime,
+    ) -> list[DomainEvent]:
+        events: list[DomainEvent] = [
+            TradeExecuted(
+                occurred_at=trade.executed_at,
+                trade_id=trade.id.value,
+                maker_order_id=trade.maker_order_id.value,
+                taker_order_id=trade.taker_order_id.value,
+                buyer_id=trade.buyer_id.value,
+                seller_id=trade.seller_id.value,
+                instrument_id=trade.instrument_id.value,
+                quantity=trade.quantity.value,
+                execution_price=trade.execution_price.amount,
+                execution_price_currency=trade.execution_price.currency.value,
+                sequence_number=trade.sequence_number,
             )
+            for trade in result.trades
+        ]
 
         if result.taker_filled_quantity > 0:
-            await self._event_publisher.publish(
+            events.append(
                 OrderFilled(
+                    occurred_at=occurred_at,
                     order_id=command.order_id,
                     trader_id=command.trader_id,
                     instrument_id=command.instrument_id,
@@ -139,8 +222,9 @@ class ProcessIncomingOrderHandler:
 
         if result.resting_order is not None:
             resting = result.resting_order
-            await self._event_publisher.publish(
+            events.append(
                 OrderPlaced(
+                    occurred_at=occurred_at,
                     order_id=resting.order_id.value,
                     trader_id=resting.trader_id.value,
                     instrument_id=resting.instrument_id.value,
@@ -150,25 +234,7 @@ class ProcessIncomingOrderHandler:
                     quantity=resting.remaining_quantity.value,
                 )
             )
-
-    async def _update_cache(self, book: OrderBook) -> None:
-        last = book.last_trade_price
-        if last is not None:
-            await self._cache.write_last_trade_price(
-                book.instrument_id,
-                last.amount,
-                last.currency.value,
-            )
-
-        bids = [(p.amount, q) for p, q in book.depth_bids()]
-        asks = [(p.amount, q) for p, q in book.depth_asks()]
-        await self._cache.write_book_snapshot(
-            book.instrument_id,
-            bids,
-            asks,
-            last.amount if last is not None else None,
-            last.currency.value if last is not None else None,
-        )
+        return events
 
     @staticmethod
     def _parse_side(value: str) -> OrderSide:
@@ -36,9 +36,69 @@ class Config:
         "matching_engine.orders",
     )
 
+    # src.supervisor runs the router + N shard workers when >1, else one worker.
+    MATCHING_SHARD_COUNT: int = int(os.getenv("MATCHING_SHARD_COUNT", "1"))
+    # Set per child by the supervisor; unset means the unsharded worker.
+    MATCHING_SHARD_INDEX: str | None = os.getenv("MATCHING_SHARD_INDEX")
+    RABBITMQ_SHARD_EXCHANGE: str = os.getenv(
+        "RABBITMQ_SHARD_EXCHANGE",
+        "matching_engine.shards",
+    )
+
     REDIS_ENABLED: bool = os.getenv("REDIS_ENABLED", "false").lower() in (
         "1",
         "true",
         "yes",
     )
     REDIS_URL: str = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+    # "decimal" (OrderBook) or "tick" (TickOrderBook, integer ticks internally).
+    MATCHING_BOOK_ENGINE: str = os.getenv("MATCHING_BOOK_ENGINE", "decimal").lower()
+    MATCHING_TICK_SIZE: str = os.getenv("MATCHING_TICK_SIZE", "0.01")
+
+    # OrderBook price ladder: "sorted", "skiplist" or "dense" (needs a band).
+    MATCHING_PRICE_LADDER: str = os.getenv("MATCHING_PRICE_LADDER", "sorted").lower()
+    MATCHING_PRICE_BAND_MIN: str = os.getenv("MATCHING_PRICE_BAND_MIN", "0.01")
+    MATCHING_PRICE_BAND_MAX: str = os.getenv("MATCHING_PRICE_BAND_MAX", "10000.00")
+
+    # Write-ahead journal + periodic book snapshots (restart recovery).
+    JOURNAL_ENABLED: bool = os.getenv("JOURNAL_ENABLED", "false").lower() in (
+        "1",
+        "true",
+        "yes",
+    )
+    JOURNAL_DIR: str = os.getenv("JOURNAL_DIR", "data/journal")
+    JOURNAL_FSYNC: bool = os.getenv("JOURNAL_FSYNC", "true").lower() in (
+        "1",
+        "true",
+        "yes",
+    )
+    JOURNAL_FLUSH_INTERVAL_MS: float = float(
+        os.getenv("JOURNAL_FLUSH_INTERVAL_MS", "2")
+    )
+    JOURNAL_SNAPSHOT_INTERVAL_SECONDS: float = float(
+        os.getenv("JOURNAL_SNAPSHOT_INTERVAL_SECONDS", "60")
+    )
+
+    # Staged consumer → matcher → publisher/cache pipeline (acks after publish).
+    MATCHING_PIPELINE_ENABLED: bool = os.getenv(
+        "MATCHING_PIPELINE_ENABLED", "false"
+    ).lower() in ("1", "true", "yes")
+    MATCHING_PIPELINE_QUEUE_SIZE: int = int(
+        os.getenv("MATCHING_PIPELINE_QUEUE_SIZE", "1024")
+    )
+    MATCHING_PIPELINE_PREFETCH: int = int(
+        os.getenv("MATCHING_PIPELINE_PREFETCH", "512")
+    )
+    MATCHING_PIPELINE_METRICS_INTERVAL_SECONDS: float = float(
+        os.getenv("MATCHING_PIPELINE_METRICS_INTERVAL_SECONDS", "30")
+    )
+
+    # Minimum interval between market data writes for one instrument.
+    MARKET_DATA_FLUSH_INTERVAL_MS: float = float(
+        os.getenv("MARKET_DATA_FLUSH_INTERVAL_MS", "50")
+    )
+    # Approximate cap on entries kept per md:deltas:{instrument_id} stream.
+    MARKET_DATA_DELTA_STREAM_MAXLEN: int = int(
+        os.getenv("MARKET_DATA_DELTA_STREAM_MAXLEN", "10000")
+    )
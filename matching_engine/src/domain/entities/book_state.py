@@ -0,0 +1,47 @@
+from dataclasses import dataclass
+from typing import TypeVar
+
+from shared.base_vo import BaseVO
+
+# (order_id, trader_id, order_type, time_in_force, remaining, sequence,
+#  accepted_at as a POSIX timestamp)
+OrderImage = tuple[str, str, str, str, int, int, float]
+
+_VO = TypeVar("_VO", bound=BaseVO)
+
+
+@dataclass(frozen=True, slots=True)
+class LevelImage:
+    """One price level with its resting orders in FIFO order."""
+
+    side: str
+    price: str
+    currency: str
+    orders: list[OrderImage]
+
+
+@dataclass(frozen=True, slots=True)
+class BookState:
+    """Plain-typed image of an order book, used for snapshots and recovery.
+
+    Restoring a ``BookState`` into an empty book reproduces levels, FIFO
+    order, remaining quantities and the book's sequence counters exactly.
+    """
+
+    instrument_id: str
+    sequence: int
+    trade_sequence: int
+    last_trade_price: str | None
+    last_trade_currency: str | None
+    levels: list[LevelImage]
+
+
+def trusted_vo(cls: type[_VO], value) -> _VO:
+    """Build a VO from a value that was validated before it was snapshotted.
+
+    Skips ``__init__`` validation (UUID re-parsing dominates restore time for
+    large books).
+    """
+    vo = cls.__new__(cls)
+    BaseVO.__init__(vo, value)
+    return vo
@@ -1,9 +1,12 @@
-from collections import deque
-from dataclasses import dataclass, field
+from collections.abc import Iterator
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from decimal import Decimal
+from src.domain.entities.book_state import BookState, LevelImage, trusted_vo
+from src.domain.entities.price_ladder import PriceLadderFactory, SortedListLadder
 from src.domain.entities.resting_order import RestingOrder
 from src.domain.entities.trade import Trade
+from src.domain.value_objects.currency import Currency
 from src.domain.value_objects.instrument_id import InstrumentId
 from src.domain.value_objects.money import Money
 from src.domain.value_objects.order_id import OrderId
@@ -11,6 +14,7 @@ from src.domain.value_objects.order_side import OrderSide
 from src.domain.value_objects.order_type import OrderType
 from src.domain.value_objects.quantity import Quantity
 from src.domain.value_objects.time_in_force import TimeInForce
+from src.domain.value_objects.trade_id import TradeId
 from src.domain.value_objects.trader_id import TraderId
 from src.exceptions import InvalidOrderBookError, OrderNotInBookError
 
@@ -26,20 +30,88 @@ class MatchResult:
     taker_fully_filled: bool
 
 
+class _OrderNode:
+    """Doubly linked FIFO node; ``_index`` points here for O(1) unlink."""
+
+    __slots__ = ("order", "level", "prev", "next")
+
+    def __init__(self, order: RestingOrder, level: "_PriceLevel") -> None:
+        self.order = order
+        self.level = level
+        self.prev: _OrderNode | None = None
+        self.next: _OrderNode | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class PriceLevelSummary:
+    """Aggregate view of one price level (depth row)."""
+
+    price: Money
+    quantity: int
+    order_count: int
+
+
 @dataclass(slots=True)
 class _PriceLevel:
-    """FIFO queue of resting orders at a single price."""
+    """FIFO queue of resting orders at a single price (intrusive linked list).
+
+    ``total_quantity`` / ``order_count`` are maintained on every rest, fill,
+    self-trade skip and cancel so depth reads never walk the queue.
+    """
 
     price: Money
-    orders: deque[RestingOrder] = field(default_factory=deque)
+    head: _OrderNode | None = None
+    tail: _OrderNode | None = None
+    total_quantity: int = 0
+    order_count: int = 0
+
+    def append(self, order: RestingOrder) -> _OrderNode:
+        node = _OrderNode(order, self)
+        if self.tail is None:
+            self.head = node
+        else:
+            node.prev = self.tail
+            self.tail.next = node
+        self.tail = node
+        self.total_quantity += order.remaining_quantity.value
+        self.order_count += 1
+        return node
+
+    def unlink(self, node: _OrderNode) -> None:
+        if node.prev is None:
+            self.head = node.next
+        else:
+            node.prev.next = node.next
+        if node.next is None:
+            self.tail = node.prev
+        else:
+            node.next.prev = node.prev
+        node.prev = node.next = None
+        self.total_quantity -= node.order.remaining_quantity.value
+        self.order_count -= 1
 
-    @property
-    def total_quantity(self) -> int:
-        return sum(o.remaining_quantity.value for o in self.orders)
+    def __iter__(self) -> Iterator[RestingOrder]:
+        node = self.head
+        while node is not None:
+            yield node.order
+            node = node.next
 
     @property
     def is_empty(self) -> bool:
-        return not self.orders
+        return self.head is None
+
+
+@dataclass(frozen=True, slots=True)
+class _TradeStamp:
+    """Where one submitted order's trade ids and execution time come from."""
+
+    command_seq: int | None
+    executed_at: datetime
+
+    def trade_id(self, taker_id: OrderId, index: int) -> TradeId | None:
+        if self.command_seq is None:
+            return None
+        return TradeId.derive(self.command_seq, taker_id.value, index)
 
 
 class OrderBook:
@@ -54,18 +126,25 @@ class OrderBook:
       - Self-trade prevention: skip opposite orders from the same trader.
 
     Data structures (optimized for the hot path):
-      - ``_bids`` / ``_asks``: price-amount → deque of orders (O(1) level access).
-      - ``_bid_prices`` / ``_ask_prices``: sorted price lists for best-price walks.
-      - ``_index``: order_id → (side, price_amount) for O(1) cancel lookup.
+      - ``_bids`` / ``_asks``: price-amount → linked FIFO of orders (O(1) level
+        access).
+      - ``_bid_prices`` / ``_ask_prices``: ``PriceLadder`` of occupied prices for
+        best-price walks (pluggable; see ``price_ladder``).
+      - ``_index``: order_id → FIFO node, so cancel unlinks in O(1) without
+        scanning the level.
     """
 
-    def __init__(self, instrument_id: InstrumentId) -> None:
+    def __init__(
+        self,
+        instrument_id: InstrumentId,
+        ladder_factory: PriceLadderFactory = SortedListLadder,
+    ) -> None:
         self.instrument_id = instrument_id
         self._bids: dict[Decimal, _PriceLevel] = {}
         self._asks: dict[Decimal, _PriceLevel] = {}
-        self._bid_prices: list[Decimal] = []  # descending
-        self._ask_prices: list[Decimal] = []  # ascending
-        self._index: dict[str, tuple[OrderSide, Decimal]] = {}
+        self._bid_prices = ladder_factory(descending=True)
+        self._ask_prices = ladder_factory(descending=False)
+        self._index: dict[str, _OrderNode] = {}
         self._sequence: int = 0
         self._trade_sequence: int = 0
         self._last_trade_price: Money | None = None
@@ -83,8 +162,16 @@ class OrderBook:
         time_in_force: TimeInForce,
         quantity: Quantity,
         limit_price: Money | None,
+        command_seq: int | None = None,
+        received_at: datetime | None = None,
     ) -> MatchResult:
-        """Match an incoming order against the book and optionally rest residual."""
+        """Match an incoming order against the book and optionally rest residual.
+
+        With ``command_seq`` (where the command was journaled), trade ids are
+        derived from it, the taker order id and the match index, so replaying
+        the command reproduces them. ``received_at`` stamps the trades and the
+        resting order instead of the current time.
+        """
         if quantity.value == 0:
             raise InvalidOrderBookError("Order quantity must be greater than zero.")
 
@@ -99,16 +186,23 @@ class OrderBook:
                 f"Order '{order_id.value}' is already on the book."
             )
 
+        if limit_price is not None:
+            # Reject before matching so a partial fill never fails to rest.
+            ladder = self._bid_prices if side is OrderSide.BUY else self._ask_prices
+            ladder.check(limit_price.amount)
+
+        now = received_at if received_at is not None else datetime.now(timezone.utc)
+        stamp = _TradeStamp(command_seq, now)
         remaining = quantity.value
         trades: list[Trade] = []
 
         if side is OrderSide.BUY:
             remaining, trades = self._match_buy(
-                order_id, trader_id, order_type, limit_price, remaining, trades
+                order_id, trader_id, order_type, limit_price, remaining, trades, stamp
             )
         else:
             remaining, trades = self._match_sell(
-                order_id, trader_id, order_type, limit_price, remaining, trades
+                order_id, trader_id, order_type, limit_price, remaining, trades, stamp
             )
 
         filled = quantity.value - remaining
@@ -129,6 +223,7 @@ class OrderBook:
                 time_in_force=time_in_force,
                 price=limit_price,
                 remaining=Quantity(remaining),
+                accepted_at=now,
             )
 
         return MatchResult(
@@ -142,41 +237,29 @@ class OrderBook:
     def cancel(self, order_id: OrderId) -> RestingOrder:
         """Remove a resting order from the book."""
         key = order_id.value
-        location = self._index.get(key)
-        if location is None:
+        node = self._index.pop(key, None)
+        if node is None:
             raise OrderNotInBookError(f"Order '{key}' is not on the book.")
 
-        side, price_amount = location
-        levels = self._bids if side is OrderSide.BUY else self._asks
-        level = levels.get(price_amount)
-        if level is None:
-            raise OrderNotInBookError(f"Order '{key}' is not on the book.")
-
-        target: RestingOrder | None = None
-        for order in level.orders:
-            if order.order_id.value == key:
-                target = order
-                break
-
-        if target is None:
-            raise OrderNotInBookError(f"Order '{key}' is not on the book.")
-
-        level.orders.remove(target)
-        del self._index[key]
+        level = node.level
+        level.unlink(node)
+        target = node.order
         if level.is_empty:
-            self._remove_level(side, price_amount)
+            self._remove_level(target.side, target.price.amount)
 
         return target
 
     def best_bid(self) -> Money | None:
-        if not self._bid_prices:
+        best = self._bid_prices.best()
+        if best is None:
             return None
-        return self._bids[self._bid_prices[0]].price
+        return self._bids[best].price
 
     def best_ask(self) -> Money | None:
-        if not self._ask_prices:
+        best = self._ask_prices.best()
+        if best is None:
             return None
-        return self._asks[self._ask_prices[0]].price
+        return self._asks[best].price
 
     @property
     def last_trade_price(self) -> Money | None:
@@ -184,21 +267,110 @@ class OrderBook:
 
     def depth_bids(self, levels: int = 10) -> list[tuple[Money, int]]:
         result: list[tuple[Money, int]] = []
-        for price_amount in self._bid_prices[:levels]:
+        for price_amount in self._bid_prices.top(levels):
             level = self._bids[price_amount]
             result.append((level.price, level.total_quantity))
         return result
 
     def depth_asks(self, levels: int = 10) -> list[tuple[Money, int]]:
         result: list[tuple[Money, int]] = []
-        for price_amount in self._ask_prices[:levels]:
+        for price_amount in self._ask_prices.top(levels):
             level = self._asks[price_amount]
             result.append((level.price, level.total_quantity))
         return result
 
+    def bid_levels(self, levels: int = 10) -> list[PriceLevelSummary]:
+        """Top bid levels with aggregate quantity and order count."""
+        return [self._summarize(self._bids[p]) for p in self._bid_prices.top(levels)]
+
+    def ask_levels(self, levels: int = 10) -> list[PriceLevelSummary]:
+        """Top ask levels with aggregate quantity and order count."""
+        return [self._summarize(self._asks[p]) for p in self._ask_prices.top(levels)]
+
     def order_count(self) -> int:
         return len(self._index)
 
+    def dump_state(self) -> BookState:
+        """Capture resting orders and counters as plain types."""
+        levels = [
+            self._dump_level(side, level)
+            for side, side_levels in (("BUY", self._bids), ("SELL", self._asks))
+            for level in side_levels.values()
+        ]
+        last = self._last_trade_price
+        return BookState(
+            instrument_id=self.instrument_id.value,
+            sequence=self._sequence,
+            trade_sequence=self._trade_sequence,
+            last_trade_price=str(last.amount) if last is not None else None,
+            last_trade_currency=last.currency.value if last is not None else None,
+            levels=levels,
+        )
+
+    def restore_state(self, state: BookState) -> None:
+        """Load a ``dump_state`` image into this (empty) book."""
+        if self._index:
+            raise InvalidOrderBookError("Can only restore state into an empty book.")
+        if state.instrument_id != self.instrument_id.value:
+            raise InvalidOrderBookError(
+                f"State belongs to instrument '{state.instrument_id}'."
+            )
+
+        # PERF: recovery restores millions of orders; share the immutable VOs
+        # that repeat (traders, quantities) and resolve enums via dicts.
+        traders: dict[str, TraderId] = {}
+        quantities: dict[int, Quantity] = {}
+        order_types = {t.value: t for t in OrderType}
+        tifs = {t.value: t for t in TimeInForce}
+        index = self._index
+        instrument_id = self.instrument_id
+        for image in state.levels:
+            side = OrderSide(image.side)
+            price = Money(Decimal(image.price), Currency(image.currency))
+            amount = price.amount
+            levels = self._bids if side is OrderSide.BUY else self._asks
+            ladder = self._bid_prices if side is OrderSide.BUY else self._ask_prices
+
+            level = _PriceLevel(price=price)
+            levels[amount] = level
+            ladder.add(amount)
+            for (
+                order_id,
+                trader_id,
+                order_type,
+                tif,
+                remaining,
+                seq,
+                ts,
+            ) in image.orders:
+                trader = traders.get(trader_id)
+                if trader is None:
+                    trader = traders[trader_id] = trusted_vo(TraderId, trader_id)
+                quantity = quantities.get(remaining)
+                if quantity is None:
+                    quantity = quantities[remaining] = Quantity(remaining)
+                resting = RestingOrder(
+                    trusted_vo(OrderId, order_id),
+                    trader,
+                    instrument_id,
+                    side,
+                    order_types[order_type],
+                    tifs[tif],
+                    price,
+                    quantity,
+                    seq,
+                    datetime.fromtimestamp(ts, timezone.utc),
+                )
+                index[order_id] = level.append(resting)
+
+        self._sequence = state.sequence
+        self._trade_sequence = state.trade_sequence
+        if state.last_trade_price is not None:
+            self._last_trade_price = Money(
+                Decimal(state.last_trade_price),
+                Currency(state.last_trade_currency),
+            )
+
     # ------------------------------------------------------------------
     # Matching
     # ------------------------------------------------------------------
@@ -211,9 +383,10 @@ class OrderBook:
         limit_price: Money | None,
         remaining: int,
         trades: list[Trade],
+        stamp: _TradeStamp,
     ) -> tuple[int, list[Trade]]:
         while remaining > 0 and self._ask_prices:
-            best_price = self._ask_prices[0]
+            best_price = self._ask_prices.best()
             if order_type is OrderType.LIMIT and limit_price is not None:
                 if best_price > limit_price.amount:
                     break
@@ -227,6 +400,7 @@ class OrderBook:
                 taker_side=OrderSide.BUY,
                 remaining=remaining,
                 trades=trades,
+                stamp=stamp,
             )
             if level.is_empty:
                 self._remove_level(OrderSide.SELL, best_price)
@@ -240,9 +414,10 @@ class OrderBook:
         limit_price: Money | None,
         remaining: int,
         trades: list[Trade],
+        stamp: _TradeStamp,
     ) -> tuple[int, list[Trade]]:
         while remaining > 0 and self._bid_prices:
-            best_price = self._bid_prices[0]
+            best_price = self._bid_prices.best()
             if order_type is OrderType.LIMIT and limit_price is not None:
                 if best_price < limit_price.amount:
                     break
@@ -256,6 +431,7 @@ class OrderBook:
                 taker_side=OrderSide.SELL,
                 remaining=remaining,
                 trades=trades,
+                stamp=stamp,
             )
             if level.is_empty:
                 self._remove_level(OrderSide.BUY, best_price)
@@ -270,13 +446,15 @@ class OrderBook:
         taker_side: OrderSide,
         remaining: int,
         trades: list[Trade],
+        stamp: _TradeStamp,
     ) -> int:
-        while remaining > 0 and level.orders:
-            maker = level.orders[0]
+        while remaining > 0 and level.head is not None:
+            node = level.head
+            maker = node.order
 
             # Self-trade prevention: skip same-trader resting orders.
             if maker.trader_id == taker_trader:
-                level.orders.popleft()
+                level.unlink(node)
                 del self._index[maker.order_id.value]
                 continue
 
@@ -296,15 +474,18 @@ class OrderBook:
                 quantity=fill,
                 execution_price=maker.price,
                 sequence_number=self._trade_sequence,
+                id=stamp.trade_id(taker_id, len(trades)),
+                executed_at=stamp.executed_at,
             )
             trades.append(trade)
             self._last_trade_price = maker.price
 
             maker.reduce(fill)
+            level.total_quantity -= fill_qty
             remaining -= fill_qty
 
             if maker.is_depleted:
-                level.orders.popleft()
+                level.unlink(node)
                 del self._index[maker.order_id.value]
 
         return remaining
@@ -322,6 +503,7 @@ class OrderBook:
         time_in_force: TimeInForce,
         price: Money,
         remaining: Quantity,
+        accepted_at: datetime,
     ) -> RestingOrder:
         self._sequence += 1
         resting = RestingOrder(
@@ -334,56 +516,54 @@ class OrderBook:
             price=price,
             remaining_quantity=remaining,
             sequence=self._sequence,
-            accepted_at=datetime.now(timezone.utc),
+            accepted_at=accepted_at,
         )
 
         levels = self._bids if side is OrderSide.BUY else self._asks
-        prices = self._bid_prices if side is OrderSide.BUY else self._ask_prices
+        ladder = self._bid_prices if side is OrderSide.BUY else self._ask_prices
         amount = price.amount
 
         level = levels.get(amount)
         if level is None:
             level = _PriceLevel(price=price)
             levels[amount] = level
-            self._insert_price(prices, amount, descending=(side is OrderSide.BUY))
+            ladder.add(amount)
 
-        level.orders.append(resting)
-        self._index[order_id.value] = (side, amount)
+        self._index[order_id.value] = level.append(resting)
         return resting
 
-    def _insert_price(
-        self,
-        prices: list[Decimal],
-        amount: Decimal,
-        *,
-        descending: bool,
-    ) -> None:
-        # PERF: binary insertion keeps best-price at index 0.
-        lo, hi = 0, len(prices)
-        while lo < hi:
-            mid = (lo + hi) // 2
-            if descending:
-                if prices[mid] < amount:
-                    hi = mid
-                else:
-                    lo = mid + 1
-            else:
-                if prices[mid] > amount:
-                    hi = mid
-                else:
-                    lo = mid + 1
-        prices.insert(lo, amount)
+    @staticmethod
+    def _dump_level(side: str, level: _PriceLevel) -> LevelImage:
+        return LevelImage(
+            side=side,
+            price=str(level.price.amount),
+            currency=level.price.currency.value,
+            orders=[
+                (
+                    order.order_id.value,
+                    order.trader_id.value,
+                    order.order_type.value,
+                    order.time_in_force.value,
+                    order.remaining_quantity.value,
+                    order.sequence,
+                    order.accepted_at.timestamp(),
+                )
+                for order in level
+            ],
+        )
+
+    @staticmethod
+    def _summarize(level: _PriceLevel) -> PriceLevelSummary:
+        return PriceLevelSummary(
+            price=level.price,
+            quantity=level.total_quantity,
+            order_count=level.order_count,
+        )
 
     def _remove_level(self, side: OrderSide, price_amount: Decimal) -> None:
         if side is OrderSide.BUY:
             self._bids.pop(price_amount, None)
-            try:
-                self._bid_prices.remove(price_amount)
-            except ValueError:
-                pass
+            self._bid_prices.discard(price_amount)
         else:
             self._asks.pop(price_amount, None)
-            try:
-                self._ask_prices.remove(price_amount)
-            except ValueError:
-                pass
+            self._ask_prices.discard(price_amount)
@@ -0,0 +1,334 @@
+import random
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections.abc import Callable
+from decimal import Decimal
+
+from src.exceptions import InvalidOrderBookError
+
+
+class PriceLadder(ABC):
+    """Ordered set of occupied price levels for one side of the book.
+
+    ``best()`` is the highest price for bids (``descending=True``) and the
+    lowest for asks. Implementations trade memory and price-range limits for
+    the cost of level creation/depletion.
+    """
+
+    def __init__(self, *, descending: bool) -> None:
+        self.descending = descending
+
+    @abstractmethod
+    def add(self, price: Decimal) -> None:
+        """Insert a price that is not yet on the ladder."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def discard(self, price: Decimal) -> None:
+        """Remove a price if present."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def best(self) -> Decimal | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def top(self, n: int) -> list[Decimal]:
+        """Return up to ``n`` prices, best first."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def check(self, price: Decimal) -> None:
+        """Raise ``InvalidOrderBookError`` if ``price`` can never be added."""
+
+
+# Called as ``factory(descending=...)``; ladder classes qualify directly.
+PriceLadderFactory = Callable[..., PriceLadder]
+
+
+class SortedListLadder(PriceLadder):
+    """Python list kept sorted best-first; O(log n) search, O(n) memmove.
+
+    Fastest for narrow books (the shift is a C ``memmove``), but level
+    creation/depletion far from the end degrades linearly with level count.
+    """
+
+    def __init__(self, *, descending: bool) -> None:
+        super().__init__(descending=descending)
+        # Stored as sort keys (negated for bids) so bisect works ascending.
+        self._keys: list[Decimal] = []
+
+    def add(self, price: Decimal) -> None:
+        key = -price if self.descending else price
+        self._keys.insert(bisect_left(self._keys, key), key)
+
+    def discard(self, price: Decimal) -> None:
+        key = -price if self.descending else price
+        i = bisect_left(self._keys, key)
+        if i < len(self._keys) and self._keys[i] == key:
+            del self._keys[i]
+
+    def best(self) -> Decimal | None:
+        if not self._keys:
+            return None
+        key = self._keys[0]
+        return -key if self.descending else key
+
+    def top(self, n: int) -> list[Decimal]:
+        keys = self._keys[:n]
+        return [-k for k in keys] if self.descending else keys
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+class _SkipNode:
+    __slots__ = ("key", "forward")
+
+    def __init__(self, key: Decimal | None, height: int) -> None:
+        self.key = key
+        self.forward: list[_SkipNode | None] = [None] * height
+
+
+class SkipListLadder(PriceLadder):
+    """Probabilistic skip list; expected O(log n) insert/delete, O(1) best."""
+
+    MAX_HEIGHT = 24
+    _P = 0.25
+
+    def __init__(self, *, descending: bool, seed: int | None = None) -> None:
+        super().__init__(descending=descending)
+        self._head = _SkipNode(None, self.MAX_HEIGHT)
+        self._height = 1
+        self._size = 0
+        self._random = random.Random(seed).random
+
+    def add(self, price: Decimal) -> None:
+        key = -price if self.descending else price
+        update = self._find_predecessors(key)
+
+        height = 1
+        rnd = self._random
+        while height < self.MAX_HEIGHT and rnd() < self._P:
+            height += 1
+        if height > self._height:
+            for level in range(self._height, height):
+                update[level] = self._head
+            self._height = height
+
+        node = _SkipNode(key, height)
+        for level in range(height):
+            node.forward[level] = update[level].forward[level]
+            update[level].forward[level] = node
+        self._size += 1
+
+    def discard(self, price: Decimal) -> None:
+        key = -price if self.descending else price
+        update = self._find_predecessors(key)
+        node = update[0].forward[0]
+        if node is None or node.key != key:
+            return
+
+        for level in range(self._height):
+            if update[level].forward[level] is not node:
+                break
+            update[level].forward[level] = node.forward[level]
+        while self._height > 1 and self._head.forward[self._height - 1] is None:
+            self._height -= 1
+        self._size -= 1
+
+    def best(self) -> Decimal | None:
+        node = self._head.forward[0]
+        if node is None:
+            return None
+        return -node.key if self.descending else node.key
+
+    def top(self, n: int) -> list[Decimal]:
+        result: list[Decimal] = []
+        node = self._head.forward[0]
+        while node is not None and len(result) < n:
+            result.append(-node.key if self.descending else node.key)
+            node = node.forward[0]
+        return result
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _find_predecessors(self, key: Decimal) -> list[_SkipNode]:
+        update: list[_SkipNode] = [self._head] * self.MAX_HEIGHT
+        node = self._head
+        for level in range(self._height - 1, -1, -1):
+            nxt = node.forward[level]
+            while nxt is not None and nxt.key < key:
+                node = nxt
+                nxt = node.forward[level]
+            update[level] = node
+        return update
+
+
+class DenseTickLadder(PriceLadder):
+    """Occupancy array indexed by tick over a fixed ``[min_price, max_price]``.
+
+    O(1) insert/delete; when the best level empties the next one is found by
+    scanning away from the touch, so cost is bounded by the gap to the next
+    occupied tick rather than by level count. Suited to instruments with
+    price bands; prices outside the band are rejected.
+    """
+
+    def __init__(
+        self,
+        *,
+        descending: bool,
+        min_price: Decimal,
+        max_price: Decimal,
+        tick_size: Decimal = Decimal("0.01"),
+    ) -> None:
+        super().__init__(descending=descending)
+        if tick_size <= 0 or max_price < min_price:
+            raise InvalidOrderBookError("Invalid price band for DenseTickLadder.")
+        self._min = Decimal(min_price)
+        self._tick = Decimal(tick_size)
+        self._slots = bytearray(int((max_price - min_price) / tick_size) + 1)
+        self._size = 0
+        self._best: int | None = None
+
+    def add(self, price: Decimal) -> None:
+        self._occupy(self._index(price))
+
+    def discard(self, price: Decimal) -> None:
+        self._vacate(self._index(price))
+
+    def best(self) -> Decimal | None:
+        if self._best is None:
+            return None
+        return self._price(self._best)
+
+    def top(self, n: int) -> list[Decimal]:
+        result: list[Decimal] = []
+        i = self._best
+        while i is not None and len(result) < n:
+            result.append(self._price(i))
+            i = self._next_occupied(i)
+        return result
+
+    def __len__(self) -> int:
+        return self._size
+
+    def check(self, price: Decimal) -> None:
+        self._index(price)
+
+    def _index(self, price: Decimal) -> int:
+        offset, rest = divmod(price - self._min, self._tick)
+        if rest or offset < 0 or offset >= len(self._slots):
+            raise InvalidOrderBookError(
+                f"Price {price} is outside the ladder band or off-tick."
+            )
+        return int(offset)
+
+    def _price(self, i: int) -> Decimal:
+        return self._min + self._tick * i
+
+    def _occupy(self, i: int) -> None:
+        if self._slots[i]:
+            return
+        self._slots[i] = 1
+        self._size += 1
+        if self._best is None or (
+            i > self._best if self.descending else i < self._best
+        ):
+            self._best = i
+
+    def _vacate(self, i: int) -> None:
+        if not self._slots[i]:
+            return
+        self._slots[i] = 0
+        self._size -= 1
+        if i == self._best:
+            self._best = self._next_occupied(i) if self._size else None
+
+    def _next_occupied(self, i: int) -> int | None:
+        # bytearray.find/rfind scan in C.
+        if self.descending:
+            j = self._slots.rfind(1, 0, i)
+        else:
+            j = self._slots.find(1, i + 1)
+        return None if j < 0 else j
+
+
+class TickLadder(DenseTickLadder):
+    """``DenseTickLadder`` over integer ticks, with a window that grows.
+
+    Prices are the tick numbers ``TickOrderBook`` keys its levels by, so
+    slot ``i`` is tick ``base + i`` with no Decimal arithmetic. Instead of a
+    configured band, the window is re-laid around the occupied ticks, at
+    least doubling, whenever a tick falls outside it; a tick more than
+    ``max_span`` ticks from the far end of the book is refused, as an
+    out-of-band price is.
+    """
+
+    def __init__(self, *, descending: bool, max_span: int = 1 << 24) -> None:
+        PriceLadder.__init__(self, descending=descending)
+        self._min = 0
+        self._tick = 1
+        self._slots = bytearray()
+        self._size = 0
+        self._best = None
+        self._max_span = max_span
+
+    def add(self, price: int) -> None:
+        i = price - self._min
+        if i < 0 or i >= len(self._slots):
+            i = self._grow(price)
+        self._occupy(i)
+
+    def discard(self, price: int) -> None:
+        i = price - self._min
+        if 0 <= i < len(self._slots):
+            self._vacate(i)
+
+    def best(self) -> int | None:
+        return None if self._best is None else self._min + self._best
+
+    def check(self, price: int) -> None:
+        if 0 <= price - self._min < len(self._slots):
+            return
+        low, high = self._span_with(price)
+        if high - low >= self._max_span:
+            raise InvalidOrderBookError(
+                f"Price tick {price} is too far from the rest of the book."
+            )
+
+    def _price(self, i: int) -> int:
+        return self._min + i
+
+    def _span_with(self, price: int) -> tuple[int, int]:
+        # Occupied ticks only; the window's empty margins don't count.
+        if not self._size:
+            return price, price
+        first = self._slots.find(1)
+        last = self._slots.rfind(1)
+        return min(self._min + first, price), max(self._min + last, price)
+
+    def _grow(self, price: int) -> int:
+        self.check(price)
+        low, high = self._span_with(price)
+        used = high - low + 1
+        new_size = min(max(used, 2 * len(self._slots), 64), self._max_span)
+        # Centre the occupied range so either side can move before regrowing.
+        new_min = low - (new_size - used) // 2
+        slots = bytearray(new_size)
+        if self._size:
+            first = self._slots.find(1)
+            last = self._slots.rfind(1)
+            at = self._min + first - new_min
+            slots[at : at + last - first + 1] = self._slots[first : last + 1]
+            self._best += self._min - new_min
+        self._min = new_min
+        self._slots = slots
+        return price - new_min
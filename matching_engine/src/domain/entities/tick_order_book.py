@@ -0,0 +1,570 @@
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+from shared.base_vo import BaseVO
+from src.domain.entities.book_state import BookState, LevelImage, trusted_vo
+from src.domain.entities.order_book import MatchResult, PriceLevelSummary
+from src.domain.entities.price_ladder import PriceLadderFactory, TickLadder
+from src.domain.entities.resting_order import RestingOrder
+from src.domain.entities.trade import Trade
+from src.domain.value_objects.currency import Currency
+from src.domain.value_objects.instrument_id import InstrumentId
+from src.domain.value_objects.money import Money
+from src.domain.value_objects.order_id import OrderId
+from src.domain.value_objects.order_side import OrderSide
+from src.domain.value_objects.order_type import OrderType
+from src.domain.value_objects.quantity import Quantity
+from src.domain.value_objects.time_in_force import TimeInForce
+from src.domain.value_objects.trade_id import TradeId
+from src.domain.value_objects.trader_id import TraderId
+from src.exceptions import InvalidOrderBookError, OrderNotInBookError
+
+DEFAULT_TICK_SIZE = Decimal("0.01")
+
+# PERF: enum member lookups are attribute accesses on the class; bind once.
+_BUY = OrderSide.BUY
+_LIMIT = OrderType.LIMIT
+_MARKET = OrderType.MARKET
+_GTC = TimeInForce.GTC
+
+_MAX_CACHED_PRICES = 65_536
+
+
+def _new_trade_id() -> TradeId:
+    # PERF: uuid4() is canonical by construction; skip the re-parse that
+    # ``TradeId.generate`` performs (it dominates per-trade cost).
+    trade_id = TradeId.__new__(TradeId)
+    BaseVO.__init__(trade_id, str(uuid.uuid4()))
+    return trade_id
+
+
+class _TickOrder:
+    """Resting order stored with plain types (ticks, ints, strs).
+
+    Also the node of its level's doubly linked FIFO (``prev``/``next``), so
+    cancel unlinks straight from ``_index`` without scanning the level.
+    """
+
+    __slots__ = (
+        "order_id",
+        "trader_id",
+        "side",
+        "order_type",
+        "time_in_force",
+        "ticks",
+        "remaining",
+        "sequence",
+        "accepted_at",
+        "order_ref",
+        "trader_ref",
+        "level",
+        "prev",
+        "next",
+    )
+
+    def __init__(
+        self,
+        order_ref: OrderId,
+        trader_ref: TraderId,
+        side: OrderSide,
+        order_type: OrderType,
+        time_in_force: TimeInForce,
+        ticks: int,
+        remaining: int,
+        sequence: int,
+        accepted_at: datetime,
+    ) -> None:
+        self.order_id: str = order_ref.value
+        self.trader_id: str = trader_ref.value
+        self.side = side
+        self.order_type = order_type
+        self.time_in_force = time_in_force
+        self.ticks = ticks
+        self.remaining = remaining
+        self.sequence = sequence
+        self.accepted_at = accepted_at
+        # Original VOs are kept only to rebuild edge objects without re-validation.
+        self.order_ref = order_ref
+        self.trader_ref = trader_ref
+        self.level: _TickLevel | None = None
+        self.prev: _TickOrder | None = None
+        self.next: _TickOrder | None = None
+
+
+class _TickLevel:
+    """FIFO of resting orders at a single tick price (intrusive linked list).
+
+    ``total_quantity`` / ``order_count`` are kept current on every mutation.
+    """
+
+    __slots__ = ("price", "head", "tail", "total_quantity", "order_count")
+
+    def __init__(self, price: Money) -> None:
+        self.price = price
+        self.head: _TickOrder | None = None
+        self.tail: _TickOrder | None = None
+        self.total_quantity = 0
+        self.order_count = 0
+
+    def append(self, order: _TickOrder) -> None:
+        order.level = self
+        if self.tail is None:
+            self.head = order
+        else:
+            order.prev = self.tail
+            self.tail.next = order
+        self.tail = order
+        self.total_quantity += order.remaining
+        self.order_count += 1
+
+    def unlink(self, order: _TickOrder) -> None:
+        if order.prev is None:
+            self.head = order.next
+        else:
+            order.prev.next = order.next
+        if order.next is None:
+            self.tail = order.prev
+        else:
+            order.next.prev = order.prev
+        order.prev = order.next = None
+        self.total_quantity -= order.remaining
+        self.order_count -= 1
+
+
+class TickOrderBook:
+    """Integer-tick limit order book for a single instrument (ADR-004).
+
+    Same public contract and matching rules as :class:`OrderBook`, but prices
+    are converted to integer ticks (``amount / tick_size``) when an order
+    enters the book. The matching loop then compares ints and mutates plain
+    slot records; VOs are only built at the edge (trades, resting/cancelled
+    orders, depth).
+
+    Data structures:
+      - ``_bids`` / ``_asks``: ticks → level.
+      - ``_bid_ticks`` / ``_ask_ticks``: ``PriceLadder`` of occupied ticks
+        (default ``TickLadder``: O(1) level creation/depletion, next best
+        found by a C scan of its occupancy array).
+      - ``_index``: order_id → resting order record, which is also its FIFO
+        node (O(1) cancel).
+    """
+
+    def __init__(
+        self,
+        instrument_id: InstrumentId,
+        tick_size: Decimal = DEFAULT_TICK_SIZE,
+        ladder_factory: PriceLadderFactory = TickLadder,
+    ) -> None:
+        tick_size = Decimal(tick_size)
+        if not tick_size.is_finite() or tick_size <= 0:
+            raise InvalidOrderBookError("Tick size must be a positive number.")
+
+        self.instrument_id = instrument_id
+        self.tick_size = tick_size
+        self._bids: dict[int, _TickLevel] = {}
+        self._asks: dict[int, _TickLevel] = {}
+        self._bid_ticks = ladder_factory(descending=True)
+        self._ask_ticks = ladder_factory(descending=False)
+        self._index: dict[str, _TickOrder] = {}
+        self._ticks_by_amount: dict[Decimal, int] = {}
+        self._sequence: int = 0
+        self._trade_sequence: int = 0
+        self._last_trade_price: Money | None = None
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def submit(
+        self,
+        order_id: OrderId,
+        trader_id: TraderId,
+        side: OrderSide,
+        order_type: OrderType,
+        time_in_force: TimeInForce,
+        quantity: Quantity,
+        limit_price: Money | None,
+        command_seq: int | None = None,
+        received_at: datetime | None = None,
+    ) -> MatchResult:
+        """Match an incoming order against the book and optionally rest residual.
+
+        ``command_seq`` and ``received_at`` make trade ids and timestamps
+        reproducible on replay, as in ``OrderBook.submit``.
+        """
+        qty = quantity.value
+        if qty == 0:
+            raise InvalidOrderBookError("Order quantity must be greater than zero.")
+
+        if order_type is _LIMIT and limit_price is None:
+            raise InvalidOrderBookError("LIMIT orders require a limit price.")
+
+        if order_type is _MARKET and limit_price is not None:
+            raise InvalidOrderBookError("MARKET orders must not specify a limit price.")
+
+        if order_id.value in self._index:
+            raise InvalidOrderBookError(
+                f"Order '{order_id.value}' is already on the book."
+            )
+
+        limit_ticks = self.to_ticks(limit_price) if limit_price is not None else None
+        if limit_ticks is not None:
+            # Reject before matching so a partial fill never fails to rest.
+            (self._bid_ticks if side is _BUY else self._ask_ticks).check(limit_ticks)
+        now = received_at if received_at is not None else datetime.now(timezone.utc)
+        trades: list[Trade] = []
+
+        if side is _BUY:
+            remaining = self._match(
+                order_id, trader_id, True, limit_ticks, qty, now, trades, command_seq
+            )
+        else:
+            remaining = self._match(
+                order_id, trader_id, False, limit_ticks, qty, now, trades, command_seq
+            )
+
+        resting: RestingOrder | None = None
+        if remaining > 0 and time_in_force is _GTC and limit_ticks is not None:
+            order = self._rest(
+                order_id,
+                trader_id,
+                side,
+                order_type,
+                time_in_force,
+                limit_price,
+                limit_ticks,
+                remaining,
+                now,
+            )
+            resting = self._to_resting(order, limit_price)
+
+        return MatchResult(
+            trades=tuple(trades),
+            resting_order=resting,
+            taker_filled_quantity=qty - remaining,
+            taker_remaining_quantity=remaining if resting is not None else 0,
+            taker_fully_filled=remaining == 0,
+        )
+
+    def cancel(self, order_id: OrderId) -> RestingOrder:
+        """Remove a resting order from the book."""
+        key = order_id.value
+        order = self._index.pop(key, None)
+        if order is None:
+            raise OrderNotInBookError(f"Order '{key}' is not on the book.")
+
+        level = order.level
+        level.unlink(order)
+        if level.head is None:
+            if order.side is _BUY:
+                del self._bids[order.ticks]
+                self._bid_ticks.discard(order.ticks)
+            else:
+                del self._asks[order.ticks]
+                self._ask_ticks.discard(order.ticks)
+
+        return self._to_resting(order, level.price)
+
+    def best_bid(self) -> Money | None:
+        best = self._bid_ticks.best()
+        return self._bids[best].price if best is not None else None
+
+    def best_ask(self) -> Money | None:
+        best = self._ask_ticks.best()
+        return self._asks[best].price if best is not None else None
+
+    @property
+    def last_trade_price(self) -> Money | None:
+        return self._last_trade_price
+
+    def depth_bids(self, levels: int = 10) -> list[tuple[Money, int]]:
+        return [
+            (self._bids[t].price, self._bids[t].total_quantity)
+            for t in self._bid_ticks.top(levels)
+        ]
+
+    def depth_asks(self, levels: int = 10) -> list[tuple[Money, int]]:
+        return [
+            (self._asks[t].price, self._asks[t].total_quantity)
+            for t in self._ask_ticks.top(levels)
+        ]
+
+    def bid_levels(self, levels: int = 10) -> list[PriceLevelSummary]:
+        """Top bid levels with aggregate quantity and order count."""
+        return [self._summarize(self._bids[t]) for t in self._bid_ticks.top(levels)]
+
+    def ask_levels(self, levels: int = 10) -> list[PriceLevelSummary]:
+        """Top ask levels with aggregate quantity and order count."""
+        return [self._summarize(self._asks[t]) for t in self._ask_ticks.top(levels)]
+
+    def order_count(self) -> int:
+        return len(self._index)
+
+    def dump_state(self) -> BookState:
+        """Capture resting orders and counters as plain types."""
+        levels = [
+            self._dump_level(side, level)
+            for side, side_levels in (("BUY", self._bids), ("SELL", self._asks))
+            for level in side_levels.values()
+        ]
+        last = self._last_trade_price
+        return BookState(
+            instrument_id=self.instrument_id.value,
+            sequence=self._sequence,
+            trade_sequence=self._trade_sequence,
+            last_trade_price=str(last.amount) if last is not None else None,
+            last_trade_currency=last.currency.value if last is not None else None,
+            levels=levels,
+        )
+
+    def restore_state(self, state: BookState) -> None:
+        """Load a ``dump_state`` image into this (empty) book."""
+        if self._index:
+            raise InvalidOrderBookError("Can only restore state into an empty book.")
+        if state.instrument_id != self.instrument_id.value:
+            raise InvalidOrderBookError(
+                f"State belongs to instrument '{state.instrument_id}'."
+            )
+
+        # PERF: see OrderBook.restore_state.
+        traders: dict[str, TraderId] = {}
+        order_types = {t.value: t for t in OrderType}
+        tifs = {t.value: t for t in TimeInForce}
+        index = self._index
+        for image in state.levels:
+            side = OrderSide(image.side)
+            price = Money(Decimal(image.price), Currency(image.currency))
+            ticks = self.to_ticks(price)
+            if side is _BUY:
+                levels, ladder = self._bids, self._bid_ticks
+            else:
+                levels, ladder = self._asks, self._ask_ticks
+
+            level = levels[ticks] = _TickLevel(price)
+            ladder.add(ticks)
+            for (
+                order_id,
+                trader_id,
+                order_type,
+                tif,
+                remaining,
+                seq,
+                ts,
+            ) in image.orders:
+                trader = traders.get(trader_id)
+                if trader is None:
+                    trader = traders[trader_id] = trusted_vo(TraderId, trader_id)
+                order = _TickOrder(
+                    trusted_vo(OrderId, order_id),
+                    trader,
+                    side,
+                    order_types[order_type],
+                    tifs[tif],
+                    ticks,
+                    remaining,
+                    seq,
+                    datetime.fromtimestamp(ts, timezone.utc),
+                )
+                level.append(order)
+                index[order_id] = order
+
+        self._sequence = state.sequence
+        self._trade_sequence = state.trade_sequence
+        if state.last_trade_price is not None:
+            self._last_trade_price = Money(
+                Decimal(state.last_trade_price),
+                Currency(state.last_trade_currency),
+            )
+
+    def to_ticks(self, price: Money) -> int:
+        """Convert a price to an integer number of ticks.
+
+        Raises:
+            InvalidOrderBookError: If the price is not a multiple of the tick size.
+        """
+        amount = price.amount
+        ticks = self._ticks_by_amount.get(amount)
+        if ticks is not None:
+            return ticks
+
+        whole, rest = divmod(amount, self.tick_size)
+        if rest:
+            raise InvalidOrderBookError(
+                f"Price {amount} is not a multiple of tick size {self.tick_size}."
+            )
+        if len(self._ticks_by_amount) >= _MAX_CACHED_PRICES:
+            self._ticks_by_amount.clear()
+        ticks = self._ticks_by_amount[amount] = int(whole)
+        return ticks
+
+    # ------------------------------------------------------------------
+    # Matching
+    # ------------------------------------------------------------------
+
+    def _match(
+        self,
+        taker_id: OrderId,
+        taker_trader: TraderId,
+        taker_is_buy: bool,
+        limit_ticks: int | None,
+        remaining: int,
+        executed_at: datetime,
+        trades: list[Trade],
+        command_seq: int | None = None,
+    ) -> int:
+        if taker_is_buy:
+            levels, ladder = self._asks, self._ask_ticks
+        else:
+            levels, ladder = self._bids, self._bid_ticks
+
+        taker_key = taker_trader.value
+        index = self._index
+        instrument_id = self.instrument_id
+
+        best = ladder.best()
+        while remaining > 0 and best is not None:
+            if limit_ticks is not None and (
+                best > limit_ticks if taker_is_buy else best < limit_ticks
+            ):
+                break
+
+            level = levels[best]
+            price = level.price
+            while remaining > 0 and level.head is not None:
+                maker = level.head
+
+                # Self-trade prevention: skip same-trader resting orders.
+                if maker.trader_id == taker_key:
+                    level.unlink(maker)
+                    del index[maker.order_id]
+                    continue
+
+                fill_qty = remaining if remaining < maker.remaining else maker.remaining
+
+                self._trade_sequence += 1
+                trades.append(
+                    Trade(
+                        id=(
+                            _new_trade_id()
+                            if command_seq is None
+                            else TradeId.derive(
+                                command_seq, taker_id.value, len(trades)
+                            )
+                        ),
+                        maker_order_id=maker.order_ref,
+                        taker_order_id=taker_id,
+                        buyer_id=taker_trader if taker_is_buy else maker.trader_ref,
+                        seller_id=maker.trader_ref if taker_is_buy else taker_trader,
+                        instrument_id=instrument_id,
+                        quantity=Quantity(fill_qty),
+                        execution_price=price,
+                        sequence_number=self._trade_sequence,
+                        executed_at=executed_at,
+                    )
+                )
+                self._last_trade_price = price
+
+                maker.remaining -= fill_qty
+                level.total_quantity -= fill_qty
+                remaining -= fill_qty
+
+                if maker.remaining == 0:
+                    level.unlink(maker)
+                    del index[maker.order_id]
+
+            if level.head is None:
+                del levels[best]
+                ladder.discard(best)
+                best = ladder.best()
+
+        return remaining
+
+    # ------------------------------------------------------------------
+    # Rest / edge helpers
+    # ------------------------------------------------------------------
+
+    def _rest(
+        self,
+        order_id: OrderId,
+        trader_id: TraderId,
+        side: OrderSide,
+        order_type: OrderType,
+        time_in_force: TimeInForce,
+        price: Money,
+        ticks: int,
+        remaining: int,
+        accepted_at: datetime,
+    ) -> _TickOrder:
+        self._sequence += 1
+        order = _TickOrder(
+            order_ref=order_id,
+            trader_ref=trader_id,
+            side=side,
+            order_type=order_type,
+            time_in_force=time_in_force,
+            ticks=ticks,
+            remaining=remaining,
+            sequence=self._sequence,
+            accepted_at=accepted_at,
+        )
+
+        if side is _BUY:
+            levels, ladder = self._bids, self._bid_ticks
+        else:
+            levels, ladder = self._asks, self._ask_ticks
+
+        level = levels.get(ticks)
+        if level is None:
+            level = _TickLevel(price)
+            levels[ticks] = level
+            ladder.add(ticks)
+
+        level.append(order)
+        self._index[order.order_id] = order
+        return order
+
+    @staticmethod
+    def _dump_level(side: str, level: _TickLevel) -> LevelImage:
+        orders = []
+        order = level.head
+        while order is not None:
+            orders.append(
+                (
+                    order.order_id,
+                    order.trader_id,
+                    order.order_type.value,
+                    order.time_in_force.value,
+                    order.remaining,
+                    order.sequence,
+                    order.accepted_at.timestamp(),
+                )
+            )
+            order = order.next
+        return LevelImage(
+            side=side,
+            price=str(level.price.amount),
+            currency=level.price.currency.value,
+            orders=orders,
+        )
+
+    @staticmethod
+    def _summarize(level: _TickLevel) -> PriceLevelSummary:
+        return PriceLevelSummary(
+            price=level.price,
+            quantity=level.total_quantity,
+            order_count=level.order_count,
+        )
+
+    def _to_resting(self, order: _TickOrder, price: Money) -> RestingOrder:
+        return RestingOrder(
+            order_id=order.order_ref,
+            trader_id=order.trader_ref,
+            instrument_id=self.instrument_id,
+            side=order.side,
+            order_type=order.order_type,
+            time_in_force=order.time_in_force,
+            price=price,
+            remaining_quantity=Quantity(order.remaining),
+            sequence=order.sequence,
+            accepted_at=order.accepted_at,
+        )
@@ -47,9 +47,11 @@ class Trade(Entity):
         quantity: Quantity,
         execution_price: Money,
         sequence_number: int,
+        id: TradeId | None = None,
+        executed_at: datetime | None = None,
     ) -> "Trade":
         return cls(
-            id=TradeId.generate(),
+            id=id if id is not None else TradeId.generate(),
             maker_order_id=maker_order_id,
             taker_order_id=taker_order_id,
             buyer_id=buyer_id,
@@ -58,5 +60,7 @@ class Trade(Entity):
             quantity=quantity,
             execution_price=execution_price,
             sequence_number=sequence_number,
-            executed_at=datetime.now(timezone.utc),
+            executed_at=(
+                executed_at if executed_at is not None else datetime.now(timezone.utc)
+            ),
         )
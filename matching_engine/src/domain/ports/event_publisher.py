@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 
 from src.domain.events.matching_events import DomainEvent
 
@@ -9,3 +10,8 @@ class EventPublisher(ABC):
     @abstractmethod
     async def publish(self, event: DomainEvent) -> None:
         raise NotImplementedError
+
+    async def publish_many(self, events: Sequence[DomainEvent]) -> None:
+        """Publish ``events`` in order; adapters may pipeline the batch."""
+        for event in events:
+            await self.publish(event)
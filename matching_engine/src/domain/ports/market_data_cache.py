@@ -1,8 +1,33 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from dataclasses import dataclass
 from decimal import Decimal
 
 from src.domain.value_objects.instrument_id import InstrumentId
 
+# (side "bid" | "ask", price, new aggregate quantity; 0 removes the level)
+LevelChange = tuple[str, Decimal, int]
+
+
+@dataclass(frozen=True, slots=True)
+class MarketDataSnapshot:
+    """Visible depth and last trade price of one book at a point in time.
+
+    ``sequence`` increases with every write of the book; ``changes`` holds
+    the per-level deltas against the write at ``previous_sequence`` (``0``
+    when there is none, which tells delta readers to resync from the
+    snapshot).
+    """
+
+    instrument_id: InstrumentId
+    bids: list[tuple[Decimal, int]]
+    asks: list[tuple[Decimal, int]]
+    last_trade_price: Decimal | None
+    last_trade_currency: str | None
+    sequence: int | None = None
+    previous_sequence: int = 0
+    changes: list[LevelChange] | None = None
+
 
 class MarketDataCache(ABC):
     """Outbound port for writing order-book snapshots and last trade price."""
@@ -26,3 +51,23 @@ class MarketDataCache(ABC):
         last_trade_currency: str | None,
     ) -> None:
         raise NotImplementedError
+
+    async def write_snapshots(self, snapshots: Sequence[MarketDataSnapshot]) -> None:
+        """Write LTP (if any) and depth for each snapshot; adapters may batch.
+
+        Adapters without a delta stream ignore ``changes``.
+        """
+        for snapshot in snapshots:
+            if snapshot.last_trade_price is not None:
+                await self.write_last_trade_price(
+                    snapshot.instrument_id,
+                    snapshot.last_trade_price,
+                    snapshot.last_trade_currency,
+                )
+            await self.write_book_snapshot(
+                snapshot.instrument_id,
+                snapshot.bids,
+                snapshot.asks,
+                snapshot.last_trade_price,
+                snapshot.last_trade_currency,
+            )
@@ -1,16 +1,24 @@
 from abc import ABC, abstractmethod
 
 from src.domain.entities.order_book import OrderBook
+from src.domain.entities.tick_order_book import TickOrderBook
 from src.domain.value_objects.instrument_id import InstrumentId
 
+# Both engines expose the same public book API (submit/cancel/depth/...).
+MatchingBook = OrderBook | TickOrderBook
+
 
 class OrderBookRegistry(ABC):
     """Provides the in-memory order book for a given instrument."""
 
     @abstractmethod
-    def get_or_create(self, instrument_id: InstrumentId) -> OrderBook:
+    def get_or_create(self, instrument_id: InstrumentId) -> MatchingBook:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get(self, instrument_id: InstrumentId) -> MatchingBook | None:
         raise NotImplementedError
 
     @abstractmethod
-    def get(self, instrument_id: InstrumentId) -> OrderBook | None:
+    def books(self) -> list[MatchingBook]:
         raise NotImplementedError
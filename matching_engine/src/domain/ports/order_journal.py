@@ -0,0 +1,55 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from decimal import Decimal
+
+
+class OrderJournal(ABC):
+    """Outbound port for the write-ahead log of accepted book commands.
+
+    ``record_*`` buffers the command before the book is mutated; ``sync``
+    waits until every command recorded so far is durable, and must complete
+    before any outcome of those commands is published or acknowledged.
+    ``record_emitted`` notes that a command's events were published (or
+    that it had none), so recovery re-publishes only what never went out.
+    """
+
+    @property
+    @abstractmethod
+    def last_seq(self) -> int:
+        """Sequence of the most recently recorded command."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def record_open(
+        self,
+        order_id: str,
+        trader_id: str,
+        instrument_id: str,
+        side: str,
+        order_type: str,
+        time_in_force: str,
+        quantity: int,
+        limit_price: Decimal | None,
+        limit_price_currency: str | None,
+        received_at: datetime | None = None,
+    ) -> bool:
+        """Record an incoming order; ``False`` if it was already journaled.
+
+        ``received_at`` is replayed with the command so trades are restamped
+        with the same time.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def record_cancel(self, order_id: str, instrument_id: str) -> bool:
+        """Record a cancel; ``False`` if it was already journaled."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def record_emitted(self, seq: int) -> None:
+        """Mark the output of the command recorded at ``seq`` as emitted."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def sync(self) -> None:
+        raise NotImplementedError
@@ -1,9 +1,23 @@
+import uuid
+
 from shared.id_vo import ID
 from src.exceptions import InvalidTradeIdError
 
+_DERIVED_NAMESPACE = uuid.UUID("0b6c3f5e-4d1a-4c55-9f1e-6a7d2c8e9b40")
+
 
 class TradeId(ID):
     """Unique identifier of a trade."""
 
     def __init__(self, value: str) -> None:
         super().__init__(value, InvalidTradeIdError)
+
+    @classmethod
+    def derive(cls, *parts: object) -> "TradeId":
+        """Deterministic id for ``parts``: the same parts give the same id.
+
+        Hashed with UUIDv5, then stamped as v4 so it passes the same format
+        checks as generated ids.
+        """
+        digest = uuid.uuid5(_DERIVED_NAMESPACE, ":".join(map(str, parts)))
+        return cls(str(uuid.UUID(bytes=digest.bytes, version=4)))
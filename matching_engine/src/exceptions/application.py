@@ -10,3 +10,7 @@ class UnknownInstrumentError(ApplicationError):
 
 class InvalidIncomingOrderError(ApplicationError):
     pass
+
+
+class DuplicateCommandError(ApplicationError):
+    pass
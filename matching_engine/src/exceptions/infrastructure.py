@@ -30,3 +30,11 @@ class CacheConnectionError(CacheError):
 
 class CacheOperationError(CacheError):
     pass
+
+
+class JournalError(InfrastructureError):
+    pass
+
+
+class SnapshotError(InfrastructureError):
+    pass
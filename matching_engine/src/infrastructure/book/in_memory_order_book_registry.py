@@ -1,21 +1,36 @@
+from collections.abc import Callable
+
 from src.domain.entities.order_book import OrderBook
-from src.domain.ports.order_book_registry import OrderBookRegistry
+from src.domain.ports.order_book_registry import MatchingBook, OrderBookRegistry
 from src.domain.value_objects.instrument_id import InstrumentId
 
 
 class InMemoryOrderBookRegistry(OrderBookRegistry):
-    """Process-local registry of order books keyed by instrument."""
+    """Process-local registry of order books keyed by instrument.
+
+    Args:
+        book_factory: Builds the book for a new instrument. Defaults to the
+            Decimal-keyed ``OrderBook``; pass a ``TickOrderBook`` factory to
+            use the integer-tick engine.
+    """
 
-    def __init__(self) -> None:
-        self._books: dict[str, OrderBook] = {}
+    def __init__(
+        self,
+        book_factory: Callable[[InstrumentId], MatchingBook] = OrderBook,
+    ) -> None:
+        self._book_factory = book_factory
+        self._books: dict[str, MatchingBook] = {}
 
-    def get_or_create(self, instrument_id: InstrumentId) -> OrderBook:
+    def get_or_create(self, instrument_id: InstrumentId) -> MatchingBook:
         key = instrument_id.value
         book = self._books.get(key)
         if book is None:
-            book = OrderBook(instrument_id)
+            book = self._book_factory(instrument_id)
             self._books[key] = book
         return book
 
-    def get(self, instrument_id: InstrumentId) -> OrderBook | None:
+    def get(self, instrument_id: InstrumentId) -> MatchingBook | None:
         return self._books.get(instrument_id.value)
+
+    def books(self) -> list[MatchingBook]:
+        return list(self._books.values())
@@ -1,24 +1,35 @@
 import json
 import logging
+from collections.abc import Sequence
 from decimal import Decimal
 
-from src.domain.ports.market_data_cache import MarketDataCache
+from src.domain.ports.market_data_cache import MarketDataCache, MarketDataSnapshot
 from src.domain.value_objects.instrument_id import InstrumentId
 from src.exceptions import CacheConnectionError, CacheOperationError
 
 logger = logging.getLogger(__name__)
 
+# Pub/sub channel announcing which instruments were just rewritten.
+UPDATES_CHANNEL = "md:updates"
+
 
 class RedisMarketDataCache(MarketDataCache):
     """Writes last-trade price and book snapshots to Redis.
 
     Keys:
       - ``md:ltp:{instrument_id}`` → JSON ``{price, currency}``
-      - ``md:book:{instrument_id}`` → JSON snapshot
+      - ``md:book:{instrument_id}`` → JSON snapshot (with ``sequence`` when
+        written through ``write_snapshots``)
+      - ``md:deltas:{instrument_id}`` → stream of per-level deltas, one entry
+        per book sequence, capped at about ``delta_stream_maxlen`` entries
+
+    ``write_snapshots`` also publishes the rewritten instrument ids on
+    ``md:updates`` so readers can drop cached copies.
     """
 
-    def __init__(self, url: str) -> None:
+    def __init__(self, url: str, delta_stream_maxlen: int = 10_000) -> None:
         self._url = url
+        self._delta_stream_maxlen = delta_stream_maxlen
         self._client = None
 
     async def connect(self) -> None:
@@ -69,16 +80,8 @@ class RedisMarketDataCache(MarketDataCache):
     ) -> None:
         client = await self._ensure_client()
         key = f"md:book:{instrument_id.value}"
-        payload = json.dumps(
-            {
-                "instrument_id": instrument_id.value,
-                "bids": [[str(p), q] for p, q in bids],
-                "asks": [[str(p), q] for p, q in asks],
-                "last_trade_price": (
-                    str(last_trade_price) if last_trade_price is not None else None
-                ),
-                "last_trade_currency": last_trade_currency,
-            }
+        payload = self._book_payload(
+            instrument_id, bids, asks, last_trade_price, last_trade_currency
         )
         try:
             await client.set(key, payload)
@@ -86,6 +89,92 @@ class RedisMarketDataCache(MarketDataCache):
             logger.exception("Failed to write book snapshot key=%s", key)
             raise CacheOperationError(f"Failed to write book snapshot: {exc}") from exc
 
+    async def write_snapshots(self, snapshots: Sequence[MarketDataSnapshot]) -> None:
+        """Write every snapshot's LTP and book keys with a single ``MSET``.
+
+        Delta stream entries are appended and the ``md:updates`` notice is
+        published in the same ``MULTI``, so a reader never sees a snapshot
+        ahead of its deltas or misses the notice for it.
+        """
+        if not snapshots:
+            return
+        client = await self._ensure_client()
+        mapping: dict[str, str] = {}
+        for snapshot in snapshots:
+            instrument = snapshot.instrument_id.value
+            if snapshot.last_trade_price is not None:
+                mapping[f"md:ltp:{instrument}"] = json.dumps(
+                    {
+                        "price": str(snapshot.last_trade_price),
+                        "currency": snapshot.last_trade_currency,
+                    }
+                )
+            mapping[f"md:book:{instrument}"] = self._book_payload(
+                snapshot.instrument_id,
+                snapshot.bids,
+                snapshot.asks,
+                snapshot.last_trade_price,
+                snapshot.last_trade_currency,
+                snapshot.sequence,
+            )
+        try:
+            pipe = client.pipeline(transaction=True)
+            pipe.mset(mapping)
+            for snapshot in snapshots:
+                if snapshot.changes is not None:
+                    pipe.xadd(
+                        f"md:deltas:{snapshot.instrument_id.value}",
+                        self._delta_fields(snapshot),
+                        maxlen=self._delta_stream_maxlen,
+                        approximate=True,
+                    )
+            pipe.publish(
+                UPDATES_CHANNEL,
+                json.dumps([snapshot.instrument_id.value for snapshot in snapshots]),
+            )
+            await pipe.execute()
+        except Exception as exc:
+            logger.exception("Failed to write %s market data keys", len(mapping))
+            raise CacheOperationError(f"Failed to write snapshots: {exc}") from exc
+
+    @staticmethod
+    def _book_payload(
+        instrument_id: InstrumentId,
+        bids: list[tuple[Decimal, int]],
+        asks: list[tuple[Decimal, int]],
+        last_trade_price: Decimal | None,
+        last_trade_currency: str | None,
+        sequence: int | None = None,
+    ) -> str:
+        payload = {
+            "instrument_id": instrument_id.value,
+            "bids": [[str(p), q] for p, q in bids],
+            "asks": [[str(p), q] for p, q in asks],
+            "last_trade_price": (
+                str(last_trade_price) if last_trade_price is not None else None
+            ),
+            "last_trade_currency": last_trade_currency,
+        }
+        if sequence is not None:
+            payload["sequence"] = sequence
+        return json.dumps(payload)
+
+    @staticmethod
+    def _delta_fields(snapshot: MarketDataSnapshot) -> dict[str, str]:
+        return {
+            "sequence": str(snapshot.sequence),
+            "previous": str(snapshot.previous_sequence),
+            "changes": json.dumps(
+                [[side, str(price), qty] for side, price, qty in snapshot.changes]
+            ),
+            "last_trade_price": (
+                str(snapshot.last_trade_price)
+                if snapshot.last_trade_price is not None
+                else ""
+            ),
+            "last_trade_currency": snapshot.last_trade_currency or "",
+        }
+
     async def _ensure_client(self):
         if self._client is None:
             await self.connect()
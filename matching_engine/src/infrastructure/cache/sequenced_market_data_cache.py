@@ -0,0 +1,61 @@
+import asyncio
+from collections.abc import Sequence
+from decimal import Decimal
+
+from src.domain.ports.market_data_cache import MarketDataCache, MarketDataSnapshot
+from src.domain.value_objects.instrument_id import InstrumentId
+from src.infrastructure.cache.snapshot_writer import SnapshotSequencer
+
+
+class SequencedMarketDataCache(MarketDataCache):
+    """Writes snapshots through ``cache`` immediately, sequenced and with
+    level deltas, the same way ``CoalescingSnapshotWriter`` does for the
+    pipeline. Used by the inline (non-pipelined) handlers so delta readers
+    get ``md:deltas:*`` and ``md:updates`` whichever path wrote the book.
+
+    Snapshots whose depth and last trade price are unchanged are skipped.
+    Writes are serialized so each one's ``previous_sequence`` is the write
+    before it.
+    """
+
+    def __init__(self, cache: MarketDataCache) -> None:
+        self._cache = cache
+        self._sequencer = SnapshotSequencer()
+        self._lock = asyncio.Lock()
+
+    async def write_last_trade_price(
+        self,
+        instrument_id: InstrumentId,
+        price: Decimal,
+        currency: str,
+    ) -> None:
+        await self._cache.write_last_trade_price(instrument_id, price, currency)
+
+    async def write_book_snapshot(
+        self,
+        instrument_id: InstrumentId,
+        bids: list[tuple[Decimal, int]],
+        asks: list[tuple[Decimal, int]],
+        last_trade_price: Decimal | None,
+        last_trade_currency: str | None,
+    ) -> None:
+        await self.write_snapshots(
+            [
+                MarketDataSnapshot(
+                    instrument_id, bids, asks, last_trade_price, last_trade_currency
+                )
+            ]
+        )
+
+    async def write_snapshots(self, snapshots: Sequence[MarketDataSnapshot]) -> None:
+        async with self._lock:
+            stamped = []
+            for snapshot in snapshots:
+                snapshot = self._sequencer.stamp(snapshot)
+                if snapshot is not None:
+                    stamped.append(snapshot)
+            if not stamped:
+                return
+            await self._cache.write_snapshots(stamped)
+            for snapshot in stamped:
+                self._sequencer.written(snapshot)
@@ -0,0 +1,166 @@
+import asyncio
+import dataclasses
+import logging
+import time
+from decimal import Decimal
+
+from src.application.command_output import book_snapshot
+from src.domain.ports.market_data_cache import (
+    LevelChange,
+    MarketDataCache,
+    MarketDataSnapshot,
+)
+from src.domain.ports.order_book_registry import MatchingBook
+
+logger = logging.getLogger(__name__)
+
+# (bids, asks, last_trade_price, last_trade_currency) as last written.
+_Fingerprint = tuple[
+    list[tuple[Decimal, int]], list[tuple[Decimal, int]], Decimal | None, str | None
+]
+
+
+def level_changes(
+    previous: list[tuple[Decimal, int]], current: list[tuple[Decimal, int]], side: str
+) -> list[LevelChange]:
+    """Per-level deltas turning ``previous`` visible depth into ``current``."""
+    before = dict(previous)
+    changes = [(side, price, qty) for price, qty in current if before.get(price) != qty]
+    now = {price for price, _ in current}
+    changes.extend((side, price, 0) for price in before if price not in now)
+    return changes
+
+
+class SnapshotSequencer:
+    """Stamps book snapshots with a ``sequence`` and the level changes since
+    the previous write of the same book.
+
+    Sequences come from one counter seeded with the wall clock in
+    microseconds, so they keep increasing across restarts; the first write of
+    a book after a restart has no ``previous_sequence`` and makes readers
+    resync from the snapshot. ``stamp`` returns ``None`` when neither the
+    visible depth nor the last trade price changed since the last
+    ``written`` snapshot.
+    """
+
+    def __init__(self) -> None:
+        self._written: dict[str, tuple[_Fingerprint, int]] = {}
+        self._sequence = time.time_ns() // 1000
+
+    def stamp(self, snapshot: MarketDataSnapshot) -> MarketDataSnapshot | None:
+        last, previous_sequence = self._written.get(
+            snapshot.instrument_id.value, (None, 0)
+        )
+        if last == _fingerprint(snapshot):
+            return None
+        last_bids, last_asks = (last[0], last[1]) if last is not None else ([], [])
+        self._sequence += 1
+        return dataclasses.replace(
+            snapshot,
+            sequence=self._sequence,
+            previous_sequence=previous_sequence,
+            changes=level_changes(last_bids, snapshot.bids, "bid")
+            + level_changes(last_asks, snapshot.asks, "ask"),
+        )
+
+    def written(self, snapshot: MarketDataSnapshot) -> None:
+        """Record a stamped snapshot as the base for the book's next deltas."""
+        self._written[snapshot.instrument_id.value] = (
+            _fingerprint(snapshot),
+            snapshot.sequence,
+        )
+
+
+def _fingerprint(snapshot: MarketDataSnapshot) -> _Fingerprint:
+    return (
+        snapshot.bids,
+        snapshot.asks,
+        snapshot.last_trade_price,
+        snapshot.last_trade_currency,
+    )
+
+
+class CoalescingSnapshotWriter:
+    """Rate-limited, coalescing writer of book snapshots to the market data cache.
+
+    ``mark_dirty`` only records the book (latest wins). A flusher task wakes on
+    the first dirty book, writes every dirty book whose visible depth or last
+    trade price differs from what it last wrote with one ``write_snapshots``
+    call (one ``MSET`` on Redis), then sleeps ``flush_interval`` seconds, so
+    each instrument is written at most once per interval. Orders that only
+    change levels below the top ``levels`` are never written.
+
+    Each write carries a book ``sequence`` and the per-level changes since
+    the previous write, for delta readers (see ``SnapshotSequencer``).
+    """
+
+    def __init__(
+        self,
+        cache: MarketDataCache,
+        flush_interval: float = 0.05,
+        levels: int = 10,
+    ) -> None:
+        self._cache = cache
+        self._flush_interval = flush_interval
+        self._levels = levels
+        self._dirty: dict[str, MatchingBook] = {}
+        self._sequencer = SnapshotSequencer()
+        self._wake = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self.flushes = 0
+        self.written = 0
+        self.skipped = 0
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._flush_loop(), name="snapshot-writer")
+
+    async def stop(self) -> None:
+        """Stop the flusher and write whatever is still dirty."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await self.flush()
+
+    def mark_dirty(self, book: MatchingBook) -> None:
+        self._dirty[book.instrument_id.value] = book
+        self._wake.set()
+
+    def pending(self) -> int:
+        return len(self._dirty)
+
+    async def flush(self) -> int:
+        """Write changed dirty books now; returns how many were written."""
+        books, self._dirty = self._dirty, {}
+        changed: list[MarketDataSnapshot] = []
+        for book in books.values():
+            snapshot = self._sequencer.stamp(book_snapshot(book, self._levels))
+            if snapshot is None:
+                self.skipped += 1
+                continue
+            changed.append(snapshot)
+        if not changed:
+            return 0
+
+        try:
+            await self._cache.write_snapshots(changed)
+        except Exception:
+            logger.exception("Market data flush of %s books failed", len(changed))
+            # Retry on the next pass unless a newer change is already queued.
+            for instrument, book in books.items():
+                self._dirty.setdefault(instrument, book)
+            self._wake.set()
+            return 0
+
+        for snapshot in changed:
+            self._sequencer.written(snapshot)
+        self.flushes += 1
+        self.written += len(changed)
+        return len(changed)
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await self._wake.wait()
+            self._wake.clear()
+            await self.flush()
+            await asyncio.sleep(self._flush_interval)
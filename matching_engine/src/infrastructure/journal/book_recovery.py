@@ -0,0 +1,184 @@
+import asyncio
+import gc
+import logging
+import time
+from dataclasses import dataclass
+
+from src.application.cancel_resting_order import (
+    CancelRestingOrderCommand,
+    CancelRestingOrderHandler,
+)
+from src.application.command_output import CommandOutput
+from src.application.process_incoming_order import ProcessIncomingOrderHandler
+from src.domain.ports.event_publisher import EventPublisher
+from src.domain.ports.order_book_registry import OrderBookRegistry
+from src.domain.value_objects.instrument_id import InstrumentId
+from src.exceptions import ApplicationError, DomainError, SnapshotError
+from src.infrastructure.journal.book_snapshot_store import BookSnapshotStore
+from src.infrastructure.journal.file_order_journal import (
+    FileOrderJournal,
+    OutputEmitted,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class RecoveryStats:
+    snapshot_seq: int
+    books: int
+    resting_orders: int
+    replayed: int
+    rejected: int
+    unpublished: int
+    seconds: float
+
+
+class BookRecovery:
+    """Rebuilds books from the latest snapshot plus the journal tail, and
+    writes periodic checkpoints.
+
+    Replay goes through the handlers' ``replay`` path (same validation and
+    matching, no publishing); replayed trades get the same ids and times as
+    the original match, so republished output is recognised downstream. Commands that failed live, e.g. a cancel for
+    an order that had already filled, fail again and are counted as
+    ``rejected``. Replayed commands with no ``OutputEmitted`` marker, i.e.
+    journaled but never published before the crash, keep their output for
+    ``republish``; their redelivery is otherwise only seen as a duplicate.
+    """
+
+    def __init__(
+        self,
+        registry: OrderBookRegistry,
+        journal: FileOrderJournal,
+        snapshot_store: BookSnapshotStore,
+        process_handler: ProcessIncomingOrderHandler,
+        cancel_handler: CancelRestingOrderHandler,
+        emit_timeout: float = 30.0,
+    ) -> None:
+        self._registry = registry
+        self._journal = journal
+        self._store = snapshot_store
+        self._process_handler = process_handler
+        self._cancel_handler = cancel_handler
+        self._emit_timeout = emit_timeout
+        self._unpublished: dict[int, CommandOutput] = {}
+
+    def recover(self) -> RecoveryStats:
+        """Restore the latest snapshot and replay the journal after it.
+
+        The cyclic GC is paused while millions of long-lived book objects are
+        allocated (it would otherwise rescan them repeatedly), and the
+        recovered heap is then frozen so later collections skip it.
+        """
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            stats = self._recover()
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        gc.freeze()
+        return stats
+
+    def _recover(self) -> RecoveryStats:
+        started = time.perf_counter()
+        snapshot_seq = 0
+        snapshot = self._store.load_latest()
+        if snapshot is not None:
+            snapshot_seq, states = snapshot
+            for state in states:
+                book = self._registry.get_or_create(InstrumentId(state.instrument_id))
+                book.restore_state(state)
+
+        # Markers follow their command closely, so this stays small.
+        unpublished = self._unpublished
+        replayed = rejected = 0
+        for seq, entry in self._journal.replay(after_seq=snapshot_seq, markers=True):
+            if isinstance(entry, OutputEmitted):
+                unpublished.pop(entry.seq, None)
+                continue
+            try:
+                if isinstance(entry, CancelRestingOrderCommand):
+                    output = self._cancel_handler.replay(entry)
+                else:
+                    output = self._process_handler.replay(entry, seq)
+                replayed += 1
+            except (DomainError, ApplicationError):
+                rejected += 1
+                continue
+            if output.events:
+                unpublished[seq] = output
+
+        books = self._registry.books()
+        stats = RecoveryStats(
+            snapshot_seq=snapshot_seq,
+            books=len(books),
+            resting_orders=sum(book.order_count() for book in books),
+            replayed=replayed,
+            rejected=rejected,
+            unpublished=len(unpublished),
+            seconds=time.perf_counter() - started,
+        )
+        logger.info(
+            "Books recovered: snapshot_seq=%s books=%s resting=%s "
+            "replayed=%s rejected=%s unpublished=%s in %.2fs",
+            stats.snapshot_seq,
+            stats.books,
+            stats.resting_orders,
+            stats.replayed,
+            stats.rejected,
+            stats.unpublished,
+            stats.seconds,
+        )
+        return stats
+
+    async def republish(self, publisher: EventPublisher) -> int:
+        """Publish the output of recovered commands that never went out.
+
+        Call after ``recover`` and before consuming. A crash between a
+        publish and its marker becoming durable republishes that output
+        again, so delivery is at least once.
+        """
+        count = 0
+        for seq in sorted(self._unpublished):
+            await publisher.publish_many(self._unpublished[seq].events)
+            self._journal.record_emitted(seq)
+            del self._unpublished[seq]
+            count += 1
+        if count:
+            await self._journal.sync()
+            logger.info("Republished output of %s recovered commands", count)
+        return count
+
+    async def checkpoint(self) -> int:
+        """Snapshot every book and prune journal segments no longer needed.
+
+        Book state is captured synchronously (between two commands) together
+        with the journal sequence it reflects; serialisation and the write run
+        in a worker thread. The snapshot is only written once every command
+        it covers has had its output emitted, since recovery never replays
+        (or re-publishes) what a snapshot includes. One snapshot interval of
+        journal is kept behind the newest snapshot so redelivered commands
+        are still recognised.
+        """
+        journal_seq = self._journal.last_seq
+        states = [book.dump_state() for book in self._registry.books()]
+        await self._journal.sync()
+        try:
+            await asyncio.wait_for(
+                self._journal.wait_emitted(journal_seq), self._emit_timeout
+            )
+        except asyncio.TimeoutError as exc:
+            raise SnapshotError(
+                f"Checkpoint at seq={journal_seq} skipped: output still unpublished."
+            ) from exc
+        await asyncio.to_thread(self._store.save, journal_seq, states)
+
+        sequences = self._store.sequences()
+        if len(sequences) > 1:
+            self._journal.prune(sequences[-2])
+        logger.info(
+            "Checkpoint written: journal_seq=%s books=%s", journal_seq, len(states)
+        )
+        return journal_seq
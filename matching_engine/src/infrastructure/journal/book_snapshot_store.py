@@ -0,0 +1,74 @@
+import logging
+import os
+import pickle
+from pathlib import Path
+
+from src.domain.entities.book_state import BookState
+from src.exceptions import SnapshotError
+
+logger = logging.getLogger(__name__)
+
+_MAGIC = b"MESNAP1\n"
+_PREFIX = "snapshot-"
+_SUFFIX = ".bin"
+
+
+class BookSnapshotStore:
+    """Binary snapshots of every book, tagged with the journal seq they cover.
+
+    Files are written atomically (temp file, fsync, rename) and only ever read
+    back by the engine that wrote them; they are pickles, so never point
+    ``directory`` at untrusted data. The newest ``keep`` snapshots are kept so
+    a corrupt latest file falls back to the previous one.
+    """
+
+    def __init__(self, directory: str | Path, keep: int = 2) -> None:
+        self._directory = Path(directory)
+        self._keep = keep
+
+    def save(self, journal_seq: int, states: list[BookState]) -> Path:
+        self._directory.mkdir(parents=True, exist_ok=True)
+        path = self._directory / f"{_PREFIX}{journal_seq:020d}{_SUFFIX}"
+        tmp = path.with_suffix(".tmp")
+        try:
+            with open(tmp, "wb") as handle:
+                handle.write(_MAGIC)
+                pickle.dump(
+                    (journal_seq, states), handle, protocol=pickle.HIGHEST_PROTOCOL
+                )
+                handle.flush()
+                os.fsync(handle.fileno())
+            os.replace(tmp, path)
+            dir_fd = os.open(self._directory, os.O_RDONLY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+        except OSError as exc:
+            raise SnapshotError(f"Failed to write snapshot {path}: {exc}") from exc
+
+        for old in self._snapshots()[: -self._keep]:
+            old.unlink()
+        return path
+
+    def load_latest(self) -> tuple[int, list[BookState]] | None:
+        """Return ``(journal_seq, states)`` of the newest readable snapshot."""
+        for path in reversed(self._snapshots()):
+            try:
+                with open(path, "rb") as handle:
+                    if handle.read(len(_MAGIC)) != _MAGIC:
+                        raise SnapshotError("bad header")
+                    return pickle.load(handle)
+            except Exception:
+                logger.exception("Skipping unreadable snapshot %s", path)
+        return None
+
+    def sequences(self) -> list[int]:
+        return [
+            int(path.name[len(_PREFIX) : -len(_SUFFIX)]) for path in self._snapshots()
+        ]
+
+    def _snapshots(self) -> list[Path]:
+        if not self._directory.exists():
+            return []
+        return sorted(self._directory.glob(f"{_PREFIX}*{_SUFFIX}"))
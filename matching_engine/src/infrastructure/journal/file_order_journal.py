@@ -0,0 +1,400 @@
+import asyncio
+import json
+import logging
+import os
+import struct
+import zlib
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+
+from src.application.cancel_resting_order import CancelRestingOrderCommand
+from src.application.process_incoming_order import ProcessIncomingOrderCommand
+from src.domain.ports.order_journal import OrderJournal
+from src.exceptions import JournalError
+
+logger = logging.getLogger(__name__)
+
+# Frame: <payload length><seq> payload <crc32 of header + payload>
+_HEADER = struct.Struct("<IQ")
+_CRC = struct.Struct("<I")
+_SEGMENT_PREFIX = "journal-"
+_SEGMENT_SUFFIX = ".log"
+
+_OPEN = "O"
+_CANCEL = "C"
+_EMITTED = "E"
+
+JournaledCommand = ProcessIncomingOrderCommand | CancelRestingOrderCommand
+
+
+@dataclass(frozen=True, slots=True)
+class OutputEmitted:
+    """Replayed marker: the output of the command at ``seq`` was published."""
+
+    seq: int
+
+
+class FileOrderJournal(OrderJournal):
+    """Append-only, segmented command journal with group-commit fsync.
+
+    ``record_*`` only appends a framed record to an in-memory buffer. A single
+    flusher task writes the buffer and fsyncs it (in a worker thread) at most
+    every ``flush_interval`` seconds, so all ``sync()`` callers waiting in
+    that window share one fsync.
+
+    Segments are named after their first sequence number and roll over at
+    ``segment_bytes``. A torn or corrupt tail, e.g. from a crash
+    mid-write, is truncated on ``start()``. Recently journaled order ids are
+    remembered (``dedupe_window``) so a broker redelivery after a crash is
+    recognised instead of being matched twice.
+
+    ``record_emitted`` appends a marker (it takes no sequence number of its
+    own) once a command's events are published; recovery re-publishes the
+    output of every replayed command without one. A failed write is fatal:
+    ``on_failure`` is called once and every later ``sync()`` raises, so the
+    owner must stop consuming and restart from the journal.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        fsync: bool = True,
+        flush_interval: float = 0.002,
+        segment_bytes: int = 64 * 1024 * 1024,
+        dedupe_window: int = 100_000,
+        on_failure: Callable[[JournalError], None] | None = None,
+    ) -> None:
+        self._directory = Path(directory)
+        self._fsync = fsync
+        self._flush_interval = flush_interval
+        self._segment_bytes = segment_bytes
+        self._dedupe_window = dedupe_window
+        self._on_failure = on_failure
+        self._recent: OrderedDict[tuple[str, str], None] = OrderedDict()
+        self._buffer = bytearray()
+        self._last_seq = 0
+        self._durable_seq = 0
+        self._waiters: list[tuple[int, asyncio.Future]] = []
+        self._unemitted: set[int] = set()
+        self._emit_waiters: list[tuple[int, asyncio.Future]] = []
+        self._wake = asyncio.Event()
+        self._flusher: asyncio.Task | None = None
+        self._file = None
+        self._file_size = 0
+        self._failure: JournalError | None = None
+        self._closing = False
+
+    @property
+    def last_seq(self) -> int:
+        """Sequence of the most recently recorded (not necessarily durable) entry."""
+        return self._last_seq
+
+    @property
+    def failed(self) -> bool:
+        return self._failure is not None
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    async def start(self) -> None:
+        self._open()
+        self._flusher = asyncio.create_task(self._flush_loop())
+        logger.info(
+            "Order journal opened: dir=%s last_seq=%s fsync=%s",
+            self._directory,
+            self._last_seq,
+            self._fsync,
+        )
+
+    async def close(self) -> None:
+        if self._flusher is not None:
+            # Let an in-flight write finish rather than cancelling it mid-thread.
+            self._closing = True
+            self._wake.set()
+            await self._flusher
+            self._flusher = None
+        if self._file is not None:
+            await self._flush()
+            self._file.close()
+            self._file = None
+            logger.info("Order journal closed at seq=%s", self._durable_seq)
+
+    # ------------------------------------------------------------------
+    # OrderJournal
+    # ------------------------------------------------------------------
+
+    def record_open(
+        self,
+        order_id: str,
+        trader_id: str,
+        instrument_id: str,
+        side: str,
+        order_type: str,
+        time_in_force: str,
+        quantity: int,
+        limit_price: Decimal | None,
+        limit_price_currency: str | None,
+        received_at: datetime | None = None,
+    ) -> bool:
+        return self._append(
+            [
+                _OPEN,
+                order_id,
+                trader_id,
+                instrument_id,
+                side,
+                order_type,
+                time_in_force,
+                quantity,
+                str(limit_price) if limit_price is not None else None,
+                limit_price_currency,
+                received_at.isoformat() if received_at is not None else None,
+            ]
+        )
+
+    def record_cancel(self, order_id: str, instrument_id: str) -> bool:
+        return self._append([_CANCEL, order_id, instrument_id])
+
+    def record_emitted(self, seq: int) -> None:
+        self._unemitted.discard(seq)
+        self._write_frame(self._last_seq, [_EMITTED, seq])
+        # Not awaited by anyone; let the flusher pick it up on its own.
+        self._wake.set()
+        if self._emit_waiters:
+            self._wake_emit_waiters()
+
+    async def wait_emitted(self, seq: int) -> None:
+        """Wait until every command recorded at or before ``seq`` is emitted."""
+        if not any(s <= seq for s in self._unemitted):
+            return
+        future = asyncio.get_running_loop().create_future()
+        self._emit_waiters.append((seq, future))
+        await future
+
+    async def sync(self) -> None:
+        if self._failure is not None:
+            raise self._failure
+        target = self._last_seq
+        if self._durable_seq >= target:
+            return
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append((target, future))
+        self._wake.set()
+        await future
+
+    # ------------------------------------------------------------------
+    # Recovery
+    # ------------------------------------------------------------------
+
+    def replay(
+        self, after_seq: int = 0, markers: bool = False
+    ) -> Iterator[tuple[int, JournaledCommand | OutputEmitted]]:
+        """Yield ``(seq, command)`` for every durable entry after ``after_seq``.
+
+        Entries at or before ``after_seq`` are still read so the dedupe window
+        covers commands that a snapshot already includes. With ``markers``,
+        ``OutputEmitted`` markers are yielded too, in journal order.
+        """
+        for path in self._segments():
+            for seq, record in self._read_segment(path)[0]:
+                if record[0] == _EMITTED:
+                    if markers and record[1] > after_seq:
+                        yield seq, OutputEmitted(record[1])
+                    continue
+                self._remember((record[0], record[1]))
+                if seq > after_seq:
+                    yield seq, self._decode(record)
+
+    def prune(self, upto_seq: int) -> int:
+        """Delete closed segments whose entries are all ``<= upto_seq``."""
+        segments = self._segments()
+        removed = 0
+        for path, successor in zip(segments, segments[1:]):
+            if self._first_seq(successor) - 1 > upto_seq:
+                break
+            path.unlink()
+            removed += 1
+        return removed
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _append(self, record: list) -> bool:
+        key = (record[0], record[1])
+        if key in self._recent:
+            return False
+        self._remember(key)
+
+        self._last_seq += 1
+        self._unemitted.add(self._last_seq)
+        self._write_frame(self._last_seq, record)
+        return True
+
+    def _write_frame(self, seq: int, record: list) -> None:
+        payload = json.dumps(record, separators=(",", ":")).encode("utf-8")
+        frame = _HEADER.pack(len(payload), seq) + payload
+        self._buffer += frame
+        self._buffer += _CRC.pack(zlib.crc32(frame))
+
+    def _wake_emit_waiters(self) -> None:
+        oldest = min(self._unemitted, default=None)
+        pending = []
+        for target, future in self._emit_waiters:
+            if future.done():
+                continue
+            if oldest is None or oldest > target:
+                future.set_result(None)
+            else:
+                pending.append((target, future))
+        self._emit_waiters = pending
+
+    def _remember(self, key: tuple[str, str]) -> None:
+        self._recent[key] = None
+        if len(self._recent) > self._dedupe_window:
+            self._recent.popitem(last=False)
+
+    async def _flush_loop(self) -> None:
+        while not self._closing:
+            await self._wake.wait()
+            if self._flush_interval and not self._closing:
+                await asyncio.sleep(self._flush_interval)
+            await self._flush()
+
+    async def _flush(self) -> None:
+        self._wake.clear()
+        if self._failure is not None:
+            # Never write past a gap; the process must restart and recover.
+            self._buffer.clear()
+        elif self._buffer:
+            data, self._buffer = self._buffer, bytearray()
+            upto = self._last_seq
+            try:
+                await asyncio.to_thread(self._write, data, upto)
+            except OSError as exc:
+                logger.exception("Order journal write failed")
+                self._failure = JournalError(f"Order journal write failed: {exc}")
+                if self._on_failure is not None:
+                    self._on_failure(self._failure)
+            else:
+                self._durable_seq = upto
+
+        pending = []
+        for target, future in self._waiters:
+            if future.done():
+                continue
+            if self._failure is not None:
+                future.set_exception(self._failure)
+            elif target <= self._durable_seq:
+                future.set_result(None)
+            else:
+                pending.append((target, future))
+        self._waiters = pending
+
+    def _write(self, data: bytearray, upto: int) -> None:
+        self._file.write(data)
+        self._file.flush()
+        if self._fsync:
+            os.fsync(self._file.fileno())
+        self._file_size += len(data)
+        if self._file_size >= self._segment_bytes:
+            self._file.close()
+            self._file = self._new_segment(upto + 1)
+            self._file_size = 0
+
+    def _open(self) -> None:
+        self._directory.mkdir(parents=True, exist_ok=True)
+        segments = self._segments()
+        if not segments:
+            self._file = self._new_segment(1)
+            return
+
+        last = segments[-1]
+        records, valid_size = self._read_segment(last)
+        self._last_seq = records[-1][0] if records else self._first_seq(last) - 1
+        self._durable_seq = self._last_seq
+        if valid_size < last.stat().st_size:
+            logger.warning(
+                "Truncating torn journal tail: %s at offset %s", last, valid_size
+            )
+            os.truncate(last, valid_size)
+        self._file = open(last, "ab")
+        self._file_size = valid_size
+
+    def _new_segment(self, first_seq: int):
+        path = self._directory / f"{_SEGMENT_PREFIX}{first_seq:020d}{_SEGMENT_SUFFIX}"
+        handle = open(path, "ab")
+        if self._fsync:
+            dir_fd = os.open(self._directory, os.O_RDONLY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+        return handle
+
+    def _segments(self) -> list[Path]:
+        return sorted(self._directory.glob(f"{_SEGMENT_PREFIX}*{_SEGMENT_SUFFIX}"))
+
+    @staticmethod
+    def _first_seq(path: Path) -> int:
+        return int(path.name[len(_SEGMENT_PREFIX) : -len(_SEGMENT_SUFFIX)])
+
+    @staticmethod
+    def _read_segment(path: Path) -> tuple[list[tuple[int, list]], int]:
+        """Return valid ``(seq, record)`` pairs and the offset where they end."""
+        data = path.read_bytes()
+        records: list[tuple[int, list]] = []
+        offset = 0
+        header_size, crc_size = _HEADER.size, _CRC.size
+        while offset + header_size <= len(data):
+            length, seq = _HEADER.unpack_from(data, offset)
+            end = offset + header_size + length
+            if end + crc_size > len(data):
+                break
+            (crc,) = _CRC.unpack_from(data, end)
+            if crc != zlib.crc32(data[offset:end]):
+                break
+            records.append((seq, json.loads(data[offset + header_size : end])))
+            offset = end + crc_size
+        return records, offset
+
+    @staticmethod
+    def _decode(record: list) -> JournaledCommand:
+        if record[0] == _CANCEL:
+            return CancelRestingOrderCommand(
+                order_id=record[1], instrument_id=record[2]
+            )
+        (
+            _,
+            order_id,
+            trader_id,
+            instrument_id,
+            side,
+            order_type,
+            tif,
+            qty,
+            price,
+            ccy,
+            *rest,
+        ) = record
+        # Records written before receive times were journaled have no 11th field.
+        received_at = rest[0] if rest else None
+        return ProcessIncomingOrderCommand(
+            order_id=order_id,
+            trader_id=trader_id,
+            instrument_id=instrument_id,
+            side=side,
+            order_type=order_type,
+            time_in_force=tif,
+            quantity=qty,
+            limit_price=Decimal(price) if price is not None else None,
+            limit_price_currency=ccy,
+            received_at=(
+                datetime.fromisoformat(received_at) if received_at is not None else None
+            ),
+        )
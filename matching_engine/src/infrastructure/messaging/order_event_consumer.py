@@ -1,5 +1,6 @@
 import json
 import logging
+from collections.abc import Iterable
 from decimal import Decimal, InvalidOperation
 from typing import Any
 
@@ -11,7 +12,12 @@ from src.application.process_incoming_order import (
     ProcessIncomingOrderCommand,
     ProcessIncomingOrderHandler,
 )
-from src.exceptions import MessagingConnectionError, MessagingConsumeError
+from src.exceptions import (
+    JournalError,
+    MessagingConnectionError,
+    MessagingConsumeError,
+)
+from src.infrastructure.pipeline.matching_pipeline import MatchingPipeline
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +32,12 @@ class OrderEventConsumer:
     Binds a durable queue to the ``order.events`` topic exchange and dispatches:
       - OrderOpened  → ProcessIncomingOrderHandler
       - OrderCancelled → CancelRestingOrderHandler
+
+    In shard mode the queue is a per-shard queue bound to the router's direct
+    exchange instead (``routing_keys=["shard.{n}"]``).
+
+    With a ``pipeline`` the consumer only decodes and enqueues; the pipeline
+    acks each delivery once its output is published.
     """
 
     def __init__(
@@ -37,16 +49,24 @@ class OrderEventConsumer:
         cancel_handler: CancelRestingOrderHandler,
         exchange_type: str = "topic",
         prefetch_count: int = 32,
+        routing_keys: Iterable[str] | None = None,
+        pipeline: MatchingPipeline | None = None,
     ) -> None:
         self._url = url
         self._exchange_name = exchange_name
         self._queue_name = queue_name
         self._exchange_type = exchange_type
         self._prefetch_count = prefetch_count
+        self._routing_keys = frozenset(
+            routing_keys if routing_keys is not None else _MATCH_EVENTS | _CANCEL_EVENTS
+        )
         self._process_handler = process_handler
         self._cancel_handler = cancel_handler
+        self._pipeline = pipeline
         self._connection = None
         self._channel = None
+        self._queue = None
+        self._consumer_tag: str | None = None
 
     async def start(self) -> None:
         """Connect, declare topology, and begin consuming."""
@@ -73,10 +93,11 @@ class OrderEventConsumer:
                 self._queue_name,
                 durable=True,
             )
-            for routing_key in _MATCH_EVENTS | _CANCEL_EVENTS:
+            for routing_key in self._routing_keys:
                 await queue.bind(exchange, routing_key=routing_key)
 
-            await queue.consume(self._on_message)
+            self._queue = queue
+            self._consumer_tag = await queue.consume(self._on_message)
             logger.info(
                 "OrderEventConsumer started: queue=%s exchange=%s",
                 self._queue_name,
@@ -89,23 +110,44 @@ class OrderEventConsumer:
             ) from exc
 
     async def stop(self) -> None:
+        if self._pipeline is not None:
+            # Stop deliveries first so the drained pipeline can still ack.
+            if self._consumer_tag is not None:
+                await self._queue.cancel(self._consumer_tag)
+            await self._pipeline.stop()
         if self._connection is not None and not self._connection.is_closed:
             await self._connection.close()
             logger.info("OrderEventConsumer stopped")
         self._connection = None
         self._channel = None
+        self._queue = None
+        self._consumer_tag = None
 
     async def _on_message(self, message: Any) -> None:
-        async with message.process(requeue=False):
+        if self._pipeline is not None:
+            await self._enqueue(message)
+            return
+
+        async with message.process(requeue=False, ignore_processed=True):
             try:
                 payload = json.loads(message.body.decode("utf-8"))
             except (UnicodeDecodeError, json.JSONDecodeError) as exc:
                 logger.error("Invalid message body: %s", exc)
                 return
 
-            event_type = payload.get("event_type") or message.routing_key
+            # Shard queues carry routing key ``shard.{n}``; the router keeps the
+            # event type in the message ``type`` property.
+            event_type = (
+                payload.get("event_type") or message.type or message.routing_key
+            )
             try:
                 await self._dispatch(event_type, payload)
+            except JournalError:
+                # Not a bad command: the journal is down and the worker exits.
+                logger.error(
+                    "Journal failed; requeueing order_id=%s", payload.get("order_id")
+                )
+                await message.nack(requeue=True)
             except Exception:
                 logger.exception(
                     "Failed to handle event_type=%s order_id=%s",
@@ -114,19 +156,47 @@ class OrderEventConsumer:
                 )
                 raise MessagingConsumeError(f"Failed to handle event '{event_type}'")
 
+    async def _enqueue(self, message: Any) -> None:
+        # No await before ``submit``: deliveries reach the pipeline in order.
+        try:
+            payload = json.loads(message.body.decode("utf-8"))
+            event_type = (
+                payload.get("event_type") or message.type or message.routing_key
+            )
+            command = self._to_command(event_type, payload)
+        except Exception as exc:
+            logger.error("Undecodable order event rejected: %s", exc)
+            await message.reject(requeue=False)
+            return
+
+        if command is None:
+            logger.debug("Ignoring unhandled event_type=%s", event_type)
+            await message.ack()
+            return
+        await self._pipeline.submit(command, message)
+
     async def _dispatch(self, event_type: str, payload: dict[str, Any]) -> None:
-        if event_type in _MATCH_EVENTS:
-            command = self._to_process_command(payload)
+        command = self._to_command(event_type, payload)
+        if isinstance(command, ProcessIncomingOrderCommand):
             await self._process_handler.handle(command)
-        elif event_type in _CANCEL_EVENTS:
-            command = CancelRestingOrderCommand(
-                order_id=str(payload["order_id"]),
-                instrument_id=str(payload["instrument_id"]),
-            )
+        elif isinstance(command, CancelRestingOrderCommand):
             await self._cancel_handler.handle(command)
         else:
             logger.debug("Ignoring unhandled event_type=%s", event_type)
 
+    @classmethod
+    def _to_command(
+        cls, event_type: str, payload: dict[str, Any]
+    ) -> ProcessIncomingOrderCommand | CancelRestingOrderCommand | None:
+        if event_type in _MATCH_EVENTS:
+            return cls._to_process_command(payload)
+        if event_type in _CANCEL_EVENTS:
+            return CancelRestingOrderCommand(
+                order_id=str(payload["order_id"]),
+                instrument_id=str(payload["instrument_id"]),
+            )
+        return None
+
     @staticmethod
     def _to_process_command(payload: dict[str, Any]) -> ProcessIncomingOrderCommand:
         limit_price: Decimal | None = None
@@ -0,0 +1,206 @@
+import asyncio
+import contextlib
+import json
+import logging
+from typing import Any
+
+from src.exceptions import MessagingConnectionError
+from src.infrastructure.messaging.sharding import (
+    shard_for,
+    shard_queue_name,
+    shard_routing_key,
+)
+
+logger = logging.getLogger(__name__)
+
+# Routing keys consumed from order.events (same set as OrderEventConsumer).
+_ROUTED_EVENTS = frozenset({"OrderOpened", "OrderCancelled"})
+
+# (delivery, shard, republish task); no shard or task if unroutable.
+_InFlight = tuple[Any, int | None, asyncio.Task | None]
+
+
+class OrderShardRouter:
+    """Routes OIS order events to per-shard matching queues by instrument.
+
+    Consumes the shared ``matching_engine.orders`` queue and republishes each
+    body unchanged to a durable direct exchange with routing key
+    ``shard.{n}`` where ``n = crc32(instrument_id) % shard_count``.
+
+    Deliveries are handed to a single forwarder task in arrival order,
+    which starts each republish without waiting for the previous confirm.
+    A settler task awaits the confirms in that same order and acks each
+    delivery only once its republish is confirmed, so per-instrument
+    ordering and at-least-once delivery hold across the extra hop while up
+    to ``prefetch_count`` confirms are in flight.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        source_exchange: str,
+        source_queue: str,
+        shard_exchange: str,
+        shard_count: int,
+        exchange_type: str = "topic",
+        prefetch_count: int = 256,
+    ) -> None:
+        self._url = url
+        self._source_exchange = source_exchange
+        self._source_queue = source_queue
+        self._shard_exchange_name = shard_exchange
+        self._shard_count = shard_count
+        self._exchange_type = exchange_type
+        self._prefetch_count = prefetch_count
+        self._connection = None
+        self._channel = None
+        self._shard_exchange = None
+        self._pending: asyncio.Queue[Any] = asyncio.Queue()
+        self._in_flight: asyncio.Queue[_InFlight] = asyncio.Queue()
+        self._forwarder: asyncio.Task | None = None
+        self._settler: asyncio.Task | None = None
+        self.routed: list[int] = [0] * shard_count
+
+    async def start(self) -> None:
+        """Connect, declare source and shard topology, and begin routing."""
+        try:
+            import aio_pika
+            from aio_pika import ExchangeType
+        except ImportError as exc:
+            raise MessagingConnectionError(
+                "aio-pika is required for OrderShardRouter. "
+                "Install it with: pip install aio-pika"
+            ) from exc
+
+        try:
+            self._connection = await aio_pika.connect_robust(self._url)
+            self._channel = await self._connection.channel(publisher_confirms=True)
+            await self._channel.set_qos(prefetch_count=self._prefetch_count)
+
+            source = await self._channel.declare_exchange(
+                self._source_exchange,
+                ExchangeType(self._exchange_type),
+                durable=True,
+            )
+            queue = await self._channel.declare_queue(self._source_queue, durable=True)
+            for routing_key in _ROUTED_EVENTS:
+                await queue.bind(source, routing_key=routing_key)
+
+            self._shard_exchange = await self._channel.declare_exchange(
+                self._shard_exchange_name,
+                ExchangeType.DIRECT,
+                durable=True,
+            )
+            # Declared here too so nothing is dropped before a shard first starts.
+            for index in range(self._shard_count):
+                shard_queue = await self._channel.declare_queue(
+                    shard_queue_name(self._source_queue, index),
+                    durable=True,
+                )
+                await shard_queue.bind(
+                    self._shard_exchange,
+                    routing_key=shard_routing_key(index),
+                )
+
+            self._forwarder = asyncio.create_task(self._forward_loop())
+            self._settler = asyncio.create_task(self._settle_loop())
+            await queue.consume(self._on_message)
+            logger.info(
+                "OrderShardRouter started: queue=%s shards=%s exchange=%s",
+                self._source_queue,
+                self._shard_count,
+                self._shard_exchange_name,
+            )
+        except Exception as exc:
+            logger.exception("Failed to start OrderShardRouter")
+            raise MessagingConnectionError(
+                f"Failed to start order shard router: {exc}"
+            ) from exc
+
+    async def stop(self) -> None:
+        for task in (self._forwarder, self._settler):
+            if task is not None:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._forwarder = None
+        self._settler = None
+        if self._connection is not None and not self._connection.is_closed:
+            await self._connection.close()
+            logger.info("OrderShardRouter stopped")
+        self._connection = None
+        self._channel = None
+        self._shard_exchange = None
+
+    async def _on_message(self, message: Any) -> None:
+        # aio-pika runs each delivery in its own task; enqueueing without an
+        # await keeps delivery order for the single forwarder.
+        self._pending.put_nowait(message)
+
+    async def _forward_loop(self) -> None:
+        while True:
+            message = await self._pending.get()
+            try:
+                self._in_flight.put_nowait(self._dispatch(message))
+            except Exception:
+                logger.exception("Failed to dispatch order event; requeueing")
+                with contextlib.suppress(Exception):
+                    await message.nack(requeue=True)
+
+    async def _settle_loop(self) -> None:
+        while True:
+            entry = await self._in_flight.get()
+            try:
+                await self._settle(*entry)
+            except Exception:
+                # Typically a closed channel; the broker redelivers unacked
+                # deliveries once the robust connection is back.
+                logger.exception("Failed to settle order event delivery")
+
+    async def _forward(self, message: Any) -> None:
+        """Route one delivery and settle it; the loops split these steps."""
+        await self._settle(*self._dispatch(message))
+
+    def _dispatch(self, message: Any) -> _InFlight:
+        """Start the republish for ``message``; ``None`` task if unroutable."""
+        try:
+            payload = json.loads(message.body.decode("utf-8"))
+            instrument_id = str(payload["instrument_id"])
+        except (UnicodeDecodeError, json.JSONDecodeError, KeyError, TypeError) as exc:
+            logger.error("Unroutable order event dropped: %s", exc)
+            return message, None, None
+
+        shard = shard_for(instrument_id, self._shard_count)
+        publish = asyncio.create_task(self._publish(message, shard_routing_key(shard)))
+        return message, shard, publish
+
+    async def _settle(
+        self, message: Any, shard: int | None, publish: asyncio.Task | None
+    ) -> None:
+        if publish is None:
+            await message.reject(requeue=False)
+            return
+        try:
+            await publish
+        except Exception:
+            logger.exception("Failed to route order event to shard=%s", shard)
+            await message.nack(requeue=True)
+            return
+
+        self.routed[shard] += 1
+        await message.ack()
+
+    async def _publish(self, message: Any, routing_key: str) -> None:
+        import aio_pika
+
+        await self._shard_exchange.publish(
+            aio_pika.Message(
+                body=message.body,
+                content_type="application/json",
+                delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+                type=message.type or message.routing_key,
+            ),
+            routing_key=routing_key,
+        )
@@ -1,6 +1,8 @@
+import asyncio
 import json
 import logging
-from dataclasses import asdict
+from collections.abc import Sequence
+from dataclasses import fields
 from datetime import datetime
 from decimal import Decimal
 from typing import Any
@@ -20,14 +22,35 @@ def _json_default(value: Any) -> Any:
     raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
 
 
+_FIELD_NAMES: dict[type, tuple[str, ...]] = {}
+
+
+def _event_body(event: DomainEvent) -> bytes:
+    # Events are flat dataclasses; a shallow field read avoids ``asdict``'s
+    # recursive deep copy on every publish.
+    names = _FIELD_NAMES.get(type(event))
+    if names is None:
+        names = _FIELD_NAMES[type(event)] = tuple(f.name for f in fields(event))
+    payload = {name: getattr(event, name) for name in names}
+    return json.dumps(payload, default=_json_default).encode("utf-8")
+
+
 class RabbitMQEventPublisher(EventPublisher):
-    """Publishes matching events to a RabbitMQ topic exchange (trade.events)."""
+    """Publishes matching events to a RabbitMQ topic exchange (trade.events).
+
+    The channel runs in publisher-confirm mode. ``publish_many`` sends a whole
+    batch without waiting for each confirm in turn; at most
+    ``max_in_flight`` messages (across concurrent batches) are unconfirmed at
+    any time, and the call returns once every message in the batch is
+    confirmed.
+    """
 
     def __init__(
         self,
         url: str,
         exchange_name: str,
         exchange_type: str = "topic",
+        max_in_flight: int = 256,
     ) -> None:
         self._url = url
         self._exchange_name = exchange_name
@@ -35,6 +58,7 @@ class RabbitMQEventPublisher(EventPublisher):
         self._connection = None
         self._channel = None
         self._exchange = None
+        self._in_flight = asyncio.Semaphore(max_in_flight)
 
     async def connect(self) -> None:
         try:
@@ -47,7 +71,7 @@ class RabbitMQEventPublisher(EventPublisher):
 
         try:
             self._connection = await aio_pika.connect_robust(self._url)
-            self._channel = await self._connection.channel()
+            self._channel = await self._connection.channel(publisher_confirms=True)
             self._exchange = await self._channel.declare_exchange(
                 self._exchange_name,
                 aio_pika.ExchangeType(self._exchange_type),
@@ -82,19 +106,53 @@ class RabbitMQEventPublisher(EventPublisher):
                 "aio-pika is required for RabbitMQEventPublisher."
             ) from exc
 
-        body = json.dumps(asdict(event), default=_json_default).encode("utf-8")
-        message = aio_pika.Message(
-            body=body,
-            content_type="application/json",
-            delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
-            type=event.event_type,
-        )
-
         try:
-            await self._exchange.publish(message, routing_key=event.event_type)
+            await self._send(aio_pika, event)
             logger.info("Published event_type=%s", event.event_type)
         except Exception as exc:
             logger.exception("Failed to publish event_type=%s", event.event_type)
             raise MessagingPublishError(
                 f"Failed to publish event '{event.event_type}': {exc}"
             ) from exc
+
+    async def publish_many(self, events: Sequence[DomainEvent]) -> None:
+        if not events:
+            return
+        if self._exchange is None:
+            await self.connect()
+
+        try:
+            import aio_pika
+        except ImportError as exc:
+            raise MessagingConnectionError(
+                "aio-pika is required for RabbitMQEventPublisher."
+            ) from exc
+
+        # Tasks start (and write their frames) in order; only confirms overlap.
+        results = await asyncio.gather(
+            *(self._send(aio_pika, event) for event in events),
+            return_exceptions=True,
+        )
+        failures = [r for r in results if isinstance(r, BaseException)]
+        if failures:
+            logger.error(
+                "Failed to publish %s of %s events: %s",
+                len(failures),
+                len(events),
+                failures[0],
+            )
+            raise MessagingPublishError(
+                f"Failed to publish {len(failures)} of {len(events)} events: "
+                f"{failures[0]}"
+            ) from failures[0]
+        logger.info("Published %s events", len(events))
+
+    async def _send(self, aio_pika, event: DomainEvent) -> None:
+        message = aio_pika.Message(
+            body=_event_body(event),
+            content_type="application/json",
+            delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+            type=event.event_type,
+        )
+        async with self._in_flight:
+            await self._exchange.publish(message, routing_key=event.event_type)
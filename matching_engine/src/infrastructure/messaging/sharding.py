@@ -0,0 +1,20 @@
+import zlib
+
+
+def shard_for(instrument_id: str, shard_count: int) -> int:
+    """Return the shard that owns ``instrument_id``.
+
+    Uses CRC32 rather than ``hash()`` so every process (router, shards,
+    restarts) agrees regardless of ``PYTHONHASHSEED``.
+    """
+    if shard_count < 1:
+        raise ValueError("shard_count must be at least 1.")
+    return zlib.crc32(instrument_id.encode("utf-8")) % shard_count
+
+
+def shard_routing_key(shard_index: int) -> str:
+    return f"shard.{shard_index}"
+
+
+def shard_queue_name(base_queue: str, shard_index: int) -> str:
+    return f"{base_queue}.shard.{shard_index}"
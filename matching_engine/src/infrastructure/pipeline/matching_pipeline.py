@@ -0,0 +1,243 @@
+import asyncio
+import logging
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Protocol
+
+from src.application.cancel_resting_order import (
+    CancelRestingOrderCommand,
+    CancelRestingOrderHandler,
+)
+from src.application.command_output import CommandOutput
+from src.application.process_incoming_order import (
+    ProcessIncomingOrderCommand,
+    ProcessIncomingOrderHandler,
+)
+from src.domain.ports.event_publisher import EventPublisher
+from src.domain.ports.order_journal import OrderJournal
+from src.exceptions import JournalError
+from src.infrastructure.cache.snapshot_writer import CoalescingSnapshotWriter
+
+logger = logging.getLogger(__name__)
+
+Command = ProcessIncomingOrderCommand | CancelRestingOrderCommand
+
+
+class Delivery(Protocol):
+    """The broker message a command came from (aio-pika ``IncomingMessage``)."""
+
+    async def ack(self) -> None: ...
+
+    async def reject(self, requeue: bool = False) -> None: ...
+
+
+@dataclass(frozen=True, slots=True)
+class PipelineMetrics:
+    """Point-in-time stage depths and cumulative counters."""
+
+    command_queue: int
+    publish_queue: int
+    cache_dirty_books: int
+    unacked: int
+    matched: int
+    rejected: int
+    published_batches: int
+    acked: int
+    snapshots_written: int
+    snapshots_skipped: int
+
+
+class MatchingPipeline:
+    """Staged matching: consumer → matcher → publisher, with a side cache stage.
+
+    - ``submit`` (called by the consumer in delivery order) awaits space in
+      the bounded command queue, so a slow downstream fills the broker
+      prefetch window instead of growing memory.
+    - One matcher task drains commands and runs the handlers' synchronous
+      ``execute`` (journal record + book mutation); it never awaits I/O.
+    - The publisher task takes everything the matcher has produced, syncs
+      the journal once, publishes all events with one ``publish_many`` and
+      then acks those deliveries in order. A delivery is therefore acked only
+      once its output is durable (the ack watermark trails confirmed output).
+      A failed publish is retried with backoff, keeping deliveries unacked;
+      a failed journal is not, as it never recovers in-process.
+    - Touched books are handed to the snapshot writer, which coalesces and
+      rate-limits market data writes off the matching path.
+
+    A failed ack or reject is logged per delivery; the broker redelivers
+    it and the journal recognises the duplicate. If the matcher or
+    publisher task ends for any other reason, ``on_failure`` is called so
+    the owner stops consuming rather than leave deliveries stranded.
+    """
+
+    def __init__(
+        self,
+        process_handler: ProcessIncomingOrderHandler,
+        cancel_handler: CancelRestingOrderHandler,
+        event_publisher: EventPublisher,
+        snapshot_writer: CoalescingSnapshotWriter,
+        journal: OrderJournal | None = None,
+        command_queue_size: int = 1024,
+        max_publish_batch: int = 512,
+        retry_delay: float = 0.1,
+        max_retry_delay: float = 5.0,
+        on_failure: Callable[[BaseException], None] | None = None,
+    ) -> None:
+        self._process_handler = process_handler
+        self._cancel_handler = cancel_handler
+        self._publisher = event_publisher
+        self._snapshots = snapshot_writer
+        self._journal = journal
+        self._max_publish_batch = max_publish_batch
+        self._retry_delay = retry_delay
+        self._max_retry_delay = max_retry_delay
+        self._on_failure = on_failure
+
+        self._commands: asyncio.Queue[tuple[Command, Delivery]] = asyncio.Queue(
+            command_queue_size
+        )
+        self._outputs: deque[tuple[CommandOutput, Delivery]] = deque()
+        self._outputs_ready = asyncio.Event()
+        self._tasks: list[asyncio.Task] = []
+
+        self._matched = 0
+        self._rejected = 0
+        self._published_batches = 0
+        self._acked = 0
+
+    def start(self) -> None:
+        self._tasks = [
+            asyncio.create_task(self._match_loop(), name="matcher"),
+            asyncio.create_task(self._publish_loop(), name="publisher"),
+        ]
+        for task in self._tasks:
+            task.add_done_callback(self._on_stage_done)
+        self._snapshots.start()
+
+    def _on_stage_done(self, task: asyncio.Task) -> None:
+        if task.cancelled():
+            return
+        exc = task.exception() or RuntimeError(f"{task.get_name()} exited")
+        logger.critical(
+            "Matching pipeline %s stage died", task.get_name(), exc_info=exc
+        )
+        if self._on_failure is not None:
+            self._on_failure(exc)
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """Drain accepted commands through publishing, then stop the stages.
+
+        Anything still unacked after ``timeout`` is left to broker redelivery.
+        """
+        try:
+            await asyncio.wait_for(self._drain(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Pipeline stopped with %s deliveries unacked", self.metrics().unacked
+            )
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        await self._snapshots.stop()
+
+    async def _drain(self) -> None:
+        await self._commands.join()
+        while self._outputs:
+            await asyncio.sleep(0.01)
+
+    async def submit(self, command: Command, delivery: Delivery) -> None:
+        await self._commands.put((command, delivery))
+
+    def metrics(self) -> PipelineMetrics:
+        return PipelineMetrics(
+            command_queue=self._commands.qsize(),
+            publish_queue=len(self._outputs),
+            cache_dirty_books=self._snapshots.pending(),
+            unacked=self._commands.qsize() + len(self._outputs),
+            matched=self._matched,
+            rejected=self._rejected,
+            published_batches=self._published_batches,
+            acked=self._acked,
+            snapshots_written=self._snapshots.written,
+            snapshots_skipped=self._snapshots.skipped,
+        )
+
+    # ------------------------------------------------------------------
+    # Stages
+    # ------------------------------------------------------------------
+
+    async def _match_loop(self) -> None:
+        while True:
+            command, delivery = await self._commands.get()
+            try:
+                output = self._execute(command)
+            except Exception:
+                self._rejected += 1
+                logger.exception(
+                    "Failed to handle %s order_id=%s",
+                    type(command).__name__,
+                    command.order_id,
+                )
+                await self._settle(delivery.reject(requeue=False))
+            else:
+                self._matched += 1
+                self._outputs.append((output, delivery))
+                self._outputs_ready.set()
+                self._snapshots.mark_dirty(output.book)
+            finally:
+                self._commands.task_done()
+
+    def _execute(self, command: Command) -> CommandOutput:
+        if isinstance(command, CancelRestingOrderCommand):
+            return self._cancel_handler.execute(command)
+        return self._process_handler.execute(command)
+
+    async def _publish_loop(self) -> None:
+        while True:
+            await self._outputs_ready.wait()
+            self._outputs_ready.clear()
+            while self._outputs:
+                count = min(len(self._outputs), self._max_publish_batch)
+                batch = [self._outputs[i] for i in range(count)]
+                await self._publish_batch(batch)
+                if self._journal is not None:
+                    for output, _ in batch:
+                        if output.journal_seq is not None:
+                            self._journal.record_emitted(output.journal_seq)
+                for _ in range(count):
+                    _, delivery = self._outputs.popleft()
+                    if await self._settle(delivery.ack()):
+                        self._acked += 1
+
+    @staticmethod
+    async def _settle(outcome: Awaitable[None]) -> bool:
+        try:
+            await outcome
+        except Exception:
+            # Typically a closed channel; the broker redelivers the message.
+            logger.exception("Failed to settle delivery")
+            return False
+        return True
+
+    async def _publish_batch(self, batch: list[tuple[CommandOutput, Delivery]]) -> None:
+        events = [event for output, _ in batch for event in output.events]
+        delay = self._retry_delay
+        while True:
+            try:
+                if self._journal is not None:
+                    await self._journal.sync()
+                await self._publisher.publish_many(events)
+                self._published_batches += 1
+                return
+            except JournalError:
+                raise
+            except Exception:
+                logger.exception(
+                    "Publishing %s events failed; retrying in %.1fs",
+                    len(events),
+                    delay,
+                )
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self._max_retry_delay)
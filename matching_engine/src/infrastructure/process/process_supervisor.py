@@ -0,0 +1,100 @@
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class ChildSpec:
+    """A supervised child process: ``argv`` run with ``env`` layered on ours."""
+
+    name: str
+    argv: tuple[str, ...]
+    env: dict[str, str] = field(default_factory=dict)
+
+
+class ProcessSupervisor:
+    """Keeps a fixed set of child processes running until stopped.
+
+    A child that exits is restarted after an exponential backoff
+    (``restart_delay`` doubling up to ``max_restart_delay``); the backoff
+    resets once a child has stayed up for ``stable_after`` seconds.
+    """
+
+    def __init__(
+        self,
+        specs: list[ChildSpec],
+        restart_delay: float = 0.5,
+        max_restart_delay: float = 30.0,
+        stable_after: float = 60.0,
+        terminate_timeout: float = 10.0,
+    ) -> None:
+        self._specs = specs
+        self._restart_delay = restart_delay
+        self._max_restart_delay = max_restart_delay
+        self._stable_after = stable_after
+        self._terminate_timeout = terminate_timeout
+        self._processes: dict[str, asyncio.subprocess.Process] = {}
+        self._stopping = False
+        self.restarts: dict[str, int] = {spec.name: 0 for spec in specs}
+
+    async def run(self, stop_event: asyncio.Event) -> None:
+        """Start every child, supervise until ``stop_event``, then stop them."""
+        watchers = [asyncio.create_task(self._watch(spec)) for spec in self._specs]
+        try:
+            await stop_event.wait()
+        finally:
+            self._stopping = True
+            await asyncio.gather(
+                *(self._terminate(name, p) for name, p in self._processes.items())
+            )
+            for watcher in watchers:
+                watcher.cancel()
+            await asyncio.gather(*watchers, return_exceptions=True)
+
+    async def _watch(self, spec: ChildSpec) -> None:
+        failures = 0
+        while not self._stopping:
+            started = time.monotonic()
+            process = await self._spawn(spec)
+            self._processes[spec.name] = process
+            logger.info("Started %s pid=%s", spec.name, process.pid)
+
+            returncode = await process.wait()
+            if self._stopping:
+                return
+
+            failures = (
+                0 if time.monotonic() - started >= self._stable_after else failures
+            )
+            delay = min(self._restart_delay * 2**failures, self._max_restart_delay)
+            failures += 1
+            self.restarts[spec.name] += 1
+            logger.warning(
+                "%s exited with code=%s; restarting in %.1fs",
+                spec.name,
+                returncode,
+                delay,
+            )
+            await asyncio.sleep(delay)
+
+    async def _spawn(self, spec: ChildSpec) -> asyncio.subprocess.Process:
+        return await asyncio.create_subprocess_exec(
+            *spec.argv,
+            env={**os.environ, **spec.env},
+        )
+
+    async def _terminate(self, name: str, process: asyncio.subprocess.Process) -> None:
+        if process.returncode is not None:
+            return
+        process.terminate()
+        try:
+            await asyncio.wait_for(process.wait(), self._terminate_timeout)
+        except asyncio.TimeoutError:
+            logger.warning("%s did not exit after SIGTERM; killing", name)
+            process.kill()
+            await process.wait()
+        logger.info("Stopped %s", name)
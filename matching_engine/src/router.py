@@ -0,0 +1,53 @@
+import asyncio
+import logging
+import signal
+
+from src.conf import Config
+from src.infrastructure.messaging.order_shard_router import OrderShardRouter
+from src.logging_config import setup_logging
+
+logger = logging.getLogger(__name__)
+
+
+async def run() -> None:
+    setup_logging()
+    logger.info(
+        "Starting Matching Engine shard router shards=%s env=%s",
+        Config.MATCHING_SHARD_COUNT,
+        Config.APP_ENV,
+    )
+
+    router = OrderShardRouter(
+        url=Config.RABBITMQ_URL,
+        source_exchange=Config.RABBITMQ_ORDER_EVENTS_EXCHANGE,
+        source_queue=Config.RABBITMQ_MATCHING_QUEUE,
+        shard_exchange=Config.RABBITMQ_SHARD_EXCHANGE,
+        shard_count=Config.MATCHING_SHARD_COUNT,
+        exchange_type=Config.RABBITMQ_EXCHANGE_TYPE,
+    )
+    await router.start()
+
+    stop_event = asyncio.Event()
+
+    def _signal_handler() -> None:
+        logger.info("Shutdown signal received")
+        stop_event.set()
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, _signal_handler)
+        except NotImplementedError:
+            pass
+
+    await stop_event.wait()
+    await router.stop()
+    logger.info("Matching Engine shard router stopped")
+
+
+def main() -> None:
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
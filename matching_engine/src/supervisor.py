@@ -0,0 +1,61 @@
+import asyncio
+import logging
+import signal
+import sys
+
+from src.conf import Config
+from src.infrastructure.process.process_supervisor import ChildSpec, ProcessSupervisor
+from src.logging_config import setup_logging
+
+logger = logging.getLogger(__name__)
+
+
+def _child_specs(shard_count: int) -> list[ChildSpec]:
+    if shard_count <= 1:
+        # Unsharded: one worker on the shared queue, no router hop.
+        return [ChildSpec("worker", (sys.executable, "-m", "src.worker"))]
+    specs = [ChildSpec("router", (sys.executable, "-m", "src.router"))]
+    for index in range(shard_count):
+        specs.append(
+            ChildSpec(
+                f"shard-{index}",
+                (sys.executable, "-m", "src.worker"),
+                {"MATCHING_SHARD_INDEX": str(index)},
+            )
+        )
+    return specs
+
+
+async def run() -> None:
+    setup_logging()
+    shard_count = Config.MATCHING_SHARD_COUNT
+    logger.info(
+        "Starting Matching Engine supervisor shards=%s env=%s",
+        shard_count,
+        Config.APP_ENV,
+    )
+
+    supervisor = ProcessSupervisor(_child_specs(shard_count))
+    stop_event = asyncio.Event()
+
+    def _signal_handler() -> None:
+        logger.info("Shutdown signal received")
+        stop_event.set()
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, _signal_handler)
+        except NotImplementedError:
+            pass
+
+    await supervisor.run(stop_event)
+    logger.info("Matching Engine supervisor stopped")
+
+
+def main() -> None:
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
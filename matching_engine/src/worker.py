@@ -1,7 +1,20 @@
 import asyncio
+import contextlib
 import logging
 import signal
+from dataclasses import asdict
+from decimal import Decimal
+from functools import partial
+from pathlib import Path
 from src.conf import Config
+from src.domain.entities.order_book import OrderBook
+from src.domain.entities.price_ladder import (
+    DenseTickLadder,
+    PriceLadderFactory,
+    SkipListLadder,
+    SortedListLadder,
+)
+from src.domain.entities.tick_order_book import TickOrderBook
 from src.infrastructure.book.in_memory_order_book_registry import (
     InMemoryOrderBookRegistry,
 )
@@ -26,21 +39,181 @@ def _build_publisher():
     return NoOpEventPublisher()
 
 
+def _build_ladder_factory() -> PriceLadderFactory:
+    if Config.MATCHING_PRICE_LADDER == "skiplist":
+        return SkipListLadder
+    if Config.MATCHING_PRICE_LADDER == "dense":
+        return partial(
+            DenseTickLadder,
+            min_price=Decimal(Config.MATCHING_PRICE_BAND_MIN),
+            max_price=Decimal(Config.MATCHING_PRICE_BAND_MAX),
+            tick_size=Decimal(Config.MATCHING_TICK_SIZE),
+        )
+    return SortedListLadder
+
+
+def _build_registry() -> InMemoryOrderBookRegistry:
+    if Config.MATCHING_BOOK_ENGINE == "tick":
+        tick_size = Decimal(Config.MATCHING_TICK_SIZE)
+        logger.info("Using integer-tick order books tick_size=%s", tick_size)
+        return InMemoryOrderBookRegistry(
+            lambda instrument_id: TickOrderBook(instrument_id, tick_size)
+        )
+    ladder_factory = _build_ladder_factory()
+    logger.info("Using price ladder=%s", Config.MATCHING_PRICE_LADDER)
+    return InMemoryOrderBookRegistry(
+        lambda instrument_id: OrderBook(instrument_id, ladder_factory)
+    )
+
+
 def _build_cache():
     if Config.REDIS_ENABLED:
         from src.infrastructure.cache.redis_market_data_cache import (
             RedisMarketDataCache,
         )
 
-        return RedisMarketDataCache(url=Config.REDIS_URL)
+        return RedisMarketDataCache(
+            url=Config.REDIS_URL,
+            delta_stream_maxlen=Config.MARKET_DATA_DELTA_STREAM_MAXLEN,
+        )
     return NoOpMarketDataCache()
 
 
+def _journal_dir() -> Path:
+    base = Path(Config.JOURNAL_DIR)
+    if Config.MATCHING_SHARD_INDEX is not None:
+        return base / f"shard-{Config.MATCHING_SHARD_INDEX}"
+    return base
+
+
+def _build_handlers(registry, publisher, cache, journal):
+    from src.application.cancel_resting_order import CancelRestingOrderHandler
+    from src.application.process_incoming_order import ProcessIncomingOrderHandler
+    from src.infrastructure.cache.sequenced_market_data_cache import (
+        SequencedMarketDataCache,
+    )
+
+    # Inline writes carry sequences and deltas too; the pipeline, when
+    # enabled, writes through its own CoalescingSnapshotWriter instead.
+    inline_cache = SequencedMarketDataCache(cache)
+    return (
+        ProcessIncomingOrderHandler(registry, publisher, inline_cache, journal),
+        CancelRestingOrderHandler(registry, publisher, inline_cache, journal),
+    )
+
+
+def _build_journal(on_failure):
+    if not Config.JOURNAL_ENABLED:
+        return None
+    from src.infrastructure.journal.file_order_journal import FileOrderJournal
+
+    return FileOrderJournal(
+        _journal_dir(),
+        fsync=Config.JOURNAL_FSYNC,
+        flush_interval=Config.JOURNAL_FLUSH_INTERVAL_MS / 1000,
+        on_failure=on_failure,
+    )
+
+
+def _build_recovery(registry, journal, process_handler, cancel_handler):
+    from src.infrastructure.journal.book_recovery import BookRecovery
+    from src.infrastructure.journal.book_snapshot_store import BookSnapshotStore
+
+    return BookRecovery(
+        registry,
+        journal,
+        BookSnapshotStore(_journal_dir()),
+        process_handler,
+        cancel_handler,
+    )
+
+
+async def _checkpoint_loop(recovery) -> None:
+    while True:
+        await asyncio.sleep(Config.JOURNAL_SNAPSHOT_INTERVAL_SECONDS)
+        try:
+            await recovery.checkpoint()
+        except Exception:
+            logger.exception("Book checkpoint failed")
+
+
+def _build_pipeline(
+    process_handler, cancel_handler, publisher, cache, journal, on_failure
+):
+    if not Config.MATCHING_PIPELINE_ENABLED:
+        return None
+    from src.infrastructure.cache.snapshot_writer import CoalescingSnapshotWriter
+    from src.infrastructure.pipeline.matching_pipeline import MatchingPipeline
+
+    snapshot_writer = CoalescingSnapshotWriter(
+        cache, flush_interval=Config.MARKET_DATA_FLUSH_INTERVAL_MS / 1000
+    )
+    return MatchingPipeline(
+        process_handler,
+        cancel_handler,
+        publisher,
+        snapshot_writer,
+        journal,
+        command_queue_size=Config.MATCHING_PIPELINE_QUEUE_SIZE,
+        on_failure=on_failure,
+    )
+
+
+def _build_consumer(process_handler, cancel_handler, pipeline):
+    from src.infrastructure.messaging.order_event_consumer import OrderEventConsumer
+
+    options = {}
+    if pipeline is not None:
+        # Acks trail publishing, so allow a deeper unacked window.
+        options["prefetch_count"] = Config.MATCHING_PIPELINE_PREFETCH
+    if Config.MATCHING_SHARD_INDEX is None:
+        return OrderEventConsumer(
+            url=Config.RABBITMQ_URL,
+            exchange_name=Config.RABBITMQ_ORDER_EVENTS_EXCHANGE,
+            queue_name=Config.RABBITMQ_MATCHING_QUEUE,
+            process_handler=process_handler,
+            cancel_handler=cancel_handler,
+            exchange_type=Config.RABBITMQ_EXCHANGE_TYPE,
+            pipeline=pipeline,
+            **options,
+        )
+
+    from src.infrastructure.messaging.sharding import (
+        shard_queue_name,
+        shard_routing_key,
+    )
+
+    # Consumer for one shard's queue on the router's direct exchange.
+    shard_index = int(Config.MATCHING_SHARD_INDEX)
+    logger.info(
+        "Running as matching shard %s/%s",
+        shard_index,
+        Config.MATCHING_SHARD_COUNT,
+    )
+    return OrderEventConsumer(
+        url=Config.RABBITMQ_URL,
+        exchange_name=Config.RABBITMQ_SHARD_EXCHANGE,
+        queue_name=shard_queue_name(Config.RABBITMQ_MATCHING_QUEUE, shard_index),
+        process_handler=process_handler,
+        cancel_handler=cancel_handler,
+        exchange_type="direct",
+        routing_keys=[shard_routing_key(shard_index)],
+        pipeline=pipeline,
+        **options,
+    )
+
+
+async def _pipeline_metrics_loop(pipeline) -> None:
+    while True:
+        await asyncio.sleep(Config.MATCHING_PIPELINE_METRICS_INTERVAL_SECONDS)
+        logger.info("Matching pipeline metrics %s", asdict(pipeline.metrics()))
+
+
 async def run() -> None:
     setup_logging()
     logger.info("Starting Matching Engine worker env=%s", Config.APP_ENV)
 
-    registry = InMemoryOrderBookRegistry()
+    registry = _build_registry()
     publisher = _build_publisher()
     cache = _build_cache()
 
@@ -49,26 +222,39 @@ async def run() -> None:
     if hasattr(cache, "connect"):
         await cache.connect()
 
-    from src.application.cancel_resting_order import CancelRestingOrderHandler
-    from src.application.process_incoming_order import ProcessIncomingOrderHandler
+    stop_event = asyncio.Event()
+    failures: list[BaseException] = []
+
+    def _on_fatal(exc: BaseException) -> None:
+        # E.g. a journal gap or a dead pipeline stage: nothing more may be
+        # acked, so stop consuming and let the supervisor restart us.
+        logger.critical("Stopping worker after fatal error: %s", exc)
+        failures.append(exc)
+        stop_event.set()
+
+    journal = _build_journal(_on_fatal)
+    process_handler, cancel_handler = _build_handlers(
+        registry, publisher, cache, journal
+    )
 
-    process_handler = ProcessIncomingOrderHandler(registry, publisher, cache)
-    cancel_handler = CancelRestingOrderHandler(registry, publisher, cache)
+    checkpoint_task = None
+    if journal is not None:
+        recovery = _build_recovery(registry, journal, process_handler, cancel_handler)
+        await journal.start()
+        recovery.recover()
+        await recovery.republish(publisher)
+        checkpoint_task = asyncio.create_task(_checkpoint_loop(recovery))
 
     consumer = None
+    metrics_task = None
     if Config.RABBITMQ_ENABLED:
-        from src.infrastructure.messaging.order_event_consumer import (
-            OrderEventConsumer,
-        )
-
-        consumer = OrderEventConsumer(
-            url=Config.RABBITMQ_URL,
-            exchange_name=Config.RABBITMQ_ORDER_EVENTS_EXCHANGE,
-            queue_name=Config.RABBITMQ_MATCHING_QUEUE,
-            process_handler=process_handler,
-            cancel_handler=cancel_handler,
-            exchange_type=Config.RABBITMQ_EXCHANGE_TYPE,
+        pipeline = _build_pipeline(
+            process_handler, cancel_handler, publisher, cache, journal, _on_fatal
         )
+        if pipeline is not None:
+            pipeline.start()
+            metrics_task = asyncio.create_task(_pipeline_metrics_loop(pipeline))
+        consumer = _build_consumer(process_handler, cancel_handler, pipeline)
         await consumer.start()
     else:
         logger.warning(
@@ -76,8 +262,6 @@ async def run() -> None:
             "Enable RabbitMQ for production matching."
         )
 
-    stop_event = asyncio.Event()
-
     def _signal_handler() -> None:
         logger.info("Shutdown signal received")
         stop_event.set()
@@ -91,14 +275,29 @@ async def run() -> None:
 
     await stop_event.wait()
 
+    if metrics_task is not None:
+        metrics_task.cancel()
     if consumer is not None:
         await consumer.stop()
+    if checkpoint_task is not None:
+        checkpoint_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await checkpoint_task
+        if not journal.failed:
+            try:
+                await recovery.checkpoint()
+            except Exception:
+                logger.exception("Final book checkpoint failed")
+        await journal.close()
     if hasattr(publisher, "close"):
         await publisher.close()
     if hasattr(cache, "close"):
         await cache.close()
 
     logger.info("Matching Engine worker stopped")
+    if failures:
+        # Non-zero so the supervisor restarts the worker.
+        raise SystemExit(1)
 
 
 def main() -> None:
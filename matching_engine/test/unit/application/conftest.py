@@ -19,6 +19,7 @@ def registry() -> OrderBookRegistry:
 def mock_event_publisher() -> AsyncMock:
     publisher = AsyncMock(spec=EventPublisher)
     publisher.publish = AsyncMock()
+    publisher.publish_many = AsyncMock()
     return publisher
 
 
@@ -27,4 +28,5 @@ def mock_cache() -> AsyncMock:
     cache = AsyncMock(spec=MarketDataCache)
     cache.write_last_trade_price = AsyncMock()
     cache.write_book_snapshot = AsyncMock()
+    cache.write_snapshots = AsyncMock()
     return cache
@@ -37,13 +37,13 @@ async def test_rests_limit_order_on_empty_book(
 
     assert result.trades == ()
     assert result.resting_order is not None
-    mock_event_publisher.publish.assert_awaited()
+    mock_event_publisher.publish_many.assert_awaited_once()
     event_types = [
-        c.args[0].event_type for c in mock_event_publisher.publish.await_args_list
+        e.event_type for e in mock_event_publisher.publish_many.await_args.args[0]
     ]
     assert "OrderPlaced" in event_types
     assert "TradeExecuted" not in event_types
-    mock_cache.write_book_snapshot.assert_awaited()
+    mock_cache.write_snapshots.assert_awaited()
 
 
 async def test_matches_and_publishes_trade(
@@ -89,11 +89,13 @@ async def test_matches_and_publishes_trade(
     assert len(result.trades) == 1
     assert result.taker_fully_filled is True
 
-    published = [c.args[0] for c in mock_event_publisher.publish.await_args_list]
+    mock_event_publisher.publish_many.assert_awaited_once()
+    published = mock_event_publisher.publish_many.await_args.args[0]
     types = {e.event_type for e in published}
     assert "TradeExecuted" in types
     assert "OrderFilled" in types
     trade_events = [e for e in published if isinstance(e, TradeExecuted)]
     assert trade_events[0].quantity == 5
     assert trade_events[0].execution_price == Decimal("10.00")
-    mock_cache.write_last_trade_price.assert_awaited()
+    (snapshot,) = mock_cache.write_snapshots.await_args.args[0]
+    assert snapshot.last_trade_price == Decimal("10.00")
@@ -213,12 +213,90 @@ def test_cancel_removes_resting_order() -> None:
     assert book.best_bid() is None
 
 
+def test_cancel_middle_order_preserves_fifo_of_the_rest() -> None:
+    book = _book()
+    ids = [OrderId.generate() for _ in range(4)]
+    for oid in ids:
+        _submit(book, side=OrderSide.SELL, qty=1, price=_usd("5.00"), order_id=oid)
+
+    book.cancel(ids[1])
+    book.cancel(ids[3])
+    result = _submit(book, side=OrderSide.BUY, qty=2, price=_usd("5.00"))
+
+    assert [t.maker_order_id for t in result.trades] == [ids[0], ids[2]]
+    assert book.order_count() == 0
+    assert book.best_ask() is None
+
+
+def test_cancel_then_rest_appends_to_tail() -> None:
+    book = _book()
+    first = OrderId.generate()
+    second = OrderId.generate()
+    late = OrderId.generate()
+    _submit(book, side=OrderSide.BUY, qty=1, price=_usd("3.00"), order_id=first)
+    _submit(book, side=OrderSide.BUY, qty=1, price=_usd("3.00"), order_id=second)
+
+    book.cancel(first)
+    _submit(book, side=OrderSide.BUY, qty=1, price=_usd("3.00"), order_id=late)
+    result = _submit(book, side=OrderSide.SELL, qty=2, price=_usd("3.00"))
+
+    assert [t.maker_order_id for t in result.trades] == [second, late]
+
+
+def test_cancel_twice_raises() -> None:
+    book = _book()
+    oid = OrderId.generate()
+    _submit(book, side=OrderSide.BUY, qty=1, price=_usd("1.00"), order_id=oid)
+    book.cancel(oid)
+
+    with pytest.raises(OrderNotInBookError):
+        book.cancel(oid)
+
+
 def test_cancel_missing_raises() -> None:
     book = _book()
     with pytest.raises(OrderNotInBookError):
         book.cancel(OrderId.generate())
 
 
+# ---------------------------------------------------------------------------
+# Level aggregates
+# ---------------------------------------------------------------------------
+
+
+def test_level_aggregates_track_rest_fill_and_cancel() -> None:
+    book = _book()
+    cancel_me = OrderId.generate()
+    _submit(book, side=OrderSide.SELL, qty=5, price=_usd("7.00"))
+    _submit(book, side=OrderSide.SELL, qty=4, price=_usd("7.00"), order_id=cancel_me)
+    _submit(book, side=OrderSide.SELL, qty=2, price=_usd("8.00"))
+
+    [first, second] = book.ask_levels()
+    assert (first.price, first.quantity, first.order_count) == (_usd("7.00"), 9, 2)
+    assert (second.quantity, second.order_count) == (2, 1)
+
+    _submit(book, side=OrderSide.BUY, qty=3, price=_usd("7.00"))
+    assert book.ask_levels()[0].quantity == 6
+    assert book.ask_levels()[0].order_count == 2
+
+    book.cancel(cancel_me)
+    assert book.ask_levels()[0].quantity == 2
+    assert book.ask_levels()[0].order_count == 1
+    assert book.depth_asks() == [(_usd("7.00"), 2), (_usd("8.00"), 2)]
+
+
+def test_level_aggregates_drop_self_trade_skipped_orders() -> None:
+    book = _book()
+    trader = TraderId.generate()
+    _submit(book, side=OrderSide.BUY, qty=5, price=_usd("4.00"), trader=trader)
+    _submit(book, side=OrderSide.BUY, qty=3, price=_usd("4.00"))
+
+    _submit(book, side=OrderSide.SELL, qty=1, price=_usd("4.00"), trader=trader)
+
+    [level] = book.bid_levels()
+    assert (level.quantity, level.order_count) == (2, 1)
+
+
 # ---------------------------------------------------------------------------
 # Self-trade prevention
 # ---------------------------------------------------------------------------
@@ -274,3 +352,38 @@ def test_duplicate_order_id_raises() -> None:
     _submit(book, side=OrderSide.BUY, qty=1, price=_usd("1.00"), order_id=oid)
     with pytest.raises(InvalidOrderBookError):
         _submit(book, side=OrderSide.BUY, qty=1, price=_usd("1.00"), order_id=oid)
+
+
+# ---------------------------------------------------------------------------
+# Snapshot state
+# ---------------------------------------------------------------------------
+
+
+def test_restore_state_reproduces_book() -> None:
+    book = _book()
+    first = _submit(book, side=OrderSide.SELL, qty=5, price=_usd("101"))
+    _submit(book, side=OrderSide.SELL, qty=7, price=_usd("101"))
+    _submit(book, side=OrderSide.BUY, qty=4, price=_usd("99"))
+    _submit(book, side=OrderSide.BUY, qty=2, price=_usd("101"))
+
+    restored = type(book)(book.instrument_id)
+    restored.restore_state(book.dump_state())
+
+    assert restored.order_count() == book.order_count() == 3
+    assert restored.bid_levels() == book.bid_levels()
+    assert restored.ask_levels() == book.ask_levels()
+    assert restored.last_trade_price == _usd("101")
+
+    # FIFO and trade sequence carry over: the partly filled order is still first.
+    result = _submit(restored, side=OrderSide.BUY, qty=4, price=_usd("101"))
+    assert result.trades[0].maker_order_id == first.resting_order.order_id
+    assert result.trades[0].quantity.value == 3
+    assert result.trades[0].sequence_number == 2
+
+
+def test_restore_state_requires_empty_book() -> None:
+    book = _book()
+    _submit(book, side=OrderSide.BUY, qty=1, price=_usd("10"))
+
+    with pytest.raises(InvalidOrderBookError):
+        book.restore_state(book.dump_state())
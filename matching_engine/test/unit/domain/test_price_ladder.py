@@ -0,0 +1,196 @@
+import random
+from decimal import Decimal
+from functools import partial
+
+import pytest
+
+from src.domain.entities.order_book import OrderBook
+from src.domain.entities.price_ladder import (
+    DenseTickLadder,
+    SkipListLadder,
+    SortedListLadder,
+    TickLadder,
+)
+from src.domain.value_objects.currency import Currency
+from src.domain.value_objects.instrument_id import InstrumentId
+from src.domain.value_objects.money import Money
+from src.domain.value_objects.order_id import OrderId
+from src.domain.value_objects.order_side import OrderSide
+from src.domain.value_objects.order_type import OrderType
+from src.domain.value_objects.quantity import Quantity
+from src.domain.value_objects.time_in_force import TimeInForce
+from src.domain.value_objects.trader_id import TraderId
+from src.exceptions import InvalidOrderBookError
+
+LADDERS = [
+    SortedListLadder,
+    partial(SkipListLadder, seed=1),
+    partial(DenseTickLadder, min_price=Decimal("0.01"), max_price=Decimal("100.00")),
+]
+LADDER_IDS = ["sorted", "skiplist", "dense"]
+
+
+def _price(cents: int) -> Decimal:
+    return Decimal(cents) / 100
+
+
+@pytest.mark.parametrize("factory", LADDERS, ids=LADDER_IDS)
+def test_bids_best_is_highest(factory) -> None:
+    ladder = factory(descending=True)
+    for cents in (1000, 1200, 1100):
+        ladder.add(_price(cents))
+
+    assert ladder.best() == Decimal("12.00")
+    assert ladder.top(2) == [Decimal("12.00"), Decimal("11.00")]
+    assert len(ladder) == 3
+
+
+@pytest.mark.parametrize("factory", LADDERS, ids=LADDER_IDS)
+def test_asks_best_is_lowest(factory) -> None:
+    ladder = factory(descending=False)
+    for cents in (1000, 1200, 1100):
+        ladder.add(_price(cents))
+
+    ladder.discard(Decimal("10.00"))
+
+    assert ladder.best() == Decimal("11.00")
+    assert ladder.top(10) == [Decimal("11.00"), Decimal("12.00")]
+
+
+@pytest.mark.parametrize("factory", LADDERS, ids=LADDER_IDS)
+def test_empty_ladder(factory) -> None:
+    ladder = factory(descending=True)
+
+    assert not ladder
+    assert ladder.best() is None
+    assert ladder.top(5) == []
+    ladder.discard(Decimal("1.00"))
+
+
+@pytest.mark.parametrize("descending", [True, False])
+@pytest.mark.parametrize("factory", LADDERS, ids=LADDER_IDS)
+def test_random_operations_match_sorted_reference(factory, descending) -> None:
+    rng = random.Random(3)
+    ladder = factory(descending=descending)
+    reference: set[int] = set()
+
+    for _ in range(3_000):
+        cents = rng.randint(1, 10_000)
+        if cents in reference:
+            ladder.discard(_price(cents))
+            reference.remove(cents)
+        else:
+            ladder.add(_price(cents))
+            reference.add(cents)
+
+        expected = sorted(reference, reverse=descending)[:10]
+        assert ladder.top(10) == [_price(c) for c in expected]
+        assert len(ladder) == len(reference)
+
+
+@pytest.mark.parametrize("descending", [True, False])
+def test_tick_ladder_grows_both_ways_and_matches_reference(descending) -> None:
+    rng = random.Random(5)
+    ladder = TickLadder(descending=descending)
+    reference: set[int] = set()
+
+    # Start mid-range so the window has to grow down as well as up.
+    for tick in [5_000] + [rng.randint(1, 10_000) for _ in range(3_000)]:
+        if tick in reference:
+            ladder.discard(tick)
+            reference.remove(tick)
+        else:
+            ladder.add(tick)
+            reference.add(tick)
+
+        expected = sorted(reference, reverse=descending)
+        assert ladder.best() == (expected[0] if expected else None)
+        assert ladder.top(10) == expected[:10]
+        assert len(ladder) == len(reference)
+
+
+def test_tick_ladder_rejects_span_wider_than_max() -> None:
+    ladder = TickLadder(descending=True, max_span=1_000)
+    ladder.add(10_000)
+    ladder.add(10_999)
+
+    with pytest.raises(InvalidOrderBookError):
+        ladder.check(11_000)
+    with pytest.raises(InvalidOrderBookError):
+        ladder.add(9_000)
+    assert ladder.top(5) == [10_999, 10_000]
+
+
+def test_tick_ladder_discard_outside_window_is_noop() -> None:
+    ladder = TickLadder(descending=False)
+    ladder.discard(7)
+    ladder.add(100)
+    ladder.discard(1_000_000)
+
+    assert ladder.top(5) == [100]
+
+
+def test_dense_ladder_rejects_out_of_band_price() -> None:
+    ladder = DenseTickLadder(
+        descending=False,
+        min_price=Decimal("1.00"),
+        max_price=Decimal("2.00"),
+    )
+
+    with pytest.raises(InvalidOrderBookError):
+        ladder.add(Decimal("2.01"))
+
+
+@pytest.mark.parametrize("factory", LADDERS, ids=LADDER_IDS)
+def test_order_book_walks_levels_with_ladder(factory) -> None:
+    book = OrderBook(InstrumentId.generate(), ladder_factory=factory)
+    for cents in (1100, 1000, 1200):
+        book.submit(
+            order_id=OrderId.generate(),
+            trader_id=TraderId.generate(),
+            side=OrderSide.SELL,
+            order_type=OrderType.LIMIT,
+            time_in_force=TimeInForce.GTC,
+            quantity=Quantity(5),
+            limit_price=Money(_price(cents), Currency.USD),
+        )
+
+    result = book.submit(
+        order_id=OrderId.generate(),
+        trader_id=TraderId.generate(),
+        side=OrderSide.BUY,
+        order_type=OrderType.MARKET,
+        time_in_force=TimeInForce.IOC,
+        quantity=Quantity(12),
+        limit_price=None,
+    )
+
+    assert [t.execution_price.amount for t in result.trades] == [
+        Decimal("10.00"),
+        Decimal("11.00"),
+        Decimal("12.00"),
+    ]
+    assert book.depth_asks() == [(Money(Decimal("12.00"), Currency.USD), 3)]
+
+
+def test_order_book_rejects_price_outside_dense_band_before_matching() -> None:
+    book = OrderBook(
+        InstrumentId.generate(),
+        ladder_factory=partial(
+            DenseTickLadder,
+            min_price=Decimal("1.00"),
+            max_price=Decimal("2.00"),
+        ),
+    )
+
+    with pytest.raises(InvalidOrderBookError):
+        book.submit(
+            order_id=OrderId.generate(),
+            trader_id=TraderId.generate(),
+            side=OrderSide.BUY,
+            order_type=OrderType.LIMIT,
+            time_in_force=TimeInForce.GTC,
+            quantity=Quantity(1),
+            limit_price=Money(Decimal("5.00"), Currency.USD),
+        )
+    assert book.order_count() == 0
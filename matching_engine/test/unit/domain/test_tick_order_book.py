@@ -0,0 +1,155 @@
+import random
+from decimal import Decimal
+from functools import partial
+
+import pytest
+
+import test_order_book as order_book_suite
+from src.domain.entities.order_book import OrderBook
+from src.domain.entities.price_ladder import TickLadder
+from src.domain.entities.tick_order_book import TickOrderBook
+from src.domain.value_objects.currency import Currency
+from src.domain.value_objects.instrument_id import InstrumentId
+from src.domain.value_objects.money import Money
+from src.domain.value_objects.order_id import OrderId
+from src.domain.value_objects.order_side import OrderSide
+from src.domain.value_objects.order_type import OrderType
+from src.domain.value_objects.quantity import Quantity
+from src.domain.value_objects.time_in_force import TimeInForce
+from src.domain.value_objects.trader_id import TraderId
+from src.exceptions import InvalidOrderBookError, OrderNotInBookError
+
+# Re-collect the whole OrderBook suite so both engines share one contract.
+from test_order_book import *  # noqa: F401,F403
+
+
+@pytest.fixture(autouse=True)
+def _use_tick_book(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        order_book_suite,
+        "_book",
+        lambda: TickOrderBook(InstrumentId.generate()),
+    )
+
+
+def _usd(amount: str) -> Money:
+    return Money(Decimal(amount), Currency.USD)
+
+
+# ---------------------------------------------------------------------------
+# Tick conversion
+# ---------------------------------------------------------------------------
+
+
+def test_to_ticks_uses_tick_size() -> None:
+    book = TickOrderBook(InstrumentId.generate(), tick_size=Decimal("0.05"))
+
+    assert book.to_ticks(_usd("10.25")) == 205
+
+
+def test_off_tick_price_raises() -> None:
+    book = TickOrderBook(InstrumentId.generate(), tick_size=Decimal("0.05"))
+
+    with pytest.raises(InvalidOrderBookError):
+        book.submit(
+            order_id=OrderId.generate(),
+            trader_id=TraderId.generate(),
+            side=OrderSide.BUY,
+            order_type=OrderType.LIMIT,
+            time_in_force=TimeInForce.GTC,
+            quantity=Quantity(1),
+            limit_price=_usd("10.02"),
+        )
+
+
+def test_non_positive_tick_size_raises() -> None:
+    with pytest.raises(InvalidOrderBookError):
+        TickOrderBook(InstrumentId.generate(), tick_size=Decimal("0"))
+
+
+def test_price_too_far_from_book_rejected_before_matching() -> None:
+    book = TickOrderBook(
+        InstrumentId.generate(),
+        ladder_factory=partial(TickLadder, max_span=1_000),
+    )
+    submit = partial(
+        book.submit,
+        order_type=OrderType.LIMIT,
+        time_in_force=TimeInForce.GTC,
+        quantity=Quantity(1),
+    )
+    submit(
+        order_id=OrderId.generate(),
+        trader_id=TraderId.generate(),
+        side=OrderSide.SELL,
+        limit_price=_usd("10.00"),
+    )
+
+    with pytest.raises(InvalidOrderBookError):
+        submit(
+            order_id=OrderId.generate(),
+            trader_id=TraderId.generate(),
+            side=OrderSide.SELL,
+            limit_price=_usd("20.00"),
+        )
+    assert book.best_ask() == _usd("10.00")
+
+
+# ---------------------------------------------------------------------------
+# Equivalence with the Decimal book
+# ---------------------------------------------------------------------------
+
+
+def test_random_stream_matches_decimal_book() -> None:
+    rng = random.Random(42)
+    instrument = InstrumentId.generate()
+    reference = OrderBook(instrument)
+    book = TickOrderBook(instrument)
+    traders = [TraderId.generate() for _ in range(5)]
+    live: list[OrderId] = []
+
+    for _ in range(2_000):
+        if live and rng.random() < 0.15:
+            oid = live.pop(rng.randrange(len(live)))
+            try:
+                expected = reference.cancel(oid)
+            except OrderNotInBookError:
+                with pytest.raises(OrderNotInBookError):
+                    book.cancel(oid)
+                continue
+            actual = book.cancel(oid)
+            assert actual.remaining_quantity == expected.remaining_quantity
+            continue
+
+        oid = OrderId.generate()
+        is_market = rng.random() < 0.1
+        kwargs = dict(
+            order_id=oid,
+            trader_id=rng.choice(traders),
+            side=rng.choice([OrderSide.BUY, OrderSide.SELL]),
+            order_type=OrderType.MARKET if is_market else OrderType.LIMIT,
+            time_in_force=TimeInForce.IOC if is_market else TimeInForce.GTC,
+            quantity=Quantity(rng.randint(1, 20)),
+            limit_price=(
+                None if is_market else _usd(f"{rng.randint(9_900, 10_100) / 100:.2f}")
+            ),
+        )
+        expected = reference.submit(**kwargs)
+        actual = book.submit(**kwargs)
+
+        assert [
+            (t.maker_order_id, t.quantity, t.execution_price) for t in actual.trades
+        ] == [
+            (t.maker_order_id, t.quantity, t.execution_price) for t in expected.trades
+        ]
+        assert actual.taker_filled_quantity == expected.taker_filled_quantity
+        assert actual.taker_remaining_quantity == expected.taker_remaining_quantity
+        if expected.resting_order is not None:
+            live.append(oid)
+
+    assert book.depth_bids() == reference.depth_bids()
+    assert book.depth_asks() == reference.depth_asks()
+    assert book.bid_levels() == reference.bid_levels()
+    assert book.ask_levels() == reference.ask_levels()
+    assert book.order_count() == reference.order_count()
+    assert book.last_trade_price == reference.last_trade_price
@@ -0,0 +1,279 @@
+from dataclasses import asdict
+from decimal import Decimal
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.application.cancel_resting_order import (
+    CancelRestingOrderCommand,
+    CancelRestingOrderHandler,
+)
+from src.application.process_incoming_order import (
+    ProcessIncomingOrderCommand,
+    ProcessIncomingOrderHandler,
+)
+from src.domain.value_objects.instrument_id import InstrumentId
+from src.domain.value_objects.order_id import OrderId
+from src.domain.value_objects.trader_id import TraderId
+from src.exceptions import (
+    DuplicateCommandError,
+    JournalError,
+    OrderNotInBookError,
+    SnapshotError,
+)
+from src.infrastructure.book.in_memory_order_book_registry import (
+    InMemoryOrderBookRegistry,
+)
+from src.infrastructure.journal.book_recovery import BookRecovery
+from src.infrastructure.journal.book_snapshot_store import BookSnapshotStore
+from src.infrastructure.journal.file_order_journal import FileOrderJournal
+
+INSTRUMENT = InstrumentId.generate().value
+
+
+def _open(side: str, qty: int, price: str) -> ProcessIncomingOrderCommand:
+    return ProcessIncomingOrderCommand(
+        order_id=OrderId.generate().value,
+        trader_id=TraderId.generate().value,
+        instrument_id=INSTRUMENT,
+        side=side,
+        order_type="LIMIT",
+        time_in_force="GTC",
+        quantity=qty,
+        limit_price=Decimal(price),
+        limit_price_currency="USD",
+    )
+
+
+class _Engine:
+    """Registry + handlers wired to a journal in ``directory``."""
+
+    def __init__(self, directory: Path, **journal_options) -> None:
+        self.registry = InMemoryOrderBookRegistry()
+        self.journal = FileOrderJournal(
+            directory, fsync=False, flush_interval=0, **journal_options
+        )
+        self.process = ProcessIncomingOrderHandler(
+            self.registry, AsyncMock(), AsyncMock(), self.journal
+        )
+        self.cancel = CancelRestingOrderHandler(
+            self.registry, AsyncMock(), AsyncMock(), self.journal
+        )
+        self.recovery = BookRecovery(
+            self.registry,
+            self.journal,
+            BookSnapshotStore(directory),
+            self.process,
+            self.cancel,
+        )
+
+    async def start(self):
+        await self.journal.start()
+        return self.recovery.recover()
+
+    def book(self):
+        return self.registry.get(InstrumentId(INSTRUMENT))
+
+
+async def test_journal_round_trips_commands(tmp_path: Path) -> None:
+    journal = FileOrderJournal(tmp_path, fsync=False, flush_interval=0)
+    await journal.start()
+    command = _open("BUY", 3, "10.50")
+    journal.record_open(**asdict(command))
+    journal.record_cancel(order_id=command.order_id, instrument_id=INSTRUMENT)
+    await journal.sync()
+    await journal.close()
+
+    reopened = FileOrderJournal(tmp_path)
+    await reopened.start()
+    entries = list(reopened.replay())
+    await reopened.close()
+
+    assert [seq for seq, _ in entries] == [1, 2]
+    assert entries[0][1] == command
+    assert entries[1][1] == CancelRestingOrderCommand(command.order_id, INSTRUMENT)
+    assert reopened.last_seq == 2
+
+
+async def test_torn_tail_is_truncated(tmp_path: Path) -> None:
+    journal = FileOrderJournal(tmp_path, fsync=False, flush_interval=0)
+    await journal.start()
+    for _ in range(3):
+        journal.record_open(**asdict(_open("BUY", 1, "10")))
+    await journal.sync()
+    await journal.close()
+
+    (segment,) = tmp_path.glob("journal-*.log")
+    segment.write_bytes(segment.read_bytes()[:-5])
+
+    reopened = FileOrderJournal(tmp_path, fsync=False, flush_interval=0)
+    await reopened.start()
+    assert reopened.last_seq == 2
+    reopened.record_open(**asdict(_open("SELL", 1, "11")))
+    await reopened.sync()
+    await reopened.close()
+
+    assert [seq for seq, _ in FileOrderJournal(tmp_path).replay()] == [1, 2, 3]
+
+
+async def test_segments_roll_over_and_prune(tmp_path: Path) -> None:
+    journal = FileOrderJournal(tmp_path, fsync=False, flush_interval=0, segment_bytes=1)
+    await journal.start()
+    for _ in range(3):
+        journal.record_open(**asdict(_open("BUY", 1, "10")))
+        await journal.sync()
+
+    assert len(list(tmp_path.glob("journal-*.log"))) == 4
+    assert journal.prune(2) == 2
+    assert [seq for seq, _ in journal.replay()] == [3]
+    await journal.close()
+
+
+async def test_recovery_restores_snapshot_plus_journal_tail(tmp_path: Path) -> None:
+    engine = _Engine(tmp_path)
+    await engine.start()
+    await engine.process.handle(_open("SELL", 5, "101"))
+    resting = _open("BUY", 4, "99")
+    await engine.process.handle(resting)
+    await engine.recovery.checkpoint()
+    await engine.process.handle(_open("BUY", 2, "101"))
+    await engine.process.handle(_open("BUY", 1, "98"))
+    await engine.cancel.handle(CancelRestingOrderCommand(resting.order_id, INSTRUMENT))
+    expected = engine.book()
+    await engine.journal.close()
+
+    restarted = _Engine(tmp_path)
+    stats = await restarted.start()
+    await restarted.journal.close()
+
+    assert stats.snapshot_seq == 2
+    assert stats.replayed == 3
+    book = restarted.book()
+    assert book.bid_levels() == expected.bid_levels()
+    assert book.ask_levels() == expected.ask_levels()
+    assert book.last_trade_price == expected.last_trade_price
+
+
+async def test_redelivered_command_is_rejected_after_restart(
+    tmp_path: Path,
+) -> None:
+    engine = _Engine(tmp_path)
+    await engine.start()
+    command = _open("BUY", 4, "99")
+    await engine.process.handle(command)
+    await engine.journal.close()
+
+    restarted = _Engine(tmp_path)
+    await restarted.start()
+    with pytest.raises(DuplicateCommandError):
+        await restarted.process.handle(command)
+    await restarted.journal.close()
+
+    assert restarted.book().order_count() == 1
+
+
+async def test_output_unpublished_before_crash_is_republished(
+    tmp_path: Path,
+) -> None:
+    engine = _Engine(tmp_path)
+    await engine.start()
+    await engine.process.handle(_open("SELL", 5, "101"))
+    engine.process._event_publisher.publish_many.side_effect = RuntimeError("crash")
+    with pytest.raises(RuntimeError):
+        await engine.process.handle(_open("BUY", 2, "101"))
+    await engine.journal.close()
+
+    restarted = _Engine(tmp_path)
+    stats = await restarted.start()
+    publisher = AsyncMock()
+    assert stats.unpublished == 1
+    assert await restarted.recovery.republish(publisher) == 1
+    await restarted.journal.close()
+
+    (events,) = publisher.publish_many.await_args.args
+    assert [type(e).__name__ for e in events] == ["TradeExecuted", "OrderFilled"]
+
+    again = _Engine(tmp_path)
+    assert (await again.start()).unpublished == 0
+    await again.journal.close()
+
+
+async def test_republished_trades_keep_their_ids_and_times(tmp_path: Path) -> None:
+    engine = _Engine(tmp_path)
+    await engine.start()
+    await engine.process.handle(_open("SELL", 5, "101"))
+    await engine.process.handle(_open("SELL", 5, "101"))
+    publish_many = engine.process._event_publisher.publish_many
+    publish_many.side_effect = RuntimeError("crash")
+    with pytest.raises(RuntimeError):
+        await engine.process.handle(_open("BUY", 7, "101"))
+    (lost,) = publish_many.await_args.args
+    await engine.journal.close()
+
+    restarted = _Engine(tmp_path)
+    await restarted.start()
+    publisher = AsyncMock()
+    await restarted.recovery.republish(publisher)
+    await restarted.journal.close()
+
+    (events,) = publisher.publish_many.await_args.args
+    trades = [
+        (e.trade_id, e.occurred_at) for e in events if e.event_type == "TradeExecuted"
+    ]
+    assert len(trades) == 2
+    assert len({trade_id for trade_id, _ in trades}) == 2
+    assert trades == [
+        (e.trade_id, e.occurred_at) for e in lost if e.event_type == "TradeExecuted"
+    ]
+
+
+async def test_checkpoint_waits_for_output_to_be_emitted(tmp_path: Path) -> None:
+    engine = _Engine(tmp_path)
+    engine.recovery._emit_timeout = 0.05
+    await engine.start()
+    output = engine.process.execute(_open("BUY", 1, "99"))
+
+    with pytest.raises(SnapshotError):
+        await engine.recovery.checkpoint()
+
+    engine.journal.record_emitted(output.journal_seq)
+    assert await engine.recovery.checkpoint() == 1
+    await engine.journal.close()
+
+
+async def test_rejected_command_counts_as_emitted(tmp_path: Path) -> None:
+    engine = _Engine(tmp_path)
+    engine.recovery._emit_timeout = 0.05
+    await engine.start()
+    await engine.process.handle(_open("BUY", 1, "99"))
+
+    with pytest.raises(OrderNotInBookError):
+        engine.cancel.execute(
+            CancelRestingOrderCommand(OrderId.generate().value, INSTRUMENT)
+        )
+
+    assert await engine.recovery.checkpoint() == 2
+    await engine.journal.close()
+
+
+async def test_write_failure_is_fatal(tmp_path: Path) -> None:
+    failures: list[JournalError] = []
+    journal = FileOrderJournal(
+        tmp_path, fsync=False, flush_interval=0, on_failure=failures.append
+    )
+    await journal.start()
+
+    def _fail(data, upto):
+        raise OSError("disk full")
+
+    journal._write = _fail
+    journal.record_open(**asdict(_open("BUY", 1, "10")))
+    with pytest.raises(JournalError):
+        await journal.sync()
+    with pytest.raises(JournalError):
+        await journal.sync()
+
+    assert len(failures) == 1
+    assert journal.failed
+    await journal.close()
@@ -0,0 +1,185 @@
+import asyncio
+from decimal import Decimal
+from unittest.mock import AsyncMock
+
+from src.application.cancel_resting_order import (
+    CancelRestingOrderCommand,
+    CancelRestingOrderHandler,
+)
+from src.application.process_incoming_order import (
+    ProcessIncomingOrderCommand,
+    ProcessIncomingOrderHandler,
+)
+from src.domain.events.matching_events import OrderRemoved, TradeExecuted
+from src.domain.value_objects.instrument_id import InstrumentId
+from src.domain.value_objects.order_id import OrderId
+from src.domain.value_objects.trader_id import TraderId
+from src.exceptions import JournalError
+from src.infrastructure.book.in_memory_order_book_registry import (
+    InMemoryOrderBookRegistry,
+)
+from src.infrastructure.cache.snapshot_writer import CoalescingSnapshotWriter
+from src.infrastructure.pipeline.matching_pipeline import MatchingPipeline
+
+INSTRUMENT = InstrumentId.generate().value
+
+
+def _open(side: str, qty: int, price: str) -> ProcessIncomingOrderCommand:
+    return ProcessIncomingOrderCommand(
+        order_id=OrderId.generate().value,
+        trader_id=TraderId.generate().value,
+        instrument_id=INSTRUMENT,
+        side=side,
+        order_type="LIMIT",
+        time_in_force="GTC",
+        quantity=qty,
+        limit_price=Decimal(price),
+        limit_price_currency="USD",
+    )
+
+
+class _Delivery:
+    def __init__(self, log: list[str], name: str) -> None:
+        self._log = log
+        self._name = name
+
+    async def ack(self) -> None:
+        self._log.append(f"ack:{self._name}")
+
+    async def reject(self, requeue: bool = False) -> None:
+        self._log.append(f"reject:{self._name}")
+
+
+def _pipeline(log: list[str], publish_many=None, **options):
+    registry = InMemoryOrderBookRegistry()
+    publisher = AsyncMock()
+    cache = AsyncMock()
+
+    async def _record(events):
+        log.append(f"publish:{len(events)}")
+
+    publisher.publish_many = AsyncMock(side_effect=publish_many or _record)
+    pipeline = MatchingPipeline(
+        ProcessIncomingOrderHandler(registry, publisher, cache),
+        CancelRestingOrderHandler(registry, publisher, cache),
+        publisher,
+        CoalescingSnapshotWriter(cache, flush_interval=0),
+        **options,
+    )
+    return pipeline, publisher, cache
+
+
+async def test_acks_follow_the_published_batch_in_order() -> None:
+    log: list[str] = []
+    pipeline, publisher, _ = _pipeline(log)
+    pipeline.start()
+
+    resting = _open("SELL", 5, "101")
+    await pipeline.submit(resting, _Delivery(log, "a"))
+    await pipeline.submit(_open("BUY", 2, "101"), _Delivery(log, "b"))
+    await pipeline.submit(
+        CancelRestingOrderCommand(resting.order_id, INSTRUMENT), _Delivery(log, "c")
+    )
+    await pipeline.stop()
+
+    acks = [entry for entry in log if entry.startswith("ack")]
+    assert acks == ["ack:a", "ack:b", "ack:c"]
+    for ack in acks:
+        assert any(entry.startswith("publish") for entry in log[: log.index(ack)]), log
+    events = [e for call in publisher.publish_many.await_args_list for e in call[0][0]]
+    assert sum(isinstance(event, TradeExecuted) for event in events) == 1
+    assert isinstance(events[-1], OrderRemoved)
+    assert pipeline.metrics().acked == 3
+
+
+async def test_failed_command_is_rejected_without_blocking_others() -> None:
+    log: list[str] = []
+    pipeline, _, _ = _pipeline(log)
+    pipeline.start()
+
+    await pipeline.submit(
+        CancelRestingOrderCommand(OrderId.generate().value, INSTRUMENT),
+        _Delivery(log, "missing"),
+    )
+    await pipeline.submit(_open("BUY", 1, "99"), _Delivery(log, "ok"))
+    await pipeline.stop()
+
+    assert "reject:missing" in log
+    assert "ack:ok" in log
+    metrics = pipeline.metrics()
+    assert (metrics.matched, metrics.rejected, metrics.acked) == (1, 1, 1)
+
+
+async def test_publish_failure_is_retried_before_acking() -> None:
+    log: list[str] = []
+    attempts = 0
+
+    async def _flaky(events):
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise RuntimeError("broker unavailable")
+        log.append("publish")
+
+    pipeline, _, _ = _pipeline(log, publish_many=_flaky, retry_delay=0.01)
+    pipeline.start()
+    await pipeline.submit(_open("BUY", 1, "99"), _Delivery(log, "a"))
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    assert "ack:a" not in log
+    assert pipeline.metrics().unacked == 1
+
+    await pipeline.stop()
+    assert attempts == 2
+    assert log == ["publish", "ack:a"]
+
+
+async def test_journal_failure_is_not_retried_and_stops_the_owner() -> None:
+    log: list[str] = []
+    failures: list[BaseException] = []
+    journal = AsyncMock()
+    journal.sync.side_effect = JournalError("disk full")
+    pipeline, publisher, _ = _pipeline(
+        log, journal=journal, retry_delay=0.01, on_failure=failures.append
+    )
+    pipeline.start()
+    await pipeline.submit(_open("BUY", 1, "99"), _Delivery(log, "a"))
+    await pipeline.stop(timeout=0.05)
+
+    journal.sync.assert_awaited_once()
+    publisher.publish_many.assert_not_awaited()
+    assert log == []
+    assert [type(exc) for exc in failures] == [JournalError]
+
+
+async def test_failed_ack_does_not_stop_the_publisher() -> None:
+    log: list[str] = []
+    failures: list[BaseException] = []
+    pipeline, _, _ = _pipeline(log, on_failure=failures.append)
+    broken = _Delivery(log, "a")
+    broken.ack = AsyncMock(side_effect=RuntimeError("channel closed"))
+    pipeline.start()
+
+    await pipeline.submit(_open("BUY", 1, "99"), broken)
+    await pipeline.submit(_open("BUY", 1, "98"), _Delivery(log, "b"))
+    await pipeline.stop()
+
+    assert "ack:b" in log
+    assert pipeline.metrics().acked == 1
+    assert failures == []
+
+
+async def test_cache_writes_are_coalesced_per_book() -> None:
+    log: list[str] = []
+    pipeline, _, cache = _pipeline(log)
+    for price in ("99", "98", "97"):
+        await pipeline.submit(_open("BUY", 1, price), _Delivery(log, price))
+    assert pipeline.metrics().command_queue == 3
+
+    pipeline.start()
+    await pipeline.stop()
+
+    assert cache.write_snapshots.await_count == 1
+    (snapshot,) = cache.write_snapshots.await_args[0][0]
+    assert len(snapshot.bids) == 3
+    assert snapshot.asks == []
@@ -0,0 +1,163 @@
+import asyncio
+import json
+from collections import Counter
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.infrastructure.messaging.order_shard_router import OrderShardRouter
+from src.infrastructure.messaging.sharding import shard_for, shard_routing_key
+
+
+class _Message:
+    def __init__(self, body: bytes, routing_key: str = "OrderOpened") -> None:
+        self.body = body
+        self.routing_key = routing_key
+        self.type = None
+        self.ack = AsyncMock()
+        self.nack = AsyncMock()
+        self.reject = AsyncMock()
+
+
+def _router(shard_count: int = 4) -> OrderShardRouter:
+    router = OrderShardRouter(
+        url="amqp://unused",
+        source_exchange="order.events",
+        source_queue="matching_engine.orders",
+        shard_exchange="matching_engine.shards",
+        shard_count=shard_count,
+    )
+    router._shard_exchange = AsyncMock()
+    return router
+
+
+def _order_event(instrument_id: str) -> bytes:
+    return json.dumps(
+        {"event_type": "OrderOpened", "instrument_id": instrument_id}
+    ).encode()
+
+
+def test_shard_for_is_stable_and_in_range() -> None:
+    assert shard_for("BTC-USD", 8) == shard_for("BTC-USD", 8)
+    assert all(0 <= shard_for(f"inst-{i}", 3) < 3 for i in range(100))
+    assert shard_for("BTC-USD", 1) == 0
+
+
+def test_shard_for_spreads_instruments() -> None:
+    counts = Counter(shard_for(f"inst-{i}", 4) for i in range(4_000))
+
+    assert set(counts) == {0, 1, 2, 3}
+    assert min(counts.values()) > 800
+
+
+def test_shard_for_rejects_non_positive_count() -> None:
+    with pytest.raises(ValueError):
+        shard_for("BTC-USD", 0)
+
+
+async def test_forward_publishes_to_owning_shard_then_acks() -> None:
+    router = _router()
+    message = _Message(_order_event("inst-7"))
+
+    await router._forward(message)
+
+    router._shard_exchange.publish.assert_awaited_once()
+    (published,) = router._shard_exchange.publish.await_args.args
+    assert published.body == message.body
+    assert published.type == "OrderOpened"
+    assert router._shard_exchange.publish.await_args.kwargs[
+        "routing_key"
+    ] == shard_routing_key(shard_for("inst-7", 4))
+    message.ack.assert_awaited_once()
+
+
+async def test_forward_preserves_delivery_order() -> None:
+    router = _router(shard_count=1)
+    messages = [_Message(_order_event("inst-1")) for _ in range(5)]
+    for message in messages:
+        await router._on_message(message)
+
+    while not router._pending.empty():
+        await router._forward(router._pending.get_nowait())
+
+    bodies = [c.args[0].body for c in router._shard_exchange.publish.await_args_list]
+    assert bodies == [m.body for m in messages]
+
+
+async def test_forward_rejects_unroutable_message() -> None:
+    router = _router()
+    message = _Message(b'{"event_type": "OrderOpened"}')
+
+    await router._forward(message)
+
+    router._shard_exchange.publish.assert_not_awaited()
+    message.reject.assert_awaited_once_with(requeue=False)
+    message.ack.assert_not_awaited()
+
+
+async def test_forward_requeues_when_publish_fails() -> None:
+    router = _router()
+    router._shard_exchange.publish.side_effect = RuntimeError("channel closed")
+    message = _Message(_order_event("inst-7"))
+
+    await router._forward(message)
+
+    message.nack.assert_awaited_once_with(requeue=True)
+    message.ack.assert_not_awaited()
+
+
+async def test_confirms_are_pipelined_and_acked_in_delivery_order() -> None:
+    router = _router(shard_count=1)
+    confirms = {i: asyncio.Event() for i in range(3)}
+    started: list[int] = []
+    acked: list[int] = []
+
+    async def publish(published, routing_key):
+        i = json.loads(published.body)["seq"]
+        started.append(i)
+        await confirms[i].wait()
+
+    router._shard_exchange.publish.side_effect = publish
+    messages = []
+    for i in range(3):
+        message = _Message(json.dumps({"instrument_id": "inst-1", "seq": i}).encode())
+        message.ack.side_effect = lambda i=i: acked.append(i)
+        messages.append(message)
+        await router._on_message(message)
+
+    forwarder = asyncio.create_task(router._forward_loop())
+    settler = asyncio.create_task(router._settle_loop())
+    try:
+        await asyncio.sleep(0.01)
+        assert started == [0, 1, 2]  # all in flight before any confirm
+        confirms[2].set()
+        confirms[1].set()
+        await asyncio.sleep(0.01)
+        assert acked == []  # held until the earliest delivery is confirmed
+        confirms[0].set()
+        await asyncio.sleep(0.01)
+        assert acked == [0, 1, 2]
+    finally:
+        forwarder.cancel()
+        settler.cancel()
+        await asyncio.gather(forwarder, settler, return_exceptions=True)
+
+
+async def test_settle_loop_survives_ack_failure() -> None:
+    router = _router(shard_count=1)
+    first = _Message(_order_event("inst-1"))
+    first.ack.side_effect = RuntimeError("channel closed")
+    second = _Message(_order_event("inst-1"))
+    for message in (first, second):
+        await router._on_message(message)
+
+    forwarder = asyncio.create_task(router._forward_loop())
+    settler = asyncio.create_task(router._settle_loop())
+    try:
+        await asyncio.sleep(0.01)
+    finally:
+        forwarder.cancel()
+        settler.cancel()
+        await asyncio.gather(forwarder, settler, return_exceptions=True)
+
+    second.ack.assert_awaited_once()
@@ -0,0 +1,41 @@
+import asyncio
+import sys
+
+from src.infrastructure.process.process_supervisor import (
+    ChildSpec,
+    ProcessSupervisor,
+)
+
+
+async def test_restarts_child_that_exits() -> None:
+    spec = ChildSpec("crasher", (sys.executable, "-c", "raise SystemExit(3)"))
+    supervisor = ProcessSupervisor([spec], restart_delay=0.01, max_restart_delay=0.01)
+    stop_event = asyncio.Event()
+
+    task = asyncio.create_task(supervisor.run(stop_event))
+    for _ in range(500):
+        if supervisor.restarts["crasher"] >= 2:
+            break
+        await asyncio.sleep(0.01)
+    stop_event.set()
+    await task
+
+    assert supervisor.restarts["crasher"] >= 2
+
+
+async def test_stop_terminates_running_children() -> None:
+    spec = ChildSpec(
+        "sleeper",
+        (sys.executable, "-c", "import time; time.sleep(60)"),
+    )
+    supervisor = ProcessSupervisor([spec])
+    stop_event = asyncio.Event()
+
+    task = asyncio.create_task(supervisor.run(stop_event))
+    while "sleeper" not in supervisor._processes:
+        await asyncio.sleep(0.01)
+    stop_event.set()
+    await asyncio.wait_for(task, 5)
+
+    assert supervisor._processes["sleeper"].returncode is not None
+    assert supervisor.restarts["sleeper"] == 0
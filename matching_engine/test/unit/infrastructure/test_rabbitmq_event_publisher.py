@@ -0,0 +1,85 @@
+import asyncio
+import json
+from decimal import Decimal
+
+import pytest
+
+from src.domain.events.matching_events import OrderFilled, TradeExecuted
+from src.exceptions import MessagingPublishError
+from src.infrastructure.messaging.rabbitmq_event_publisher import (
+    RabbitMQEventPublisher,
+)
+
+
+class _Exchange:
+    """Records publishes and holds each confirm open for a moment."""
+
+    def __init__(self, fail_on: int | None = None) -> None:
+        self.published: list[tuple[str, dict]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._fail_on = fail_on
+
+    async def publish(self, message, routing_key: str) -> None:
+        position = len(self.published)
+        self.published.append((routing_key, json.loads(message.body)))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.001)
+            if self._fail_on == position:
+                raise RuntimeError("nack")
+        finally:
+            self.in_flight -= 1
+
+
+def _publisher(exchange: _Exchange, max_in_flight: int) -> RabbitMQEventPublisher:
+    publisher = RabbitMQEventPublisher(
+        url="amqp://unused",
+        exchange_name="trade.events",
+        max_in_flight=max_in_flight,
+    )
+    publisher._exchange = exchange
+    return publisher
+
+
+def _trades(n: int) -> list[TradeExecuted]:
+    return [TradeExecuted(trade_id=f"t{i}", sequence_number=i) for i in range(n)]
+
+
+async def test_publish_many_pipelines_within_window_in_order() -> None:
+    exchange = _Exchange()
+    publisher = _publisher(exchange, max_in_flight=8)
+    events = [*_trades(20), OrderFilled(order_id="o1", fill_quantity=20)]
+
+    await publisher.publish_many(events)
+
+    assert [key for key, _ in exchange.published] == ["TradeExecuted"] * 20 + [
+        "OrderFilled"
+    ]
+    assert [body["trade_id"] for _, body in exchange.published[:20]] == [
+        f"t{i}" for i in range(20)
+    ]
+    assert exchange.max_in_flight == 8
+
+
+async def test_publish_many_raises_after_batch_when_a_confirm_fails() -> None:
+    exchange = _Exchange(fail_on=3)
+    publisher = _publisher(exchange, max_in_flight=4)
+
+    with pytest.raises(MessagingPublishError, match="1 of 10"):
+        await publisher.publish_many(_trades(10))
+    assert len(exchange.published) == 10
+
+
+async def test_event_body_serializes_decimals_and_timestamps() -> None:
+    exchange = _Exchange()
+    publisher = _publisher(exchange, max_in_flight=1)
+    event = TradeExecuted(trade_id="t1", execution_price=Decimal("10.50"))
+
+    await publisher.publish(event)
+
+    ((_, body),) = exchange.published
+    assert body["execution_price"] == "10.50"
+    assert body["occurred_at"] == event.occurred_at.isoformat()
+    assert body["event_type"] == "TradeExecuted"
@@ -0,0 +1,176 @@
+import asyncio
+import json
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+from src.application.command_output import write_book_to_cache
+from src.application.process_incoming_order import (
+    ProcessIncomingOrderCommand,
+    ProcessIncomingOrderHandler,
+)
+from src.domain.ports.market_data_cache import MarketDataSnapshot
+from src.domain.value_objects.instrument_id import InstrumentId
+from src.domain.value_objects.order_id import OrderId
+from src.domain.value_objects.trader_id import TraderId
+from src.infrastructure.book.in_memory_order_book_registry import (
+    InMemoryOrderBookRegistry,
+)
+from src.infrastructure.cache.redis_market_data_cache import RedisMarketDataCache
+from src.infrastructure.cache.sequenced_market_data_cache import (
+    SequencedMarketDataCache,
+)
+from src.infrastructure.cache.snapshot_writer import CoalescingSnapshotWriter
+
+
+class _Books:
+    """Builds books by running orders through the real handler."""
+
+    def __init__(self) -> None:
+        self._handler = ProcessIncomingOrderHandler(
+            InMemoryOrderBookRegistry(), AsyncMock(), AsyncMock()
+        )
+
+    def bid(self, instrument: str, price: str, qty: int = 1):
+        command = ProcessIncomingOrderCommand(
+            order_id=OrderId.generate().value,
+            trader_id=TraderId.generate().value,
+            instrument_id=instrument,
+            side="BUY",
+            order_type="LIMIT",
+            time_in_force="GTC",
+            quantity=qty,
+            limit_price=Decimal(price),
+            limit_price_currency="USD",
+        )
+        return self._handler.execute(command).book
+
+
+def _written(cache: AsyncMock) -> list[MarketDataSnapshot]:
+    return [s for call in cache.write_snapshots.await_args_list for s in call[0][0]]
+
+
+async def test_flush_batches_books_and_skips_unchanged_depth() -> None:
+    books, cache = _Books(), AsyncMock()
+    writer = CoalescingSnapshotWriter(cache, levels=2)
+    first, second = InstrumentId.generate().value, InstrumentId.generate().value
+    writer.mark_dirty(books.bid(first, "10"))
+    writer.mark_dirty(books.bid(first, "11"))
+    writer.mark_dirty(books.bid(second, "20"))
+
+    assert await writer.flush() == 2
+    assert cache.write_snapshots.await_count == 1
+    assert [len(s.bids) for s in _written(cache)] == [2, 1]
+
+    # A third level is below the visible depth: nothing to write.
+    writer.mark_dirty(books.bid(first, "9"))
+    assert await writer.flush() == 0
+    assert (cache.write_snapshots.await_count, writer.skipped) == (1, 1)
+
+    writer.mark_dirty(books.bid(first, "11"))
+    assert await writer.flush() == 1
+    assert _written(cache)[-1].bids == [(Decimal("11"), 2), (Decimal("10"), 1)]
+
+
+async def test_writes_are_rate_limited_per_interval() -> None:
+    books, cache = _Books(), AsyncMock()
+    writer = CoalescingSnapshotWriter(cache, flush_interval=0.05)
+    instrument = InstrumentId.generate().value
+    writer.start()
+    for tick in range(20):
+        writer.mark_dirty(books.bid(instrument, str(100 + tick)))
+        await asyncio.sleep(0.001)
+    await writer.stop()
+
+    assert cache.write_snapshots.await_count <= 3
+    assert _written(cache)[-1].bids[0] == (Decimal("119"), 1)
+    assert writer.pending() == 0
+
+
+async def test_failed_flush_is_retried() -> None:
+    books, cache = _Books(), AsyncMock()
+    cache.write_snapshots.side_effect = [RuntimeError("redis down"), None]
+    writer = CoalescingSnapshotWriter(cache)
+    writer.mark_dirty(books.bid(InstrumentId.generate().value, "10"))
+
+    assert await writer.flush() == 0
+    assert writer.pending() == 1
+    assert await writer.flush() == 1
+    assert writer.written == 1
+
+
+async def test_level_deltas_link_consecutive_sequences() -> None:
+    books, cache = _Books(), AsyncMock()
+    writer = CoalescingSnapshotWriter(cache, levels=2)
+    instrument = InstrumentId.generate().value
+    writer.mark_dirty(books.bid(instrument, "10"))
+    await writer.flush()
+    writer.mark_dirty(books.bid(instrument, "11"))
+    writer.mark_dirty(books.bid(instrument, "12", qty=4))
+    await writer.flush()
+
+    first, second = _written(cache)
+    assert first.previous_sequence == 0
+    assert first.changes == [("bid", Decimal("10"), 1)]
+    assert second.previous_sequence == first.sequence
+    assert second.sequence > first.sequence
+    # 12 and 11 enter the visible depth; 10 drops out of it.
+    assert second.changes == [
+        ("bid", Decimal("12"), 4),
+        ("bid", Decimal("11"), 1),
+        ("bid", Decimal("10"), 0),
+    ]
+
+
+async def test_inline_writes_are_sequenced_and_skip_unchanged_books() -> None:
+    books, inner = _Books(), AsyncMock()
+    cache = SequencedMarketDataCache(inner)
+    instrument = InstrumentId.generate().value
+    book = books.bid(instrument, "10")
+    await write_book_to_cache(cache, book)
+    await write_book_to_cache(cache, book)
+    await write_book_to_cache(cache, books.bid(instrument, "11"))
+
+    first, second = _written(inner)
+    assert (first.previous_sequence, first.changes) == (0, [("bid", Decimal("10"), 1)])
+    assert second.previous_sequence == first.sequence
+    assert second.changes == [("bid", Decimal("11"), 1)]
+
+
+async def test_redis_writes_snapshots_and_deltas_in_one_transaction() -> None:
+    cache = RedisMarketDataCache(url="redis://unused", delta_stream_maxlen=100)
+    cache._client = MagicMock()
+    pipe = cache._client.pipeline.return_value
+    pipe.execute = AsyncMock()
+    instrument = InstrumentId.generate()
+    await cache.write_snapshots(
+        [
+            MarketDataSnapshot(
+                instrument,
+                [(Decimal("10"), 3)],
+                [],
+                None,
+                None,
+                sequence=7,
+                previous_sequence=6,
+                changes=[("bid", Decimal("10"), 3)],
+            ),
+            MarketDataSnapshot(
+                InstrumentId.generate(), [], [(Decimal("5"), 1)], Decimal("5"), "USD"
+            ),
+        ]
+    )
+
+    cache._client.pipeline.assert_called_once_with(transaction=True)
+    (mapping,) = pipe.mset.call_args[0]
+    assert len(mapping) == 3
+    assert json.loads(mapping[f"md:book:{instrument.value}"])["sequence"] == 7
+    assert f"md:ltp:{instrument.value}" not in mapping
+    stream, fields = pipe.xadd.call_args[0]
+    assert stream == f"md:deltas:{instrument.value}"
+    assert fields["previous"] == "6"
+    assert json.loads(fields["changes"]) == [["bid", "10", 3]]
+    assert pipe.xadd.call_args[1] == {"maxlen": 100, "approximate": True}
+    channel, message = pipe.publish.call_args[0]
+    assert channel == "md:updates"
+    assert json.loads(message)[0] == instrument.value
+    pipe.execute.assert_awaited_once()
@@ -0,0 +1,135 @@
+"""Outbound hop latency on submit: client per call vs pooled keep-alive client.
+
+Run from the service directory::
+
+    PYTHONPATH=..:. python benchmarks/bench_gateway_pooling.py --submits 2000
+
+A local stub answers the Admin and Wallet calls a BUY LIMIT submit makes
+(``GET /api/v1/instruments/{id}``, ``GET /api/v1/wallets/by-trader/{id}``,
+``POST /api/v1/wallets/{id}/cash-reservations``) after ``--delay-ms``. Each
+mode drives the real gateways for ``--submits`` submits, ``--concurrency``
+at a time:
+
+- "per-call": a fresh ``httpx.AsyncClient`` per request (TCP connect and
+  pool setup on every hop, as the gateways used to do);
+- "pooled": one ``build_http_client`` client per service, shared.
+
+Per-hop p50/p95 come from the gateways' ``LatencyRecorder``; "submit" is
+the three hops together. Against a remote service the connect cost (and
+TLS, if any) is larger than on loopback, so the gap widens.
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import uuid
+from decimal import Decimal
+
+import httpx
+
+from src.infrastructure.http_clients.http_client import build_http_client
+from src.infrastructure.http_clients.http_instrument_gateway import (
+    HttpInstrumentGateway,
+)
+from src.infrastructure.http_clients.http_wallet_gateway import HttpWalletGateway
+from src.infrastructure.metrics.latency import LatencyRecorder
+
+
+def _stub(delay: float):
+    async def serve(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                lines = head.decode().split("\r\n")
+                method, path, _ = lines[0].split(" ", 2)
+                length = 0
+                for line in lines[1:]:
+                    if line.lower().startswith("content-length:"):
+                        length = int(line.split(":", 1)[1])
+                if length:
+                    await reader.readexactly(length)
+                if delay:
+                    await asyncio.sleep(delay)
+                if "/by-trader/" in path:
+                    body = {"wallet_id": str(uuid.uuid4())}
+                elif path.startswith("/api/v1/instruments/"):
+                    body = {"status": "ACTIVE"}
+                else:
+                    body = {}
+                payload = json.dumps(body).encode()
+                status = "201 Created" if method == "POST" else "200 OK"
+                writer.write(
+                    f"HTTP/1.1 {status}\r\nContent-Type: application/json\r\n"
+                    f"Content-Length: {len(payload)}\r\n\r\n".encode() + payload
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    return serve
+
+
+class _PerCallClient:
+    """The old gateway behaviour: one throwaway client per request."""
+
+    def __init__(self, base_url: str) -> None:
+        self._base_url = base_url
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        async with httpx.AsyncClient(base_url=self._base_url) as client:
+            return await client.get(url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        async with httpx.AsyncClient(base_url=self._base_url) as client:
+            return await client.post(url, **kwargs)
+
+
+async def run(mode: str, base_url: str, args) -> LatencyRecorder:
+    latency = LatencyRecorder()
+    if mode == "pooled":
+        client = build_http_client(base_url, max_keepalive_connections=args.concurrency)
+    else:
+        client = _PerCallClient(base_url)
+    instruments = HttpInstrumentGateway(client, latency)  # type: ignore[arg-type]
+    wallets = HttpWalletGateway(client, latency)  # type: ignore[arg-type]
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def submit() -> None:
+        async with semaphore:
+            with latency.time("submit"):
+                await instruments.ensure_tradable(str(uuid.uuid4()))
+                await wallets.reserve_for_buy(str(uuid.uuid4()), Decimal("10"), "USD")
+
+    started = time.perf_counter()
+    await asyncio.gather(*(submit() for _ in range(args.submits)))
+    elapsed = time.perf_counter() - started
+    if isinstance(client, httpx.AsyncClient):
+        await client.aclose()
+    print(f"{mode}: {args.submits / elapsed:.0f} submits/s")
+    return latency
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--submits", type=int, default=2_000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--delay-ms", type=float, default=1.0)
+    args = parser.parse_args()
+
+    server = await asyncio.start_server(_stub(args.delay_ms / 1000), "127.0.0.1", 0)
+    host, port = server.sockets[0].getsockname()[:2]
+    base_url = f"http://{host}:{port}"
+    async with server:
+        for mode in ("per-call", "pooled"):
+            for snapshot in (await run(mode, base_url, args)).snapshot():
+                print(
+                    f"  {snapshot.name:>26}  mean {snapshot.mean_ms:>7.2f} ms"
+                    f"  p50 <= {snapshot.p50_ms:>5g} ms  p95 <= {snapshot.p95_ms:>5g} ms"
+                )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,112 @@
+"""Submit latency: inline confirmed publishes vs the transactional outbox.
+
+Run from the service directory::
+
+    PYTHONPATH=..:. python benchmarks/bench_outbox_relay.py --submits 500 \\
+        --confirm-ms 2
+
+``SubmitOrderHandler`` runs MARKET submits one at a time against the
+database at ``--database-url`` (default: a fresh SQLite file); a stub
+publisher takes ``--confirm-ms`` to return each broker ack.
+
+- "inline": after the commit the request publishes OrderSubmitted and
+  OrderOpened one after the other, as the handlers used to;
+- "outbox": the request returns at commit and an ``OutboxRelay`` (woken by
+  each commit, ``--batch-size`` rows per pass) publishes in the
+  background. Its commit-to-ack lag is reported too.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.application.submit_order import SubmitOrderCommand, SubmitOrderHandler
+from src.domain.events.order_events import DomainEvent
+from src.domain.ports.event_publisher import EventPublisher
+from src.infrastructure.messaging.outbox_relay import OutboxRelay
+from src.infrastructure.metrics.latency import LatencyRecorder
+from src.infrastructure.persistence.models import Base
+from src.infrastructure.persistence.unit_of_work import SQLAlchemyUnitOfWork
+
+
+class _ConfirmingPublisher(EventPublisher):
+    def __init__(self, confirm_delay: float) -> None:
+        self._confirm_delay = confirm_delay
+
+    async def publish(self, event: DomainEvent) -> None:
+        await asyncio.sleep(self._confirm_delay)
+
+    async def publish_payload(self, event_type: str, payload: str) -> None:
+        await asyncio.sleep(self._confirm_delay)
+
+
+async def run(mode: str, args) -> None:
+    engine = create_async_engine(args.database_url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+
+    publisher = _ConfirmingPublisher(args.confirm_ms / 1000)
+    latency = LatencyRecorder()
+    relay = OutboxRelay(session_maker, publisher, latency, batch_size=args.batch_size)
+    if mode == "outbox":
+        await relay.start()
+
+    timings = []
+    for index in range(args.submits):
+        handler = SubmitOrderHandler(
+            SQLAlchemyUnitOfWork(session_maker, on_commit=relay.notify)
+        )
+        started = time.perf_counter()
+        await handler.handle(
+            SubmitOrderCommand(
+                trader_id=str(uuid.uuid4()),
+                instrument_id=str(uuid.uuid4()),
+                side="SELL",
+                order_type="MARKET",
+                time_in_force="IOC",
+                quantity=10,
+                idempotency_key=f"bench-{index}",
+            )
+        )
+        if mode == "inline":
+            await publisher.publish_payload("OrderSubmitted", "{}")
+            await publisher.publish_payload("OrderOpened", "{}")
+        timings.append((time.perf_counter() - started) * 1000)
+
+    if mode == "outbox":
+        while (await relay.stats()).pending:
+            await asyncio.sleep(0.01)
+        await relay.stop()
+    await engine.dispose()
+
+    timings.sort()
+    p95 = timings[int(len(timings) * 0.95) - 1]
+    print(f"{mode}: submit p50 {statistics.median(timings):.2f} ms  p95 {p95:.2f} ms")
+    for snapshot in latency.snapshot():
+        print(
+            f"  {snapshot.name}: p50 <= {snapshot.p50_ms:g} ms  "
+            f"p95 <= {snapshot.p95_ms:g} ms  mean {snapshot.mean_ms:.2f} ms"
+        )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--submits", type=int, default=500)
+    parser.add_argument("--confirm-ms", type=float, default=2.0)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument(
+        "--database-url", default="sqlite+aiosqlite:///bench_outbox_relay.db"
+    )
+    args = parser.parse_args()
+    for mode in ("inline", "outbox"):
+        await run(mode, args)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
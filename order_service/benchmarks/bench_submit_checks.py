@@ -0,0 +1,115 @@
+"""Submit latency breakdown: serial vs concurrent pre-trade checks.
+
+Run from the service directory::
+
+    PYTHONPATH=..:. python benchmarks/bench_submit_checks.py --submits 500 \\
+        --admin-ms 3 --wallet-ms 4
+
+``SubmitOrderHandler`` runs BUY LIMIT submits (one at a time, each for a new
+trader, so the wallet id cache is always cold) against the real HTTP
+gateways, whose transport answers after ``--admin-ms`` (instrument check)
+or ``--wallet-ms`` (wallet lookup, reservation) instead of calling out, and
+the database at ``--database-url`` (default: a fresh SQLite file).
+
+- "serial": ``concurrent_checks=False`` (Admin, then idempotency lookup,
+  then wallet lookup, then reservation and insert);
+- "concurrent": the three checks overlap, so the pre-trade phase costs
+  the slowest of them rather than their sum.
+
+Per-hop means come from the gateways' ``LatencyRecorder``.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from decimal import Decimal
+
+import httpx
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.application.submit_order import SubmitOrderCommand, SubmitOrderHandler
+from src.infrastructure.http_clients.http_instrument_gateway import (
+    HttpInstrumentGateway,
+)
+from src.infrastructure.http_clients.http_wallet_gateway import HttpWalletGateway
+from src.infrastructure.http_clients.wallet_id_cache import WalletIdCache
+from src.infrastructure.metrics.latency import LatencyRecorder
+from src.infrastructure.persistence.models import Base
+from src.infrastructure.persistence.unit_of_work import SQLAlchemyUnitOfWork
+
+
+def _transport(admin_delay: float, wallet_delay: float) -> httpx.MockTransport:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.startswith("/api/v1/instruments/"):
+            await asyncio.sleep(admin_delay)
+            return httpx.Response(200, json={"status": "ACTIVE"})
+        await asyncio.sleep(wallet_delay)
+        if "/by-trader/" in request.url.path:
+            return httpx.Response(200, json={"wallet_id": str(uuid.uuid4())})
+        return httpx.Response(201)
+
+    return httpx.MockTransport(handler)
+
+
+async def run(mode: str, args) -> None:
+    engine = create_async_engine(args.database_url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+
+    latency = LatencyRecorder()
+    transport = _transport(args.admin_ms / 1000, args.wallet_ms / 1000)
+    async with httpx.AsyncClient(base_url="http://svc", transport=transport) as client:
+        instruments = HttpInstrumentGateway(client, latency)
+        wallet = HttpWalletGateway(client, latency, WalletIdCache())
+        instrument_id = str(uuid.uuid4())
+        timings = []
+        for index in range(args.submits):
+            handler = SubmitOrderHandler(
+                SQLAlchemyUnitOfWork(session_maker),
+                wallet_gateway=wallet,
+                instrument_gateway=instruments,
+                concurrent_checks=mode == "concurrent",
+            )
+            started = time.perf_counter()
+            await handler.handle(
+                SubmitOrderCommand(
+                    trader_id=str(uuid.uuid4()),
+                    instrument_id=instrument_id,
+                    side="BUY",
+                    order_type="LIMIT",
+                    time_in_force="GTC",
+                    quantity=10,
+                    idempotency_key=f"bench-{index}",
+                    limit_price=Decimal("10.00"),
+                    limit_price_currency="USD",
+                )
+            )
+            timings.append((time.perf_counter() - started) * 1000)
+    await engine.dispose()
+
+    timings.sort()
+    p95 = timings[int(len(timings) * 0.95) - 1]
+    print(f"{mode}: p50 {statistics.median(timings):.2f} ms  p95 {p95:.2f} ms")
+    for snapshot in latency.snapshot():
+        print(f"  {snapshot.name:>26}  mean {snapshot.mean_ms:>7.2f} ms")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--submits", type=int, default=500)
+    parser.add_argument("--admin-ms", type=float, default=3.0)
+    parser.add_argument("--wallet-ms", type=float, default=4.0)
+    parser.add_argument(
+        "--database-url", default="sqlite+aiosqlite:///bench_submit_checks.db"
+    )
+    args = parser.parse_args()
+    for mode in ("serial", "concurrent"):
+        await run(mode, args)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
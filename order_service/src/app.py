@@ -1,17 +1,39 @@
+import logging
 from contextlib import asynccontextmanager
 
+import httpx
 from fastapi import FastAPI
 
 from src.conf import Config
 from src.database import async_session_maker, engine
 from src.domain.ports.event_publisher import EventPublisher
+from src.infrastructure.http_clients.http_client import build_http_client
+from src.infrastructure.http_clients.http_instrument_gateway import (
+    HttpInstrumentGateway,
+)
+from src.infrastructure.http_clients.http_wallet_gateway import HttpWalletGateway
+from src.infrastructure.http_clients.instrument_status_table import (
+    InstrumentStatusTable,
+)
+from src.infrastructure.http_clients.noop_instrument_gateway import (
+    NoOpInstrumentGateway,
+)
+from src.infrastructure.http_clients.noop_wallet_gateway import NoOpWalletGateway
+from src.infrastructure.http_clients.wallet_id_cache import WalletIdCache
+from src.infrastructure.messaging.instrument_event_consumer import (
+    InstrumentEventConsumer,
+)
 from src.infrastructure.messaging.noop_event_publisher import NoOpEventPublisher
+from src.infrastructure.messaging.outbox_relay import OutboxRelay
 from src.infrastructure.messaging.rabbitmq_event_publisher import (
     RabbitMQEventPublisher,
 )
+from src.infrastructure.metrics.latency import LatencyRecorder
 from src.infrastructure.persistence.models import Base
 from src.presentation.api.v1 import api_v1_router
 
+logger = logging.getLogger(__name__)
+
 
 def _build_event_publisher() -> EventPublisher:
     if Config.RABBITMQ_ENABLED:
@@ -23,6 +45,29 @@ def _build_event_publisher() -> EventPublisher:
     return NoOpEventPublisher()
 
 
+def _build_http_client(base_url: str, token: str = "") -> httpx.AsyncClient:
+    return build_http_client(
+        base_url,
+        timeout=Config.HTTP_TIMEOUT_SECONDS,
+        connect_timeout=Config.HTTP_CONNECT_TIMEOUT_SECONDS,
+        max_connections=Config.HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=Config.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=Config.HTTP_KEEPALIVE_EXPIRY_SECONDS,
+        http2=Config.HTTP2_ENABLED,
+        headers={"Authorization": f"Bearer {token}"} if token else None,
+    )
+
+
+def _build_wallet_id_cache() -> WalletIdCache | None:
+    if not Config.WALLET_ID_CACHE_ENABLED:
+        return None
+    return WalletIdCache(
+        max_entries=Config.WALLET_ID_CACHE_MAX_ENTRIES,
+        ttl_seconds=Config.WALLET_ID_CACHE_TTL_SECONDS,
+        negative_ttl_seconds=Config.WALLET_ID_CACHE_NEGATIVE_TTL_SECONDS,
+    )
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     async with engine.begin() as conn:
@@ -31,9 +76,61 @@ async def lifespan(app: FastAPI):
     publisher = app.state.event_publisher
     if isinstance(publisher, RabbitMQEventPublisher):
         await publisher.connect()
+    # Without the bus nothing is staged (stage_outbox_events), so there is
+    # nothing to relay.
+    relay = app.state.outbox_relay
+    if Config.RABBITMQ_ENABLED and Config.OUTBOX_RELAY_ENABLED:
+        await relay.start()
+    elif Config.RABBITMQ_ENABLED:
+        logger.warning(
+            "OUTBOX_RELAY_ENABLED=false — events stay in the outbox until an "
+            "OIS process with the relay enabled sends them."
+        )
+
+    # Pooled keep-alive clients live as long as the app, not one per call.
+    clients: list[httpx.AsyncClient] = []
+    if Config.WALLET_INTEGRATION_ENABLED:
+        wallet_client = _build_http_client(Config.WALLET_SERVICE_URL)
+        clients.append(wallet_client)
+        app.state.wallet_gateway = HttpWalletGateway(
+            wallet_client, app.state.latency, app.state.wallet_id_cache
+        )
+    instrument_table: InstrumentStatusTable | None = None
+    instrument_consumer: InstrumentEventConsumer | None = None
+    if Config.ADMIN_INTEGRATION_ENABLED:
+        admin_client = _build_http_client(
+            Config.ADMIN_SERVICE_URL, Config.ADMIN_SERVICE_TOKEN
+        )
+        clients.append(admin_client)
+        admin = HttpInstrumentGateway(admin_client, app.state.latency)
+        app.state.instrument_gateway = admin
+        # The table is only as fresh as its events, so it needs the bus.
+        if Config.INSTRUMENT_STATUS_TABLE_ENABLED and Config.RABBITMQ_ENABLED:
+            instrument_table = InstrumentStatusTable(
+                admin, refresh_interval=Config.INSTRUMENT_STATUS_REFRESH_SECONDS
+            )
+            instrument_consumer = InstrumentEventConsumer(
+                url=Config.RABBITMQ_URL,
+                exchange_name=Config.RABBITMQ_INSTRUMENT_EVENTS_EXCHANGE,
+                table=instrument_table,
+                exchange_type=Config.RABBITMQ_EXCHANGE_TYPE,
+            )
+            # Subscribe before loading so no change falls between the two.
+            await instrument_consumer.start()
+            await instrument_table.start()
+            app.state.instrument_gateway = instrument_table
 
     yield
 
+    if instrument_consumer is not None:
+        await instrument_consumer.stop()
+    if instrument_table is not None:
+        await instrument_table.stop()
+    for client in clients:
+        await client.aclose()
+    app.state.wallet_gateway = NoOpWalletGateway()
+    app.state.instrument_gateway = NoOpInstrumentGateway()
+    await relay.stop()
     if isinstance(publisher, RabbitMQEventPublisher):
         await publisher.close()
     await engine.dispose()
@@ -49,4 +146,16 @@ app = FastAPI(
 app.state.engine = engine
 app.state.session_factory = async_session_maker
 app.state.event_publisher = _build_event_publisher()
+app.state.latency = LatencyRecorder()
+app.state.outbox_relay = OutboxRelay(
+    async_session_maker,
+    app.state.event_publisher,
+    app.state.latency,
+    batch_size=Config.OUTBOX_RELAY_BATCH_SIZE,
+    poll_interval=Config.OUTBOX_RELAY_POLL_INTERVAL_SECONDS,
+)
+app.state.stage_outbox_events = Config.RABBITMQ_ENABLED
+app.state.wallet_id_cache = _build_wallet_id_cache()
+app.state.wallet_gateway = NoOpWalletGateway()
+app.state.instrument_gateway = NoOpInstrumentGateway()
 app.include_router(api_v1_router)
@@ -3,7 +3,6 @@ from dataclasses import dataclass
 from decimal import Decimal
 
 from src.domain.events.order_events import OrderCancelled
-from src.domain.ports.event_publisher import EventPublisher
 from src.domain.ports.unit_of_work import UnitOfWork
 from src.domain.ports.wallet_gateway import WalletGateway
 from src.domain.value_objects.order_id import OrderId
@@ -21,23 +20,21 @@ class CancelOrderCommand:
 
 
 class CancelOrderHandler:
-    """Cancel an active order, release reservations, publish OrderCancelled."""
+    """Cancel an active order, stage OrderCancelled, release reservations."""
 
     def __init__(
         self,
         uow: UnitOfWork,
-        event_publisher: EventPublisher,
         wallet_gateway: WalletGateway | None = None,
     ) -> None:
         self._uow = uow
-        self._event_publisher = event_publisher
         self._wallet = wallet_gateway or NoOpWalletGateway()
 
     async def handle(self, command: CancelOrderCommand) -> None:
         logger.info("Cancelling order: order_id=%s", command.order_id)
 
         order_id = OrderId(command.order_id)
-        published = False
+        cancelled = False
 
         async with self._uow:
             order = await self._uow.orders.get_by_id(order_id)
@@ -45,22 +42,22 @@ class CancelOrderHandler:
 
             if order.is_changed():
                 await self._uow.orders.update(order)
+                await self._uow.outbox.add(
+                    OrderCancelled(
+                        order_id=order.id.value,
+                        trader_id=order.trader_id.value,
+                        instrument_id=order.instrument_id.value,
+                        side=order.side.value,
+                        filled_quantity=order.filled_quantity.value,
+                        remaining_quantity=order.remaining_quantity.value,
+                    )
+                )
                 await self._uow.commit()
                 order.clear_changes()
-                published = True
+                cancelled = True
 
-        if published:
+        if cancelled:
             await self._release_reservation(order)
-            await self._event_publisher.publish(
-                OrderCancelled(
-                    order_id=order.id.value,
-                    trader_id=order.trader_id.value,
-                    instrument_id=order.instrument_id.value,
-                    side=order.side.value,
-                    filled_quantity=order.filled_quantity.value,
-                    remaining_quantity=order.remaining_quantity.value,
-                )
-            )
 
         logger.info("Order cancelled successfully: order_id=%s", command.order_id)
 
@@ -2,7 +2,6 @@ import logging
 from dataclasses import dataclass
 
 from src.domain.events.order_events import OrderFilled
-from src.domain.ports.event_publisher import EventPublisher
 from src.domain.ports.unit_of_work import UnitOfWork
 from src.domain.value_objects.order_id import OrderId
 from src.domain.value_objects.quantity import Quantity
@@ -19,18 +18,18 @@ class FillOrderCommand:
 
 
 class FillOrderHandler:
-    """Application service that applies a fill to an order."""
+    """Application service that applies a fill to an order.
 
-    def __init__(
-        self,
-        uow: UnitOfWork,
-        event_publisher: EventPublisher,
-    ) -> None:
+    ``emit_events=False`` skips OrderFilled: the fill worker applies ME's
+    own OrderFilled events, which consumers have already seen.
+    """
+
+    def __init__(self, uow: UnitOfWork, emit_events: bool = True) -> None:
         self._uow = uow
-        self._event_publisher = event_publisher
+        self._emit_events = emit_events
 
     async def handle(self, command: FillOrderCommand) -> None:
-        """Apply a fill and publish OrderFilled."""
+        """Apply a fill and stage OrderFilled in the outbox."""
         logger.info(
             "Filling order: order_id=%s, fill_quantity=%s",
             command.order_id,
@@ -45,22 +44,22 @@ class FillOrderHandler:
 
             order.fill(fill_quantity)
             await self._uow.orders.update(order)
+            if self._emit_events:
+                await self._uow.outbox.add(
+                    OrderFilled(
+                        order_id=order.id.value,
+                        trader_id=order.trader_id.value,
+                        instrument_id=order.instrument_id.value,
+                        side=order.side.value,
+                        fill_quantity=fill_quantity.value,
+                        filled_quantity=order.filled_quantity.value,
+                        remaining_quantity=order.remaining_quantity.value,
+                        status=order.status.value,
+                    )
+                )
             await self._uow.commit()
             order.clear_changes()
 
-        await self._event_publisher.publish(
-            OrderFilled(
-                order_id=order.id.value,
-                trader_id=order.trader_id.value,
-                instrument_id=order.instrument_id.value,
-                side=order.side.value,
-                fill_quantity=fill_quantity.value,
-                filled_quantity=order.filled_quantity.value,
-                remaining_quantity=order.remaining_quantity.value,
-                status=order.status.value,
-            )
-        )
-
         logger.info(
             "Order filled successfully: order_id=%s, fill_quantity=%s",
             command.order_id,
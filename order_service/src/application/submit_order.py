@@ -1,10 +1,12 @@
+import asyncio
 import logging
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from decimal import Decimal
+from functools import partial
 
 from src.domain.events.order_events import OrderOpened, OrderSubmitted
 from src.domain.factories.order_factory import OrderFactory
-from src.domain.ports.event_publisher import EventPublisher
 from src.domain.ports.instrument_gateway import InstrumentGateway
 from src.domain.ports.unit_of_work import UnitOfWork
 from src.domain.ports.wallet_gateway import WalletGateway
@@ -49,26 +51,38 @@ class SubmitOrderResult:
 
 
 class SubmitOrderHandler:
-    """Submit a new order, reserve funds, open it, and publish lifecycle events.
+    """Submit a new order, reserve funds, open it, and stage lifecycle events.
 
     Flow:
-        1. Validate instrument is tradable (Admin).
+        1. Concurrently: check the instrument is tradable (Admin), check the
+           idempotency key is unused (in its own short unit of work), and
+           resolve the trader's wallet (Wallet). The first failure cancels
+           the other checks.
         2. Reserve cash (BUY) or holdings (SELL) via Wallet.
-        3. Persist NEW → OPEN in one unit of work.
-        4. Publish OrderSubmitted and OrderOpened (ME matches on Opened).
+        3. Persist NEW → OPEN together with OrderSubmitted and OrderOpened
+           in the outbox (ME matches on Opened), in a second unit of work
+           opened only now, so no transaction is held across the HTTP
+           calls. If a step before the commit fails (including a
+           concurrent submit winning the idempotency key), the reservation
+           is released before the error propagates. A failed commit is not
+           compensated, since it may have gone through. The outbox relay
+           publishes the events after commit.
+
+    ``concurrent_checks=False`` runs step 1 one check at a time, for
+    comparison (``benchmarks/bench_submit_checks.py``).
     """
 
     def __init__(
         self,
         uow: UnitOfWork,
-        event_publisher: EventPublisher,
         wallet_gateway: WalletGateway | None = None,
         instrument_gateway: InstrumentGateway | None = None,
+        concurrent_checks: bool = True,
     ) -> None:
         self._uow = uow
-        self._event_publisher = event_publisher
         self._wallet = wallet_gateway or NoOpWalletGateway()
         self._instruments = instrument_gateway or NoOpInstrumentGateway()
+        self._concurrent_checks = concurrent_checks
 
     async def handle(self, command: SubmitOrderCommand) -> SubmitOrderResult:
         logger.info(
@@ -96,79 +110,128 @@ class SubmitOrderHandler:
             order_type,
         )
 
-        await self._instruments.ensure_tradable(command.instrument_id)
+        checks = [
+            partial(self._instruments.ensure_tradable, command.instrument_id),
+            partial(self._ensure_new, command, trader_id, idempotency_key),
+        ]
+        if self._reserves(side, order_type, limit_price):
+            checks.append(partial(self._wallet.resolve_wallet, command.trader_id))
+        await self._run_checks(checks)
 
         await self._reserve(command, side, order_type, limit_price)
-
         async with self._uow:
-            existing = await self._uow.orders.get_by_idempotency_key(
-                trader_id,
-                idempotency_key,
-            )
-            if existing is not None:
-                raise OrderAlreadyExistsError(
-                    f"Order already exists for trader '{command.trader_id}' "
-                    f"with idempotency key '{command.idempotency_key}'."
+            try:
+                order = OrderFactory.create(
+                    trader_id=trader_id,
+                    instrument_id=instrument_id,
+                    side=side,
+                    order_type=order_type,
+                    time_in_force=time_in_force,
+                    quantity=quantity,
+                    idempotency_key=idempotency_key,
+                    limit_price=limit_price,
                 )
+                await self._uow.orders.add(order)
 
-            order = OrderFactory.create(
-                trader_id=trader_id,
-                instrument_id=instrument_id,
-                side=side,
-                order_type=order_type,
-                time_in_force=time_in_force,
-                quantity=quantity,
-                idempotency_key=idempotency_key,
-                limit_price=limit_price,
-            )
-            await self._uow.orders.add(order)
-
-            # Accept onto the book immediately so ME can match (NEW → OPEN).
-            order.open()
-            await self._uow.orders.update(order)
-            await self._uow.commit()
+                # Accept onto the book immediately so ME can match (NEW → OPEN).
+                order.open()
+                await self._uow.orders.update(order)
+                limit = order.limit_price
+                await self._uow.outbox.add(
+                    OrderSubmitted(
+                        order_id=order.id.value,
+                        trader_id=order.trader_id.value,
+                        instrument_id=order.instrument_id.value,
+                        side=order.side.value,
+                        order_type=order.order_type.value,
+                        time_in_force=order.time_in_force.value,
+                        quantity=order.quantity.value,
+                        limit_price=limit.amount if limit is not None else None,
+                        limit_price_currency=(
+                            limit.currency.value if limit is not None else None
+                        ),
+                        idempotency_key=order.idempotency_key.value,
+                    )
+                )
+                await self._uow.outbox.add(
+                    OrderOpened(
+                        order_id=order.id.value,
+                        trader_id=order.trader_id.value,
+                        instrument_id=order.instrument_id.value,
+                        side=order.side.value,
+                        order_type=order.order_type.value,
+                        time_in_force=order.time_in_force.value,
+                        quantity=order.quantity.value,
+                        remaining_quantity=order.remaining_quantity.value,
+                        limit_price=limit.amount if limit is not None else None,
+                        limit_price_currency=(
+                            limit.currency.value if limit is not None else None
+                        ),
+                    )
+                )
+            except BaseException:
+                # Shielded so a cancelled request still gives the funds back.
+                await asyncio.shield(
+                    self._release(command, side, order_type, limit_price)
+                )
+                raise
+            try:
+                await self._uow.commit()
+            except BaseException:
+                logger.exception(
+                    "Commit failed after reserving; reservation kept for "
+                    "reconciliation: trader_id=%s, idempotency_key=%s",
+                    command.trader_id,
+                    command.idempotency_key,
+                )
+                raise
             order.clear_changes()
 
-        limit = order.limit_price
-        await self._event_publisher.publish(
-            OrderSubmitted(
-                order_id=order.id.value,
-                trader_id=order.trader_id.value,
-                instrument_id=order.instrument_id.value,
-                side=order.side.value,
-                order_type=order.order_type.value,
-                time_in_force=order.time_in_force.value,
-                quantity=order.quantity.value,
-                limit_price=limit.amount if limit is not None else None,
-                limit_price_currency=(
-                    limit.currency.value if limit is not None else None
-                ),
-                idempotency_key=order.idempotency_key.value,
-            )
-        )
-        await self._event_publisher.publish(
-            OrderOpened(
-                order_id=order.id.value,
-                trader_id=order.trader_id.value,
-                instrument_id=order.instrument_id.value,
-                side=order.side.value,
-                order_type=order.order_type.value,
-                time_in_force=order.time_in_force.value,
-                quantity=order.quantity.value,
-                remaining_quantity=order.remaining_quantity.value,
-                limit_price=limit.amount if limit is not None else None,
-                limit_price_currency=(
-                    limit.currency.value if limit is not None else None
-                ),
-            )
-        )
-
         logger.info(
             "Order submitted and opened: order_id=%s",
             order.id.value,
         )
         return SubmitOrderResult(order_id=order.id.value)
 
+    async def _run_checks(self, checks: list[Callable[[], Awaitable[None]]]) -> None:
+        if not self._concurrent_checks:
+            for check in checks:
+                await check()
+            return
+        try:
+            async with asyncio.TaskGroup() as group:
+                for check in checks:
+                    group.create_task(check())
+        except ExceptionGroup as errors:
+            # Surface the first failure as itself, as the serial path does.
+            raise errors.exceptions[0]
+
+    async def _ensure_new(
+        self,
+        command: SubmitOrderCommand,
+        trader_id: TraderId,
+        idempotency_key: IdempotencyKey,
+    ) -> None:
+        async with self._uow:
+            existing = await self._uow.orders.get_by_idempotency_key(
+                trader_id,
+                idempotency_key,
+            )
+        if existing is not None:
+            raise OrderAlreadyExistsError(
+                f"Order already exists for trader '{command.trader_id}' "
+                f"with idempotency key '{command.idempotency_key}'."
+            )
+
+    @staticmethod
+    def _reserves(
+        side: OrderSide, order_type: OrderType, limit_price: Money | None
+    ) -> bool:
+        if side is OrderSide.BUY:
+            # MARKET buys: reservation requires LTP; deferred when no price.
+            return order_type is OrderType.LIMIT and limit_price is not None
+        return True
+
     async def _reserve(
         self,
         command: SubmitOrderCommand,
@@ -176,23 +239,51 @@ class SubmitOrderHandler:
         order_type: OrderType,
         limit_price: Money | None,
     ) -> None:
+        if not self._reserves(side, order_type, limit_price):
+            return
         if side is OrderSide.BUY:
-            if order_type is OrderType.LIMIT and limit_price is not None:
-                notional = limit_price.amount * Decimal(command.quantity)
-                await self._wallet.reserve_for_buy(
-                    command.trader_id,
-                    notional,
-                    limit_price.currency.value,
-                )
-            # MARKET buys: reservation requires LTP; deferred when no price.
+            await self._wallet.reserve_for_buy(
+                command.trader_id,
+                limit_price.amount * Decimal(command.quantity),
+                limit_price.currency.value,
+            )
             return
-
         await self._wallet.reserve_for_sell(
             command.trader_id,
             command.instrument_id,
             command.quantity,
         )
 
+    async def _release(
+        self,
+        command: SubmitOrderCommand,
+        side: OrderSide,
+        order_type: OrderType,
+        limit_price: Money | None,
+    ) -> None:
+        """Compensate ``_reserve`` after a later step failed."""
+        if not self._reserves(side, order_type, limit_price):
+            return
+        try:
+            if side is OrderSide.BUY:
+                await self._wallet.release_buy_reservation(
+                    command.trader_id,
+                    limit_price.amount * Decimal(command.quantity),
+                    limit_price.currency.value,
+                )
+            else:
+                await self._wallet.release_sell_reservation(
+                    command.trader_id,
+                    command.instrument_id,
+                    command.quantity,
+                )
+        except Exception:
+            logger.exception(
+                "Failed to release reservation: trader_id=%s, idempotency_key=%s",
+                command.trader_id,
+                command.idempotency_key,
+            )
+
     @staticmethod
     def _parse_side(value: str) -> OrderSide:
         try:
@@ -41,6 +41,18 @@ class Config:
         "topic",
     )
 
+    # Transactional outbox relay (publishes events committed with orders)
+    OUTBOX_RELAY_ENABLED: bool = os.getenv("OUTBOX_RELAY_ENABLED", "true").lower() in (
+        "1",
+        "true",
+        "yes",
+    )
+    OUTBOX_RELAY_BATCH_SIZE: int = int(os.getenv("OUTBOX_RELAY_BATCH_SIZE", "100"))
+    # Fallback poll; commits in this process wake the relay immediately.
+    OUTBOX_RELAY_POLL_INTERVAL_SECONDS: float = float(
+        os.getenv("OUTBOX_RELAY_POLL_INTERVAL_SECONDS", "1.0")
+    )
+
     # Cross-service integrations (disabled by default for isolated tests)
     WALLET_INTEGRATION_ENABLED: bool = os.getenv(
         "WALLET_INTEGRATION_ENABLED", "false"
@@ -56,10 +68,58 @@ class Config:
         "ADMIN_SERVICE_URL",
         "http://localhost:8002",
     )
+    # Bearer token sent to Admin Service (its API requires an ADMIN JWT).
+    ADMIN_SERVICE_TOKEN: str = os.getenv("ADMIN_SERVICE_TOKEN", "")
+    # Tradability checks read an in-memory status table, loaded from Admin
+    # and kept current by instrument lifecycle events when the bus is on.
+    INSTRUMENT_STATUS_TABLE_ENABLED: bool = os.getenv(
+        "INSTRUMENT_STATUS_TABLE_ENABLED", "true"
+    ).lower() in ("1", "true", "yes")
+    INSTRUMENT_STATUS_REFRESH_SECONDS: float = float(
+        os.getenv("INSTRUMENT_STATUS_REFRESH_SECONDS", "60")
+    )
+
+    # Outbound HTTP clients (Wallet / Admin), one pooled client per service
+    HTTP_TIMEOUT_SECONDS: float = float(os.getenv("HTTP_TIMEOUT_SECONDS", "5.0"))
+    HTTP_CONNECT_TIMEOUT_SECONDS: float = float(
+        os.getenv("HTTP_CONNECT_TIMEOUT_SECONDS", "2.0")
+    )
+    HTTP_MAX_CONNECTIONS: int = int(os.getenv("HTTP_MAX_CONNECTIONS", "100"))
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = int(
+        os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "20")
+    )
+    HTTP_KEEPALIVE_EXPIRY_SECONDS: float = float(
+        os.getenv("HTTP_KEEPALIVE_EXPIRY_SECONDS", "30")
+    )
+    # Requires the h2 package (pip install 'httpx[http2]').
+    HTTP2_ENABLED: bool = os.getenv("HTTP2_ENABLED", "false").lower() in (
+        "1",
+        "true",
+        "yes",
+    )
+
+    # Trader -> wallet id cache in front of GET /wallets/by-trader/{id}
+    WALLET_ID_CACHE_ENABLED: bool = os.getenv(
+        "WALLET_ID_CACHE_ENABLED", "true"
+    ).lower() in ("1", "true", "yes")
+    WALLET_ID_CACHE_MAX_ENTRIES: int = int(
+        os.getenv("WALLET_ID_CACHE_MAX_ENTRIES", "10000")
+    )
+    WALLET_ID_CACHE_TTL_SECONDS: float = float(
+        os.getenv("WALLET_ID_CACHE_TTL_SECONDS", "300")
+    )
+    WALLET_ID_CACHE_NEGATIVE_TTL_SECONDS: float = float(
+        os.getenv("WALLET_ID_CACHE_NEGATIVE_TTL_SECONDS", "5")
+    )
+
     RABBITMQ_TRADE_EVENTS_EXCHANGE: str = os.getenv(
         "RABBITMQ_TRADE_EVENTS_EXCHANGE",
         "trade.events",
     )
+    RABBITMQ_INSTRUMENT_EVENTS_EXCHANGE: str = os.getenv(
+        "RABBITMQ_INSTRUMENT_EVENTS_EXCHANGE",
+        "instrument.events",
+    )
     RABBITMQ_FILL_QUEUE: str = os.getenv(
         "RABBITMQ_FILL_QUEUE",
         "order_service.fills",
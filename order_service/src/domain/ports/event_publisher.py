@@ -14,3 +14,12 @@ class EventPublisher(ABC):
             MessagingError: If the event cannot be delivered to the bus.
         """
         raise NotImplementedError
+
+    @abstractmethod
+    async def publish_payload(self, event_type: str, payload: str) -> None:
+        """Publish an event already serialized to JSON (e.g. from the outbox).
+
+        Raises:
+            MessagingError: If the event cannot be delivered to the bus.
+        """
+        raise NotImplementedError
@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+
+from src.domain.events.order_events import DomainEvent
+
+
+class OutboxRepository(ABC):
+    """Stages domain events in the unit of work's transaction.
+
+    Staged events reach the event bus only if the transaction commits, and
+    then at least once, in staging order, via the outbox relay (events of
+    transactions that overlap may go out in either order).
+    """
+
+    @abstractmethod
+    async def add(self, event: DomainEvent) -> None:
+        """Stage an event for publishing once the transaction commits."""
+        raise NotImplementedError
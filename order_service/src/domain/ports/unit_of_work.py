@@ -1,12 +1,14 @@
 from abc import ABC, abstractmethod
 
 from src.domain.ports.order_repository import OrderRepository
+from src.domain.ports.outbox_repository import OutboxRepository
 
 
 class UnitOfWork(ABC):
     """Coordinates repositories and transaction boundaries."""
 
     orders: OrderRepository
+    outbox: OutboxRepository
 
     @abstractmethod
     async def __aenter__(self) -> "UnitOfWork":
@@ -5,6 +5,12 @@ from decimal import Decimal
 class WalletGateway(ABC):
     """Outbound port for reserving and releasing trader funds/holdings."""
 
+    @abstractmethod
+    async def resolve_wallet(self, trader_id: str) -> None:
+        """Look up the trader's wallet ahead of a reservation, so the
+        reservation itself is one call. Raises if there is no wallet."""
+        raise NotImplementedError
+
     @abstractmethod
     async def reserve_for_buy(
         self,
@@ -32,3 +32,9 @@ class WalletIntegrationError(ApplicationError):
     """Raised when the wallet service call fails unexpectedly."""
 
     pass
+
+
+class AdminIntegrationError(ApplicationError):
+    """Raised when the admin service call fails unexpectedly."""
+
+    pass
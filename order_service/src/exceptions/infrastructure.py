@@ -52,3 +52,10 @@ class MessagingConsumeError(MessagingError):
     """Raised when consuming a message fails after retries are exhausted."""
 
     pass
+
+
+# ======= HTTP =======
+class HttpClientError(InfrastructureError):
+    """Raised when an outbound HTTP client cannot be configured."""
+
+    pass
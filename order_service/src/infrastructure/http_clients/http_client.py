@@ -0,0 +1,42 @@
+import httpx
+
+from src.exceptions import HttpClientError
+
+
+def build_http_client(
+    base_url: str,
+    *,
+    timeout: float = 5.0,
+    connect_timeout: float = 2.0,
+    max_connections: int = 100,
+    max_keepalive_connections: int = 20,
+    keepalive_expiry: float = 30.0,
+    http2: bool = False,
+    headers: dict[str, str] | None = None,
+) -> httpx.AsyncClient:
+    """App-scoped client for one downstream service.
+
+    One client per service keeps a warm pool of keep-alive connections, so a
+    request only pays for TCP (and TLS) setup when the pool has no idle
+    connection. ``http2`` multiplexes requests over one connection and needs
+    the ``h2`` package.
+    """
+    if http2:
+        try:
+            import h2  # noqa: F401
+        except ImportError as exc:
+            raise HttpClientError(
+                "h2 is required for HTTP/2. Install it with: pip install 'httpx[http2]'"
+            ) from exc
+
+    return httpx.AsyncClient(
+        base_url=base_url.rstrip("/"),
+        timeout=httpx.Timeout(timeout, connect=connect_timeout),
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        ),
+        http2=http2,
+        headers=headers,
+    )
@@ -1,21 +1,41 @@
 import httpx
 
 from src.domain.ports.instrument_gateway import InstrumentGateway
-from src.exceptions import InstrumentNotTradableError
+from src.exceptions import AdminIntegrationError, InstrumentNotTradableError
+from src.infrastructure.metrics.latency import LatencyRecorder
+
+
+def ensure_active(instrument_id: str, status: str | None) -> None:
+    if status != "ACTIVE":
+        raise InstrumentNotTradableError(
+            f"Instrument '{instrument_id}' is not tradable (status={status})."
+        )
 
 
 class HttpInstrumentGateway(InstrumentGateway):
-    """Reads instrument status from Admin Service."""
+    """Reads instrument status from Admin Service.
+
+    ``client`` is the app-scoped Admin client (``build_http_client``); the
+    gateway never opens or closes it.
+    """
 
-    def __init__(self, base_url: str, timeout: float = 5.0) -> None:
-        self._base = base_url.rstrip("/")
-        self._timeout = timeout
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        latency: LatencyRecorder | None = None,
+    ) -> None:
+        self._client = client
+        self._latency = latency or LatencyRecorder()
 
     async def ensure_tradable(self, instrument_id: str) -> None:
-        url = f"{self._base}/api/v1/instruments/{instrument_id}"
+        ensure_active(instrument_id, await self.fetch_status(instrument_id))
+
+    async def fetch_status(self, instrument_id: str) -> str | None:
         try:
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                response = await client.get(url)
+            with self._latency.time("admin.get_instrument"):
+                response = await self._client.get(
+                    f"/api/v1/instruments/{instrument_id}"
+                )
         except Exception as exc:
             raise InstrumentNotTradableError(
                 f"Failed to load instrument '{instrument_id}': {exc}"
@@ -29,9 +49,21 @@ class HttpInstrumentGateway(InstrumentGateway):
             raise InstrumentNotTradableError(
                 f"Instrument lookup failed ({response.status_code})."
             )
+        return response.json().get("status")
 
-        status = response.json().get("status")
-        if status != "ACTIVE":
-            raise InstrumentNotTradableError(
-                f"Instrument '{instrument_id}' is not tradable (status={status})."
+    async def fetch_statuses(self) -> dict[str, str]:
+        """Status of every instrument, from the bulk statuses endpoint."""
+        try:
+            with self._latency.time("admin.list_statuses"):
+                response = await self._client.get("/api/v1/instruments/statuses")
+        except Exception as exc:
+            raise AdminIntegrationError(
+                f"Failed to load instrument statuses: {exc}"
+            ) from exc
+
+        if response.status_code >= 400:
+            raise AdminIntegrationError(
+                f"Instrument status listing failed ({response.status_code}): "
+                f"{response.text}"
             )
+        return {item["instrument_id"]: item["status"] for item in response.json()}
@@ -8,14 +8,37 @@ from src.exceptions import (
     InsufficientHoldingsError,
     WalletIntegrationError,
 )
+from src.infrastructure.http_clients.wallet_id_cache import WalletIdCache
+from src.infrastructure.metrics.latency import LatencyRecorder
 
 
 class HttpWalletGateway(WalletGateway):
-    """HTTP adapter for Wallet Service reserve/release APIs."""
+    """HTTP adapter for Wallet Service reserve/release APIs.
 
-    def __init__(self, base_url: str, timeout: float = 5.0) -> None:
-        self._base = base_url.rstrip("/")
-        self._timeout = timeout
+    ``client`` is the app-scoped Wallet client (``build_http_client``); the
+    gateway never opens or closes it. With ``wallet_ids`` the trader ->
+    wallet id lookup is cached, so a reserve or release is usually a single
+    round trip. A 404 from a wallet operation drops the cached id; if the id
+    came from the cache the operation is retried once with a fresh lookup
+    (the wallet may have been replaced), which is safe because a 404 changed
+    nothing.
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        latency: LatencyRecorder | None = None,
+        wallet_ids: WalletIdCache | None = None,
+    ) -> None:
+        self._client = client
+        self._latency = latency or LatencyRecorder()
+        self._wallet_ids = wallet_ids
+
+    async def resolve_wallet(self, trader_id: str) -> None:
+        # Without a cache a resolved id has nowhere to live until the
+        # reservation, which then looks it up itself.
+        if self._wallet_ids is not None:
+            await self._wallet_id_for_trader(trader_id)
 
     async def reserve_for_buy(
         self,
@@ -23,9 +46,9 @@ class HttpWalletGateway(WalletGateway):
         amount: Decimal,
         currency: str,
     ) -> None:
-        wallet_id = await self._wallet_id_for_trader(trader_id)
-        await self._post(
-            f"/api/v1/wallets/{wallet_id}/cash-reservations",
+        await self._call(
+            trader_id,
+            "cash-reservations",
             {"amount": str(amount), "currency": currency},
             insufficient_cls=InsufficientFundsError,
         )
@@ -36,9 +59,9 @@ class HttpWalletGateway(WalletGateway):
         instrument_id: str,
         quantity: int,
     ) -> None:
-        wallet_id = await self._wallet_id_for_trader(trader_id)
-        await self._post(
-            f"/api/v1/wallets/{wallet_id}/holding-reservations",
+        await self._call(
+            trader_id,
+            "holding-reservations",
             {"instrument_id": instrument_id, "quantity": quantity},
             insufficient_cls=InsufficientHoldingsError,
         )
@@ -49,9 +72,9 @@ class HttpWalletGateway(WalletGateway):
         amount: Decimal,
         currency: str,
     ) -> None:
-        wallet_id = await self._wallet_id_for_trader(trader_id)
-        await self._post(
-            f"/api/v1/wallets/{wallet_id}/cash-releases",
+        await self._call(
+            trader_id,
+            "cash-releases",
             {"amount": str(amount), "currency": currency},
             insufficient_cls=WalletIntegrationError,
         )
@@ -62,48 +85,75 @@ class HttpWalletGateway(WalletGateway):
         instrument_id: str,
         quantity: int,
     ) -> None:
-        wallet_id = await self._wallet_id_for_trader(trader_id)
-        await self._post(
-            f"/api/v1/wallets/{wallet_id}/holding-releases",
+        await self._call(
+            trader_id,
+            "holding-releases",
             {"instrument_id": instrument_id, "quantity": quantity},
             insufficient_cls=WalletIntegrationError,
         )
 
-    async def _wallet_id_for_trader(self, trader_id: str) -> str:
-        url = f"{self._base}/api/v1/wallets/by-trader/{trader_id}"
+    async def _call(
+        self,
+        trader_id: str,
+        operation: str,
+        body: dict,
+        *,
+        insufficient_cls: type[Exception],
+    ) -> None:
+        wallet_id, cached = await self._wallet_id_for_trader(trader_id)
+        response = await self._post(wallet_id, operation, body)
+        if response.status_code == 404 and self._wallet_ids is not None:
+            self._wallet_ids.invalidate(trader_id)
+            if cached:
+                wallet_id, _ = await self._wallet_id_for_trader(trader_id)
+                response = await self._post(wallet_id, operation, body)
+
+        if response.status_code in (409, 422):
+            raise insufficient_cls(response.text)
+        if response.status_code >= 400:
+            raise WalletIntegrationError(
+                f"Wallet request failed ({response.status_code}): {response.text}"
+            )
+
+    async def _wallet_id_for_trader(self, trader_id: str) -> tuple[str, bool]:
+        """Return the trader's wallet id and whether it came from the cache."""
+        if self._wallet_ids is not None:
+            found, wallet_id = self._wallet_ids.lookup(trader_id)
+            if found:
+                if wallet_id is None:
+                    raise WalletIntegrationError(
+                        f"No wallet found for trader '{trader_id}'."
+                    )
+                return wallet_id, True
+
         try:
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                response = await client.get(url)
+            with self._latency.time("wallet.by_trader"):
+                response = await self._client.get(
+                    f"/api/v1/wallets/by-trader/{trader_id}"
+                )
         except Exception as exc:
             raise WalletIntegrationError(
                 f"Failed to resolve wallet for trader '{trader_id}': {exc}"
             ) from exc
 
         if response.status_code == 404:
+            if self._wallet_ids is not None:
+                self._wallet_ids.put_missing(trader_id)
             raise WalletIntegrationError(f"No wallet found for trader '{trader_id}'.")
         if response.status_code >= 400:
             raise WalletIntegrationError(
                 f"Wallet lookup failed ({response.status_code}): {response.text}"
             )
-        return response.json()["wallet_id"]
+        wallet_id = response.json()["wallet_id"]
+        if self._wallet_ids is not None:
+            self._wallet_ids.put(trader_id, wallet_id)
+        return wallet_id, False
 
-    async def _post(
-        self,
-        path: str,
-        body: dict,
-        *,
-        insufficient_cls: type[Exception],
-    ) -> None:
-        url = f"{self._base}{path}"
+    async def _post(self, wallet_id: str, operation: str, body: dict) -> httpx.Response:
         try:
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                response = await client.post(url, json=body)
+            with self._latency.time(f"wallet.{operation}"):
+                return await self._client.post(
+                    f"/api/v1/wallets/{wallet_id}/{operation}", json=body
+                )
         except Exception as exc:
             raise WalletIntegrationError(f"Wallet request failed: {exc}") from exc
-
-        if response.status_code in (409, 422):
-            raise insufficient_cls(response.text)
-        if response.status_code >= 400:
-            raise WalletIntegrationError(
-                f"Wallet request failed ({response.status_code}): {response.text}"
-            )
@@ -0,0 +1,88 @@
+import asyncio
+import logging
+
+from src.domain.ports.instrument_gateway import InstrumentGateway
+from src.exceptions import AdminIntegrationError
+from src.infrastructure.http_clients.http_instrument_gateway import (
+    HttpInstrumentGateway,
+    ensure_active,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class InstrumentStatusTable(InstrumentGateway):
+    """In-memory instrument id -> status, so ``ensure_tradable`` is a lookup.
+
+    ``start`` loads every status from Admin Service's bulk endpoint and
+    reloads it every ``refresh_interval`` seconds, which heals events missed
+    while the bus was unreachable. Lifecycle events (``InstrumentEventConsumer``)
+    call ``apply`` in between. An instrument the table has not seen yet is
+    fetched individually once and then kept.
+
+    A reload that overlaps events keeps the statuses those events applied,
+    since the bulk response may predate them.
+    """
+
+    def __init__(
+        self,
+        admin: HttpInstrumentGateway,
+        refresh_interval: float = 60.0,
+    ) -> None:
+        self._admin = admin
+        self._refresh_interval = refresh_interval
+        self._statuses: dict[str, str] = {}
+        self._applied_during_refresh: set[str] | None = None
+        self._task: asyncio.Task | None = None
+
+    def __len__(self) -> int:
+        return len(self._statuses)
+
+    async def start(self) -> None:
+        await self.refresh()
+        if self._task is None and self._refresh_interval > 0:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def refresh(self) -> bool:
+        """Reload all statuses; return False (keeping the table) on failure."""
+        self._applied_during_refresh = set()
+        try:
+            statuses = await self._admin.fetch_statuses()
+        except AdminIntegrationError as exc:
+            logger.warning("Instrument status refresh failed: %s", exc)
+            return False
+        finally:
+            applied, self._applied_during_refresh = self._applied_during_refresh, None
+
+        for instrument_id in applied:
+            statuses[instrument_id] = self._statuses[instrument_id]
+        self._statuses = statuses
+        logger.info("Instrument status table loaded: instruments=%s", len(statuses))
+        return True
+
+    def apply(self, instrument_id: str, status: str) -> None:
+        self._statuses[instrument_id] = status
+        if self._applied_during_refresh is not None:
+            self._applied_during_refresh.add(instrument_id)
+
+    def status_of(self, instrument_id: str) -> str | None:
+        return self._statuses.get(instrument_id)
+
+    async def ensure_tradable(self, instrument_id: str) -> None:
+        status = self._statuses.get(instrument_id)
+        if status is None:
+            status = await self._admin.fetch_status(instrument_id)
+            # An event that arrived during the fetch is newer.
+            status = self._statuses.setdefault(instrument_id, status)
+        ensure_active(instrument_id, status)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._refresh_interval)
+            await self.refresh()
@@ -6,6 +6,9 @@ from src.domain.ports.wallet_gateway import WalletGateway
 class NoOpWalletGateway(WalletGateway):
     """No-op wallet adapter used when WALLET_INTEGRATION_ENABLED is false."""
 
+    async def resolve_wallet(self, trader_id: str) -> None:
+        return None
+
     async def reserve_for_buy(
         self,
         trader_id: str,
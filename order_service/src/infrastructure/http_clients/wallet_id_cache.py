@@ -0,0 +1,89 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class WalletIdCacheStats:
+    hits: int
+    negative_hits: int
+    misses: int
+    invalidations: int
+    evictions: int
+    entries: int
+
+
+class WalletIdCache:
+    """Bounded LRU of trader id -> wallet id with per-entry expiry.
+
+    A trader's wallet practically never changes, so entries live for
+    ``ttl_seconds``. "No wallet" (a 404 from Wallet Service) is cached too,
+    for the much shorter ``negative_ttl_seconds``, so a trader without a
+    wallet cannot turn every submit into a lookup, yet can trade soon after
+    the wallet is created. The least recently used entry is evicted beyond
+    ``max_entries``.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        ttl_seconds: float = 300.0,
+        negative_ttl_seconds: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._negative_ttl = negative_ttl_seconds
+        self._clock = clock
+        # trader_id -> (expires_at, wallet_id or None for "no wallet")
+        self._entries: OrderedDict[str, tuple[float, str | None]] = OrderedDict()
+        self._hits = 0
+        self._negative_hits = 0
+        self._misses = 0
+        self._invalidations = 0
+        self._evictions = 0
+
+    def lookup(self, trader_id: str) -> tuple[bool, str | None]:
+        """Return ``(found, wallet_id)``; ``(True, None)`` is a cached 404."""
+        entry = self._entries.get(trader_id)
+        if entry is None or entry[0] <= self._clock():
+            if entry is not None:
+                del self._entries[trader_id]
+            self._misses += 1
+            return False, None
+        self._entries.move_to_end(trader_id)
+        if entry[1] is None:
+            self._negative_hits += 1
+        else:
+            self._hits += 1
+        return True, entry[1]
+
+    def put(self, trader_id: str, wallet_id: str) -> None:
+        self._store(trader_id, wallet_id, self._ttl)
+
+    def put_missing(self, trader_id: str) -> None:
+        self._store(trader_id, None, self._negative_ttl)
+
+    def invalidate(self, trader_id: str) -> None:
+        if self._entries.pop(trader_id, None) is not None:
+            self._invalidations += 1
+
+    def stats(self) -> WalletIdCacheStats:
+        return WalletIdCacheStats(
+            hits=self._hits,
+            negative_hits=self._negative_hits,
+            misses=self._misses,
+            invalidations=self._invalidations,
+            evictions=self._evictions,
+            entries=len(self._entries),
+        )
+
+    def _store(self, trader_id: str, wallet_id: str | None, ttl: float) -> None:
+        if ttl <= 0:
+            return
+        self._entries[trader_id] = (self._clock() + ttl, wallet_id)
+        self._entries.move_to_end(trader_id)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
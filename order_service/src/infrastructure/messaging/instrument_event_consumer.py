@@ -0,0 +1,95 @@
+import json
+import logging
+from typing import Any
+
+from src.exceptions import MessagingConnectionError
+from src.infrastructure.http_clients.instrument_status_table import (
+    InstrumentStatusTable,
+)
+
+logger = logging.getLogger(__name__)
+
+# Admin Service lifecycle event -> instrument status after it.
+_STATUS_BY_EVENT = {
+    "InstrumentActivated": "ACTIVE",
+    "InstrumentHalted": "HALTED",
+    "InstrumentDelisted": "DELISTED",
+}
+
+
+class InstrumentEventConsumer:
+    """Keep an ``InstrumentStatusTable`` current from instrument lifecycle events.
+
+    Every OIS process holds its own table, so each consumes through its own
+    exclusive, server-named queue rather than a shared work queue.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        exchange_name: str,
+        table: InstrumentStatusTable,
+        exchange_type: str = "topic",
+    ) -> None:
+        self._url = url
+        self._exchange_name = exchange_name
+        self._exchange_type = exchange_type
+        self._table = table
+        self._connection = None
+        self._channel = None
+
+    async def start(self) -> None:
+        try:
+            import aio_pika
+            from aio_pika import ExchangeType
+        except ImportError as exc:
+            raise MessagingConnectionError(
+                "aio-pika is required. Install with: pip install aio-pika"
+            ) from exc
+
+        try:
+            self._connection = await aio_pika.connect_robust(self._url)
+            self._channel = await self._connection.channel()
+            exchange = await self._channel.declare_exchange(
+                self._exchange_name,
+                ExchangeType(self._exchange_type),
+                durable=True,
+            )
+            queue = await self._channel.declare_queue(exclusive=True)
+            for key in _STATUS_BY_EVENT:
+                await queue.bind(exchange, routing_key=key)
+
+            await queue.consume(self._on_message)
+            logger.info("InstrumentEventConsumer started: queue=%s", queue.name)
+        except Exception as exc:
+            logger.exception("Failed to start InstrumentEventConsumer")
+            raise MessagingConnectionError(
+                f"Failed to start instrument event consumer: {exc}"
+            ) from exc
+
+    async def stop(self) -> None:
+        if self._connection is not None and not self._connection.is_closed:
+            await self._connection.close()
+        self._connection = None
+        self._channel = None
+
+    async def _on_message(self, message: Any) -> None:
+        async with message.process(requeue=False):
+            try:
+                payload = json.loads(message.body.decode("utf-8"))
+            except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+                logger.error("Invalid instrument event: %s", exc)
+                return
+
+            event_type = payload.get("event_type") or message.routing_key
+            status = _STATUS_BY_EVENT.get(event_type)
+            instrument_id = str(payload.get("instrument_id", ""))
+            if status is None or not instrument_id:
+                return
+
+            self._table.apply(instrument_id, status)
+            logger.info(
+                "Instrument status updated: instrument_id=%s status=%s",
+                instrument_id,
+                status,
+            )
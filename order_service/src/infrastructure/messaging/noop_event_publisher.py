@@ -14,3 +14,9 @@ class NoOpEventPublisher(EventPublisher):
             "NoOpEventPublisher: dropping event_type=%s",
             event.event_type,
         )
+
+    async def publish_payload(self, event_type: str, payload: str) -> None:
+        logger.debug(
+            "NoOpEventPublisher: dropping event_type=%s",
+            event_type,
+        )
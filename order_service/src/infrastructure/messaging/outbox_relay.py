@@ -0,0 +1,178 @@
+import asyncio
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.domain.ports.event_publisher import EventPublisher
+from src.infrastructure.metrics.latency import LatencyRecorder
+from src.infrastructure.persistence.repositories.sqlalchemy_outbox_repository import (
+    OutboxMessage,
+    SQLAlchemyOutboxRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class OutboxRelayStats:
+    running: bool
+    pending: int
+    oldest_pending_age_seconds: float | None
+    published: int
+    failed: int
+    batches: int
+    last_lag_seconds: float | None
+
+
+class OutboxRelay:
+    """Publishes events staged in the outbox table to the event bus.
+
+    Each pass takes the relay lock (a transaction-scoped advisory lock on
+    PostgreSQL), so while every OIS process runs a relay only one pass is
+    in progress at a time. It claims up to ``batch_size`` of the oldest
+    rows, publishes them pipelined on the confirming channel in id order
+    and waits for the acks in the same order. At the first failure the
+    rest of the batch is cancelled. Only the acked prefix is deleted, so
+    retries resume at the failed event and events leave in id order.
+    Events after it may already have reached the broker; they are sent
+    again with it, so delivery is at least once.
+
+    After a fully published batch the next pass starts at once; otherwise
+    the relay sleeps until ``notify`` (called on every OIS commit) or
+    ``poll_interval`` seconds, which picks up rows other processes commit.
+    Each published event's commit-to-ack delay is recorded in ``latency``
+    as ``outbox.relay_lag``.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        publisher: EventPublisher,
+        latency: LatencyRecorder | None = None,
+        batch_size: int = 100,
+        poll_interval: float = 1.0,
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ) -> None:
+        self._session_factory = session_factory
+        self._publisher = publisher
+        self._latency = latency
+        self._batch_size = batch_size
+        self._poll_interval = poll_interval
+        self._clock = clock
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._published = 0
+        self._failed = 0
+        self._batches = 0
+        self._last_lag: float | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def notify(self) -> None:
+        """Wake the relay now rather than at its next poll."""
+        self._wakeup.set()
+
+    async def relay_once(self) -> int:
+        """Publish one batch; return how many events the broker acked."""
+        async with self._session_factory() as session:
+            outbox = SQLAlchemyOutboxRepository(session)
+            if not await outbox.lock_relay():
+                return 0
+            messages = await outbox.claim_batch(self._batch_size)
+            if not messages:
+                return 0
+            acked = await self._publish_in_order(messages)
+            await outbox.delete([m.id for m in acked])
+            await session.commit()
+
+        now = self._clock()
+        for message in acked:
+            lag = (now - message.created_at).total_seconds()
+            if self._latency is not None:
+                self._latency.observe("outbox.relay_lag", lag)
+            self._last_lag = lag
+        self._batches += 1
+        self._published += len(acked)
+        failed = len(messages) - len(acked)
+        if failed:
+            self._failed += failed
+            logger.warning(
+                "Outbox relay: %s of %s events not published; will retry",
+                failed,
+                len(messages),
+            )
+        return len(acked)
+
+    async def _publish_in_order(
+        self, messages: list[OutboxMessage]
+    ) -> list[OutboxMessage]:
+        """Return the leading messages the broker acked, up to the first
+        failure."""
+        # Started in order, so they go out on the channel in order.
+        publishes = [
+            asyncio.create_task(
+                self._publisher.publish_payload(m.event_type, m.payload)
+            )
+            for m in messages
+        ]
+        acked: list[OutboxMessage] = []
+        try:
+            for message, publish in zip(messages, publishes):
+                try:
+                    await publish
+                except Exception:
+                    logger.exception(
+                        "Outbox relay: publish of event id=%s failed", message.id
+                    )
+                    break
+                acked.append(message)
+        finally:
+            for publish in publishes:
+                publish.cancel()
+            await asyncio.gather(*publishes, return_exceptions=True)
+        return acked
+
+    async def stats(self) -> OutboxRelayStats:
+        async with self._session_factory() as session:
+            pending, oldest = await SQLAlchemyOutboxRepository(session).backlog()
+        return OutboxRelayStats(
+            running=self.running,
+            pending=pending,
+            oldest_pending_age_seconds=(
+                (self._clock() - oldest).total_seconds() if oldest else None
+            ),
+            published=self._published,
+            failed=self._failed,
+            batches=self._batches,
+            last_lag_seconds=self._last_lag,
+        )
+
+    async def _run(self) -> None:
+        while True:
+            self._wakeup.clear()
+            try:
+                published = await self.relay_once()
+            except Exception:
+                logger.exception("Outbox relay pass failed")
+                published = 0
+            if published >= self._batch_size:
+                continue
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self._poll_interval)
+            except TimeoutError:
+                pass
@@ -1,31 +1,21 @@
-import json
 import logging
-from dataclasses import asdict
-from datetime import datetime
-from decimal import Decimal
-from typing import Any
 
 from src.domain.events.order_events import DomainEvent
 from src.domain.ports.event_publisher import EventPublisher
 from src.exceptions import MessagingConnectionError, MessagingPublishError
+from src.infrastructure.messaging.serialization import event_to_json
 
 logger = logging.getLogger(__name__)
 
 
-def _json_default(value: Any) -> Any:
-    if isinstance(value, datetime):
-        return value.isoformat()
-    if isinstance(value, Decimal):
-        return str(value)
-    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
-
-
 class RabbitMQEventPublisher(EventPublisher):
     """Publishes domain events to a RabbitMQ topic exchange.
 
     Connection is established lazily on first publish (or via connect()).
     The exchange is declared as durable topic so consumers can bind queues
     with routing keys such as ``OrderSubmitted`` / ``OrderCancelled``.
+    The channel runs in publisher-confirm mode: a publish returns only once
+    the broker has taken the message, so concurrent publishes pipeline.
     """
 
     def __init__(
@@ -53,7 +43,7 @@ class RabbitMQEventPublisher(EventPublisher):
 
         try:
             self._connection = await aio_pika.connect_robust(self._url)
-            self._channel = await self._connection.channel()
+            self._channel = await self._connection.channel(publisher_confirms=True)
             self._exchange = await self._channel.declare_exchange(
                 self._exchange_name,
                 aio_pika.ExchangeType(self._exchange_type),
@@ -81,6 +71,10 @@ class RabbitMQEventPublisher(EventPublisher):
 
     async def publish(self, event: DomainEvent) -> None:
         """Serialize and publish the event with routing_key = event_type."""
+        await self.publish_payload(event.event_type, event_to_json(event))
+
+    async def publish_payload(self, event_type: str, payload: str) -> None:
+        """Publish an already serialized event and wait for the broker ack."""
         if self._exchange is None:
             await self.connect()
 
@@ -91,29 +85,28 @@ class RabbitMQEventPublisher(EventPublisher):
                 "aio-pika is required for RabbitMQEventPublisher."
             ) from exc
 
-        body = json.dumps(asdict(event), default=_json_default).encode("utf-8")
         message = aio_pika.Message(
-            body=body,
+            body=payload.encode("utf-8"),
             content_type="application/json",
             delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
-            type=event.event_type,
+            type=event_type,
         )
 
         try:
             await self._exchange.publish(
                 message,
-                routing_key=event.event_type,
+                routing_key=event_type,
             )
             logger.info(
                 "Published event_type=%s routing_key=%s",
-                event.event_type,
-                event.event_type,
+                event_type,
+                event_type,
             )
         except Exception as exc:
             logger.exception(
                 "Failed to publish event_type=%s",
-                event.event_type,
+                event_type,
             )
             raise MessagingPublishError(
-                f"Failed to publish event '{event.event_type}': {exc}"
+                f"Failed to publish event '{event_type}': {exc}"
             ) from exc
@@ -0,0 +1,20 @@
+import json
+from dataclasses import asdict
+from datetime import datetime
+from decimal import Decimal
+from typing import Any
+
+from src.domain.events.order_events import DomainEvent
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def event_to_json(event: DomainEvent) -> str:
+    """Serialize an event to the JSON body consumers receive."""
+    return json.dumps(asdict(event), default=_json_default)
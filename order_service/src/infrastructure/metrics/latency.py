@@ -0,0 +1,105 @@
+import bisect
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+# Upper bounds in milliseconds; the last bucket catches everything slower.
+BUCKETS_MS: tuple[float, ...] = (
+    0.5,
+    1,
+    2,
+    5,
+    10,
+    25,
+    50,
+    100,
+    250,
+    500,
+    1000,
+    2500,
+    5000,
+    float("inf"),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class LatencySnapshot:
+    name: str
+    count: int
+    sum_ms: float
+    buckets: tuple[tuple[float, int], ...]
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+
+    @property
+    def mean_ms(self) -> float:
+        return self.sum_ms / self.count if self.count else 0.0
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram.
+
+    Percentiles are reported as the upper bound of the bucket they fall in,
+    so they are coarse but cheap and never need the raw samples.
+    """
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._counts = [0] * len(BUCKETS_MS)
+        self._count = 0
+        self._sum_ms = 0.0
+
+    def observe(self, seconds: float) -> None:
+        ms = seconds * 1000
+        self._counts[bisect.bisect_left(BUCKETS_MS, ms)] += 1
+        self._count += 1
+        self._sum_ms += ms
+
+    def snapshot(self) -> LatencySnapshot:
+        return LatencySnapshot(
+            name=self._name,
+            count=self._count,
+            sum_ms=self._sum_ms,
+            buckets=tuple(zip(BUCKETS_MS, self._counts)),
+            p50_ms=self._quantile(0.50),
+            p95_ms=self._quantile(0.95),
+            p99_ms=self._quantile(0.99),
+        )
+
+    def _quantile(self, q: float) -> float:
+        if not self._count:
+            return 0.0
+        rank = q * self._count
+        seen = 0
+        for bound, count in zip(BUCKETS_MS, self._counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return BUCKETS_MS[-1]
+
+
+class LatencyRecorder:
+    """Named latency histograms, one per hop (``"wallet.by_trader"``, ...)."""
+
+    def __init__(self) -> None:
+        self._histograms: dict[str, LatencyHistogram] = {}
+
+    def observe(self, name: str, seconds: float) -> None:
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            histogram = self._histograms[name] = LatencyHistogram(name)
+        histogram.observe(seconds)
+
+    @contextmanager
+    def time(self, name: str) -> Iterator[None]:
+        """Observe the duration of the block, whether or not it raises."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started)
+
+    def snapshot(self) -> list[LatencySnapshot]:
+        return [self._histograms[name].snapshot() for name in sorted(self._histograms)]
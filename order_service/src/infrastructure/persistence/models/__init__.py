@@ -1,2 +1,3 @@
 from src.infrastructure.persistence.models.base import *
 from src.infrastructure.persistence.models.order import *
+from src.infrastructure.persistence.models.outbox import *
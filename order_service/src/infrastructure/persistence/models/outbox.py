@@ -0,0 +1,28 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.infrastructure.persistence.models.base import Base
+
+
+class OutboxModel(Base):
+    """Events committed with their order changes, awaiting the relay."""
+
+    __tablename__ = "outbox"
+
+    # The relay sends rows in id (insert) order. On PostgreSQL ids are drawn
+    # when a transaction flushes, not when it commits, so concurrent
+    # transactions can commit out of id order and a lower id can become
+    # visible after the relay has sent a higher one (it goes out on a later
+    # pass). SQLite only autoincrements INTEGER primary keys.
+    id: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    )
+    event_type: Mapped[str] = mapped_column(String(64), nullable=False)
+    payload: Mapped[str] = mapped_column(Text, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
@@ -0,0 +1,17 @@
+import logging
+
+from src.domain.events.order_events import DomainEvent
+from src.domain.ports.outbox_repository import OutboxRepository
+
+logger = logging.getLogger(__name__)
+
+
+class NoOpOutboxRepository(OutboxRepository):
+    """Drops events; used when the event bus is disabled, so no relay would
+    ever drain the outbox table."""
+
+    async def add(self, event: DomainEvent) -> None:
+        logger.debug(
+            "NoOpOutboxRepository: dropping event_type=%s",
+            event.event_type,
+        )
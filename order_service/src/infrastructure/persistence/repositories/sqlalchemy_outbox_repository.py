@@ -0,0 +1,128 @@
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from sqlalchemy import delete, func, select, text
+from sqlalchemy.exc import OperationalError, SQLAlchemyError, TimeoutError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.events.order_events import DomainEvent
+from src.domain.ports.outbox_repository import OutboxRepository
+from src.exceptions import (
+    DatabaseConnectionError,
+    DatabaseOperationError,
+    DatabaseTimeoutError,
+)
+from src.infrastructure.messaging.serialization import event_to_json
+from src.infrastructure.persistence.models import OutboxModel
+
+logger = logging.getLogger(__name__)
+
+# Held for one relay pass, so relays in other processes sit it out.
+_RELAY_LOCK_KEY = 0x6F69735F6F757462
+
+
+@dataclass(frozen=True, slots=True)
+class OutboxMessage:
+    """A staged event as the relay reads it back."""
+
+    id: int
+    event_type: str
+    payload: str
+    created_at: datetime
+
+
+def _utc(value: datetime) -> datetime:
+    # SQLite hands back naive datetimes for timezone-aware columns.
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+
+class SQLAlchemyOutboxRepository(OutboxRepository):
+    """Outbox rows in the ``outbox`` table.
+
+    ``add`` is what handlers use; ``lock_relay`` / ``claim_batch`` /
+    ``delete`` / ``backlog`` serve the relay.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def add(self, event: DomainEvent) -> None:
+        # Flushed with the order changes at commit; no extra round trip.
+        self._session.add(
+            OutboxModel(
+                event_type=event.event_type,
+                payload=event_to_json(event),
+                created_at=datetime.now(timezone.utc),
+            )
+        )
+        logger.debug("Staged outbox event: event_type=%s", event.event_type)
+
+    async def lock_relay(self) -> bool:
+        """Take the relay lock for the rest of the transaction; False if
+        another relay holds it. Always True off PostgreSQL."""
+        if self._session.bind.dialect.name != "postgresql":
+            return True
+        result = await self._execute_db_operation(
+            "lock_outbox_relay",
+            self._session.execute,
+            text(f"SELECT pg_try_advisory_xact_lock({_RELAY_LOCK_KEY})"),
+        )
+        return bool(result.scalar())
+
+    async def claim_batch(self, limit: int) -> list[OutboxMessage]:
+        """Lock and return the oldest ``limit`` rows.
+
+        Called under ``lock_relay``, so no other relay is claiming. Rows are
+        not skipped when locked: the batch must be the oldest rows, or
+        events would leave out of order.
+        """
+        stmt = (
+            select(OutboxModel).order_by(OutboxModel.id).limit(limit).with_for_update()
+        )
+        result = await self._execute_db_operation(
+            "claim_outbox_batch",
+            self._session.execute,
+            stmt,
+        )
+        return [
+            OutboxMessage(
+                id=model.id,
+                event_type=model.event_type,
+                payload=model.payload,
+                created_at=_utc(model.created_at),
+            )
+            for model in result.scalars().all()
+        ]
+
+    async def delete(self, ids: list[int]) -> None:
+        if not ids:
+            return
+        await self._execute_db_operation(
+            "delete_outbox_rows",
+            self._session.execute,
+            delete(OutboxModel).where(OutboxModel.id.in_(ids)),
+        )
+
+    async def backlog(self) -> tuple[int, datetime | None]:
+        """Return the number of pending rows and when the oldest was staged."""
+        result = await self._execute_db_operation(
+            "outbox_backlog",
+            self._session.execute,
+            select(func.count(OutboxModel.id), func.min(OutboxModel.created_at)),
+        )
+        pending, oldest = result.one()
+        return pending, _utc(oldest) if oldest is not None else None
+
+    async def _execute_db_operation(self, operation: str, coro, *args, **kwargs):
+        try:
+            return await coro(*args, **kwargs)
+        except OperationalError as e:
+            logger.exception("Database connection error during %s", operation)
+            raise DatabaseConnectionError(f"Failed to connect to database: {e}") from e
+        except TimeoutError as e:
+            logger.exception("Database timeout during %s", operation)
+            raise DatabaseTimeoutError(f"Database operation timed out: {e}") from e
+        except SQLAlchemyError as e:
+            logger.exception("Database error during %s", operation)
+            raise DatabaseOperationError(f"Database operation failed: {e}") from e
@@ -1,33 +1,61 @@
 import logging
+from collections.abc import Callable
 from types import TracebackType
+
 from sqlalchemy.exc import OperationalError, SQLAlchemyError, TimeoutError
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from src.domain.ports.outbox_repository import OutboxRepository
 from src.domain.ports.unit_of_work import UnitOfWork
 from src.exceptions import (
     DatabaseConnectionError,
     DatabaseOperationError,
     DatabaseTimeoutError,
 )
+from src.infrastructure.persistence.repositories.noop_outbox_repository import (
+    NoOpOutboxRepository,
+)
 from src.infrastructure.persistence.repositories.sqlalchemy_order_repository import (
     SQLAlchemyOrderRepository,
 )
+from src.infrastructure.persistence.repositories.sqlalchemy_outbox_repository import (
+    SQLAlchemyOutboxRepository,
+)
 
 logger = logging.getLogger(__name__)
 
 
 class SQLAlchemyUnitOfWork(UnitOfWork):
-    """Coordinates a single transactional boundary over order repositories."""
+    """Coordinates a single transactional boundary over order repositories.
+
+    ``on_commit`` is called after every successful commit (the app passes
+    the outbox relay's ``notify`` so staged events go out without waiting
+    for its next poll). With ``stage_events=False`` (no event bus, so no
+    relay) the outbox drops events instead of storing rows nobody sends.
+    """
 
-    def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        on_commit: Callable[[], None] | None = None,
+        stage_events: bool = True,
+    ) -> None:
         self._session_factory = session_factory
+        self._on_commit = on_commit
+        self._stage_events = stage_events
         self._session: AsyncSession | None = None
         self.orders: SQLAlchemyOrderRepository
+        self.outbox: OutboxRepository
 
     async def __aenter__(self) -> "SQLAlchemyUnitOfWork":
         """Open a new session and bind repositories."""
         self._session = self._session_factory()
         self.orders = SQLAlchemyOrderRepository(self._session)
+        self.outbox = (
+            SQLAlchemyOutboxRepository(self._session)
+            if self._stage_events
+            else NoOpOutboxRepository()
+        )
         return self
 
     async def __aexit__(
@@ -57,6 +85,8 @@ class SQLAlchemyUnitOfWork(UnitOfWork):
         )
 
         logger.debug("Transaction committed successfully")
+        if self._on_commit is not None:
+            self._on_commit()
 
     async def rollback(self) -> None:
         """Rollback the current transaction."""
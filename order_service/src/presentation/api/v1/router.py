@@ -2,7 +2,9 @@
 
 from fastapi import APIRouter
 
+from src.presentation.api.v1.routers.metrics import router as metrics_router
 from src.presentation.api.v1.routers.orders import router as orders_router
 
 api_v1_router = APIRouter(prefix="/api/v1")
 api_v1_router.include_router(orders_router)
+api_v1_router.include_router(metrics_router)
@@ -0,0 +1,104 @@
+import math
+
+from fastapi import APIRouter, HTTPException, status
+
+from src.presentation.api.v1.schemas.responses import (
+    LatencyBucketResponse,
+    LatencyHistogramResponse,
+    LatencyMetricsResponse,
+    OutboxMetricsResponse,
+    WalletIdCacheStatsResponse,
+)
+from src.presentation.dependencies import (
+    LatencyRecorderDep,
+    OutboxRelayDep,
+    WalletIdCacheDep,
+)
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+
+def _ms(value: float) -> float | None:
+    # JSON has no infinity; the overflow bucket is reported as null.
+    return None if math.isinf(value) else value
+
+
+@router.get(
+    "/latency",
+    response_model=LatencyMetricsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get per-hop latency histograms",
+)
+async def get_latency_metrics(latency: LatencyRecorderDep) -> LatencyMetricsResponse:
+    """Submit latency and each outbound Wallet / Admin hop, in milliseconds."""
+    return LatencyMetricsResponse(
+        histograms=[
+            LatencyHistogramResponse(
+                name=snapshot.name,
+                count=snapshot.count,
+                mean_ms=snapshot.mean_ms,
+                p50_ms=_ms(snapshot.p50_ms),
+                p95_ms=_ms(snapshot.p95_ms),
+                p99_ms=_ms(snapshot.p99_ms),
+                buckets=[
+                    LatencyBucketResponse(le_ms=_ms(bound), count=count)
+                    for bound, count in snapshot.buckets
+                ],
+            )
+            for snapshot in latency.snapshot()
+        ]
+    )
+
+
+@router.get(
+    "/wallet-id-cache",
+    response_model=WalletIdCacheStatsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get trader -> wallet id cache counters",
+)
+async def get_wallet_id_cache_stats(
+    cache: WalletIdCacheDep,
+) -> WalletIdCacheStatsResponse:
+    if cache is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Wallet id cache is disabled.",
+        )
+    stats = cache.stats()
+    lookups = stats.hits + stats.negative_hits + stats.misses
+    return WalletIdCacheStatsResponse(
+        hits=stats.hits,
+        negative_hits=stats.negative_hits,
+        misses=stats.misses,
+        invalidations=stats.invalidations,
+        evictions=stats.evictions,
+        entries=stats.entries,
+        hit_ratio=(stats.hits + stats.negative_hits) / lookups if lookups else 0.0,
+    )
+
+
+@router.get(
+    "/outbox",
+    response_model=OutboxMetricsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get outbox relay lag and backlog",
+)
+async def get_outbox_metrics(relay: OutboxRelayDep) -> OutboxMetricsResponse:
+    """Events committed but not yet published, and how far the relay lags.
+
+    The commit-to-publish histogram is ``outbox.relay_lag`` in /latency.
+    """
+    stats = await relay.stats()
+    return OutboxMetricsResponse(
+        relay_running=stats.running,
+        pending=stats.pending,
+        oldest_pending_age_seconds=stats.oldest_pending_age_seconds,
+        published=stats.published,
+        failed=stats.failed,
+        batches=stats.batches,
+        last_lag_ms=(
+            stats.last_lag_seconds * 1000
+            if stats.last_lag_seconds is not None
+            else None
+        ),
+    )
@@ -33,8 +33,6 @@ from src.exceptions import (
     InvalidOrderStateError,
     InvalidQuantityError,
     InvalidTraderIdError,
-    MessagingConnectionError,
-    MessagingPublishError,
     OrderAlreadyExistsError,
     OrderNotFoundError,
 )
@@ -47,8 +45,8 @@ from src.presentation.api.v1.schemas.responses import (
     SubmitOrderResponse,
 )
 from src.presentation.dependencies import (
-    EventPublisherDep,
     InstrumentGatewayDep,
+    LatencyRecorderDep,
     UoWFactory,
     WalletGatewayDep,
 )
@@ -102,9 +100,9 @@ def _order_response_from_dto(dto) -> OrderResponse:
 async def submit_order(
     body: SubmitOrderRequest,
     uow_factory: UoWFactory,
-    event_publisher: EventPublisherDep,
     wallet_gateway: WalletGatewayDep,
     instrument_gateway: InstrumentGatewayDep,
+    latency: LatencyRecorderDep,
 ) -> SubmitOrderResponse:
     """Submit a new order for a trader."""
     logger.info(
@@ -116,24 +114,24 @@ async def submit_order(
     )
     handler = SubmitOrderHandler(
         uow_factory(),
-        event_publisher,
         wallet_gateway=wallet_gateway,
         instrument_gateway=instrument_gateway,
     )
     try:
-        result = await handler.handle(
-            SubmitOrderCommand(
-                trader_id=body.trader_id,
-                instrument_id=body.instrument_id,
-                side=body.side,
-                order_type=body.order_type,
-                time_in_force=body.time_in_force,
-                quantity=body.quantity,
-                idempotency_key=body.idempotency_key,
-                limit_price=body.limit_price,
-                limit_price_currency=body.limit_price_currency,
-            ),
-        )
+        with latency.time("POST /orders"):
+            result = await handler.handle(
+                SubmitOrderCommand(
+                    trader_id=body.trader_id,
+                    instrument_id=body.instrument_id,
+                    side=body.side,
+                    order_type=body.order_type,
+                    time_in_force=body.time_in_force,
+                    quantity=body.quantity,
+                    idempotency_key=body.idempotency_key,
+                    limit_price=body.limit_price,
+                    limit_price_currency=body.limit_price_currency,
+                ),
+            )
     except OrderAlreadyExistsError as exc:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
@@ -153,13 +151,12 @@ async def submit_order(
     except (
         DatabaseConnectionError,
         DatabaseTimeoutError,
-        MessagingConnectionError,
     ) as exc:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail=str(exc) or "Service temporarily unavailable.",
         )
-    except (DatabaseOperationError, MessagingPublishError) as exc:
+    except DatabaseOperationError as exc:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=str(exc) or "Operation failed.",
@@ -278,11 +275,10 @@ async def list_orders_by_trader(
 async def open_order(
     order_id: OrderIdPath,
     uow_factory: UoWFactory,
-    event_publisher: EventPublisherDep,
 ) -> Response:
     """Accept a NEW order onto the book (NEW → OPEN)."""
     logger.info("Opening order: order_id=%s", order_id)
-    handler = OpenOrderHandler(uow_factory(), event_publisher)
+    handler = OpenOrderHandler(uow_factory())
     try:
         await handler.handle(OpenOrderCommand(order_id=order_id))
     except OrderNotFoundError as exc:
@@ -303,13 +299,12 @@ async def open_order(
     except (
         DatabaseConnectionError,
         DatabaseTimeoutError,
-        MessagingConnectionError,
     ) as exc:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail=str(exc) or "Service temporarily unavailable.",
         )
-    except (DatabaseOperationError, MessagingPublishError) as exc:
+    except DatabaseOperationError as exc:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=str(exc) or "Operation failed.",
@@ -334,7 +329,6 @@ async def fill_order(
     order_id: OrderIdPath,
     body: FillOrderRequest,
     uow_factory: UoWFactory,
-    event_publisher: EventPublisherDep,
 ) -> Response:
     """Apply a fill against the remaining quantity of an order."""
     logger.info(
@@ -342,7 +336,7 @@ async def fill_order(
         order_id,
         body.fill_quantity,
     )
-    handler = FillOrderHandler(uow_factory(), event_publisher)
+    handler = FillOrderHandler(uow_factory())
     try:
         await handler.handle(
             FillOrderCommand(order_id=order_id, fill_quantity=body.fill_quantity),
@@ -369,13 +363,12 @@ async def fill_order(
     except (
         DatabaseConnectionError,
         DatabaseTimeoutError,
-        MessagingConnectionError,
     ) as exc:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail=str(exc) or "Service temporarily unavailable.",
         )
-    except (DatabaseOperationError, MessagingPublishError) as exc:
+    except DatabaseOperationError as exc:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=str(exc) or "Database operation failed.",
@@ -403,14 +396,11 @@ async def fill_order(
 async def cancel_order(
     order_id: OrderIdPath,
     uow_factory: UoWFactory,
-    event_publisher: EventPublisherDep,
     wallet_gateway: WalletGatewayDep,
 ) -> Response:
     """Cancel an active order."""
     logger.info("Cancelling order: order_id=%s", order_id)
-    handler = CancelOrderHandler(
-        uow_factory(), event_publisher, wallet_gateway=wallet_gateway
-    )
+    handler = CancelOrderHandler(uow_factory(), wallet_gateway=wallet_gateway)
     try:
         await handler.handle(CancelOrderCommand(order_id=order_id))
     except OrderNotFoundError as exc:
@@ -431,13 +421,12 @@ async def cancel_order(
     except (
         DatabaseConnectionError,
         DatabaseTimeoutError,
-        MessagingConnectionError,
     ) as exc:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail=str(exc) or "Service temporarily unavailable.",
         )
-    except (DatabaseOperationError, MessagingPublishError) as exc:
+    except DatabaseOperationError as exc:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=str(exc) or "Operation failed.",
@@ -461,11 +450,10 @@ async def cancel_order(
 async def reject_order(
     order_id: OrderIdPath,
     uow_factory: UoWFactory,
-    event_publisher: EventPublisherDep,
 ) -> Response:
     """Reject a NEW order."""
     logger.info("Rejecting order: order_id=%s", order_id)
-    handler = RejectOrderHandler(uow_factory(), event_publisher)
+    handler = RejectOrderHandler(uow_factory())
     try:
         await handler.handle(RejectOrderCommand(order_id=order_id))
     except OrderNotFoundError as exc:
@@ -486,13 +474,12 @@ async def reject_order(
     except (
         DatabaseConnectionError,
         DatabaseTimeoutError,
-        MessagingConnectionError,
     ) as exc:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail=str(exc) or "Service temporarily unavailable.",
         )
-    except (DatabaseOperationError, MessagingPublishError) as exc:
+    except DatabaseOperationError as exc:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=str(exc) or "Operation failed.",
@@ -516,11 +503,10 @@ async def reject_order(
 async def expire_order(
     order_id: OrderIdPath,
     uow_factory: UoWFactory,
-    event_publisher: EventPublisherDep,
 ) -> Response:
     """Expire an order that is still on the book."""
     logger.info("Expiring order: order_id=%s", order_id)
-    handler = ExpireOrderHandler(uow_factory(), event_publisher)
+    handler = ExpireOrderHandler(uow_factory())
     try:
         await handler.handle(ExpireOrderCommand(order_id=order_id))
     except OrderNotFoundError as exc:
@@ -541,13 +527,12 @@ async def expire_order(
     except (
         DatabaseConnectionError,
         DatabaseTimeoutError,
-        MessagingConnectionError,
     ) as exc:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail=str(exc) or "Service temporarily unavailable.",
         )
-    except (DatabaseOperationError, MessagingPublishError) as exc:
+    except DatabaseOperationError as exc:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=str(exc) or "Operation failed.",
@@ -32,6 +32,56 @@ class SubmitOrderResponse(BaseModel):
     order_id: str
 
 
+class LatencyBucketResponse(BaseModel):
+    """Observations at or below ``le_ms`` (not cumulative); ``le_ms`` is
+    null for the overflow bucket."""
+
+    le_ms: float | None
+    count: int
+
+
+class LatencyHistogramResponse(BaseModel):
+    """Latency of one hop (or of a whole request) since startup."""
+
+    name: str
+    count: int
+    mean_ms: float
+    p50_ms: float | None
+    p95_ms: float | None
+    p99_ms: float | None
+    buckets: list[LatencyBucketResponse]
+
+
+class LatencyMetricsResponse(BaseModel):
+    """All latency histograms recorded by this process."""
+
+    histograms: list[LatencyHistogramResponse]
+
+
+class WalletIdCacheStatsResponse(BaseModel):
+    """Trader -> wallet id cache counters since startup."""
+
+    hits: int
+    negative_hits: int
+    misses: int
+    invalidations: int
+    evictions: int
+    entries: int
+    hit_ratio: float
+
+
+class OutboxMetricsResponse(BaseModel):
+    """Outbox backlog and relay counters since startup."""
+
+    relay_running: bool
+    pending: int
+    oldest_pending_age_seconds: float | None
+    published: int
+    failed: int
+    batches: int
+    last_lag_ms: float | None
+
+
 class ErrorResponse(BaseModel):
     """Standard error body."""
 
@@ -4,19 +4,12 @@ from typing import Annotated
 from fastapi import Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from src.conf import Config
-from src.domain.ports.event_publisher import EventPublisher
 from src.domain.ports.instrument_gateway import InstrumentGateway
 from src.domain.ports.unit_of_work import UnitOfWork
 from src.domain.ports.wallet_gateway import WalletGateway
-from src.infrastructure.http_clients.http_instrument_gateway import (
-    HttpInstrumentGateway,
-)
-from src.infrastructure.http_clients.http_wallet_gateway import HttpWalletGateway
-from src.infrastructure.http_clients.noop_instrument_gateway import (
-    NoOpInstrumentGateway,
-)
-from src.infrastructure.http_clients.noop_wallet_gateway import NoOpWalletGateway
+from src.infrastructure.http_clients.wallet_id_cache import WalletIdCache
+from src.infrastructure.messaging.outbox_relay import OutboxRelay
+from src.infrastructure.metrics.latency import LatencyRecorder
 from src.infrastructure.persistence.unit_of_work import SQLAlchemyUnitOfWork
 
 
@@ -24,35 +17,49 @@ def get_session_factory(request: Request) -> async_sessionmaker[AsyncSession]:
     return request.app.state.session_factory
 
 
+def get_outbox_relay(request: Request) -> OutboxRelay:
+    return request.app.state.outbox_relay
+
+
+def get_stage_outbox_events(request: Request) -> bool:
+    return request.app.state.stage_outbox_events
+
+
 def get_uow_factory(
     session_factory: Annotated[
         async_sessionmaker[AsyncSession],
         Depends(get_session_factory),
     ],
+    relay: Annotated[OutboxRelay, Depends(get_outbox_relay)],
+    stage_events: Annotated[bool, Depends(get_stage_outbox_events)],
 ) -> Callable[[], UnitOfWork]:
     def factory() -> UnitOfWork:
-        return SQLAlchemyUnitOfWork(session_factory)
+        return SQLAlchemyUnitOfWork(
+            session_factory, on_commit=relay.notify, stage_events=stage_events
+        )
 
     return factory
 
 
-def get_event_publisher(request: Request) -> EventPublisher:
-    return request.app.state.event_publisher
+def get_wallet_gateway(request: Request) -> WalletGateway:
+    return request.app.state.wallet_gateway
+
+
+def get_instrument_gateway(request: Request) -> InstrumentGateway:
+    return request.app.state.instrument_gateway
 
 
-def get_wallet_gateway() -> WalletGateway:
-    if Config.WALLET_INTEGRATION_ENABLED:
-        return HttpWalletGateway(Config.WALLET_SERVICE_URL)
-    return NoOpWalletGateway()
+def get_latency_recorder(request: Request) -> LatencyRecorder:
+    return request.app.state.latency
 
 
-def get_instrument_gateway() -> InstrumentGateway:
-    if Config.ADMIN_INTEGRATION_ENABLED:
-        return HttpInstrumentGateway(Config.ADMIN_SERVICE_URL)
-    return NoOpInstrumentGateway()
+def get_wallet_id_cache(request: Request) -> WalletIdCache | None:
+    return request.app.state.wallet_id_cache
 
 
 UoWFactory = Annotated[Callable[[], UnitOfWork], Depends(get_uow_factory)]
-EventPublisherDep = Annotated[EventPublisher, Depends(get_event_publisher)]
 WalletGatewayDep = Annotated[WalletGateway, Depends(get_wallet_gateway)]
 InstrumentGatewayDep = Annotated[InstrumentGateway, Depends(get_instrument_gateway)]
+LatencyRecorderDep = Annotated[LatencyRecorder, Depends(get_latency_recorder)]
+WalletIdCacheDep = Annotated[WalletIdCache | None, Depends(get_wallet_id_cache)]
+OutboxRelayDep = Annotated[OutboxRelay, Depends(get_outbox_relay)]
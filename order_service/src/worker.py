@@ -14,7 +14,6 @@ from src.application.fill_order import FillOrderHandler
 from src.conf import Config
 from src.database import async_session_maker, engine
 from src.infrastructure.messaging.fill_event_consumer import FillEventConsumer
-from src.infrastructure.messaging.noop_event_publisher import NoOpEventPublisher
 from src.infrastructure.persistence.models import Base
 from src.infrastructure.persistence.unit_of_work import SQLAlchemyUnitOfWork
 from src.logging_config import setup_logging
@@ -30,9 +29,10 @@ async def run() -> None:
         await conn.run_sync(Base.metadata.create_all)
 
     def fill_handler() -> FillOrderHandler:
+        # ME already published these OrderFilled events on trade.events.
         return FillOrderHandler(
             SQLAlchemyUnitOfWork(async_session_maker),
-            NoOpEventPublisher(),
+            emit_events=False,
         )
 
     class _Handler:
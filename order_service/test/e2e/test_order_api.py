@@ -519,3 +519,59 @@ class TestOrderJourneys:
         order_id = _submit(client, market_order_payload)
         assert _get_order(client, order_id)["status"] == "OPEN"
         assert client.post(f"{BASE}/{order_id}/reject").status_code == 409
+
+
+# ---------------------------------------------------------------------------
+# Metrics
+# ---------------------------------------------------------------------------
+
+
+class TestLatencyMetrics:
+    def test_submit_latency_is_recorded(
+        self, client: TestClient, limit_order_payload: dict
+    ) -> None:
+        _submit(client, limit_order_payload)
+
+        response = client.get("/api/v1/metrics/latency")
+
+        assert response.status_code == 200, response.text
+        histograms = {h["name"]: h for h in response.json()["histograms"]}
+        submit = histograms["POST /orders"]
+        assert submit["count"] >= 1
+        assert submit["buckets"][-1]["le_ms"] is None
+        assert sum(b["count"] for b in submit["buckets"]) == submit["count"]
+
+    def test_lifespan_owns_pooled_gateway_clients(self, monkeypatch) -> None:
+        from src.app import app
+        from src.conf import Config
+        from src.infrastructure.http_clients.http_wallet_gateway import (
+            HttpWalletGateway,
+        )
+
+        monkeypatch.setattr(Config, "WALLET_INTEGRATION_ENABLED", True)
+        with TestClient(app):
+            gateway = app.state.wallet_gateway
+            assert isinstance(gateway, HttpWalletGateway)
+            assert not gateway._client.is_closed
+
+        assert gateway._client.is_closed
+
+    def test_wallet_id_cache_stats(self, client: TestClient) -> None:
+        response = client.get("/api/v1/metrics/wallet-id-cache")
+
+        assert response.status_code == 200, response.text
+        assert set(response.json()) >= {"hits", "misses", "entries", "hit_ratio"}
+
+    def test_outbox_is_not_written_without_a_bus(
+        self, client: TestClient, limit_order_payload: dict
+    ) -> None:
+        before = client.get("/api/v1/metrics/outbox").json()
+        _submit(client, limit_order_payload)
+
+        response = client.get("/api/v1/metrics/outbox")
+
+        assert response.status_code == 200, response.text
+        body = response.json()
+        # No bus in tests, so no relay would ever drain staged events.
+        assert body["relay_running"] is False
+        assert body["pending"] == before["pending"]
@@ -3,8 +3,8 @@ from unittest.mock import AsyncMock
 import pytest
 
 from src.domain.entities.order import Order
-from src.domain.ports.event_publisher import EventPublisher
 from src.domain.ports.order_repository import OrderRepository
+from src.domain.ports.outbox_repository import OutboxRepository
 from src.domain.ports.unit_of_work import UnitOfWork
 from src.domain.value_objects.currency import Currency
 from src.domain.value_objects.idempotency_key import IdempotencyKey
@@ -33,9 +33,17 @@ def mock_order_repository() -> AsyncMock:
 
 
 @pytest.fixture
-def mock_uow(mock_order_repository: AsyncMock) -> AsyncMock:
+def mock_outbox() -> AsyncMock:
+    outbox = AsyncMock(spec=OutboxRepository)
+    outbox.add = AsyncMock()
+    return outbox
+
+
+@pytest.fixture
+def mock_uow(mock_order_repository: AsyncMock, mock_outbox: AsyncMock) -> AsyncMock:
     uow = AsyncMock(spec=UnitOfWork)
     uow.orders = mock_order_repository
+    uow.outbox = mock_outbox
     uow.commit = AsyncMock()
     uow.rollback = AsyncMock()
     uow.__aenter__ = AsyncMock(return_value=uow)
@@ -43,13 +51,6 @@ def mock_uow(mock_order_repository: AsyncMock) -> AsyncMock:
     return uow
 
 
-@pytest.fixture
-def mock_event_publisher() -> AsyncMock:
-    publisher = AsyncMock(spec=EventPublisher)
-    publisher.publish = AsyncMock()
-    return publisher
-
-
 # ---------------------------------------------------------------------------
 # Identifiers
 # ---------------------------------------------------------------------------
@@ -12,13 +12,13 @@ from src.exceptions import InvalidOrderFillError, InvalidOrderStateError
 
 async def test_partial_fill(
     mock_uow: AsyncMock,
-    mock_event_publisher: AsyncMock,
+    mock_outbox: AsyncMock,
     mock_order_repository: AsyncMock,
     open_order: Order,
 ) -> None:
     mock_order_repository.get_by_id.return_value = open_order
 
-    handler = FillOrderHandler(mock_uow, mock_event_publisher)
+    handler = FillOrderHandler(mock_uow)
     await handler.handle(
         FillOrderCommand(order_id=open_order.id.value, fill_quantity=40)
     )
@@ -28,23 +28,41 @@ async def test_partial_fill(
     assert open_order.status is OrderStatus.PARTIALLY_FILLED
     mock_order_repository.update.assert_awaited_once_with(open_order)
     mock_uow.commit.assert_awaited_once()
-    mock_event_publisher.publish.assert_awaited_once()
-    event = mock_event_publisher.publish.await_args.args[0]
+    mock_outbox.add.assert_awaited_once()
+    event = mock_outbox.add.await_args.args[0]
     assert isinstance(event, OrderFilled)
     assert event.fill_quantity == 40
     assert event.filled_quantity == 40
     assert event.status == OrderStatus.PARTIALLY_FILLED.value
 
 
+async def test_fill_without_events_stages_nothing(
+    mock_uow: AsyncMock,
+    mock_outbox: AsyncMock,
+    mock_order_repository: AsyncMock,
+    open_order: Order,
+) -> None:
+    mock_order_repository.get_by_id.return_value = open_order
+
+    handler = FillOrderHandler(mock_uow, emit_events=False)
+    await handler.handle(
+        FillOrderCommand(order_id=open_order.id.value, fill_quantity=40)
+    )
+
+    assert open_order.filled_quantity == Quantity(40)
+    mock_uow.commit.assert_awaited_once()
+    mock_outbox.add.assert_not_awaited()
+
+
 async def test_full_fill(
     mock_uow: AsyncMock,
-    mock_event_publisher: AsyncMock,
+    mock_outbox: AsyncMock,
     mock_order_repository: AsyncMock,
     open_order: Order,
 ) -> None:
     mock_order_repository.get_by_id.return_value = open_order
 
-    handler = FillOrderHandler(mock_uow, mock_event_publisher)
+    handler = FillOrderHandler(mock_uow)
     await handler.handle(
         FillOrderCommand(order_id=open_order.id.value, fill_quantity=100)
     )
@@ -53,21 +71,20 @@ async def test_full_fill(
     assert open_order.status is OrderStatus.FILLED
     mock_order_repository.update.assert_awaited_once()
     mock_uow.commit.assert_awaited_once()
-    mock_event_publisher.publish.assert_awaited_once()
-    event = mock_event_publisher.publish.await_args.args[0]
+    mock_outbox.add.assert_awaited_once()
+    event = mock_outbox.add.await_args.args[0]
     assert isinstance(event, OrderFilled)
     assert event.status == OrderStatus.FILLED.value
 
 
 async def test_fill_to_complete_after_partial(
     mock_uow: AsyncMock,
-    mock_event_publisher: AsyncMock,
     mock_order_repository: AsyncMock,
     partially_filled_order: Order,
 ) -> None:
     mock_order_repository.get_by_id.return_value = partially_filled_order
 
-    handler = FillOrderHandler(mock_uow, mock_event_publisher)
+    handler = FillOrderHandler(mock_uow)
     await handler.handle(
         FillOrderCommand(
             order_id=partially_filled_order.id.value,
@@ -81,13 +98,12 @@ async def test_fill_to_complete_after_partial(
 
 async def test_raises_on_overfill(
     mock_uow: AsyncMock,
-    mock_event_publisher: AsyncMock,
     mock_order_repository: AsyncMock,
     open_order: Order,
 ) -> None:
     mock_order_repository.get_by_id.return_value = open_order
 
-    handler = FillOrderHandler(mock_uow, mock_event_publisher)
+    handler = FillOrderHandler(mock_uow)
 
     with pytest.raises(InvalidOrderFillError):
         await handler.handle(
@@ -100,13 +116,12 @@ async def test_raises_on_overfill(
 
 async def test_raises_when_order_not_fillable(
     mock_uow: AsyncMock,
-    mock_event_publisher: AsyncMock,
     mock_order_repository: AsyncMock,
     new_limit_order: Order,
 ) -> None:
     mock_order_repository.get_by_id.return_value = new_limit_order
 
-    handler = FillOrderHandler(mock_uow, mock_event_publisher)
+    handler = FillOrderHandler(mock_uow)
 
     with pytest.raises(InvalidOrderStateError):
         await handler.handle(
@@ -1,3 +1,4 @@
+import asyncio
 from decimal import Decimal
 from unittest.mock import AsyncMock
 
@@ -10,23 +11,30 @@ from src.application.submit_order import (
 )
 from src.domain.entities.order import Order
 from src.domain.events.order_events import OrderOpened, OrderSubmitted
+from src.domain.ports.instrument_gateway import InstrumentGateway
+from src.domain.ports.wallet_gateway import WalletGateway
 from src.domain.value_objects.instrument_id import InstrumentId
 from src.domain.value_objects.order_status import OrderStatus
 from src.domain.value_objects.order_type import OrderType
 from src.domain.value_objects.trader_id import TraderId
-from src.exceptions import InvalidOrderParametersError, OrderAlreadyExistsError
+from src.exceptions import (
+    DatabaseOperationError,
+    InstrumentNotTradableError,
+    InvalidOrderParametersError,
+    OrderAlreadyExistsError,
+)
 
 
 async def test_submits_limit_order(
     mock_uow: AsyncMock,
-    mock_event_publisher: AsyncMock,
+    mock_outbox: AsyncMock,
     mock_order_repository: AsyncMock,
     sample_trader_id: TraderId,
     sample_instrument_id: InstrumentId,
 ) -> None:
     mock_order_repository.get_by_idempotency_key.return_value = None
 
-    handler = SubmitOrderHandler(mock_uow, mock_event_publisher)
+    handler = SubmitOrderHandler(mock_uow)
     result = await handler.handle(
         SubmitOrderCommand(
             trader_id=sample_trader_id.value,
@@ -55,8 +63,8 @@ async def test_submits_limit_order(
     assert added.limit_price is not None
     assert added.limit_price.amount == Decimal("10.50")
     mock_uow.commit.assert_awaited_once()
-    assert mock_event_publisher.publish.await_count == 2
-    events = [c.args[0] for c in mock_event_publisher.publish.await_args_list]
+    assert mock_outbox.add.await_count == 2
+    events = [c.args[0] for c in mock_outbox.add.await_args_list]
     assert isinstance(events[0], OrderSubmitted)
     assert isinstance(events[1], OrderOpened)
     assert events[0].order_id == result.order_id
@@ -68,14 +76,14 @@ async def test_submits_limit_order(
 
 async def test_submits_market_order(
     mock_uow: AsyncMock,
-    mock_event_publisher: AsyncMock,
+    mock_outbox: AsyncMock,
     mock_order_repository: AsyncMock,
     sample_trader_id: TraderId,
     sample_instrument_id: InstrumentId,
 ) -> None:
     mock_order_repository.get_by_idempotency_key.return_value = None
 
-    handler = SubmitOrderHandler(mock_uow, mock_event_publisher)
+    handler = SubmitOrderHandler(mock_uow)
     result = await handler.handle(
         SubmitOrderCommand(
             trader_id=sample_trader_id.value,
@@ -93,17 +101,36 @@ async def test_submits_market_order(
     assert added.order_type is OrderType.MARKET
     assert added.limit_price is None
     mock_uow.commit.assert_awaited_once()
-    assert mock_event_publisher.publish.await_count == 2
-    events = [c.args[0] for c in mock_event_publisher.publish.await_args_list]
+    assert mock_outbox.add.await_count == 2
+    events = [c.args[0] for c in mock_outbox.add.await_args_list]
     assert isinstance(events[0], OrderSubmitted)
     assert isinstance(events[1], OrderOpened)
     assert events[0].order_type == "MARKET"
     assert events[0].limit_price is None
 
 
+async def test_events_are_staged_in_the_commit(
+    mock_uow: AsyncMock,
+    mock_outbox: AsyncMock,
+    mock_order_repository: AsyncMock,
+    sample_trader_id: TraderId,
+    sample_instrument_id: InstrumentId,
+) -> None:
+    mock_order_repository.get_by_idempotency_key.return_value = None
+    staged_at_commit: list[int] = []
+    mock_uow.commit.side_effect = lambda: staged_at_commit.append(
+        mock_outbox.add.await_count
+    )
+
+    handler = SubmitOrderHandler(mock_uow)
+    await handler.handle(_buy_limit(sample_trader_id, sample_instrument_id))
+
+    assert staged_at_commit == [2]
+
+
 async def test_raises_when_idempotency_key_exists(
     mock_uow: AsyncMock,
-    mock_event_publisher: AsyncMock,
+    mock_outbox: AsyncMock,
     mock_order_repository: AsyncMock,
     new_limit_order: Order,
     sample_trader_id: TraderId,
@@ -111,7 +138,7 @@ async def test_raises_when_idempotency_key_exists(
 ) -> None:
     mock_order_repository.get_by_idempotency_key.return_value = new_limit_order
 
-    handler = SubmitOrderHandler(mock_uow, mock_event_publisher)
+    handler = SubmitOrderHandler(mock_uow)
 
     with pytest.raises(OrderAlreadyExistsError):
         await handler.handle(
@@ -130,17 +157,16 @@ async def test_raises_when_idempotency_key_exists(
 
     mock_order_repository.add.assert_not_awaited()
     mock_uow.commit.assert_not_awaited()
-    mock_event_publisher.publish.assert_not_awaited()
+    mock_outbox.add.assert_not_awaited()
 
 
 async def test_rejects_invalid_side(
     mock_uow: AsyncMock,
-    mock_event_publisher: AsyncMock,
     mock_order_repository: AsyncMock,
     sample_trader_id: TraderId,
     sample_instrument_id: InstrumentId,
 ) -> None:
-    handler = SubmitOrderHandler(mock_uow, mock_event_publisher)
+    handler = SubmitOrderHandler(mock_uow)
 
     with pytest.raises(InvalidOrderParametersError):
         await handler.handle(
@@ -163,12 +189,11 @@ async def test_rejects_invalid_side(
 
 async def test_rejects_invalid_order_type(
     mock_uow: AsyncMock,
-    mock_event_publisher: AsyncMock,
     mock_order_repository: AsyncMock,
     sample_trader_id: TraderId,
     sample_instrument_id: InstrumentId,
 ) -> None:
-    handler = SubmitOrderHandler(mock_uow, mock_event_publisher)
+    handler = SubmitOrderHandler(mock_uow)
 
     with pytest.raises(InvalidOrderParametersError):
         await handler.handle(
@@ -186,12 +211,11 @@ async def test_rejects_invalid_order_type(
 
 async def test_rejects_invalid_time_in_force(
     mock_uow: AsyncMock,
-    mock_event_publisher: AsyncMock,
     mock_order_repository: AsyncMock,
     sample_trader_id: TraderId,
     sample_instrument_id: InstrumentId,
 ) -> None:
-    handler = SubmitOrderHandler(mock_uow, mock_event_publisher)
+    handler = SubmitOrderHandler(mock_uow)
 
     with pytest.raises(InvalidOrderParametersError):
         await handler.handle(
@@ -209,12 +233,11 @@ async def test_rejects_invalid_time_in_force(
 
 async def test_rejects_invalid_limit_price_currency(
     mock_uow: AsyncMock,
-    mock_event_publisher: AsyncMock,
     mock_order_repository: AsyncMock,
     sample_trader_id: TraderId,
     sample_instrument_id: InstrumentId,
 ) -> None:
-    handler = SubmitOrderHandler(mock_uow, mock_event_publisher)
+    handler = SubmitOrderHandler(mock_uow)
 
     with pytest.raises(InvalidOrderParametersError):
         await handler.handle(
@@ -230,3 +253,247 @@ async def test_rejects_invalid_limit_price_currency(
                 limit_price_currency="XYZ",
             )
         )
+
+
+# ---------------------------------------------------------------------------
+# Pre-trade checks and compensation
+# ---------------------------------------------------------------------------
+
+
+def _buy_limit(trader_id: TraderId, instrument_id: InstrumentId) -> SubmitOrderCommand:
+    return SubmitOrderCommand(
+        trader_id=trader_id.value,
+        instrument_id=instrument_id.value,
+        side="BUY",
+        order_type="LIMIT",
+        time_in_force="GTC",
+        quantity=100,
+        idempotency_key="checks-001",
+        limit_price=Decimal("10.50"),
+        limit_price_currency="USD",
+    )
+
+
+@pytest.fixture
+def wallet() -> AsyncMock:
+    return AsyncMock(spec=WalletGateway)
+
+
+@pytest.fixture
+def instruments() -> AsyncMock:
+    return AsyncMock(spec=InstrumentGateway)
+
+
+async def test_checks_run_concurrently(
+    mock_uow: AsyncMock,
+    mock_order_repository: AsyncMock,
+    wallet: AsyncMock,
+    instruments: AsyncMock,
+    sample_trader_id: TraderId,
+    sample_instrument_id: InstrumentId,
+) -> None:
+    started: set[str] = set()
+
+    def check(name: str):
+        async def run(*args) -> None:
+            started.add(name)
+            # Each check finishes only once all three have started.
+            while len(started) < 3:
+                await asyncio.sleep(0)
+
+        return run
+
+    instruments.ensure_tradable.side_effect = check("instrument")
+    wallet.resolve_wallet.side_effect = check("wallet")
+    mock_order_repository.get_by_idempotency_key.side_effect = check("idempotency")
+
+    handler = SubmitOrderHandler(
+        mock_uow,
+        wallet_gateway=wallet,
+        instrument_gateway=instruments,
+    )
+    await asyncio.wait_for(
+        handler.handle(_buy_limit(sample_trader_id, sample_instrument_id)), 1
+    )
+
+    wallet.reserve_for_buy.assert_awaited_once_with(
+        sample_trader_id.value, Decimal("1050.00"), "USD"
+    )
+    mock_uow.commit.assert_awaited_once()
+
+
+async def test_failed_check_cancels_the_others(
+    mock_uow: AsyncMock,
+    mock_order_repository: AsyncMock,
+    wallet: AsyncMock,
+    instruments: AsyncMock,
+    sample_trader_id: TraderId,
+    sample_instrument_id: InstrumentId,
+) -> None:
+    cancelled = asyncio.Event()
+
+    async def slow_resolve(trader_id: str) -> None:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    wallet.resolve_wallet.side_effect = slow_resolve
+    instruments.ensure_tradable.side_effect = InstrumentNotTradableError("halted")
+    mock_order_repository.get_by_idempotency_key.return_value = None
+
+    handler = SubmitOrderHandler(
+        mock_uow,
+        wallet_gateway=wallet,
+        instrument_gateway=instruments,
+    )
+    with pytest.raises(InstrumentNotTradableError, match="halted"):
+        await handler.handle(_buy_limit(sample_trader_id, sample_instrument_id))
+
+    assert cancelled.is_set()
+    wallet.reserve_for_buy.assert_not_awaited()
+    mock_order_repository.add.assert_not_awaited()
+
+
+async def test_duplicate_key_reserves_nothing(
+    mock_uow: AsyncMock,
+    mock_order_repository: AsyncMock,
+    wallet: AsyncMock,
+    new_limit_order: Order,
+    sample_trader_id: TraderId,
+    sample_instrument_id: InstrumentId,
+) -> None:
+    mock_order_repository.get_by_idempotency_key.return_value = new_limit_order
+
+    handler = SubmitOrderHandler(mock_uow, wallet_gateway=wallet)
+    with pytest.raises(OrderAlreadyExistsError):
+        await handler.handle(_buy_limit(sample_trader_id, sample_instrument_id))
+
+    wallet.reserve_for_buy.assert_not_awaited()
+
+
+async def test_reservation_is_released_when_persisting_fails(
+    mock_uow: AsyncMock,
+    mock_order_repository: AsyncMock,
+    wallet: AsyncMock,
+    sample_trader_id: TraderId,
+    sample_instrument_id: InstrumentId,
+) -> None:
+    mock_order_repository.get_by_idempotency_key.return_value = None
+    # The insert flushes, so a concurrent submit's key surfaces here.
+    mock_order_repository.add.side_effect = DatabaseOperationError("unique violation")
+
+    handler = SubmitOrderHandler(mock_uow, wallet_gateway=wallet)
+    with pytest.raises(DatabaseOperationError):
+        await handler.handle(_buy_limit(sample_trader_id, sample_instrument_id))
+
+    wallet.release_buy_reservation.assert_awaited_once_with(
+        sample_trader_id.value, Decimal("1050.00"), "USD"
+    )
+    mock_uow.commit.assert_not_awaited()
+
+
+async def test_failed_commit_keeps_the_reservation(
+    mock_uow: AsyncMock,
+    mock_order_repository: AsyncMock,
+    wallet: AsyncMock,
+    sample_trader_id: TraderId,
+    sample_instrument_id: InstrumentId,
+) -> None:
+    mock_order_repository.get_by_idempotency_key.return_value = None
+    mock_uow.commit.side_effect = DatabaseOperationError("connection lost")
+
+    handler = SubmitOrderHandler(mock_uow, wallet_gateway=wallet)
+    with pytest.raises(DatabaseOperationError):
+        await handler.handle(_buy_limit(sample_trader_id, sample_instrument_id))
+
+    wallet.reserve_for_buy.assert_awaited_once()
+    wallet.release_buy_reservation.assert_not_awaited()
+
+
+async def test_no_transaction_is_open_during_the_http_calls(
+    mock_uow: AsyncMock,
+    mock_order_repository: AsyncMock,
+    wallet: AsyncMock,
+    sample_trader_id: TraderId,
+    sample_instrument_id: InstrumentId,
+) -> None:
+    mock_order_repository.get_by_idempotency_key.return_value = None
+    depth = 0
+
+    async def enter() -> AsyncMock:
+        nonlocal depth
+        depth += 1
+        return mock_uow
+
+    async def exit_(*exc_info) -> None:
+        nonlocal depth
+        depth -= 1
+
+    async def reserve(*args) -> None:
+        assert depth == 0
+
+    mock_uow.__aenter__.side_effect = enter
+    mock_uow.__aexit__.side_effect = exit_
+    wallet.reserve_for_buy.side_effect = reserve
+
+    handler = SubmitOrderHandler(mock_uow, wallet_gateway=wallet)
+    await handler.handle(_buy_limit(sample_trader_id, sample_instrument_id))
+
+    wallet.reserve_for_buy.assert_awaited_once()
+    assert mock_uow.__aenter__.await_count == 2
+    mock_uow.commit.assert_awaited_once()
+
+
+async def test_failed_release_does_not_mask_the_error(
+    mock_uow: AsyncMock,
+    mock_order_repository: AsyncMock,
+    wallet: AsyncMock,
+    sample_trader_id: TraderId,
+    sample_instrument_id: InstrumentId,
+) -> None:
+    mock_order_repository.get_by_idempotency_key.return_value = None
+    mock_order_repository.add.side_effect = DatabaseOperationError("down")
+    wallet.release_sell_reservation.side_effect = RuntimeError("wallet down")
+
+    handler = SubmitOrderHandler(mock_uow, wallet_gateway=wallet)
+    with pytest.raises(DatabaseOperationError):
+        await handler.handle(
+            SubmitOrderCommand(
+                trader_id=sample_trader_id.value,
+                instrument_id=sample_instrument_id.value,
+                side="SELL",
+                order_type="MARKET",
+                time_in_force="IOC",
+                quantity=5,
+                idempotency_key="sell-001",
+            )
+        )
+
+    wallet.release_sell_reservation.assert_awaited_once_with(
+        sample_trader_id.value, sample_instrument_id.value, 5
+    )
+
+
+async def test_serial_checks_stop_at_first_failure(
+    mock_uow: AsyncMock,
+    mock_order_repository: AsyncMock,
+    wallet: AsyncMock,
+    instruments: AsyncMock,
+    sample_trader_id: TraderId,
+    sample_instrument_id: InstrumentId,
+) -> None:
+    instruments.ensure_tradable.side_effect = InstrumentNotTradableError("halted")
+
+    handler = SubmitOrderHandler(
+        mock_uow,
+        wallet_gateway=wallet,
+        instrument_gateway=instruments,
+        concurrent_checks=False,
+    )
+    with pytest.raises(InstrumentNotTradableError):
+        await handler.handle(_buy_limit(sample_trader_id, sample_instrument_id))
+
+    mock_order_repository.get_by_idempotency_key.assert_not_awaited()
+    wallet.resolve_wallet.assert_not_awaited()
@@ -0,0 +1,223 @@
+import importlib.util
+from decimal import Decimal
+
+import httpx
+import pytest
+
+from src.exceptions import (
+    HttpClientError,
+    InstrumentNotTradableError,
+    InsufficientFundsError,
+    WalletIntegrationError,
+)
+from src.infrastructure.http_clients.http_client import build_http_client
+from src.infrastructure.http_clients.http_instrument_gateway import (
+    HttpInstrumentGateway,
+)
+from src.infrastructure.http_clients.http_wallet_gateway import HttpWalletGateway
+from src.infrastructure.http_clients.wallet_id_cache import WalletIdCache
+from src.infrastructure.metrics.latency import LatencyRecorder
+
+TRADER = "11111111-1111-4111-8111-111111111111"
+WALLET = "22222222-2222-4222-8222-222222222222"
+INSTRUMENT = "33333333-3333-4333-8333-333333333333"
+
+
+def _client(handler, base_url: str = "http://svc") -> httpx.AsyncClient:
+    return httpx.AsyncClient(base_url=base_url, transport=httpx.MockTransport(handler))
+
+
+def _wallet_handler(requests: list[httpx.Request], reserve_status: int = 201):
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.path == f"/api/v1/wallets/by-trader/{TRADER}":
+            return httpx.Response(200, json={"wallet_id": WALLET})
+        return httpx.Response(reserve_status, text="reserved")
+
+    return handler
+
+
+# ---------------------------------------------------------------------------
+# build_http_client
+# ---------------------------------------------------------------------------
+
+
+async def test_build_http_client_applies_base_url_and_timeouts() -> None:
+    client = build_http_client("http://wallet:8001/", timeout=3.0, connect_timeout=1.0)
+    try:
+        assert client.base_url == httpx.URL("http://wallet:8001")
+        assert client.timeout.read == 3.0
+        assert client.timeout.connect == 1.0
+    finally:
+        await client.aclose()
+
+
+@pytest.mark.skipif(importlib.util.find_spec("h2") is not None, reason="h2 installed")
+def test_build_http_client_requires_h2_for_http2() -> None:
+    with pytest.raises(HttpClientError, match="pip install"):
+        build_http_client("http://wallet:8001", http2=True)
+
+
+# ---------------------------------------------------------------------------
+# HttpWalletGateway
+# ---------------------------------------------------------------------------
+
+
+async def test_wallet_gateway_reuses_shared_client() -> None:
+    requests: list[httpx.Request] = []
+    client = _client(_wallet_handler(requests))
+    gateway = HttpWalletGateway(client)
+
+    await gateway.reserve_for_buy(TRADER, Decimal("10.50"), "USD")
+    await gateway.reserve_for_sell(TRADER, INSTRUMENT, 5)
+
+    assert [r.url.path for r in requests] == [
+        f"/api/v1/wallets/by-trader/{TRADER}",
+        f"/api/v1/wallets/{WALLET}/cash-reservations",
+        f"/api/v1/wallets/by-trader/{TRADER}",
+        f"/api/v1/wallets/{WALLET}/holding-reservations",
+    ]
+    assert not client.is_closed
+    await client.aclose()
+
+
+async def test_wallet_gateway_maps_conflict_to_insufficient_funds() -> None:
+    async with _client(_wallet_handler([], reserve_status=409)) as client:
+        with pytest.raises(InsufficientFundsError):
+            await HttpWalletGateway(client).reserve_for_buy(TRADER, Decimal("1"), "USD")
+
+
+async def test_wallet_gateway_wraps_transport_errors() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused", request=request)
+
+    async with _client(handler) as client:
+        with pytest.raises(WalletIntegrationError, match="refused"):
+            await HttpWalletGateway(client).reserve_for_buy(TRADER, Decimal("1"), "USD")
+
+
+async def test_wallet_gateway_records_per_hop_latency() -> None:
+    latency = LatencyRecorder()
+    async with _client(_wallet_handler([])) as client:
+        gateway = HttpWalletGateway(client, latency)
+        await gateway.reserve_for_buy(TRADER, Decimal("1"), "USD")
+        await gateway.release_buy_reservation(TRADER, Decimal("1"), "USD")
+
+    counts = {s.name: s.count for s in latency.snapshot()}
+    assert counts == {
+        "wallet.by_trader": 2,
+        "wallet.cash-reservations": 1,
+        "wallet.cash-releases": 1,
+    }
+
+
+async def test_wallet_gateway_caches_wallet_id() -> None:
+    requests: list[httpx.Request] = []
+    async with _client(_wallet_handler(requests)) as client:
+        gateway = HttpWalletGateway(client, wallet_ids=WalletIdCache())
+        await gateway.reserve_for_buy(TRADER, Decimal("1"), "USD")
+        await gateway.release_buy_reservation(TRADER, Decimal("1"), "USD")
+
+    assert [r.url.path for r in requests] == [
+        f"/api/v1/wallets/by-trader/{TRADER}",
+        f"/api/v1/wallets/{WALLET}/cash-reservations",
+        f"/api/v1/wallets/{WALLET}/cash-releases",
+    ]
+
+
+async def test_wallet_gateway_caches_missing_wallet() -> None:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(404, json={"detail": "Wallet not found"})
+
+    async with _client(handler) as client:
+        gateway = HttpWalletGateway(client, wallet_ids=WalletIdCache())
+        for _ in range(2):
+            with pytest.raises(WalletIntegrationError, match="No wallet"):
+                await gateway.reserve_for_buy(TRADER, Decimal("1"), "USD")
+
+    assert len(requests) == 1
+
+
+async def test_wallet_gateway_refreshes_stale_wallet_id_on_404() -> None:
+    new_wallet = "44444444-4444-4444-8444-444444444444"
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if "/by-trader/" in request.url.path:
+            return httpx.Response(200, json={"wallet_id": new_wallet})
+        if WALLET in request.url.path:
+            return httpx.Response(404, json={"detail": "Wallet not found"})
+        return httpx.Response(201)
+
+    cache = WalletIdCache()
+    cache.put(TRADER, WALLET)
+    async with _client(handler) as client:
+        await HttpWalletGateway(client, wallet_ids=cache).reserve_for_buy(
+            TRADER, Decimal("1"), "USD"
+        )
+
+    assert [r.url.path for r in requests] == [
+        f"/api/v1/wallets/{WALLET}/cash-reservations",
+        f"/api/v1/wallets/by-trader/{TRADER}",
+        f"/api/v1/wallets/{new_wallet}/cash-reservations",
+    ]
+    assert cache.lookup(TRADER) == (True, new_wallet)
+    assert cache.stats().invalidations == 1
+
+
+async def test_wallet_gateway_does_not_retry_fresh_wallet_id_on_404() -> None:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if "/by-trader/" in request.url.path:
+            return httpx.Response(200, json={"wallet_id": WALLET})
+        return httpx.Response(404, json={"detail": "Cash balance not found"})
+
+    cache = WalletIdCache()
+    async with _client(handler) as client:
+        with pytest.raises(WalletIntegrationError, match="404"):
+            await HttpWalletGateway(client, wallet_ids=cache).reserve_for_buy(
+                TRADER, Decimal("1"), "USD"
+            )
+
+    assert len(requests) == 2
+    assert cache.lookup(TRADER) == (False, None)
+
+
+# ---------------------------------------------------------------------------
+# HttpInstrumentGateway
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    ("status_code", "body"),
+    [(404, {}), (500, {}), (200, {"status": "HALTED"})],
+)
+async def test_instrument_gateway_rejects_untradable(
+    status_code: int, body: dict
+) -> None:
+    async with _client(
+        lambda request: httpx.Response(status_code, json=body)
+    ) as client:
+        with pytest.raises(InstrumentNotTradableError):
+            await HttpInstrumentGateway(client).ensure_tradable(INSTRUMENT)
+
+
+async def test_instrument_gateway_accepts_active_and_records_latency() -> None:
+    latency = LatencyRecorder()
+    paths: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        return httpx.Response(200, json={"status": "ACTIVE"})
+
+    async with _client(handler) as client:
+        await HttpInstrumentGateway(client, latency).ensure_tradable(INSTRUMENT)
+
+    assert paths == [f"/api/v1/instruments/{INSTRUMENT}"]
+    assert [s.name for s in latency.snapshot()] == ["admin.get_instrument"]
@@ -0,0 +1,186 @@
+import asyncio
+import json
+from contextlib import asynccontextmanager
+
+import httpx
+import pytest
+
+from src.exceptions import InstrumentNotTradableError
+from src.infrastructure.http_clients.http_instrument_gateway import (
+    HttpInstrumentGateway,
+)
+from src.infrastructure.http_clients.instrument_status_table import (
+    InstrumentStatusTable,
+)
+from src.infrastructure.messaging.instrument_event_consumer import (
+    InstrumentEventConsumer,
+)
+
+ACTIVE_ID = "11111111-1111-4111-8111-111111111111"
+HALTED_ID = "22222222-2222-4222-8222-222222222222"
+NEW_ID = "33333333-3333-4333-8333-333333333333"
+
+
+class _Admin:
+    """Admin stub; ``statuses`` is served by both endpoints."""
+
+    def __init__(self, statuses: dict[str, str]) -> None:
+        self.statuses = statuses
+        self.paths: list[str] = []
+        self.fail = False
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.paths.append(request.url.path)
+        if self.fail:
+            return httpx.Response(503, text="unavailable")
+        if request.url.path == "/api/v1/instruments/statuses":
+            return httpx.Response(
+                200,
+                json=[
+                    {"instrument_id": k, "status": v} for k, v in self.statuses.items()
+                ],
+            )
+        instrument_id = request.url.path.rsplit("/", 1)[-1]
+        if instrument_id not in self.statuses:
+            return httpx.Response(404, json={"detail": "Instrument not found"})
+        return httpx.Response(200, json={"status": self.statuses[instrument_id]})
+
+
+@pytest.fixture
+def admin() -> _Admin:
+    return _Admin({ACTIVE_ID: "ACTIVE", HALTED_ID: "HALTED"})
+
+
+@pytest.fixture
+async def table(admin: _Admin):
+    async with httpx.AsyncClient(
+        base_url="http://admin", transport=httpx.MockTransport(admin)
+    ) as client:
+        yield InstrumentStatusTable(HttpInstrumentGateway(client), refresh_interval=0)
+
+
+async def test_checks_are_lookups_after_start(
+    table: InstrumentStatusTable, admin: _Admin
+) -> None:
+    await table.start()
+
+    await table.ensure_tradable(ACTIVE_ID)
+    with pytest.raises(InstrumentNotTradableError, match="HALTED"):
+        await table.ensure_tradable(HALTED_ID)
+
+    assert admin.paths == ["/api/v1/instruments/statuses"]
+    assert len(table) == 2
+
+
+async def test_unknown_instrument_is_fetched_once(
+    table: InstrumentStatusTable, admin: _Admin
+) -> None:
+    await table.start()
+    admin.statuses[NEW_ID] = "ACTIVE"
+
+    await table.ensure_tradable(NEW_ID)
+    await table.ensure_tradable(NEW_ID)
+
+    assert admin.paths[1:] == [f"/api/v1/instruments/{NEW_ID}"]
+
+
+async def test_missing_instrument_is_not_tradable(
+    table: InstrumentStatusTable,
+) -> None:
+    await table.start()
+
+    with pytest.raises(InstrumentNotTradableError, match="does not exist"):
+        await table.ensure_tradable(NEW_ID)
+
+
+async def test_events_update_the_table(table: InstrumentStatusTable) -> None:
+    await table.start()
+
+    table.apply(ACTIVE_ID, "HALTED")
+    table.apply(HALTED_ID, "ACTIVE")
+
+    with pytest.raises(InstrumentNotTradableError):
+        await table.ensure_tradable(ACTIVE_ID)
+    await table.ensure_tradable(HALTED_ID)
+
+
+async def test_failed_refresh_keeps_table(
+    table: InstrumentStatusTable, admin: _Admin
+) -> None:
+    await table.start()
+    admin.fail = True
+
+    assert await table.refresh() is False
+    await table.ensure_tradable(ACTIVE_ID)
+
+
+async def test_refresh_keeps_events_applied_while_it_ran(admin: _Admin) -> None:
+    release = asyncio.Event()
+
+    async def slow(request: httpx.Request) -> httpx.Response:
+        await release.wait()
+        return admin(request)
+
+    async with httpx.AsyncClient(
+        base_url="http://admin", transport=httpx.MockTransport(slow)
+    ) as client:
+        table = InstrumentStatusTable(HttpInstrumentGateway(client), refresh_interval=0)
+        refresh = asyncio.create_task(table.refresh())
+        await asyncio.sleep(0)
+        table.apply(ACTIVE_ID, "HALTED")
+        release.set()
+        assert await refresh is True
+
+    assert table.status_of(ACTIVE_ID) == "HALTED"
+    assert table.status_of(HALTED_ID) == "HALTED"
+
+
+# ---------------------------------------------------------------------------
+# InstrumentEventConsumer
+# ---------------------------------------------------------------------------
+
+
+class _Message:
+    def __init__(self, payload: dict | bytes, routing_key: str = "") -> None:
+        self.body = (
+            payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+        )
+        self.routing_key = routing_key
+
+    @asynccontextmanager
+    async def process(self, requeue: bool = False):
+        yield
+
+
+@pytest.mark.parametrize(
+    ("event_type", "status"),
+    [
+        ("InstrumentActivated", "ACTIVE"),
+        ("InstrumentHalted", "HALTED"),
+        ("InstrumentDelisted", "DELISTED"),
+    ],
+)
+async def test_consumer_applies_lifecycle_events(
+    table: InstrumentStatusTable, event_type: str, status: str
+) -> None:
+    consumer = InstrumentEventConsumer("amqp://unused", "instrument.events", table)
+
+    await consumer._on_message(
+        _Message({"event_type": event_type, "instrument_id": NEW_ID})
+    )
+
+    assert table.status_of(NEW_ID) == status
+
+
+async def test_consumer_ignores_invalid_and_unknown_events(
+    table: InstrumentStatusTable,
+) -> None:
+    consumer = InstrumentEventConsumer("amqp://unused", "instrument.events", table)
+
+    await consumer._on_message(_Message(b"not json"))
+    await consumer._on_message(
+        _Message({"event_type": "InstrumentCreated", "instrument_id": NEW_ID})
+    )
+    await consumer._on_message(_Message({"event_type": "InstrumentHalted"}))
+
+    assert len(table) == 0
@@ -0,0 +1,46 @@
+import pytest
+
+from src.infrastructure.metrics.latency import LatencyHistogram, LatencyRecorder
+
+
+def test_histogram_counts_and_percentiles() -> None:
+    histogram = LatencyHistogram("hop")
+    for _ in range(90):
+        histogram.observe(0.004)  # 4 ms -> 5 ms bucket
+    for _ in range(10):
+        histogram.observe(0.2)  # 200 ms -> 250 ms bucket
+
+    snapshot = histogram.snapshot()
+
+    assert snapshot.count == 100
+    assert snapshot.mean_ms == pytest.approx(23.6)
+    assert snapshot.p50_ms == 5
+    assert snapshot.p95_ms == 250
+    assert dict(snapshot.buckets)[5] == 90
+
+
+def test_histogram_overflow_bucket() -> None:
+    histogram = LatencyHistogram("hop")
+    histogram.observe(60)
+
+    assert histogram.snapshot().p99_ms == float("inf")
+
+
+def test_empty_histogram_reports_zero() -> None:
+    snapshot = LatencyHistogram("hop").snapshot()
+
+    assert snapshot.count == 0
+    assert snapshot.mean_ms == 0.0
+    assert snapshot.p50_ms == 0.0
+
+
+def test_recorder_times_block_even_when_it_raises() -> None:
+    recorder = LatencyRecorder()
+
+    with pytest.raises(RuntimeError):
+        with recorder.time("b"):
+            raise RuntimeError
+    with recorder.time("a"):
+        pass
+
+    assert [(s.name, s.count) for s in recorder.snapshot()] == [("a", 1), ("b", 1)]
@@ -0,0 +1,237 @@
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import StaticPool
+
+from src.domain.events.order_events import OrderCancelled, OrderOpened
+from src.domain.ports.event_publisher import EventPublisher
+from src.exceptions import DatabaseOperationError, MessagingPublishError
+from src.infrastructure.messaging.outbox_relay import OutboxRelay
+from src.infrastructure.metrics.latency import LatencyRecorder
+from src.infrastructure.persistence.models import Base
+from src.infrastructure.persistence.repositories.sqlalchemy_outbox_repository import (
+    SQLAlchemyOutboxRepository,
+)
+from src.infrastructure.persistence.unit_of_work import SQLAlchemyUnitOfWork
+
+
+@pytest_asyncio.fixture
+async def session_factory() -> AsyncIterator[async_sessionmaker[AsyncSession]]:
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield async_sessionmaker(bind=engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+@pytest.fixture
+def publisher() -> AsyncMock:
+    return AsyncMock(spec=EventPublisher)
+
+
+def _cancelled(order_id: str) -> OrderCancelled:
+    return OrderCancelled(order_id=order_id, trader_id="t1", side="BUY")
+
+
+async def _stage(session_factory, *events) -> None:
+    async with SQLAlchemyUnitOfWork(session_factory) as uow:
+        for event in events:
+            await uow.outbox.add(event)
+        await uow.commit()
+
+
+async def _pending(session_factory) -> list[str]:
+    async with session_factory() as session:
+        messages = await SQLAlchemyOutboxRepository(session).claim_batch(100)
+    return [json.loads(m.payload)["order_id"] for m in messages]
+
+
+# ---------------------------------------------------------------------------
+# Repository / unit of work
+# ---------------------------------------------------------------------------
+
+
+async def test_staged_events_are_stored_in_commit_order(session_factory) -> None:
+    await _stage(session_factory, _cancelled("o1"), OrderOpened(order_id="o2"))
+
+    async with session_factory() as session:
+        messages = await SQLAlchemyOutboxRepository(session).claim_batch(10)
+
+    assert [m.event_type for m in messages] == ["OrderCancelled", "OrderOpened"]
+    payload = json.loads(messages[0].payload)
+    assert payload["event_type"] == "OrderCancelled"
+    assert payload["order_id"] == "o1"
+    assert messages[0].created_at.tzinfo is not None
+
+
+async def test_rolled_back_events_are_not_stored(session_factory) -> None:
+    with pytest.raises(RuntimeError):
+        async with SQLAlchemyUnitOfWork(session_factory) as uow:
+            await uow.outbox.add(_cancelled("o1"))
+            raise RuntimeError("order update failed")
+
+    assert await _pending(session_factory) == []
+
+
+async def test_events_are_not_stored_when_staging_is_off(session_factory) -> None:
+    async with SQLAlchemyUnitOfWork(session_factory, stage_events=False) as uow:
+        await uow.outbox.add(_cancelled("o1"))
+        await uow.commit()
+
+    assert await _pending(session_factory) == []
+
+
+async def test_commit_calls_on_commit(session_factory) -> None:
+    calls: list[None] = []
+
+    async with SQLAlchemyUnitOfWork(
+        session_factory, on_commit=lambda: calls.append(None)
+    ) as uow:
+        await uow.outbox.add(_cancelled("o1"))
+        await uow.commit()
+
+    assert calls == [None]
+
+
+async def test_on_commit_not_called_when_commit_fails(session_factory) -> None:
+    calls: list[None] = []
+
+    with pytest.raises(DatabaseOperationError):
+        async with SQLAlchemyUnitOfWork(
+            session_factory, on_commit=lambda: calls.append(None)
+        ) as uow:
+            await uow.outbox.add(OrderOpened(order_id="o1", event_type=None))
+            await uow.commit()
+
+    assert calls == []
+
+
+async def test_backlog_reports_count_and_oldest(session_factory) -> None:
+    async with session_factory() as session:
+        assert await SQLAlchemyOutboxRepository(session).backlog() == (0, None)
+
+    await _stage(session_factory, _cancelled("o1"), _cancelled("o2"))
+
+    async with session_factory() as session:
+        pending, oldest = await SQLAlchemyOutboxRepository(session).backlog()
+    assert pending == 2
+    assert oldest <= datetime.now(timezone.utc)
+
+
+# ---------------------------------------------------------------------------
+# Relay
+# ---------------------------------------------------------------------------
+
+
+async def test_relay_publishes_and_deletes_batch(session_factory, publisher) -> None:
+    await _stage(session_factory, _cancelled("o1"), _cancelled("o2"))
+    latency = LatencyRecorder()
+    relay = OutboxRelay(session_factory, publisher, latency)
+
+    assert await relay.relay_once() == 2
+
+    published = [c.args for c in publisher.publish_payload.await_args_list]
+    assert [event_type for event_type, _ in published] == ["OrderCancelled"] * 2
+    assert [json.loads(p)["order_id"] for _, p in published] == ["o1", "o2"]
+    assert await _pending(session_factory) == []
+    assert latency.snapshot()[0].name == "outbox.relay_lag"
+    assert latency.snapshot()[0].count == 2
+
+
+async def test_relay_respects_batch_size(session_factory, publisher) -> None:
+    await _stage(session_factory, *(_cancelled(f"o{i}") for i in range(5)))
+    relay = OutboxRelay(session_factory, publisher, batch_size=2)
+
+    assert await relay.relay_once() == 2
+    assert await _pending(session_factory) == ["o2", "o3", "o4"]
+
+
+async def test_relay_keeps_unacked_events(session_factory, publisher) -> None:
+    await _stage(session_factory, _cancelled("o1"), _cancelled("o2"))
+
+    async def publish(event_type: str, payload: str) -> None:
+        if json.loads(payload)["order_id"] == "o2":
+            raise MessagingPublishError("nack")
+
+    publisher.publish_payload.side_effect = publish
+    relay = OutboxRelay(session_factory, publisher)
+
+    assert await relay.relay_once() == 1
+    assert await _pending(session_factory) == ["o2"]
+    stats = await relay.stats()
+    assert (stats.published, stats.failed, stats.pending) == (1, 1, 1)
+
+
+async def test_relay_keeps_everything_after_a_failed_event(
+    session_factory, publisher
+) -> None:
+    await _stage(session_factory, *(_cancelled(f"o{i}") for i in range(3)))
+
+    async def publish(event_type: str, payload: str) -> None:
+        if json.loads(payload)["order_id"] == "o1":
+            raise MessagingPublishError("nack")
+
+    publisher.publish_payload.side_effect = publish
+    relay = OutboxRelay(session_factory, publisher)
+
+    # o2 may have been acked, but deleting it would let it overtake o1.
+    assert await relay.relay_once() == 1
+    assert await _pending(session_factory) == ["o1", "o2"]
+
+    publisher.publish_payload.side_effect = None
+    assert await relay.relay_once() == 2
+    retried = [
+        json.loads(c.args[1])["order_id"]
+        for c in publisher.publish_payload.await_args_list[-2:]
+    ]
+    assert retried == ["o1", "o2"]
+
+
+async def test_stats_report_lag(session_factory, publisher) -> None:
+    now = datetime.now(timezone.utc) + timedelta(seconds=30)
+    await _stage(session_factory, _cancelled("o1"))
+    relay = OutboxRelay(session_factory, publisher, clock=lambda: now)
+
+    before = await relay.stats()
+    await relay.relay_once()
+    after = await relay.stats()
+
+    assert before.pending == 1
+    assert before.oldest_pending_age_seconds == pytest.approx(30, abs=5)
+    assert after.pending == 0
+    assert after.oldest_pending_age_seconds is None
+    assert after.last_lag_seconds == pytest.approx(30, abs=5)
+    assert (after.batches, after.running) == (1, False)
+
+
+async def test_notify_wakes_relay_before_poll(session_factory, publisher) -> None:
+    relay = OutboxRelay(session_factory, publisher, poll_interval=60)
+    await relay.start()
+    try:
+        await asyncio.sleep(0.05)  # first, empty pass; now waiting
+        async with SQLAlchemyUnitOfWork(session_factory, relay.notify) as uow:
+            await uow.outbox.add(_cancelled("o1"))
+            await uow.commit()
+        for _ in range(100):
+            if publisher.publish_payload.await_count:
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        await relay.stop()
+
+    publisher.publish_payload.assert_awaited_once()
+    assert not relay.running
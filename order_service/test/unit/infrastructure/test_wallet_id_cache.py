@@ -0,0 +1,74 @@
+from src.infrastructure.http_clients.wallet_id_cache import WalletIdCache
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_lookup_hit_and_miss() -> None:
+    cache = WalletIdCache()
+
+    assert cache.lookup("t1") == (False, None)
+    cache.put("t1", "w1")
+    assert cache.lookup("t1") == (True, "w1")
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+
+
+def test_entries_expire_after_ttl() -> None:
+    clock = _Clock()
+    cache = WalletIdCache(ttl_seconds=10, clock=clock)
+    cache.put("t1", "w1")
+
+    clock.now = 9.9
+    assert cache.lookup("t1") == (True, "w1")
+    clock.now = 10.0
+    assert cache.lookup("t1") == (False, None)
+    assert cache.stats().entries == 0
+
+
+def test_missing_wallet_is_cached_briefly() -> None:
+    clock = _Clock()
+    cache = WalletIdCache(ttl_seconds=300, negative_ttl_seconds=5, clock=clock)
+    cache.put_missing("t1")
+
+    assert cache.lookup("t1") == (True, None)
+    clock.now = 5.0
+    assert cache.lookup("t1") == (False, None)
+    assert cache.stats().negative_hits == 1
+
+
+def test_zero_negative_ttl_disables_negative_caching() -> None:
+    cache = WalletIdCache(negative_ttl_seconds=0)
+    cache.put_missing("t1")
+
+    assert cache.lookup("t1") == (False, None)
+
+
+def test_least_recently_used_entry_is_evicted() -> None:
+    cache = WalletIdCache(max_entries=2)
+    cache.put("t1", "w1")
+    cache.put("t2", "w2")
+    cache.lookup("t1")
+    cache.put("t3", "w3")
+
+    assert cache.lookup("t2") == (False, None)
+    assert cache.lookup("t1") == (True, "w1")
+    assert cache.lookup("t3") == (True, "w3")
+    assert cache.stats().evictions == 1
+
+
+def test_invalidate_drops_entry() -> None:
+    cache = WalletIdCache()
+    cache.put("t1", "w1")
+
+    cache.invalidate("t1")
+    cache.invalidate("t1")
+
+    assert cache.lookup("t1") == (False, None)
+    assert cache.stats().invalidations == 1